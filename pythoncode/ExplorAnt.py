@@ -1,7 +1,8 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2022-08-22"
+__version__ = "2026-10-17"
+# 2026-10-17    -E uses the emulated ANT dongle (HRM and i-Vortex) of antEmulator
 # 2022-08-22    AntDongle stores received messages in a queue.
 # 2020-05-07    clsAntDongle encapsulates all functions
 #               and implements dongle recovery
@@ -30,12 +31,12 @@ import sys
 import struct
 import threading
 import time
-import usb.core
 import wx
 
 from datetime import datetime
 
 import antDongle         as ant
+import antEmulator
 import antHRM            as hrm
 import antFE             as fe
 import debug
@@ -87,7 +88,8 @@ if True or debug.on(debug.Any):
 # ------------------------------------------------------------------------------
 # First enumerate all dongles
 # ------------------------------------------------------------------------------
-ant.EnumerateAll()
+if not clv.EmulateDongle:
+    ant.EnumerateAll()
 
 # ------------------------------------------------------------------------------
 # Open dongle; either the defined one or default
@@ -101,7 +103,12 @@ if clv.dongle > 0:
 else:
     p = None            # Take the default
 
-AntDongle = ant.clsAntDongle(p)
+if clv.EmulateDongle:
+    Transport = antEmulator.clsAntEmulatedTransport( \
+                    [antEmulator.clsEmulatedHRM(), antEmulator.clsEmulatedVortex()])
+else:
+    Transport = None    # The default; pyusb
+AntDongle = ant.clsAntDongle(p, Transport)
 logfile.Console (AntDongle.Message)
 
 if AntDongle.OK and not clv.SimulateTrainer:
@@ -1,7 +1,8 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-05-01"
+__version__ = "2026-10-17"
+# 2026-10-17    Added: -E, use the emulated ANT dongle (antEmulator)
 # 2020-05-01    Added: vhu, no command line variable defined
 # 2020-04-23    Create() and Get() removed because it is weard
 # 2020-04-20    Added: -S -V
@@ -29,6 +30,7 @@ class CommandLineVariables(object):
     vtx             = -1            # i-Vortex
     vhu             = -1            # i-Vortex Headunit
     SimulateTrainer = False
+    EmulateDongle   = False
 
     #---------------------------------------------------------------------------
     # Define and process command line
@@ -41,6 +43,7 @@ class CommandLineVariables(object):
         parser.add_argument('-a','--autostart', help='Automatically start',                 required=False, action='store_true')
         parser.add_argument('-d','--debug',     help='Show debugging data',                 required=False, default=False)
         parser.add_argument('-s','--simulate',  help='Simulate master HRM and FE-C',        required=False, action='store_true')
+        parser.add_argument('-E','--emulate',   help='Use an emulated ANT dongle',          required=False, action='store_true')
         parser.add_argument('-D','--dongle',    help='Use this ANT dongle',                 required=False, default=False)
         parser.add_argument('-H','--hrm',       help='Pair with this Heart Rate Monitor',   required=False, default=False)
         parser.add_argument('-F','--fe',        help='Pair with this Fitness Equipment',    required=False, default=False)
@@ -54,6 +57,7 @@ class CommandLineVariables(object):
         #-----------------------------------------------------------------------
         self.autostart         = args.autostart
         self.SimulateTrainer   = args.simulate
+        self.EmulateDongle     = args.emulate
 
         #-----------------------------------------------------------------------
         # Get debug-flags, used in debug module
@@ -112,6 +116,7 @@ class CommandLineVariables(object):
             v = debug.on(debug.Any)     # Verbose: print all command-line variables with values
             if      self.autostart:          logfile.Console ("-a")
             if      self.SimulateTrainer:    logfile.Console ("-s")
+            if      self.EmulateDongle:      logfile.Console ("-E")
             if v or self.args.debug:         logfile.Console ("-d %s (%s)" % (self.debug,  bin(self.debug  ) ) )
             if v or self.args.dongle:        logfile.Console ("-D %s (%s)" % (self.dongle, hex(self.dongle ) ) )
             if v or self.args.hrm:           logfile.Console ("-H %s (%s)" % (self.hrm,    hex(self.hrm    ) ) )
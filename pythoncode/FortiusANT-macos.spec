@@ -16,7 +16,7 @@ a = Analysis(['FortiusAnt.py'],
                 ( './tacxfortius_1942_firmware.hex', '.' ),
                 ( './tacximagic_1902_firmware.hex',  '.' )
              ],
-             hiddenimports=[],
+             hiddenimports=['bleBless', 'importlib.metadata', 'requests'],   # lazyImport
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
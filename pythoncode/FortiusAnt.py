@@ -1,7 +1,16 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2023-03-17"
+__version__ = "2026-10-17"
+# 2026-10-17    Subsystems imported when used (lazyImport): wx, FortiusAntGui
+#               and RadarGraph only with the GUI (DefineFrmFortiusAnt...),
+#               bless only with -bb; numpy and usb no longer imported here,
+#               importlib.metadata only for the version info.
+#               --profile-startup reports the import time per module
+#               GuiAvailable(); console mode if wx cannot be imported
+# 2026-10-17    With multiprocessing, SetValues/SetLeds/SetMessages are passed
+#               to the GUI through liveState (shared memory), read by the GUI
+#               on its own timer, instead of the pipe; SetValues not throttled
 # 2023-03-17    #422 importlib not found; ignore that issue
 # 2022-11-19    importlib_metadata_version used to print bless.version
 # 2022-03-08    bleBless, bleBlessClass added
@@ -28,26 +37,25 @@ __version__ = "2023-03-17"
 #               This module contains program startup, GUI-binding and
 #               multi-processing functionality only
 #-------------------------------------------------------------------------------
+import sys
+import lazyImport                       # First, so that all imports are measured
+if '--profile-startup' in sys.argv:
+    lazyImport.ProfileStartup()
+
 from   constants import mode_Power, mode_Grade, UseGui, UseBluetooth, UseMultiProcessing, OnRaspberry, mile
 import constants                        #  for __version__
 
 import argparse
 from datetime                           import datetime
-try:
-    from importlib.metadata             import version  as importlib_metadata_version
-except:
-    pass
+importlib_metadata = lazyImport.clsLazyModule('importlib.metadata')
 import multiprocessing
-import numpy
 import pickle
 import platform, glob
 import os
 import random
-import sys
 import struct
 import threading
 import time
-import usb.core
 
 import antCTRL
 import antDongle            as ant
@@ -55,25 +63,41 @@ import antHRM               as hrm
 import antFE                as fe
 import antPWR               as pwr
 import antSCS               as scs
-import bleBless
-import bleBlessClass
 import bleDongle
 import debug
 import logfile
 import FortiusAntBody
 import FortiusAntCommand    as cmd
 from   FortiusAntTitle                  import githubWindowTitle
+import liveState
 import raspberry
 import settings
 import structConstants      as sc
 import TCXexport
 import usbTrainer
 
-if UseGui:
+# ------------------------------------------------------------------------------
+# The GUI is imported when used, not at startup; see DefineFrmFortiusAnt()
+# ------------------------------------------------------------------------------
+def ImportGui():
+    global wx, gui, RadarGraph
     import wx
     import FortiusAntGui        as gui
     import RadarGraph
 
+# ------------------------------------------------------------------------------
+# constants.UseGui only checks that wx is installed; if wx cannot be imported
+# FortiusAnt continues without GUI, as before wx was imported when used.
+# ------------------------------------------------------------------------------
+def GuiAvailable():
+    if constants.UseGui:
+        try:
+            import wx                   # pylint: disable=unused-import
+        except Exception as e:
+            logfile.Console('wxPython cannot be imported, GUI disabled (%s)' % e)
+            constants.UseGui = False
+    return constants.UseGui
+
 #-------------------------------------------------------------------------------
 # Directives for this module
 #-------------------------------------------------------------------------------
@@ -95,6 +119,8 @@ cmd_SetValues           = 19597         # Main->Child; No response expected
 cmd_PedalStrokeAnalysis = 19598         # Main->Child; No response expected
 cmd_SetLeds             = 19599         # Main->Child; No response expected
 
+LiveStateInterval       = 100           # ms; the GUI reads liveState
+
 # ==============================================================================
 # The following functions are called from the GUI, Console or multi-processing
 # parent process.
@@ -176,8 +202,14 @@ def Tacx2Dongle(self):
 # ------------------------------------------------------------------------------
 # Called:       IdleFunction, LocateHW(), Runoff() and Tacx2Dongle() are called
 #                    to provide the required functionality.
+#
+#               The class is defined by DefineFrmFortiusAnt(), when the GUI is
+#               used, because it requires wx.
 # ==============================================================================
-if UseGui:
+def DefineFrmFortiusAnt():
+    global frmFortiusAnt
+    ImportGui()
+
     class frmFortiusAnt(gui.frmFortiusAntGui):
         def callSettings(self, RestartApplication, pclv):
             return Settings(self, RestartApplication, pclv)
@@ -311,16 +343,54 @@ class clsFortiusAntConsole:
 #               received.
 #
 # Functions:    For this purpose, GuiMessageToMain() is available.
+#
+#               When LiveStateName is provided, the values to be displayed are
+#               read from liveState by LiveStatePoll() on a timer.
+#
+#               The class is defined by DefineFrmFortiusAntChild(), in the
+#               child-process only.
 # ==============================================================================
-if UseGui:
+def DefineFrmFortiusAntChild():
+    global frmFortiusAntChild
+    ImportGui()
+
     class frmFortiusAntChild(gui.frmFortiusAntGui):
         # --------------------------------------------------------------------------
         # gui_conn is the child-connection to the parent process
         # --------------------------------------------------------------------------
-        def __init__(self, parent, conn, pclv):
+        def __init__(self, parent, conn, pclv, LiveStateName=None):
             self.gui_conn = conn
             super(frmFortiusAntChild, self).__init__(parent, pclv)
 
+            self.LiveState = None
+            if LiveStateName:
+                self.LiveState      = liveState.clsLiveState(LiveStateName)
+                self.LiveStateTimer = wx.Timer(self, 251)
+                self.LiveStateTimer.Start(LiveStateInterval)
+
+        # --------------------------------------------------------------------------
+        # All timers of the frame are bound to OnTimer()
+        # --------------------------------------------------------------------------
+        def OnTimer(self, event):
+            if self.LiveState and event.GetId() == self.LiveStateTimer.GetId():
+                self.LiveStatePoll()
+            else:
+                gui.frmFortiusAntGui.OnTimer(self, event)
+
+        # --------------------------------------------------------------------------
+        # Display what the main process has written in liveState; since we are
+        # in the GUI thread, the ...GUI() functions are called directly.
+        # --------------------------------------------------------------------------
+        def LiveStatePoll(self):
+            Values, Leds, Messages = self.LiveState.Poll()
+            for Tacx, Dongle, HRM in Messages:
+                self.SetMessagesGUI(Tacx, Dongle, HRM)
+            if Leds is not None:
+                self.StatusLeds[:] = Leds
+                self.RefreshArea(self.LedsRect())
+            if Values is not None:
+                self.SetValuesGUI(*Values)
+
         def GuiMessageToMain(self, command, wait=True, p1=None, p2=None):
             # ----------------------------------------------------------------------
             # Step 1. GUI sends a command to main
@@ -414,6 +484,8 @@ if UseGui:
         def OnClose(self, event):
             if self.RunningSwitch == True:          # Thread is running
                 self.GuiMessageToMain(cmd_StopButton, False)
+            if self.LiveState:
+                self.LiveStateTimer.Stop()
             gui.frmFortiusAntGui.OnClose(self, event)
 
 # ==============================================================================
@@ -431,7 +503,7 @@ if UseGui:
 #
 #               SetMessages() and SetValues() are called by the functions and
 #               send the data to be displayed to the child, not awaiting an
-#               answer.
+#               answer. With LiveState, the data is written in shared memory.
 #
 #               RunoffThread() and Tacx2DongleThread() act as function to create
 #               a thread to execute the functions, whilst not blocking the
@@ -439,9 +511,10 @@ if UseGui:
 #               order to stop.
 # ==============================================================================
 class clsFortiusAntParent:
-    def __init__(self, app_conn):
+    def __init__(self, app_conn, LiveState=None):
         self.RunningSwitch      = False
         self.app_conn           = app_conn
+        self.LiveState          = LiveState
         self.LastTime           = 0
         self.PreviousMessages   = None
 
@@ -460,6 +533,10 @@ class clsFortiusAntParent:
         self.app_conn.send((command, rtn))      # Step 3. Main sends the response to GUI
 
     def SetValues(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, iTacx, iHeartRate, iCrancksetIndex, iCassetteIndex, fReduction):
+        if self.LiveState:                      # No need to throttle
+            self.LiveState.SetValues(fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, iTacx, iHeartRate, iCrancksetIndex, iCassetteIndex, fReduction)
+            return
+
         delta = time.time() - self.LastTime     # Delta time since previous call
         if delta >= 1:                          # Do not send faster than once per second
             self.LastTime = time.time()         # Time in seconds
@@ -471,6 +548,9 @@ class clsFortiusAntParent:
         newMessages = (Tacx, Dongle, HRM)
         if newMessages != self.PreviousMessages:    # Send immediatly if changed
             self.PreviousMessages = newMessages
+            if self.LiveState:
+                self.LiveState.SetMessages(Tacx, Dongle, HRM)
+                return
             if debug.on(debug.MultiProcessing): logfile.Write ("mp-MainDataToGUI(%s, (%s, %s, %s))" % (cmd_SetMessages, Tacx, Dongle, HRM))
             self.app_conn.send((cmd_SetMessages, (Tacx, Dongle, HRM)))  # x. Main sends messages to GUI; no response expected
 
@@ -479,6 +559,9 @@ class clsFortiusAntParent:
         self.app_conn.send((cmd_PedalStrokeAnalysis, (info, Cadence)))  # x. Main sends messages to GUI; no response expected
 
     def SetLeds(self, ANT=None, BLE=None, Cadence=None, Shutdown=None, Tacx=None):
+        if self.LiveState:
+            self.LiveState.SetLeds(ANT, BLE, Cadence, Shutdown, Tacx)
+            return
         if debug.on(debug.MultiProcessing): logfile.Write ("mp-MainDataToGUI(%s, (%s, %s, %s, %d, %s))" % (cmd_SetLeds, Tacx, Shutdown, Cadence, BLE, ANT))
         self.app_conn.send((cmd_SetLeds, (ANT, BLE, Cadence, Shutdown, Tacx)))  # x. Main sends messages to GUI; no response expected
 
@@ -539,6 +622,7 @@ class clsFortiusAntParent:
 # ------------------------------------------------------------------------------
 # Input:        clv     Command line variables
 #               conn    the child-side of the multiprocessing pipe
+#               LiveStateName   shared memory with the values to be displayed
 #
 # Description:  Here the user-interface is created.
 #               The user-interface will call the callback functions as defined
@@ -546,7 +630,7 @@ class clsFortiusAntParent:
 #
 # Output:       none
 # ------------------------------------------------------------------------------
-def FortiusAntChild(clv, conn):
+def FortiusAntChild(clv, conn, LiveStateName=None):
     # --------------------------------------------------------------------------
     # Initialize the child process, create our own logfile
     # --------------------------------------------------------------------------
@@ -558,8 +642,9 @@ def FortiusAntChild(clv, conn):
     # --------------------------------------------------------------------------
     # Start the user-interface
     # --------------------------------------------------------------------------
+    DefineFrmFortiusAntChild()
     app = wx.App(0)
-    frame = frmFortiusAntChild(None, conn, clv)
+    frame = frmFortiusAntChild(None, conn, clv, LiveStateName)
     app.SetTopWindow(frame)
     frame.Show()
     if clv.autostart:
@@ -570,6 +655,8 @@ def FortiusAntChild(clv, conn):
     # Signal parent that we're done
     # --------------------------------------------------------------------------
     frame.GuiMessageToMain(cmd_EndExecution, False)
+    if frame.LiveState:
+        frame.LiveState.Close()
     if debug.on(debug.Any):
         logfile.Console('FortiusAnt GUI ended')
 
@@ -616,18 +703,18 @@ def mainProgram():
         logfile.Write(s % ('antHRM',                    hrm.__version__ ))
         logfile.Write(s % ('antPWR',                    pwr.__version__ ))
         logfile.Write(s % ('antSCS',                    scs.__version__ ))
-        logfile.Write(s % ('bleBless',             bleBless.__version__ ))
-        logfile.Write(s % ('bleBlessClass',   bleBlessClass.__version__ ))
+        logfile.Write(s % ('bleBless',   lazyImport.Version('bleBless') ))
+        logfile.Write(s % ('bleBlessClass', lazyImport.Version('bleBlessClass') ))
         logfile.Write(s % ('bleDongle',           bleDongle.__version__ ))
         logfile.Write(s % ('constants',           constants.__version__ ))
         logfile.Write(s % ('debug',                   debug.__version__ ))
         logfile.Write(s % ('FortiusAntBody', FortiusAntBody.__version__ ))
         logfile.Write(s % ('FortiusAntCommand',         cmd.__version__ ))
-        if UseGui:
-            logfile.Write(s % ('FortiusAntGui',         gui.__version__ ))
+        logfile.Write(s % ('FortiusAntGui', lazyImport.Version('FortiusAntGui') ))
+        logfile.Write(s % ('lazyImport',         lazyImport.__version__ ))
+        logfile.Write(s % ('liveState',           liveState.__version__ ))
         logfile.Write(s % ('logfile',               logfile.__version__ ))
-        if UseGui:
-            logfile.Write(s % ('RadarGraph',     RadarGraph.__version__ ))
+        logfile.Write(s % ('RadarGraph', lazyImport.Version('RadarGraph') ))
         logfile.Write(s % ('raspberry',           raspberry.__version__ ))
         logfile.Write(s % ('settings',             settings.__version__ ))
         logfile.Write(s % ('structConstants',            sc.__version__ ))
@@ -641,12 +728,12 @@ def mainProgram():
         #   I did not try them all.
         logfile.Write(s % ('argparse',             argparse.__version__ ))
         try:
-            logfile.Write(s % ('bless',    importlib_metadata_version("bless") ))
+            logfile.Write(s % ('bless',    importlib_metadata.version("bless") ))
         except:
             pass
     #   logfile.Write(s % ('binascii',             binascii.__version__ ))
     #   logfile.Write(s % ('math',                     math.__version__ ))
-        logfile.Write(s % ('numpy',                   numpy.__version__ ))
+        logfile.Write(s % ('numpy',         lazyImport.Version('numpy') ))
         logfile.Write(s % ('os',                         os.name        ))
         if os.name == 'nt':
             v = sys.getwindowsversion()
@@ -659,9 +746,8 @@ def mainProgram():
     #   logfile.Write(s % ('struct',                 struct.__version__ ))
     #   logfile.Write(s % ('threading',           threading.__version__ ))
     #   logfile.Write(s % ('time',                     time.__version__ ))
-        logfile.Write(s % ('usb',                       usb.__version__ ))
-        if UseGui:
-            logfile.Write(s % ('wx',                     wx.__version__ ))
+        logfile.Write(s % ('usb',             lazyImport.Version('usb') ))
+        logfile.Write(s % ('wx',               lazyImport.Version('wx') ))
 
         logfile.Write('FortiusANT code flags')
         logfile.Write(s % ('UseMultiProcessing',            UseMultiProcessing))
@@ -669,12 +755,18 @@ def mainProgram():
         logfile.Write(s % ('UseBluetooth',                  UseBluetooth))
         logfile.Write("------------------")
 
+    if clv.ProfileStartup:
+        lazyImport.Report('FortiusAnt initialized')
+
     #-------------------------------------------------------------------------------
     # Modify ANT deviceNumbers if requested
     #-------------------------------------------------------------------------------
     if clv.DeviceNumberBase:
         ant.DeviceNumberBase(clv.DeviceNumberBase)
 
+    if clv.gui and not GuiAvailable():
+        clv.gui = False
+
     if not clv.gui:
         # --------------------------------------------------------------------------
         # Console only, no multiprocessing required to separate GUI
@@ -687,6 +779,7 @@ def mainProgram():
         # No multiprocessing wanted, start GUI immediatly
         # --------------------------------------------------------------------------
         clv.PedalStrokeAnalysis = False
+        DefineFrmFortiusAnt()
         app = wx.App(0)
         frame = frmFortiusAnt(None, clv)
         app.SetTopWindow(frame)
@@ -703,19 +796,24 @@ def mainProgram():
         # Create queue and sub-process
         # --------------------------------------------------------------------------
         app_conn, gui_conn = multiprocessing.Pipe(True)
-        pChild = multiprocessing.Process(target=FortiusAntChild, args=(clv, gui_conn) )
+        LiveState = liveState.clsLiveState() if liveState.UseSharedMemory else None
+        pChild = multiprocessing.Process(target=FortiusAntChild, \
+                    args=(clv, gui_conn, LiveState.Name if LiveState else None) )
         pChild.start()
 
         # --------------------------------------------------------------------------
         # Poll child-process untill done
         # --------------------------------------------------------------------------
-        parent = clsFortiusAntParent(app_conn)  # The child process has the GUI
+        parent = clsFortiusAntParent(app_conn, LiveState)  # The child process has the GUI
         parent.ListenToChild()
 
         # --------------------------------------------------------------------------
         # Wait for child-process to complete
         # --------------------------------------------------------------------------
         pChild.join()
+        if LiveState:
+            LiveState.Close()
+            LiveState.Unlink()
 
     # ------------------------------------------------------------------------------
     # We're done
@@ -1,7 +1,35 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2024-01-19"
+__version__ = "2026-10-17"
+# 2026-10-17    bleBless imported on first use (lazyImport), so only with -bb;
+#               without bluetooth bleCTP is the bleDongle 'dummy' class.
+#               wx not imported (not used); --profile-startup report when the
+#               devices are activated
+# 2026-10-17    Calibration averages with ringStatistics instead of numpy arrays
+# 2026-10-17    constants.UseAntTxScheduler; master channels broadcast on EVENT_TX
+# 2026-10-17    constants.UseAntShards; channels spread over the ANT dongles found
+# 2026-10-17    msgID_BurstData is reassembled by ant.clsAntBurst; a transfer is
+#               discarded on EVENT_TRANSFER_RX_FAILED
+# 2026-10-17    Received ANT messages are taken with AntDongle.MessageQueueDrain()
+# 2026-10-17    Terminate() closes the ANT capture file (-d r)
+# 2026-10-17    Terminate() releases the dongle with devAntDongle.Release(),
+#               the pyusb specifics are in ant.clsAntUsbTransport.
+# 2026-10-17    Time and waiting via cycleClock.Time() and cycleClock.Wait(), so
+#               that FortiusAntHarness.py can run with a clsVirtualClock.
+# 2026-10-17    constants.UseTrainerThread: TacxTrainer.StartIOthread() during
+#               the main loop, so that a slow head unit does not delay ANT/BLE.
+# 2026-10-17    Tacx2DongleSub, Runoff and calibration are timed by
+#               cycleClock.clsCycleClock (time.monotonic, absolute deadlines)
+#               instead of time.time() and sleep(CycleTime - ElapsedTime).
+# 2026-10-17    Main loop waits on Wakeup (set by ANT read thread and Bluetooth
+#               server) instead of time.sleep(); received commands are handled
+#               and sent to the trainer right away, TacxTrainer.SendTarget().
+#               The 4Hz ANT broadcast and the cycle use a deadline.
+# 2026-10-17    Received ANT messages are dispatched by ant.clsAntRouter to the
+#               handlers registered for (id, channel, page), instead of the
+#               if/elif cascade; the message is decomposed only once.
+#               Page 71 command status in ant.clsCommandStatus per channel.
 # 2024-01-19    #381/1  ANT/Remote buttons are processed twice
 #               #381/2  ANT/Remote has four buttons, but 3 are implemented
 #               #381/3  Additional datapage implemented for HRM
@@ -222,12 +250,11 @@ __version__ = "2024-01-19"
 #               - test with Zwift; done 2019-12-24
 #               - calibration test; done 2020-01-07
 #-------------------------------------------------------------------------------
-from   constants                    import mode_Power, mode_Grade, UseBluetooth, UseGui
+from   constants                    import mode_Power, mode_Grade, UseBluetooth
 
 import argparse
 import binascii
 import math
-import numpy
 import os
 import pickle
 import platform, glob
@@ -235,10 +262,6 @@ import random
 import sys
 import struct
 import threading
-import time
-import usb.core
-if UseGui:
-    import wx
 
 from   datetime                     import datetime
 
@@ -249,19 +272,23 @@ import antPWR            as pwr
 import antSCS            as scs
 import antCTRL           as ctrl
 import constants
+import cycleClock
 import debug
+import lazyImport
 import logfile
 import raspberry
+import ringStatistics
 import steering
 import TCXexport
 import usbTrainer
 
-import bleBless
+bleBless = lazyImport.clsLazyModule('bleBless')
 import bleDongle
 
 PrintWarnings = False   # Print warnings even when logging = off
 CycleTimeFast = 0.02    # TRAINER- SHOULD WRITE THEN READ 70MS LATER REALLY
 CycleTimeANT  = 0.25
+Wakeup        = threading.Event()   # Set when ANT/BLE data is received
 # ------------------------------------------------------------------------------
 # Initialize globals
 # ------------------------------------------------------------------------------
@@ -287,7 +314,7 @@ def Initialize(pclv):
         bleCTP = bleDongle.clsBleCTP(clv)       # nodejs implementation
 
     else:
-        bleCTP =  bleBless.clsFTMS_bless(False) # Create data structure,
+        bleCTP = bleDongle.clsBleCTP(clv)       # Create data structure,
                                                 # e.g. so that .Message exists
                                                 # No methods may be called
 
@@ -304,17 +331,9 @@ def Terminate():
     # --------------------------------------------------------------------------
     # If there is an AntDongle, release it as good as possible
     # --------------------------------------------------------------------------
-    if AntDongle != None and AntDongle.OK:
-        if debug.on(debug.Function): f ("AntDongle.reset()")
-        AntDongle.devAntDongle.reset()
-
-        for cfg in AntDongle.devAntDongle:
-            for intf in cfg:
-                if debug.on(debug.Function): f ("AntDongle.release_interface()")
-                usb.util.release_interface(AntDongle.devAntDongle, intf)
-
-        if debug.on(debug.Function): f ("AntDongle.dispose_resources()")
-        usb.util.dispose_resources(AntDongle.devAntDongle)
+    if AntDongle != None:
+        AntDongle.StopCapture()
+        AntDongle.Release()
     # --------------------------------------------------------------------------
     # Delete our globals to help python clean-up
     # --------------------------------------------------------------------------
@@ -418,6 +437,8 @@ def LocateHW(FortiusAntGui):
         pass
     else:
         AntDongle = ant.clsAntDongle(clv.antDeviceID)
+        if constants.UseAntShards:
+            AntDongle.AddShards(ant.ShardMastersSlaves)
         manualMsg = ''
         if AntDongle.OK or not (clv.Tacx_Vortex or clv.Tacx_Genius or clv.Tacx_Bushido):       # 2020-09-29
              if clv.homeTrainer: manualMsg = ' (home trainer)'
@@ -522,8 +543,10 @@ def Runoff(FortiusAntGui):
     else:
         CycleTime = CycleTimeANT    # 0.25 Seconds, inspired by 4Hz ANT+
 
+    LoopClock = cycleClock.clsCycleClock(CycleTime, 'Runoff')
+
     while FortiusAntGui.RunningSwitch == True:
-        StartTime     = time.time()
+        LoopClock.Begin()
         #-----------------------------------------------------------------------
         # Get data from trainer
         #-----------------------------------------------------------------------
@@ -569,16 +592,16 @@ def Runoff(FortiusAntGui):
                 if TacxTrainer.SpeedKmh <= clv.RunoffMaxSpeed - clv.RunoffDip:
                     # rolldown timer starts when dips below 38
                     if rolldown_time == 0:
-                        rolldown_time = time.time()
+                        rolldown_time = cycleClock.Time()
                     FortiusAntGui.SetMessages(Tacx=ShortMessage + \
                                         "KEEP STILL, Rolldown timer %s seconds" % \
-                                        ( round((time.time() - rolldown_time),1) ) \
+                                        ( round((cycleClock.Time() - rolldown_time),1) ) \
                                     )
           
                 if TacxTrainer.SpeedKmh < clv.RunoffMinSpeed :  # wheel almost stopped
                     FortiusAntGui.SetMessages(Tacx=ShortMessage + \
                                         "Rolldown time = %s seconds (aim %s s)" % \
-                                        (round((time.time() - rolldown_time),1), clv.RunoffTime) \
+                                        (round((cycleClock.Time() - rolldown_time),1), clv.RunoffTime) \
                                     )
 
                 if TacxTrainer.SpeedKmh < 0.1 :                 # wheel stopped
@@ -613,7 +636,7 @@ def Runoff(FortiusAntGui):
                 pdaInfo = []
 
             # Store data for analysis until next signal
-            pdaInfo.append((time.time(), TacxTrainer.CurrentPower)) 
+            pdaInfo.append((cycleClock.Time(), TacxTrainer.CurrentPower)) 
             LastPedalEcho = TacxTrainer.PedalEcho
             
             if TacxTrainer.CurrentPower > 50 and TacxTrainer.Cadence > 30:
@@ -634,17 +657,8 @@ def Runoff(FortiusAntGui):
         #-----------------------------------------------------------------------
         # WAIT untill CycleTime is done
         #-----------------------------------------------------------------------
-        ElapsedTime = time.time() - StartTime
-        SleepTime = CycleTime - ElapsedTime
-        if SleepTime > 0:
-            time.sleep(SleepTime)
-            if debug.on(debug.Data2):
-                logfile.Write ("Sleep(%4.2f) to fill %s seconds done." % (SleepTime, CycleTime) )
-        else:
-            if ElapsedTime > CycleTime * 2 and debug.on(debug.Any):
-                logfile.Write ("Runoff; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % (ElapsedTime, SleepTime * -1, CycleTime) )
-            pass
-        
+        LoopClock.Wait()
+
     #---------------------------------------------------------------------------
     # Finalize
     #---------------------------------------------------------------------------
@@ -706,26 +720,10 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     CassetteIndex  = clv.CassetteStart
 
     #---------------------------------------------------------------------------
-    # Command status data
+    # Command status data (page 71) for FE-C and ANT Control
     #---------------------------------------------------------------------------
-    p71_LastReceivedCommandID   = 255
-    p71_SequenceNr              = 255
-    p71_CommandStatus           = 255
-    p71_Data1                   = 0xff
-    p71_Data2                   = 0xff
-    p71_Data3                   = 0xff
-    p71_Data4                   = 0xff
-
-    #---------------------------------------------------------------------------
-    # Command status data for ANT Control
-    #---------------------------------------------------------------------------
-    ctrl_p71_LastReceivedCommandID   = 255
-    ctrl_p71_SequenceNr              = 255
-    ctrl_p71_CommandStatus           = 255
-    ctrl_p71_Data1                   = 0xff
-    ctrl_p71_Data2                   = 0xff
-    ctrl_p71_Data3                   = 0xff
-    ctrl_p71_Data4                   = 0xff
+    p71_FE   = ant.clsCommandStatus(ant.channel_FE)
+    p71_CTRL = ant.clsCommandStatus(ant.channel_CTRL)
 
     ctrl_Commands = []  # Containing tuples (manufacturer, serial, CommandNr)
 
@@ -875,11 +873,12 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                         # This will not cause the countdown to take longer,
                         # it only extends the maximum time untill a stable reading.
     CountDown             = 120 * CountDownX # 2 minutes; 120 is the max on the cadence meter
-    ResistanceArray       = numpy.array([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]) # Array for calculating running average
-    AvgResistanceArray    = numpy.array([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]) # Array for collating running averages
+    Resistance            = ringStatistics.clsRingStatistics(20, 0) # For calculating running average
+    AvgResistance         = ringStatistics.clsRingStatistics(20, 0) # For collating running averages
     TacxTrainer.Calibrate = 0
     StartPedaling         = True
     Counter               = 0
+    LoopClock             = cycleClock.clsCycleClock(0.25, 'Calibrate') # 4 x per second
 
     bleEvent              = False
     antEvent              = False
@@ -899,7 +898,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
               and     TacxTrainer.Calibrate == 0 \
               and     TacxTrainer.CalibrateSupported() \
               and not Restart:
-            StartTime = time.time()
+            LoopClock.Begin()
             #-------------------------------------------------------------------
             # Receive / Send trainer
             #-------------------------------------------------------------------
@@ -954,15 +953,12 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                 # At least 30 seconds but not longer than the countdown time (8 minutes)
                 # Note that the limits are empiracally established.
                 # --------------------------------------------------------------
-                ResistanceArray = numpy.append(ResistanceArray, TacxTrainer.CurrentResistance * -1) # Add new instantaneous value to array
-                ResistanceArray = numpy.delete(ResistanceArray, 0)                      # Remove oldest from array
+                Resistance.Add(TacxTrainer.CurrentResistance * -1)  # Add new instantaneous value, remove oldest
+                AvgResistance.Add(Resistance.Mean())                # Add new running average value, remove oldest
 
-                AvgResistanceArray = numpy.append(AvgResistanceArray, numpy.average(ResistanceArray)) # Add new running average value to array
-                AvgResistanceArray = numpy.delete(AvgResistanceArray, 0) # Remove oldest from array
-                
-                if CountDown < (120 * CountDownX - 30) and numpy.min(ResistanceArray) > 0:
-                    if (numpy.max(AvgResistanceArray) - numpy.min(AvgResistanceArray) ) < 2 or CountDown <= 0:
-                        TacxTrainer.Calibrate = int(numpy.average(AvgResistanceArray))
+                if CountDown < (120 * CountDownX - 30) and Resistance.Min() > 0:
+                    if AvgResistance.Stable(2) or CountDown <= 0:
+                        TacxTrainer.Calibrate = int(AvgResistance.Mean())
                         if debug.on(debug.Function):
                             logfile.Write( "Calibration stopped with resistance=%s after %s seconds" % \
                                            (TacxTrainer.Calibrate, int(120 * CountDownX - CountDown) ) )
@@ -985,8 +981,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             #-------------------------------------------------------------------
             # WAIT        So we do not cycle faster than 4 x per second
             #-------------------------------------------------------------------
-            SleepTime = 0.25 - (time.time() - StartTime)
-            if SleepTime > 0: time.sleep(SleepTime)
+            LoopClock.Wait()
     except KeyboardInterrupt:
         logfile.Console ("Stopped")
     except Exception as e:
@@ -1027,8 +1022,6 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     TargetPowerTime         = 0             # Time that last TargetPower received
     PowerModeActive         = ''            # Text showing in userinterface
     
-    LastANTtime             = 0             # ANT+ interface is sent/received only
-                                            # every 250ms
 
     #---------------------------------------------------------------------------
     # Initialize antHRM and antFE module
@@ -1051,6 +1044,14 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     else:
         CycleTime = CycleTimeANT    # Seconds, default = 0.25 (inspired by 4Hz ANT+)
 
+    #---------------------------------------------------------------------------
+    # The cycle and the ANT+ interface (sent/received only every 250ms) are
+    # timed with absolute deadlines, so that the broadcast does not drift.
+    # When late, missed deadlines are skipped (the 4Hz grid is kept).
+    #---------------------------------------------------------------------------
+    LoopClock = cycleClock.clsCycleClock(CycleTime,    'Tacx2Dongle')
+    AntClock  = cycleClock.clsCycleClock(CycleTimeANT, 'Tacx2Dongle ANT')
+
     #---------------------------------------------------------------------------
     # ANT-, BLE- devices are active from here (after calibration!)
     #---------------------------------------------------------------------------
@@ -1062,12 +1063,478 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     ActivationMsg = '---------- %sdevices are activated ----------' % s
     if not Restart:
         logfile.Console (ActivationMsg)
+        if clv.ProfileStartup:
+            lazyImport.Report('devices are activated')
 
     #---------------------------------------------------------------------------
     # NOTE: If MAY BE that there is not an ANT nor BLE interface active and we 
     #      still continue. This exception is not handled and we continue "idle".
     #---------------------------------------------------------------------------
 
+    #---------------------------------------------------------------------------
+    # ANT message handlers
+    #
+    # Here all response from the ANT dongle are processed.
+    #
+    # Commands from dongle that are expected are:
+    # - TargetGradeFromDongle or TargetPowerFromDongle
+    # - Information from HRM (if paired)
+    # - Information from i-Vortex (if paired)
+    #
+    # Each handler is registered at the Router for (id, channel, page) and
+    # returns True when the message is handled. The Router decomposes each
+    # message once and finds the handler with a dictionary lookup, so that
+    # handling a message does not take longer when channels are added.
+    # The trainer (Vortex, Genius, Bushido) and BlackTrack register themselves
+    # for their own channel(s).
+    # Burst packets are reassembled by Burst; a complete transfer is given to
+    # the handler registered with Burst.Register(Handler, Channel).
+    # With constants.UseAntTxScheduler, the broadcasts of the master channels
+    # are sent by TxScheduler when the dongle reports EVENT_TX for the channel,
+    # instead of all together every 250ms.
+    #---------------------------------------------------------------------------
+    Router = ant.clsAntRouter(PrintWarnings)
+    Burst  = ant.clsAntBurst()
+    TxScheduler = ant.clsAntTxScheduler() if constants.UseAntTxScheduler else None
+
+    #---------------------------------------------------------------------------
+    # Reply a data page, requested with page 70, NrTimes
+    #---------------------------------------------------------------------------
+    def SendRequestedPage(info, NrTimes):
+        d = ant.ComposeMessage (ant.msgID_BroadcastData, info)
+        AntDongle.Write([d] * NrTimes, False)
+
+    #---------------------------------------------------------------------------
+    # AcknowledgedData = Slave -> Master
+    #       channel_FE = From CTP (Trainer Road, Zwift) --> Tacx
+    #---------------------------------------------------------------------------
+    def FE_Command():
+        nonlocal antEvent, CTPcommandTime
+        antEvent       = True
+        CTPcommandTime = cycleClock.Time()
+
+    #---------------------------------------------------------------------------
+    # Data page 48 (0x30) Basic resistance
+    #---------------------------------------------------------------------------
+    def FE_Page48_BasicResistance(m):
+        FE_Command()
+        # logfile.Console('Data page 48 Basic mode not implemented')
+        # I never saw this appear anywhere (2020-05-08)
+        # TargetMode            = mode_Basic
+        # TargetGradeFromDongle = 0
+        # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
+
+        # 2020-11-04 as requested in issue 119
+        # The percentage is used to calculate grade 0...20%
+        Grade = ant.msgUnpage48_BasicResistance(m.info) * 20
+
+        # Implemented for Magnetic Brake:
+        # - grade is NOT shifted with GradeShift (here never negative)
+        # - but is reduced with factor
+        # - and is NOT reduced with factorDH since never negative
+        Grade *= clv.GradeFactor
+
+        TacxTrainer.SetGrade(Grade)
+        TacxTrainer.SetRollingResistance(0.004)
+        TacxTrainer.SetWind(0.51, 0.0, 1.0)
+
+        # Update "last command" data in case page 71 is requested later
+        p71_FE.Update(m.DataPageNumber, 0xff, 0xff, 0xff, \
+                      m.info[8])                        # target resistance
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 49 (0x31) Target Power
+    #---------------------------------------------------------------------------
+    def FE_Page49_TargetPower(m):
+        nonlocal TargetPowerTime
+        FE_Command()
+        TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(m.info))
+        TargetPowerTime = cycleClock.Time()
+        if False and clv.PowerMode and debug.on(debug.Application):
+            logfile.Write('PowerMode: TargetPower info received - timestamp set')
+
+        # Update "last command" data in case page 71 is requested later
+        p71_FE.Update(m.DataPageNumber, 0xff, 0xff, \
+                      m.info[7], \
+                      m.info[8])                        # target power (LSB, MSB)
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 50 (0x32) Wind Resistance
+    #---------------------------------------------------------------------------
+    def FE_Page50_WindResistance(m):
+        FE_Command()
+        WindResistance, WindSpeed, DraftingFactor = \
+            ant.msgUnpage50_WindResistance(m.info)
+        TacxTrainer.SetWind(WindResistance, WindSpeed, DraftingFactor)
+
+        # Update "last command" data in case page 71 is requested later
+        p71_FE.Update(m.DataPageNumber, 0xff, \
+                      m.info[6], \
+                      m.info[7], \
+                      m.info[8])    # wind resistance coefficient, wind speed, drafting factor
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 51 (0x33) Track resistance
+    #---------------------------------------------------------------------------
+    def FE_Page51_TrackResistance(m):
+        nonlocal PowerModeActive
+        FE_Command()
+        if clv.PowerMode and (cycleClock.Time() - TargetPowerTime) < 30:
+            #-------------------------------------------------------------------
+            # In PowerMode, TrackResistance is ignored
+            #       (for xx seconds after the last power-command)
+            # So if TrainerRoad is used simultaneously with
+            #       Zwift/Rouvythe power commands from TR
+            #       take precedence over Zwift/Rouvy and a
+            #       power-training can be done while riding
+            #       a Zwift/Rouvy simulation/video!
+            # When TrainerRoad is finished, the Track
+            #       resistance is active again
+            #-------------------------------------------------------------------
+            PowerModeActive = ' [P]'
+            if False and clv.PowerMode and debug.on(debug.Application):
+                logfile.Write('PowerMode: Grade info ignored')
+            pass
+        else:
+            Grade, RollingResistance = ant.msgUnpage51_TrackResistance(m.info)
+
+            #-------------------------------------------------------------------
+            # Implemented when implementing Magnetic Brake:
+            # [-] grade is shifted with GradeShift (-10% --> 0) ]
+            # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
+            # - and reduced with factorDH (for downhill only)
+            #
+            # GradeAdjust is valid for all configurations!
+            #
+            # GradeShift is not expected to be used anymore,
+            # and only left from earliest implementations
+            # to avoid it has to be re-introduced in future again.
+            #-------------------------------------------------------------------
+            Grade += clv.GradeShift
+            Grade *= clv.GradeFactor
+            if Grade < 0: Grade *= clv.GradeFactorDH
+
+            TacxTrainer.SetGrade(Grade)
+            TacxTrainer.SetRollingResistance(RollingResistance)
+            PowerModeActive       = ''
+
+        # Update "last command" data in case page 71 is requested later
+        p71_FE.Update(m.DataPageNumber, 0xff, \
+                      m.info[6], \
+                      m.info[7], \
+                      m.info[8])    # target grade (LSB, MSB), rolling resistance coefficient
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 55 User configuration
+    #---------------------------------------------------------------------------
+    def FE_Page55_UserConfiguration(m):
+        FE_Command()
+        UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio = \
+            ant.msgUnpage55_UserConfiguration(m.info)
+        TacxTrainer.SetUserConfiguration(UserWeight, \
+            BicycleWeight, BicycleWheelDiameter, GearRatio)
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 70 Request data page
+    #---------------------------------------------------------------------------
+    def FE_Page70_RequestDataPage(m):
+        FE_Command()
+        _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
+            _AckRequired, NrTimes, RequestedPageNumber, \
+            _CommandType = ant.msgUnpage70_RequestDataPage(m.info)
+
+        info = False
+        if   RequestedPageNumber == 54:
+            # Capabilities;
+            # bit 0 = Basic mode
+            # bit 1 = Target/Power/Ergo mode
+            # bit 2 = Simulation/Restance/Slope mode
+            info = ant.msgPage54_FE_Capabilities(ant.channel_FE, 0xff, 0xff, 0xff, 0xff, 1000, 0x07)
+
+        elif RequestedPageNumber == 71:
+            info = p71_FE.Page()
+
+        elif RequestedPageNumber == 80:
+            info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
+                ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
+
+        elif RequestedPageNumber == 81:
+            info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
+                ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
+
+        elif RequestedPageNumber == 82:
+            info = ant.msgPage82_BatteryStatus(ant.channel_FE)
+
+        else:
+            Router.Log(m, "Requested page not suported")
+
+        if info != False:
+            SendRequestedPage(info, NrTimes)
+        return True
+
+    #---------------------------------------------------------------------------
+    # Other data pages, page 252 ????
+    #---------------------------------------------------------------------------
+    def FE_OtherPage(m):
+        FE_Command()
+        if m.DataPageNumber == 252 and (PrintWarnings or debug.on(debug.Data1)):
+            logfile.Write('FE data page 252 ignored. info=%s' % logfile.HexSpace(m.info))
+        else:
+            Router.Log(m, "Unknown FE data page")
+        return True
+
+    #---------------------------------------------------------------------------
+    # Control Channel inputs
+    # Data page 73 (0x53) Generic Command
+    #---------------------------------------------------------------------------
+    def CTRL_Page73_GenericCommand(m):
+        ctrl_SlaveSerialNumber, ctrl_SlaveManufacturerID, SequenceNr, ctrl_CommandNr =\
+            ant.msgUnpage73_GenericCommand(m.info)
+
+        # Update "last command" data in case page 71 is requested later
+        p71_CTRL.Update(m.DataPageNumber, \
+                         ctrl_CommandNr & 0x00ff, \
+                        (ctrl_CommandNr & 0xff00) >> 8, \
+                        0xff, 0xff, SequenceNr)
+
+        #-----------------------------------------------------------------------
+        # Commands should not overwrite, therefore stored
+        # in a table as tuples.
+        #-----------------------------------------------------------------------
+        ctrl_Commands.append((ctrl_SlaveManufacturerID, ctrl_SlaveSerialNumber, ctrl_CommandNr))
+        CommandName = ctrl.CommandName.get(ctrl_CommandNr, 'Unknown')
+        if debug.on(debug.Application):
+            logfile.Print(f"ANT+ Control {ctrl_SlaveManufacturerID} {ctrl_SlaveSerialNumber}: Received command {ctrl_CommandNr} = {CommandName} ")
+        return True
+
+    #---------------------------------------------------------------------------
+    # Data page 70 Request data page
+    #---------------------------------------------------------------------------
+    def CTRL_Page70_RequestDataPage(m):
+        _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
+            _AckRequired, NrTimes, RequestedPageNumber, \
+            _CommandType = ant.msgUnpage70_RequestDataPage(m.info)
+
+        if RequestedPageNumber == 71:
+            SendRequestedPage(p71_CTRL.Page(), NrTimes)
+        else:
+            Router.Log(m, "Requested page not suported")
+        return True
+
+    def CTRL_OtherPage(m):
+        Router.Log(m, "Unknown Control data page")
+        return True
+
+    #---------------------------------------------------------------------------
+    # BroadcastData = Master -> Slave
+    #       channel_HRM_s = Heartbeat received from HRM
+    #---------------------------------------------------------------------------
+    def HRM_Broadcast(m):
+        nonlocal HeartRate, HeartRateTime
+        #-----------------------------------------------------------------------
+        # Ask what device is paired
+        #-----------------------------------------------------------------------
+        if not AntHRMpaired:
+            msg = ant.msg4D_RequestMessage(ant.channel_HRM_s, ant.msgID_ChannelID)
+            AntDongle.Write([msg], False)
+
+        #-----------------------------------------------------------------------
+        # Data page 0...4 HRM data
+        # Only expected when -H flag specified
+        # #383/3 datapage 64 added, because of @krusty82's
+        #        ANT+ HRM from Ciclosport...
+        # Data page 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
+        #        Added to previous set, provides HR info
+        #-----------------------------------------------------------------------
+        if m.DataPageNumber & 0x7f in (0,1,2,3,4,5,6,7,64,89,95):
+            _Channel, _DataPageNumber, _Spec1, _Spec2, _Spec3, \
+                _HeartBeatEventTime, _HeartBeatCount, HeartRate = \
+                ant.msgUnpage_Hrm(m.info)
+            HeartRateTime = cycleClock.Time() #381/4
+            # logfile.Console('Heartrate received from HRM: %d' % HeartRate)
+
+        #-----------------------------------------------------------------------
+        # Other data pages
+        #-----------------------------------------------------------------------
+        else: Router.Log(m, "Unknown HRM data page")
+        return True
+
+    #---------------------------------------------------------------------------
+    # Speed Cadence Sensor inputs
+    #       channel_SCS = Speed/Cadence received from SCS
+    #---------------------------------------------------------------------------
+    def SCS_Broadcast(m):
+        #-----------------------------------------------------------------------
+        # Data page 0 CSC data
+        # Only expected when -S flag specified
+        #-----------------------------------------------------------------------
+        if False:
+            pass
+#scs    elif clv.scs >= 0 and m.DataPageNumber & 0x7f == 0:
+#scs        Channel, DataPageNumber, BikeCadenceEventTime, \
+#scs            CumulativeCadenceRevolutionCount, BikeSpeedEventTime, \
+#scs            CumulativeSpeedRevolutionCount = \
+#scs            ant.msgUnpage0_CombinedSpeedCadence(m.info)
+#scs        SpeedKmh   = ...
+#scs        Cadence    = ...
+
+        #-----------------------------------------------------------------------
+        # Other data pages
+        #-----------------------------------------------------------------------
+        else: Router.Log(m, "Unknown SCS data page")
+        return True
+
+    #---------------------------------------------------------------------------
+    # ChannelID - the info that a master on the network is paired
+    #---------------------------------------------------------------------------
+    def ChannelID(m):
+        nonlocal AntHRMpaired
+        Channel, DeviceNumber, DeviceTypeID, _TransmissionType = \
+            ant.unmsg51_ChannelID(m.info)
+
+        if DeviceNumber == 0:   # No device paired, ignore
+            pass
+
+        elif Channel == ant.channel_HRM_s and DeviceTypeID == ant.DeviceTypeID_HRM:
+            AntHRMpaired = True
+            FortiusAntGui.SetMessages(HRM='Heart Rate Monitor paired: %s' % DeviceNumber)
+            # logfile.Console('Heart Rate Monitor paired: %s' % DeviceNumber)
+
+        elif Channel == ant.channel_CTRL:
+            pass # Ignore since 2022-08-22; to be investigated
+                 # Obviously message was dropped before
+
+        else:
+            logfile.Console('Unexpected device %s on channel %s' % (DeviceNumber, Channel))
+        return True
+
+    #---------------------------------------------------------------------------
+    # Message ChannelResponse, acknowledges a message
+    # A failed burst transfer is discarded, other responses are ignored
+    #---------------------------------------------------------------------------
+    def ChannelResponse(m):
+        Burst.ChannelResponse(m)
+        return True
+
+    #---------------------------------------------------------------------------
+    # Broadcast messages, created when the channel is due (TxScheduler)
+    #---------------------------------------------------------------------------
+    def HRM_Payload():
+        if TacxTrainer.HeartRate > 0:
+            return hrm.BroadcastHeartrateMessage(HeartRate)
+        return None
+
+    def PWR_Payload():
+        return pwr.BroadcastMessage(TacxTrainer.CurrentPower, TacxTrainer.Cadence)
+
+    def SCS_Payload():
+        return scs.BroadcastMessage(TacxTrainer.PedalEchoTime, TacxTrainer.PedalEchoCount, \
+                                    TacxTrainer.VirtualSpeedKmh, TacxTrainer.Cadence)
+
+    def CTRL_Payload():
+        return ctrl.BroadcastControlMessage()
+
+    def FE_Payload():
+        return fe.BroadcastTrainerDataMessage(TacxTrainer.Cadence, \
+                    TacxTrainer.CurrentPower, TacxTrainer.SpeedKmh, HeartRate)
+
+    def TxScheduled():
+        nonlocal flush
+        messages = TxScheduler.Messages()
+        if messages:
+            AntDongle.Write(messages, True, False, flush)
+            flush = False
+
+    #---------------------------------------------------------------------------
+    # Commands from the Bluetooth interface
+    #
+    # When data is received, TacxTrainer parameters are copied from
+    # the bleCTP object.
+    #---------------------------------------------------------------------------
+    def BleCommands():
+        nonlocal bleEvent, CTPcommandTime, TargetPowerTime
+        bleCTP.CommandReceived = False
+        if bleCTP.Refresh():
+            bleEvent = True
+            CTPcommandTime = cycleClock.Time()
+            if bleCTP.TargetMode == mode_Power:
+                TargetPowerTime = cycleClock.Time()
+                TacxTrainer.SetPower(bleCTP.TargetPower)
+
+            if bleCTP.TargetMode == mode_Grade:
+                if clv.PowerMode and (cycleClock.Time() - TargetPowerTime) < 30:
+                    pass
+                else:
+                    Grade  = bleCTP.TargetGrade
+                    Grade += clv.GradeShift
+                    Grade *= clv.GradeFactor
+                    if Grade < 0: Grade *= clv.GradeFactorDH
+
+                    TacxTrainer.SetGrade(Grade)
+
+            if bleCTP.WindResistance and bleCTP.WindSpeed and bleCTP.DraftingFactor:
+                TacxTrainer.SetWind(bleCTP.WindResistance, bleCTP.WindSpeed, bleCTP.DraftingFactor)
+
+            if bleCTP.RollingResistance:
+                TacxTrainer.SetRollingResistance(bleCTP.RollingResistance)
+
+    #---------------------------------------------------------------------------
+    # Register the handlers
+    #---------------------------------------------------------------------------
+    ack = ant.msgID_AcknowledgedData
+    Router.Register(FE_Page48_BasicResistance,   ack, ant.channel_FE, 48)
+    Router.Register(FE_Page49_TargetPower,       ack, ant.channel_FE, 49)
+    Router.Register(FE_Page50_WindResistance,    ack, ant.channel_FE, 50)
+    Router.Register(FE_Page51_TrackResistance,   ack, ant.channel_FE, 51)
+    Router.Register(FE_Page55_UserConfiguration, ack, ant.channel_FE, 55)
+    Router.Register(FE_Page70_RequestDataPage,   ack, ant.channel_FE, 70)
+    Router.Register(FE_OtherPage,                ack, ant.channel_FE)
+
+    Router.Register(CTRL_Page73_GenericCommand,  ack, ant.channel_CTRL, 73)
+    Router.Register(CTRL_Page70_RequestDataPage, ack, ant.channel_CTRL, 70)
+    Router.Register(CTRL_OtherPage,              ack, ant.channel_CTRL)
+
+    if clv.hrm != None and clv.hrm >= 0:
+        Router.Register(HRM_Broadcast, ant.msgID_BroadcastData, ant.channel_HRM_s)
+
+    if clv.scs != None:
+        Router.Register(SCS_Broadcast, ant.msgID_BroadcastData, ant.channel_SCS_s)
+
+    Router.Register(ChannelID, ant.msgID_ChannelID)
+    Router.Register(ChannelResponse, ant.msgID_ChannelResponse)
+    Router.Register(Burst.Dispatch, ant.msgID_BurstData) # Reassembled, no
+                                                # channel handlers (yet)
+
+    if TxScheduler:
+        if clv.hrm == None:
+            TxScheduler.Register(HRM_Payload,  ant.channel_HRM)
+        TxScheduler.Register(PWR_Payload,      ant.channel_PWR)
+        if clv.scs == None:
+            TxScheduler.Register(SCS_Payload,  ant.channel_SCS)
+        TxScheduler.Register(CTRL_Payload,     ant.channel_CTRL)
+        TxScheduler.Register(FE_Payload,       ant.channel_FE)
+        for Channel in TxScheduler.Providers:
+            Router.Register(TxScheduler.Dispatch, ant.msgID_ChannelResponse, Channel)
+
+    TacxTrainer.RegisterANThandlers(Router)     # Vortex, Genius, Bushido
+
+    if BlackTrack is not None:
+        BlackTrack.RegisterAntHandlers(Router)
+
+    #---------------------------------------------------------------------------
+    # The ANT read thread and the Bluetooth server signal Wakeup when data is
+    # received, so that the main loop does not sleep until the end of the cycle
+    # but handles the command right away.
+    #---------------------------------------------------------------------------
+    Wakeup.clear()
+    AntDongle.Wakeup = Wakeup
+    bleCTP.Wakeup    = Wakeup
+
     #---------------------------------------------------------------------------
     # Our main loop!
     # The loop has the following phases
@@ -1085,18 +1552,16 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     TacxMessage           = ''
     if debug.on(debug.Function): logfile.Write('Tacx2Dongle; start main loop')
     rpi.DisplayState(constants.faOperational, TacxTrainer)
+    if constants.UseTrainerThread:
+        TacxTrainer.StartIOthread()     # Refresh() does not wait for trainer
     try:
         while FortiusAntGui.RunningSwitch == True and not AntDongle.DongleReconnected:
-            StartTime = time.time()
+            StartTime = LoopClock.Begin()
             #-------------------------------------------------------------------
             # ANT process is done once every 250ms
             # In case of PedalStrokeAnalysis, check whether it's time for ANT
             #-------------------------------------------------------------------
-            if CycleTime == CycleTimeANT or (time.time() - LastANTtime) > 0.25:
-                LastANTtime = time.time()
-                QuarterSecond = True
-            else:
-                QuarterSecond = False 
+            QuarterSecond = AntClock.Due(StartTime)
 
             #-------------------------------------------------------------------
             # Get data from trainer (Receive + Calc + Send)
@@ -1149,13 +1614,13 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             #-------------------------------------------------------------------
             if clv.hrm == None:
                 HeartRate     = TacxTrainer.HeartRate
-                HeartRateTime = time.time()                   #381/4
+                HeartRateTime = cycleClock.Time()             #381/4
                 # logfile.Console('Use heartrate from trainer %d' % HeartRate)
 
             #-------------------------------------------------------------------
             # #381/4 If NO HeartRate received, set to 0
             #-------------------------------------------------------------------
-            if HeartRate and (time.time() - HeartRateTime) > 5:
+            if HeartRate and (cycleClock.Time() - HeartRateTime) > 5:
                 # logfile.Console('No Heartrate received for 5 seconds')
                 HeartRate     = 0
                 HeartRateTime = 0
@@ -1204,7 +1669,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                     #    (TacxTrainer.Cadence, len(pdaInfo), pdaInfo[0][0]))
 
                     pdaInfo = []
-                pdaInfo.append((time.time(), TacxTrainer.CurrentPower)) # Store data for analysis
+                pdaInfo.append((cycleClock.Time(), TacxTrainer.CurrentPower)) # Store data for analysis
                 LastPedalEcho = TacxTrainer.PedalEcho                   # until next signal
 
             #-------------------------------------------------------------------
@@ -1254,7 +1719,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # TargetPower and TargetGrade are set in this section only!
             #-------------------------------------------------------------------
             ReductionChanged = False
-            if clv.homeTrainer and not (time.time() - CTPcommandTime) < 30:
+            if clv.homeTrainer and not (cycleClock.Time() - CTPcommandTime) < 30:
                 # In homeTrainer mode, buttons are only valid when no CTP active
                 if   TacxTrainer.Buttons == usbTrainer.EnterButton:     pass
                 elif TacxTrainer.Buttons == usbTrainer.DownButton:      TacxTrainer.MultiplyPower(1 / 1.1)
@@ -1353,7 +1818,6 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # Do ANT/BLE work every 1/4 second
             #-------------------------------------------------------------------
             messages = []       # messages to be sent to ANT
-            data = []           # responses received from ANT
             if QuarterSecond:
                 # LastANTtime = time.time()         # 2020-11-13 removed since duplicate
                 #---------------------------------------------------------------
@@ -1361,41 +1825,45 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                 #---------------------------------------------------------------
 
                 #---------------------------------------------------------------
-                # Broadcast Heartrate message
+                # With TxScheduler the broadcasts are done on EVENT_TX, below
                 #---------------------------------------------------------------
-                if clv.hrm == None and TacxTrainer.HeartRate > 0:
-                    messages.append(hrm.BroadcastHeartrateMessage(HeartRate))
+                if TxScheduler is None:
+                    #-----------------------------------------------------------
+                    # Broadcast Heartrate message
+                    #-----------------------------------------------------------
+                    if clv.hrm == None and TacxTrainer.HeartRate > 0:
+                        messages.append(hrm.BroadcastHeartrateMessage(HeartRate))
 
-                #---------------------------------------------------------------
-                # Broadcast Bike Power message
-                #---------------------------------------------------------------
-                if True:
-                    messages.append(pwr.BroadcastMessage( \
-                        TacxTrainer.CurrentPower, TacxTrainer.Cadence))
+                    #-----------------------------------------------------------
+                    # Broadcast Bike Power message
+                    #-----------------------------------------------------------
+                    if True:
+                        messages.append(pwr.BroadcastMessage( \
+                            TacxTrainer.CurrentPower, TacxTrainer.Cadence))
 
-                #---------------------------------------------------------------
-                # Broadcast Speed and Cadence Sensor message
-                #---------------------------------------------------------------
-                if clv.scs == None:
-                    messages.append(scs.BroadcastMessage( \
-                        TacxTrainer.PedalEchoTime, TacxTrainer.PedalEchoCount, \
-                        TacxTrainer.VirtualSpeedKmh, TacxTrainer.Cadence))
+                    #-----------------------------------------------------------
+                    # Broadcast Speed and Cadence Sensor message
+                    #-----------------------------------------------------------
+                    if clv.scs == None:
+                        messages.append(scs.BroadcastMessage( \
+                            TacxTrainer.PedalEchoTime, TacxTrainer.PedalEchoCount, \
+                            TacxTrainer.VirtualSpeedKmh, TacxTrainer.Cadence))
 
-                #---------------------------------------------------------------
-                # Broadcast Controllable message
-                #---------------------------------------------------------------
-                if True:
-                    messages.append(ctrl.BroadcastControlMessage())
+                    #-----------------------------------------------------------
+                    # Broadcast Controllable message
+                    #-----------------------------------------------------------
+                    if True:
+                        messages.append(ctrl.BroadcastControlMessage())
 
-                #---------------------------------------------------------------
-                # Broadcast TrainerData message to the CTP (Trainer Road, ...)
-                # #381/5 The heartrate that is displayed (HeartRate) is transmitted
-                #      to FE-C; this is either from HRM or Trainer.
-                #      Initially, TacxTrainer.HeartRate was always used.
-                #---------------------------------------------------------------
-                # print('fe.BroadcastTrainerDataMessage', Cadence, CurrentPower, SpeedKmh, HeartRate)
-                messages.append(fe.BroadcastTrainerDataMessage (TacxTrainer.Cadence, \
-                    TacxTrainer.CurrentPower, TacxTrainer.SpeedKmh, HeartRate))
+                    #-----------------------------------------------------------
+                    # Broadcast TrainerData message to the CTP (Trainer Road, ...)
+                    # #381/5 The heartrate that is displayed (HeartRate) is transmitted
+                    #      to FE-C; this is either from HRM or Trainer.
+                    #      Initially, TacxTrainer.HeartRate was always used.
+                    #-----------------------------------------------------------
+                    # print('fe.BroadcastTrainerDataMessage', Cadence, CurrentPower, SpeedKmh, HeartRate)
+                    messages.append(fe.BroadcastTrainerDataMessage (TacxTrainer.Cadence, \
+                        TacxTrainer.CurrentPower, TacxTrainer.SpeedKmh, HeartRate))
 
                 #---------------------------------------------------------------
                 # Send/receive to Bluetooth interface
@@ -1411,29 +1879,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                     if Steering is not None:
                         bleCTP.SetSteeringAngle(Steering.Angle)
 
-                    if bleCTP.Refresh():
-                        bleEvent = True
-                        CTPcommandTime = time.time()
-                        if bleCTP.TargetMode == mode_Power:
-                            TargetPowerTime = time.time()
-                            TacxTrainer.SetPower(bleCTP.TargetPower)
-
-                        if bleCTP.TargetMode == mode_Grade:
-                            if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
-                                pass
-                            else:
-                                Grade  = bleCTP.TargetGrade
-                                Grade += clv.GradeShift
-                                Grade *= clv.GradeFactor
-                                if Grade < 0: Grade *= clv.GradeFactorDH
-
-                                TacxTrainer.SetGrade(Grade)
-
-                        if bleCTP.WindResistance and bleCTP.WindSpeed and bleCTP.DraftingFactor:
-                            TacxTrainer.SetWind(bleCTP.WindResistance, bleCTP.WindSpeed, bleCTP.DraftingFactor)
-
-                        if bleCTP.RollingResistance:
-                            TacxTrainer.SetRollingResistance(bleCTP.RollingResistance)
+                    BleCommands()
 
             #-------------------------------------------------------------------
             # Broadcast and receive ANT+ responses
@@ -1442,433 +1888,66 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                 AntDongle.Write(messages, True, False, flush)
                 flush = False
                 # antEvent is not set here; only for data on FE-C channel
+            elif TxScheduler:
+                AntDongle.Read(False)   # EVENT_TX, when there is no read thread
 
             #-------------------------------------------------------------------
             # Here all response from the ANT dongle are processed (receive=True)
-            #
-            # Commands from dongle that are expected are:
-            # - TargetGradeFromDongle or TargetPowerFromDongle
-            # - Information from HRM (if paired)
-            # - Information from i-Vortex (if paired)
-            #
-            # Input is grouped by messageID, then channel. This has little
-            # practical impact; grouping by Channel would enable to handle all
-            # ANT in a channel (device) module. No advantage today.
+            # by the handlers, registered at the Router for the id/channel/page.
             #-------------------------------------------------------------------
-            while AntDongle.MessageQueueSize() > 0:
-                d = AntDongle.MessageQueueGet()
-
-                synch, length, id, info, checksum, _rest, Channel, DataPageNumber = ant.DecomposeMessage(d)
-                error = False
-
-                if clv.Tacx_Vortex or clv.Tacx_Genius or clv.Tacx_Bushido:
-                    if TacxTrainer.HandleANTmessage(d):
-                        continue                    # Message is handled or ignored
-
-                if BlackTrack is not None:
-                    if BlackTrack.HandleAntMessage(d):
-                        continue
-
-                #---------------------------------------------------------------
-                # AcknowledgedData = Slave -> Master
-                #       channel_FE = From CTP (Trainer Road, Zwift) --> Tacx 
-                #---------------------------------------------------------------
-                if id == ant.msgID_AcknowledgedData:
-                    #-----------------------------------------------------------
-                    # Fitness Equipment Channel inputs
-                    #-----------------------------------------------------------
-                    if Channel == ant.channel_FE:
-                        antEvent = True
-                        CTPcommandTime = time.time()
-                        #-------------------------------------------------------
-                        # Data page 48 (0x30) Basic resistance
-                        #-------------------------------------------------------
-                        if   DataPageNumber == 48:
-                            # logfile.Console('Data page 48 Basic mode not implemented')
-                            # I never saw this appear anywhere (2020-05-08)
-                            # TargetMode            = mode_Basic
-                            # TargetGradeFromDongle = 0
-                            # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
-
-                            # 2020-11-04 as requested in issue 119
-                            # The percentage is used to calculate grade 0...20%
-                            Grade = ant.msgUnpage48_BasicResistance(info) * 20
-
-                            # Implemented for Magnetic Brake:
-                            # - grade is NOT shifted with GradeShift (here never negative)
-                            # - but is reduced with factor
-                            # - and is NOT reduced with factorDH since never negative
-                            Grade *= clv.GradeFactor
-
-                            TacxTrainer.SetGrade(Grade)
-                            TacxTrainer.SetRollingResistance(0.004)
-                            TacxTrainer.SetWind(0.51, 0.0, 1.0)
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr              = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus           = 0     # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2                   = 0xff
-                            p71_Data3                   = 0xff
-                            p71_Data4                   = info[8]      # target resistance
-                            
-                        #-------------------------------------------------------
-                        # Data page 49 (0x31) Target Power
-                        #-------------------------------------------------------
-                        elif   DataPageNumber == 49:
-                            TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(info))
-                            TargetPowerTime = time.time()
-                            if False and clv.PowerMode and debug.on(debug.Application):
-                                logfile.Write('PowerMode: TargetPower info received - timestamp set')
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr              = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus           = 0     # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2                   = 0xff
-                            p71_Data3                   = info[7]       # target power (LSB)
-                            p71_Data4                   = info[8]       # target power (MSB)
-
-                        #-------------------------------------------------------
-                        # Data page 50 (0x32) Wind Resistance
-                        #-------------------------------------------------------
-                        elif   DataPageNumber == 50:
-                            WindResistance, WindSpeed, DraftingFactor = \
-                                ant.msgUnpage50_WindResistance(info)
-                            TacxTrainer.SetWind(WindResistance, WindSpeed, DraftingFactor)
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr              = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus           = 0     # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2                   = info[6]       # wind resistance coefficient
-                            p71_Data3                   = info[7]       # wind speed
-                            p71_Data4                   = info[8]       # drafting factor
-
-                        #-------------------------------------------------------
-                        # Data page 51 (0x33) Track resistance
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 51:
-                            if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
-                                #-----------------------------------------------
-                                # In PowerMode, TrackResistance is ignored
-                                #       (for xx seconds after the last power-command)
-                                # So if TrainerRoad is used simultaneously with
-                                #       Zwift/Rouvythe power commands from TR 
-                                #       take precedence over Zwift/Rouvy and a 
-                                #       power-training can be done while riding
-                                #       a Zwift/Rouvy simulation/video!
-                                # When TrainerRoad is finished, the Track
-                                #       resistance is active again
-                                #-----------------------------------------------
-                                PowerModeActive = ' [P]'
-                                if False and clv.PowerMode and debug.on(debug.Application):
-                                    logfile.Write('PowerMode: Grade info ignored')
-                                pass
-                            else:
-                                Grade, RollingResistance = ant.msgUnpage51_TrackResistance(info)
-
-                                #-----------------------------------------------
-                                # Implemented when implementing Magnetic Brake:
-                                # [-] grade is shifted with GradeShift (-10% --> 0) ]
-                                # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
-                                # - and reduced with factorDH (for downhill only)
-                                #
-                                # GradeAdjust is valid for all configurations!
-                                #
-                                # GradeShift is not expected to be used anymore,
-                                # and only left from earliest implementations
-                                # to avoid it has to be re-introduced in future again.
-                                #-----------------------------------------------
-                                Grade += clv.GradeShift
-                                Grade *= clv.GradeFactor
-                                if Grade < 0: Grade *= clv.GradeFactorDH
-
-                                TacxTrainer.SetGrade(Grade)
-                                TacxTrainer.SetRollingResistance(RollingResistance)
-                                PowerModeActive       = ''
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID   = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr              = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus           = 0     # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2                   = info[6]       # target grade (LSB)
-                            p71_Data3                   = info[7]       # target grade (MSB)
-                            p71_Data4                   = info[8]       # rolling resistance coefficient
-
-                        #-------------------------------------------------------
-                        # Data page 55 User configuration
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 55:
-                            UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio = \
-                                ant.msgUnpage55_UserConfiguration(info)
-                            TacxTrainer.SetUserConfiguration(UserWeight, \
-                                BicycleWeight, BicycleWheelDiameter, GearRatio)
-
-                        #-------------------------------------------------------
-                        # Data page 70 Request data page
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 70:
-                            _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
-                                _AckRequired, NrTimes, RequestedPageNumber, \
-                                _CommandType = ant.msgUnpage70_RequestDataPage(info)
-                            
-                            info = False
-                            if   RequestedPageNumber == 54:
-                                # Capabilities;
-                                # bit 0 = Basic mode
-                                # bit 1 = Target/Power/Ergo mode
-                                # bit 2 = Simulation/Restance/Slope mode
-                                info = ant.msgPage54_FE_Capabilities(ant.channel_FE, 0xff, 0xff, 0xff, 0xff, 1000, 0x07)
-
-                            elif RequestedPageNumber == 71:
-                                info = ant.msgPage71_CommandStatus(ant.channel_FE, p71_LastReceivedCommandID, \
-                                    p71_SequenceNr, p71_CommandStatus, p71_Data1, p71_Data2, p71_Data3, p71_Data4)
-
-                            elif RequestedPageNumber == 80:
-                                info = ant.msgPage80_ManufacturerInfo(ant.channel_FE, 0xff, 0xff, \
-                                    ant.HWrevision_FE, ant.Manufacturer_tacx, ant.ModelNumber_FE)
-
-                            elif RequestedPageNumber == 81:
-                                info = ant.msgPage81_ProductInformation(ant.channel_FE, 0xff, \
-                                    ant.SWrevisionSupp_FE, ant.SWrevisionMain_FE, ant.SerialNumber_FE)
-
-                            elif RequestedPageNumber == 82:
-                                info = ant.msgPage82_BatteryStatus(ant.channel_FE)
-
-                            else:
-                                error = "Requested page not suported"
-
-                            if info != False:
-                                data = []
-                                d    = ant.ComposeMessage (ant.msgID_BroadcastData, info)
-                                while (NrTimes):
-                                    data.append(d)
-                                    NrTimes -= 1
-                                AntDongle.Write(data, False)
-
-                        #-------------------------------------------------------
-                        # Data page 252 ????
-                        #-------------------------------------------------------
-                        elif DataPageNumber == 252 and (PrintWarnings or debug.on(debug.Data1)):
-                            logfile.Write('FE data page 252 ignored. info=%s' % logfile.HexSpace(info))
-                            pass
-                            
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown FE data page"
-
-                    #-----------------------------------------------------------
-                    # Control Channel inputs
-                    #-----------------------------------------------------------
-                    if Channel == ant.channel_CTRL:
-                        #-------------------------------------------------------
-                        # Data page 73 (0x53) Generic Command
-                        #-------------------------------------------------------
-                        if   DataPageNumber == 73:
-                            ctrl_SlaveSerialNumber, ctrl_SlaveManufacturerID, SequenceNr, ctrl_CommandNr =\
-                                ant.msgUnpage73_GenericCommand(info)
-
-                            # Update "last command" data in case page 71 is requested later
-                            ctrl_p71_LastReceivedCommandID = DataPageNumber
-                            ctrl_p71_SequenceNr = SequenceNr
-                            ctrl_p71_CommandStatus = 0      # successfully processed
-                            ctrl_p71_Data1 =  ctrl_CommandNr & 0x00ff
-                            ctrl_p71_Data2 = (ctrl_CommandNr & 0xff00) >> 8
-                            ctrl_p71_Data3 = 0xFF
-                            ctrl_p71_Data4 = 0xFF
-
-                            #---------------------------------------------------
-                            # Commands should not overwrite, therefore stored
-                            # in a table as tuples.
-                            #---------------------------------------------------
-                            ctrl_Commands.append((ctrl_SlaveManufacturerID, ctrl_SlaveSerialNumber, ctrl_CommandNr))
-                            CommandName = ctrl.CommandName.get(ctrl_CommandNr, 'Unknown')
-                            if debug.on(debug.Application):
-                                logfile.Print(f"ANT+ Control {ctrl_SlaveManufacturerID} {ctrl_SlaveSerialNumber}: Received command {ctrl_CommandNr} = {CommandName} ")
-
-                        # -------------------------------------------------------
-                        # Data page 70 Request data page
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 70:
-                            _SlaveSerialNumber, _DescriptorByte1, _DescriptorByte2, \
-                            _AckRequired, NrTimes, RequestedPageNumber, \
-                            _CommandType = ant.msgUnpage70_RequestDataPage(info)
-
-                            info = False
-                            if RequestedPageNumber == 71:
-                                info = ant.msgPage71_CommandStatus(ant.channel_CTRL, ctrl_p71_LastReceivedCommandID,
-                                                                   ctrl_p71_SequenceNr, ctrl_p71_CommandStatus,
-                                                                   ctrl_p71_Data1, ctrl_p71_Data2, ctrl_p71_Data3,
-                                                                   ctrl_p71_Data4)
-                            else:
-                                error = "Requested page not suported"
-
-                            if info != False:
-                                data = []
-                                d    = ant.ComposeMessage (ant.msgID_BroadcastData, info)
-                                while (NrTimes):
-                                    data.append(d)
-                                    NrTimes -= 1
-                                AntDongle.Write(data, False)
-
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown Control data page"
-
-                    #-----------------------------------------------------------
-                    # Unknown channel
-                    #-----------------------------------------------------------
-                    else: error="Unknown channel"
-
-                #---------------------------------------------------------------
-                # BroadcastData = Master -> Slave
-                #       channel_HRM_s = Heartbeat received from HRM
-                #       channel_SCS_s = Speed/Cadence received from SCS
-                #---------------------------------------------------------------
-                elif id == ant.msgID_BroadcastData:
-                    #-----------------------------------------------------------
-                    # Heart Rate Monitor inputs
-                    #-----------------------------------------------------------
-                    if Channel == ant.channel_HRM_s:
-                        #-------------------------------------------------------
-                        # Ask what device is paired
-                        #-------------------------------------------------------
-                        if not AntHRMpaired:
-                            msg = ant.msg4D_RequestMessage(ant.channel_HRM_s, ant.msgID_ChannelID)
-                            AntDongle.Write([msg], False)
-
-                        #-------------------------------------------------------
-                        # Data page 0...4 HRM data
-                        # Only expected when -H flag specified
-                        # #383/3 datapage 64 added, because of @krusty82's
-                        #        ANT+ HRM from Ciclosport...
-                        #-------------------------------------------------------
-                        if DataPageNumber & 0x7f in (0,1,2,3,4,5,6,7,64,89,95):
-                            if clv.hrm >= 0:
-                                _Channel, _DataPageNumber, _Spec1, _Spec2, _Spec3, \
-                                    _HeartBeatEventTime, _HeartBeatCount, HeartRate = \
-                                    ant.msgUnpage_Hrm(info)
-                                HeartRateTime = time.time() #381/4
-                                # logfile.Console('Heartrate received from HRM: %d' % HeartRate)
-
-                            else:
-                                pass                            # Ignore it
-                                
-                        #-------------------------------------------------------
-                        # Data page 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
-                        # Added to previous set, provides HR info
-                        #-------------------------------------------------------
-                        elif DataPageNumber in (89, 95):
-                            pass                                # Ignore it
-
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown HRM data page"
-
-                    #-----------------------------------------------------------
-                    # Speed Cadence Sensor inputs
-                    #-----------------------------------------------------------
-                    elif Channel == ant.channel_SCS:
-                        #-------------------------------------------------------
-                        # Data page 0 CSC data
-                        # Only expected when -S flag specified
-                        #-------------------------------------------------------
-                        if False:
-                            pass
-#scs                    elif clv.scs >= 0 and DataPageNumber & 0x7f == 0:
-#scs                        Channel, DataPageNumber, BikeCadenceEventTime, \
-#scs                            CumulativeCadenceRevolutionCount, BikeSpeedEventTime, \
-#scs                            CumulativeSpeedRevolutionCount = \
-#scs                            ant.msgUnpage0_CombinedSpeedCadence(info) 
-#scs                        SpeedKmh   = ...
-#scs                        Cadence    = ...
-
-                        #-------------------------------------------------------
-                        # Other data pages
-                        #-------------------------------------------------------
-                        else: error = "Unknown SCS data page"
-
-                    #-----------------------------------------------------------
-                    # Unknown channel
-                    #-----------------------------------------------------------
-                    else: error = "Unknown channel"
+            for message in AntDongle.MessageQueueDrain():
+                Router.Dispatch(message)
 
-                #---------------------------------------------------------------
-                # ChannelID - the info that a master on the network is paired
-                #---------------------------------------------------------------
-                elif id == ant.msgID_ChannelID:
-                    Channel, DeviceNumber, DeviceTypeID, _TransmissionType = \
-                        ant.unmsg51_ChannelID(info)
+            if TxScheduler: TxScheduled()
 
-                    if DeviceNumber == 0:   # No device paired, ignore
-                        pass
+            #-------------------------------------------------------------------
+            # WAIT untill CycleTime is done
+            #
+            # Meanwhile, when woken by the ANT read thread or Bluetooth server,
+            # handle the received commands and when the target changed, send
+            # it to the trainer immediately (not after up to 250ms).
+            # Broadcasting, display etc remain once per cycle.
+            #-------------------------------------------------------------------
+            ElapsedTime = LoopClock.End()
+            SleepTime   = LoopClock.Remaining()
+            if SleepTime > 0:
+                WaitTime = SleepTime
+                while SleepTime > 0 and FortiusAntGui.RunningSwitch and not AntDongle.DongleReconnected:
+                    if cycleClock.Wait(Wakeup, SleepTime):
+                        Wakeup.clear()
+                        Target = (TacxTrainer.TargetMode, TacxTrainer.TargetPowerProvided, \
+                                  TacxTrainer.TargetGrade, TacxTrainer.RollingResistance)
 
-                    elif Channel == ant.channel_HRM_s and DeviceTypeID == ant.DeviceTypeID_HRM:
-                        AntHRMpaired = True
-                        FortiusAntGui.SetMessages(HRM='Heart Rate Monitor paired: %s' % DeviceNumber)
-                        # logfile.Console('Heart Rate Monitor paired: %s' % DeviceNumber)
+                        for message in AntDongle.MessageQueueDrain():
+                            Router.Dispatch(message)
 
-                    elif Channel == ant.channel_CTRL:
-                        pass # Ignore since 2022-08-22; to be investigated
-                             # Obviously message was dropped before
+                        if TxScheduler: TxScheduled()
 
-                    else:
-                        logfile.Console('Unexpected device %s on channel %s' % (DeviceNumber, Channel))
+                        if clv.ble and bleCTP.CommandReceived:
+                            BleCommands()
 
-                #---------------------------------------------------------------
-                # Message ChannelResponse, acknowledges a message
-                #---------------------------------------------------------------
-                elif id == ant.msgID_ChannelResponse:
-                    Channel, _InitiatingMessageID, _ResponseCode = ant.unmsg64_ChannelResponse(info)
-                    pass
-                    
-                #---------------------------------------------------------------
-                # Message BurstData, ignored
-                #---------------------------------------------------------------
-                elif id == ant.msgID_BurstData:
-                    pass
-
-                else: error = "Unknown message ID"
-
-                #---------------------------------------------------------------
-                # Unsupported channel, message or page can be silently ignored
-                # Show WHAT we ignore, not to be blind for surprises!
-                #---------------------------------------------------------------
-                if error and (PrintWarnings or debug.on(debug.Data1)): logfile.Write(\
-                    "ANT Dongle:%s: synch=%s, len=%2s, id=%s, check=%s, channel=%s, page=%s(%s) info=%s" % \
-                    (error, synch, length, hex(id), checksum, Channel, DataPageNumber, hex(DataPageNumber), logfile.HexSpace(info)))
+                        if Target != (TacxTrainer.TargetMode, TacxTrainer.TargetPowerProvided, \
+                                      TacxTrainer.TargetGrade, TacxTrainer.RollingResistance):
+                            TacxTrainer.SendTarget(usbTrainer.modeResistance)
 
-            #-------------------------------------------------------------------
-            # WAIT untill CycleTime is done
-            #-------------------------------------------------------------------
-            ElapsedTime = time.time() - StartTime
-            SleepTime = CycleTime - ElapsedTime
-            if SleepTime > 0:
-                time.sleep(SleepTime)
-                if debug.on(debug.Data2): logfile.Write ("Sleep(%4.2f) to fill %s seconds done." % (SleepTime, CycleTime) )
+                    SleepTime = LoopClock.Remaining()
+                if debug.on(debug.Data2): logfile.Write ("Wait(%4.2f) to fill %s seconds done." % (WaitTime, CycleTime) )
             else:
                 if ElapsedTime > CycleTime * 2 and debug.on(debug.Any):
-                    logfile.Write ("Tacx2Dongle; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % (ElapsedTime, SleepTime * -1, CycleTime) )
+                    logfile.Write ("Tacx2Dongle; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % (ElapsedTime, ElapsedTime - CycleTime, CycleTime) )
                 pass
 
+            if debug.on(debug.Performance) and LoopClock.Cycles % 240 == 0:
+                LoopClock.Log()
+                AntDongle.LogStatistics()
+
             EventCounter += 1           # Increment and ...
             EventCounter &= 0xff        # maximize to 255
             
     except KeyboardInterrupt:
         logfile.Console ("Stopped")
 
+    TacxTrainer.StopIOthread()
     rpi.DisplayState(constants.faStopped, TacxTrainer)
     #---------------------------------------------------------------------------
     # Stop devices, if not reconnecting ANT
@@ -1,7 +1,9 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2024-03-14"
+__version__ = "2026-10-17"
+# 2026-10-17    --profile-startup added; wx only imported for the test code
+# 2026-10-17    -d r: capture the ANT dongle traffic (debug.AntCapture)
 # 2024-03-14    Issue #463: parameter -c handled incorrectly
 # 2023-12-13    Issue #445: Specifying Vortex interactively has no effect
 # 2023-03-15    Typo in message corrected
@@ -82,9 +84,6 @@ from   constants                    import UseBluetooth, UseGui, OnRaspberry
 import constants
 import settings
 
-if UseGui:
-    import wx
-
 #-------------------------------------------------------------------------------
 # Realize clv to be program-global, by accessing through this function.
 #-------------------------------------------------------------------------------
@@ -127,6 +126,7 @@ class CommandLineVariables(object):
     OutputDisplay   = False      # introduced 2021-03-24; Raspberry small display
     OutputDisplayR  = 0          # introduced 2021-04-09; Rotation
     PowerFactor     = 1.00
+    ProfileStartup  = False      # introduced 2026-10-17; Report import times at startup
     SimulateTrainer = False
     TacxType        = False
     Tacx_Vortex     = False
@@ -262,6 +262,7 @@ class CommandLineVariables(object):
                     choices=self.ant_tacx_models + ['i-Vortex'])
                     # i-Vortex is still allowed for compatibility
         parser.add_argument   ('-x', dest='exportTCX',                                  help=constants.help_x,  required=False, action='store_true')
+        parser.add_argument   ('--profile-startup', dest='ProfileStartup',              help=constants.help_profile, required=False, action='store_true')
 
         #-----------------------------------------------------------------------
         # Parse command line
@@ -330,6 +331,7 @@ class CommandLineVariables(object):
         self.Resistance             = self.args.Resistance
         self.SimulateTrainer        = self.args.simulate
         self.exportTCX              = self.args.exportTCX or self.homeTrainer or self.manual or self.manualGrade
+        self.ProfileStartup         = self.args.ProfileStartup
 
         i = 0
         if self.homeTrainer:    i += 1
@@ -482,6 +484,7 @@ class CommandLineVariables(object):
                 if 'W' in self.args.debug: self.debug |= debug.logging_WARNING
                 if 'E' in self.args.debug: self.debug |= debug.logging_ERROR
                 if 'C' in self.args.debug: self.debug |= debug.logging_CRITICAL
+                if 'r' in self.args.debug: self.debug |= debug.AntCapture
 
         #-----------------------------------------------------------------------
         # Get antDeviceID
@@ -792,6 +795,7 @@ class CommandLineVariables(object):
                                                                      self.Cranckset[self.CrancksetStart], \
                                                                      self.Cassette [self.CassetteStart]) )
             if      self.exportTCX:                     logfile.Console("-x")
+            if      self.ProfileStartup:                logfile.Console("--profile-startup")
 
         except:
             pass # May occur when incorrect command line parameters, error already given before
@@ -815,5 +819,6 @@ if __name__ == "__main__":
         print(i)
 
     if UseGui:
+        import wx
         app = wx.App(0)
         settings.OpenDialog(app, None, clv)
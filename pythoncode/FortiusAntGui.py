@@ -1,7 +1,15 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2024-02-17"
+__version__ = "2026-10-17"
+# 2026-10-17    Click on the pedal stroke analysis switches between the last
+#               revolution and the heatmap of the session
+# 2026-10-17    OnPaint() buffered, with the background cached in a bitmap;
+#               only the changed areas (heart, gearbox, leds, radar) are
+#               refreshed, and only what intersects the area is drawn
+# 2026-10-17    SetValues(), SetLeds() and SetMessages() coalesce; the pending
+#               data is updated and at most one wx.CallAfter() is queued
+# 2026-10-17    Power average with ringStatistics instead of a numpy array
 # 2024-02-17    #460; the gearboxOverlay window was not closed, so FortiusAnt hanging
 # 2024-02-17    wx.DEFAULT_FRAME_STYLE replaced by wx.CLOSE_BOX on overlay frame
 # 2024-01-31    Smoother power was reset when powermeter resized
@@ -100,7 +108,6 @@ __version__ = "2024-02-17"
 #-------------------------------------------------------------------------------
 import array
 import math
-import numpy
 import os
 import random
 import sys
@@ -116,6 +123,7 @@ import logfile
 import FortiusAntCommand     as cmd
 from   FortiusAntTitle                  import githubWindowTitle
 import RadarGraph
+import ringStatistics
 import settings
 
 #-------------------------------------------------------------------------------
@@ -164,6 +172,13 @@ class frmFortiusAntGui(wx.Frame):
     StatusLedsXr = None # Right side of rightmost status-led-label
     StatusLedsYb = None # Bottom of status-led-row
 
+    PendingValues   = None  # SetValues()   not yet displayed; the latest
+    PendingLeds     = None  # SetLeds()     not yet displayed; combined
+    PendingMessages = None  # SetMessages() not yet displayed; merged
+
+    BackgroundBuffer = None # BackgroundBitmap on a bitmap of the panel size
+    PaintedGearbox   = None # What the gearbox was painted for
+
     def __init__(self, parent, pclv):
         # ----------------------------------------------------------------------
 		# Create frame and panel for TAB-handling
@@ -180,6 +195,7 @@ class frmFortiusAntGui(wx.Frame):
 		# Save Command Line Variables in the GUI-context
         # ----------------------------------------------------------------------
         self.clv = pclv
+        self.PendingLock = threading.Lock()     # For the Pending... data
 
         # ----------------------------------------------------------------------
 		# Images are either in directory of the .py or embedded in .exe
@@ -206,6 +222,7 @@ class frmFortiusAntGui(wx.Frame):
 		# Default initial actions, bind functions to frame
         # ----------------------------------------------------------------------
         self.Bind(wx.EVT_CLOSE, self.OnClose)
+        self.panel.SetBackgroundStyle(wx.BG_STYLE_PAINT)  # OnPaint() paints all
         self.panel.Bind(wx.EVT_PAINT, self.OnPaint)    # Draw the bitmap
         self.Iconize(False)                            # un-iconize
         #self.Centre() # Too early, do after all controls created
@@ -480,7 +497,7 @@ class frmFortiusAntGui(wx.Frame):
                                                                             # Assign A Font To The Center Text
 
             self.PowerMax = 0
-            self.PowerArray = numpy.array([0,0,0,0,0,0,0,0,0,0])            # Array for running everage
+            self.PowerArray = ringStatistics.clsRingStatistics(10, 0)       # For running everage
             self.DefinePowerMeter(400)
             self.Power.SetTicksFont(wx.Font(TicksFontSize, wx.FONTFAMILY_SWISS, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
                                                                             # Set The Font For The Ticks Markers
@@ -597,6 +614,7 @@ class frmFortiusAntGui(wx.Frame):
         wh = self.txtHeartRate.Position [1] + self.txtHeartRate.Size [1] - y
         if self.clv.PedalStrokeAnalysis:
             self.RadarGraph = RadarGraph.clsRadarGraph(self.panel, "Pedal stroke analysis", x, y, wh)
+            self.panel.Bind(wx.EVT_LEFT_DOWN, self.OnClick_RadarGraph)
 
         # ----------------------------------------------------------------------
         # Define position of the status leds
@@ -878,11 +896,36 @@ class frmFortiusAntGui(wx.Frame):
     # input:        Tacx, Shutdown, Cadence, BLE, ANT
     #
     # Description:  Modify the leds according the inputs
+    #               True = toggle, False = off, None = unchanged
+    #
+    #               The calls are combined in PendingLeds, until displayed by
+    #               SetLedsPending(); only one wx.CallAfter() is queued, so
+    #               that a busy GUI does not get a queue of updates.
+    #               PendingLeds per led: None, 'toggle', False (off), True (on)
     #
     # Output:       self.StatusLeds
     # --------------------------------------------------------------------------
     def SetLeds(self, ANT=None, BLE=None, Cadence=None, Shutdown=None, Tacx=None): #Thread safe
-        wx.CallAfter(self.SetLedsGUI, ANT, BLE, Cadence, Shutdown, Tacx)
+        with self.PendingLock:
+            Queued = self.PendingLeds is not None
+            if not Queued: self.PendingLeds = [None] * 5
+            for i, Led in enumerate((Tacx, Shutdown, Cadence, BLE, ANT)):
+                Pending = self.PendingLeds[i]
+                if   Led     == None:     pass
+                elif not Led:             self.PendingLeds[i] = False
+                elif Pending is None:     self.PendingLeds[i] = 'toggle'
+                elif Pending == 'toggle': self.PendingLeds[i] = None      # Toggled twice
+                else:                     self.PendingLeds[i] = not Pending
+        if not Queued:
+            wx.CallAfter(self.SetLedsPending)
+
+    def SetLedsPending(self):
+        with self.PendingLock:
+            Leds, self.PendingLeds = self.PendingLeds, None
+        for i, Led in enumerate(Leds):
+            if   Led == 'toggle':   self.StatusLeds[i] = not self.StatusLeds[i]
+            elif Led is not None:   self.StatusLeds[i] = Led
+        self.RefreshArea(self.LedsRect())
 
     def SetLedsGUI(self, ANT=None, BLE=None, Cadence=None, Shutdown=None, Tacx=None):
         # print (ANT, BLE, Cadence, Shutdown, Tacx, self.StatusLeds)
@@ -891,7 +934,7 @@ class frmFortiusAntGui(wx.Frame):
         if Cadence  != None: self.StatusLeds[2] = not self.StatusLeds[2] if Cadence  else False
         if BLE      != None: self.StatusLeds[3] = not self.StatusLeds[3] if BLE      else False
         if ANT      != None: self.StatusLeds[4] = not self.StatusLeds[4] if ANT      else False
-        self.panel.Refresh()
+        self.RefreshArea(self.LedsRect())
 
     # --------------------------------------------------------------------------
     # S e t V a l u e s
@@ -910,6 +953,10 @@ class frmFortiusAntGui(wx.Frame):
     #
     # Description:  Show the values in SpeedoMeter and text-fields
     #
+    #               The latest values are kept in PendingValues, until displayed
+    #               by SetValuesPending(); only one wx.CallAfter() is queued, so
+    #               that a busy GUI shows the latest values, not old ones.
+    #
     # Output:       None
     # --------------------------------------------------------------------------
     def ResetValues(self):
@@ -918,11 +965,18 @@ class frmFortiusAntGui(wx.Frame):
     def SetValues(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, \
                     iTacx, iHeartRate, \
                     iCrancksetIndex, iCassetteIndex, fReduction):  # Tread safe
-        wx.CallAfter(
-                    self.SetValuesGUI, \
-                    fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, \
-                    iTacx, iHeartRate, \
-                    iCrancksetIndex, iCassetteIndex, fReduction)
+        with self.PendingLock:
+            Queued = self.PendingValues is not None
+            self.PendingValues = (fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, \
+                                  iTacx, iHeartRate, \
+                                  iCrancksetIndex, iCassetteIndex, fReduction)
+        if not Queued:
+            wx.CallAfter(self.SetValuesPending)
+
+    def SetValuesPending(self):
+        with self.PendingLock:
+            Values, self.PendingValues = self.PendingValues, None
+        self.SetValuesGUI(*Values)
 
     def SetValuesGUI(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, \
                         iTacx, iHeartRate, \
@@ -939,9 +993,8 @@ class frmFortiusAntGui(wx.Frame):
         # ----------------------------------------------------------------------
         # Average power over the last 10 readings
         # ----------------------------------------------------------------------
-        self.PowerArray = numpy.append(self.PowerArray, iPower)     # Add new value to array
-        self.PowerArray = numpy.delete(self.PowerArray, 0)          # Remove oldest from array
-        iPowerMean = int(numpy.mean(self.PowerArray))               # Calculate average
+        self.PowerArray.Add(iPower)                                 # Add new value, remove oldest
+        iPowerMean = int(self.PowerArray.Mean())                    # Calculate average
 
         # ----------------------------------------------------------------------
         # Force refresh to avoid ghost values at end-of-loop
@@ -1046,7 +1099,8 @@ class frmFortiusAntGui(wx.Frame):
         # We pass here every 0.250 second = 400 times/minute
         # Do not process more often than heartbeat
         # ----------------------------------------------------------------------
-        bRefreshRequired = False
+        bRefreshRequired = False        # Layout changed; all
+        bRefreshHeart    = False
         delta = time.time() - self.LastHeart # Delta time since previous
         if delta >= 60 / max(60, self.HeartRate * 2):   # At HeartRate, not slower than 1/second
                                                         # *2 because one heartbeat = 2 cycles
@@ -1061,19 +1115,20 @@ class frmFortiusAntGui(wx.Frame):
                         self.txtCassette .SetPosition(( int(self.txtCassette .Position[0]), int(self.CassetteY )))
                     self.txtHeartRate.Show()
                     self.txtHeartRateShown = True
+                    bRefreshRequired  = True
                 self.txtHeartRate.SetValue  ("%i" % self.HeartRate)
 
                 if self.HeartRateWH  == 40:             # Show 36x36 on every other passage
                     self.HeartRateWH  = 36
                     self.HeartRateX  += 2               # center in the 40x40 area
                     self.HeartRateY  += 2               # center in the 40x40 area
-                    bRefreshRequired  = True
+                    bRefreshHeart     = True
 
                 elif self.HeartRateWH  == 36:           # Show 40x40 on every other passage
                     self.HeartRateWH  = 40
                     self.HeartRateX  -= 2               # use the 40x40 area
                     self.HeartRateY  -= 2               # use the 40x40 area
-                    bRefreshRequired  = True
+                    bRefreshHeart     = True
 
             else:
                 if self.txtHeartRate.IsShown():
@@ -1097,7 +1152,6 @@ class frmFortiusAntGui(wx.Frame):
                 self.txtCranckset.Show()
 
             self.txtCranckset.SetValue  ("%i" % self.clv.Cranckset[self.CrancksetIndex])
-            bRefreshRequired  = True            # So that Cranckset is painted
             
         else:
             if self.txtCranckset.IsShown():
@@ -1116,7 +1170,6 @@ class frmFortiusAntGui(wx.Frame):
                 teeth = self.clv.Cassette[self.CassetteIndex]
 
             self.txtCassette.SetValue  ("%i" % int(round(teeth / self.Reduction) ) )
-            bRefreshRequired  = True            # So that Cassette is painted
             
         else:
             if self.txtCassette.IsShown():
@@ -1131,11 +1184,33 @@ class frmFortiusAntGui(wx.Frame):
 
         # ----------------------------------------------------------------------
         # Refresh if required; so that JPGs are drawn in the OnPaint() event
+        # Only the area that changed, unless the layout changed.
+        # The gearbox is painted when the selected gears (or position) changed.
         # ----------------------------------------------------------------------
-        if ForceRefresh and bRefreshRequired: self.panel.Refresh()
+        Gearbox = (self.CrancksetIndex, self.CassetteIndex, self.CrancksetY, self.CassetteY)
+        if ForceRefresh:
+            if bRefreshRequired:
+                self.panel.Refresh()
+            else:
+                if bRefreshHeart:
+                    self.RefreshArea(self.HeartRateRect())
+                if Gearbox != self.PaintedGearbox:
+                    self.RefreshArea(self.GearboxRect())
+            self.PaintedGearbox = Gearbox
 
     def SetMessages(self, Tacx=None, Dongle=None, HRM=None):       # Tread safe
-        wx.CallAfter(self.SetMessagesGUI, Tacx, Dongle, HRM)
+        with self.PendingLock:                                      # Merge, None = unchanged
+            Queued = self.PendingMessages is not None
+            if not Queued: self.PendingMessages = [None, None, None]
+            for i, Message in enumerate((Tacx, Dongle, HRM)):
+                if Message != None: self.PendingMessages[i] = Message
+        if not Queued:
+            wx.CallAfter(self.SetMessagesPending)
+
+    def SetMessagesPending(self):
+        with self.PendingLock:
+            Messages, self.PendingMessages = self.PendingMessages, None
+        self.SetMessagesGUI(*Messages)
 
     def SetMessagesGUI(self, Tacx=None, Dongle=None, HRM=None):
         if Tacx   != None:
@@ -1174,20 +1249,29 @@ class frmFortiusAntGui(wx.Frame):
     # Description:  Paint the frame, the bitmap and the HeartRate
     #               Ref: http://zetcode.com/wxpython/gdi/
     #
+    #               Painting is buffered (no flicker) and limited to the area
+    #               that is invalidated (see RefreshArea); the background is
+    #               copied from BackgroundBuffer and only the items that
+    #               intersect the area are drawn.
+    #
     # Output:       None
     # --------------------------------------------------------------------------
     def OnPaint(self, event):
         # ----------------------------------------------------------------------
         # Draw background (to be done on every OnPaint() otherwise disappears!
         # ----------------------------------------------------------------------
-        dc = wx.PaintDC(self.panel)
-        dc.DrawBitmap(self.BackgroundBitmap, 0, 0)          # LeftTop in pixels
+        dc  = wx.AutoBufferedPaintDC(self.panel)
+        Box = self.panel.GetUpdateRegion().GetBox()
+
+        mdc = wx.MemoryDC(self.GetBackgroundBuffer())
+        dc.Blit(Box.x, Box.y, Box.width, Box.height, mdc, Box.x, Box.y)
+        mdc.SelectObject(wx.NullBitmap)
 
         # ----------------------------------------------------------------------
         # Draw HeartRate
         #       Image functions done once, instead of every OnPaint()
         # ----------------------------------------------------------------------
-        if self.HeartRateImage and self.HeartRate > 40:
+        if self.HeartRateImage and self.HeartRate > 40 and Box.Intersects(self.HeartRateRect()):
 #           img = self.HeartRateImage.Scale(self.HeartRateWH, self.HeartRateWH, wx.IMAGE_QUALITY_HIGH)
 #           bmp = wx.Bitmap(img)
             if   self.HeartRateWH == 36:
@@ -1207,10 +1291,11 @@ class frmFortiusAntGui(wx.Frame):
         ChainY1 = False
         ChainX2 = False
         ChainY1 = False
+        Gearbox = Box.Intersects(self.GearboxRect())
         # ----------------------------------------------------------------------
         # Draw Cassette
         # ----------------------------------------------------------------------
-        if self.CassetteIndex != None:
+        if self.CassetteIndex != None and Gearbox:
             # ------------------------------------------------------------------
             # The sprocket is 2 pixels wide, 1 space = 3 per sprocket
             # With 40 pixels and 13 sprockets: 3 * 13 = 39 which fits
@@ -1246,7 +1331,7 @@ class frmFortiusAntGui(wx.Frame):
         # ----------------------------------------------------------------------
         # Draw Cranckset
         # ----------------------------------------------------------------------
-        if self.CrancksetIndex != None:
+        if self.CrancksetIndex != None and Gearbox:
             # ------------------------------------------------------------------
             # The chainring is 2 pixels wide, 2 space = 4 per chainring
             # Since max 3 chainrings, this always fits
@@ -1291,7 +1376,7 @@ class frmFortiusAntGui(wx.Frame):
         # ----------------------------------------------------------------------
         # Draw Pedal Stroke Analysis
         # ----------------------------------------------------------------------
-        if self.clv.PedalStrokeAnalysis:
+        if self.clv.PedalStrokeAnalysis and Box.Intersects(self.RadarGraph.Rect()):
             self.RadarGraph.OnPaint(dc)
         # ----------------------------------------------------------------------
         # Draw status leds
@@ -1299,7 +1384,7 @@ class frmFortiusAntGui(wx.Frame):
         # - If there is no BLE interface, do not show BLE-led
         # - Only on Raspberry, not show shutdown-led
         # ----------------------------------------------------------------------
-        if True or self.clv.StatusLeds:
+        if (True or self.clv.StatusLeds) and Box.Intersects(self.LedsRect()):
             all = FixedForDocu
             x   = self.StatusLedsXr         # Right side of rightmost label
             y   = self.StatusLedsYb - 10    # Upper size of status leds
@@ -1326,6 +1411,52 @@ class frmFortiusAntGui(wx.Frame):
                 x -= distance
                 self.DrawLed(dc, 255, 140,  0, x, y, r, self.StatusLeds[0], 'Tacx'     )
 
+    # --------------------------------------------------------------------------
+    # G e t B a c k g r o u n d B u f f e r
+    # --------------------------------------------------------------------------
+    # Description:  The background of the panel; created once (and again when
+    #               the panel is resized) instead of drawing the image on every
+    #               OnPaint()
+    # --------------------------------------------------------------------------
+    def GetBackgroundBuffer(self):
+        w, h = self.panel.GetClientSize()
+        if self.BackgroundBuffer is None or self.BackgroundBuffer.GetSize() != (w, h):
+            self.BackgroundBuffer = wx.Bitmap(max(1, w), max(1, h))
+            mdc = wx.MemoryDC(self.BackgroundBuffer)
+            mdc.SetBackground(wx.Brush(self.panel.GetBackgroundColour()))
+            mdc.Clear()
+            if self.BackgroundBitmap:
+                mdc.DrawBitmap(self.BackgroundBitmap, 0, 0)  # LeftTop in pixels
+            mdc.SelectObject(wx.NullBitmap)
+        return self.BackgroundBuffer
+
+    # --------------------------------------------------------------------------
+    # R e f r e s h A r e a
+    # --------------------------------------------------------------------------
+    # Description:  Invalidate the area of an item drawn in OnPaint(), so that
+    #               only that area is painted.
+    #               The rectangles below cover the item in all its states.
+    # --------------------------------------------------------------------------
+    def RefreshArea(self, Rect):
+        if Rect is None:
+            self.panel.Refresh()
+        else:
+            self.panel.RefreshRect(Rect, eraseBackground=False)
+
+    def HeartRateRect(self):                        # The 40x40 area
+        if self.HeartRateWH == 36:
+            return wx.Rect(self.HeartRateX - 2, self.HeartRateY - 2, 40, 40)
+        return wx.Rect(self.HeartRateX, self.HeartRateY, 40, 40)
+
+    def GearboxRect(self):                          # Cassette, cranckset, chain
+        return wx.Rect(self.CassetteX,  self.CassetteY,  self.CassetteWH,  self.CassetteWH ).Union( \
+               wx.Rect(self.CrancksetX, self.CrancksetY, self.CrancksetWH, self.CrancksetWH)).Inflate(2, 2)
+
+    def LedsRect(self):                             # 5 leds, 70 pixels each
+        if self.StatusLedsXr is None:
+            return None
+        return wx.Rect(self.StatusLedsXr - 5 * 70 - 5, self.StatusLedsYb - 10 - 10, 5 * 70 + 15, 24)
+
     # --------------------------------------------------------------------------
     # D r a w L e d
     # --------------------------------------------------------------------------
@@ -1530,6 +1661,23 @@ class frmFortiusAntGui(wx.Frame):
         if __name__ == "__main__": print ("OnClick_btnSponsor()")
         webbrowser.open_new_tab('https://github.com/sponsors/WouterJD')
 
+    # --------------------------------------------------------------------------
+    # O n C l i c k _ R a d a r G r a p h
+    # --------------------------------------------------------------------------
+    # input:        Click on the panel
+    #
+    # Description:  Click on the radar graph switches the mode
+    #
+    # Output:       None
+    # --------------------------------------------------------------------------
+    def OnClick_RadarGraph(self, event):
+        if self.RadarGraph.Rect().Contains(event.GetPosition()):
+            if self.RadarGraph.Mode == RadarGraph.ModeHeatmap:
+                self.RadarGraph.SetMode(RadarGraph.ModeRevolution)
+            else:
+                self.RadarGraph.SetMode(RadarGraph.ModeHeatmap)
+        event.Skip()
+
     # --------------------------------------------------------------------------
     # O n C l i c k _ b t n H e l p 
     # --------------------------------------------------------------------------
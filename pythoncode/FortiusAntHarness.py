@@ -0,0 +1,233 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    -E broadcasts on EVENT_TX (constants.UseAntTxScheduler)
+# 2026-10-17    clsHarnessUsbDevice replaced by antEmulator; the dongle is the
+#               standard clsAntDongle with clsAntEmulatedTransport
+# 2026-10-17    First version; run Tacx2Dongle headless, faster than real-time
+#-------------------------------------------------------------------------------
+# Description:  FortiusAntHarness runs the complete Tacx2Dongle loop without
+#               hardware and without GUI:
+#               - clsSimulatedTrainer           as Tacx trainer
+#               - clsAntDongle                  with clsAntEmulatedTransport,
+#                                               including the commands of a CTP
+#                                               and optionally an HRM (-H)
+#               - clsHarnessGui                 does not display anything
+#               - cycleClock.clsVirtualClock    so that waiting costs no time
+#
+#               A ride of an hour takes (a few) seconds, so that the loop
+#               performance and the ANT protocol can be checked without
+#               trainer and dongle, e.g. in a CI-pipeline.
+#
+#               Reported are: cycles per second, the time spent per phase and
+#               the number of ANT messages sent per channel and FE-C page.
+#
+# Usage:        python FortiusAntHarness.py [harness options] [-- FortiusAnt options]
+#               e.g.
+#               python FortiusAntHarness.py -r 3600
+#               python FortiusAntHarness.py -r 600 -- -d 127 -x
+#
+#               FortiusAnt options are as for FortiusAnt.py; -s is implied.
+#-------------------------------------------------------------------------------
+import argparse
+import random
+import sys
+import time
+
+import antDongle         as ant
+import antFE             as fe
+import antHRM            as hrm
+import antPWR            as pwr
+import antSCS            as scs
+import antCTRL           as ctrl
+import antEmulator
+import constants
+import cycleClock
+import debug
+import FortiusAntBody
+import FortiusAntCommand as cmd
+import logfile
+
+# ------------------------------------------------------------------------------
+# c l s H a r n e s s G u i
+# ------------------------------------------------------------------------------
+# Description:  Null-GUI; the functions that FortiusAntBody calls do nothing.
+#               When RideTime seconds have passed, RunningSwitch is reset,
+#               as if the Stop-button were pressed.
+# ------------------------------------------------------------------------------
+class clsHarnessGui:
+    def __init__(self, RideTime):
+        self.RideTime      = RideTime
+        self.StartTime     = cycleClock.Monotonic()
+        self.RunningSwitch = False
+
+    def SetValues(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, \
+            fTargetGrade, iTacx, iHeartRate, iCrancksetIndex, iCassetteIndex, fReduction):
+        pass
+
+    def SetMessages(self, Tacx=None, Dongle=None, HRM=None):
+        if debug.on(debug.Application):
+            logfile.Write ("Harness; SetMessages(Tacx=%s, Dongle=%s, HRM=%s)" % (Tacx, Dongle, HRM))
+
+    def SetLeds(self, ANT=None, BLE=None, Cadence=None, Shutdown=None, Tacx=None):
+        if cycleClock.Monotonic() - self.StartTime >= self.RideTime:
+            self.RunningSwitch = False
+
+    def PedalStrokeAnalysis(self, info, Cadence):
+        pass
+
+# ------------------------------------------------------------------------------
+# c l s P h a s e T i m e r
+# ------------------------------------------------------------------------------
+# Description:  Measure the (real) time spent in a function, by replacing the
+#               function by a wrapper that accumulates the time.
+#               A function that is called from within another measured function
+#               is counted in both phases.
+#
+# Functions:    Wrap(Object, Name, Phase)   Object = module, class or instance
+#               Report(Total, Cycles)
+# ------------------------------------------------------------------------------
+class clsPhaseTimer:
+    def __init__(self):
+        self.Phases = {}                        # Phase --> [calls, seconds]
+
+    def Wrap(self, Object, Name, Phase):
+        Function = getattr(Object, Name)
+        Counters = self.Phases.setdefault(Phase, [0, 0])
+
+        def Timed(*args, **kwargs):
+            t = time.perf_counter()
+            try:
+                return Function(*args, **kwargs)
+            finally:
+                Counters[0] += 1
+                Counters[1] += time.perf_counter() - t
+
+        setattr(Object, Name, Timed)
+
+    def Report(self, Total, Cycles):
+        logfile.Console ("%-16s %8s %10s %14s %6s" % ('phase', 'calls', 'seconds', 'us/cycle', '%'))
+        for Phase, (Calls, Seconds) in self.Phases.items():
+            logfile.Console ("%-16s %8s %10.3f %14.1f %6.1f" % (Phase, Calls, Seconds, \
+                    Seconds / max(1, Cycles) * 1e6, Seconds / max(Total, 1e-9) * 100))
+
+# ------------------------------------------------------------------------------
+# R u n
+# ------------------------------------------------------------------------------
+# input:        args    harness options, see main program
+#               clv     FortiusAnt command line variables
+#
+# Description:  Run Tacx2Dongle with the harness components and report
+#
+# Returns:      Statistics (dictionary)
+# ------------------------------------------------------------------------------
+def Run(args, clv):
+    if not args.realtime:
+        cycleClock.SetClock(cycleClock.clsVirtualClock())
+    random.seed(args.seed)                      # clsSimulatedTrainer is random
+    constants.UseAntTxScheduler = args.event
+
+    FortiusAntBody.Initialize(clv)
+    Gui       = clsHarnessGui(args.ride)
+    CTP       = antEmulator.clsEmulatedCTP(args.commands)
+    Devices   = [CTP]
+    if args.hrm: Devices.append(antEmulator.clsEmulatedHRM())
+    Transport = antEmulator.clsAntEmulatedTransport(Devices)
+    AntDongle = ant.clsAntDongle(None, Transport)
+    AntDongle.UseThread = False                 # So that the run is reproducible
+
+    #---------------------------------------------------------------------------
+    # The dongle is created here, the trainer by LocateHW(); clv.SimulateTrainer
+    #---------------------------------------------------------------------------
+    FortiusAntBody.AntDongle = AntDongle
+    FortiusAntBody.manualMsg = ''
+    if not FortiusAntBody.LocateHW(Gui):
+        logfile.Console ("Harness; LocateHW() failed")
+        return None
+    TacxTrainer = FortiusAntBody.TacxTrainer
+
+    #---------------------------------------------------------------------------
+    # Phases to be measured
+    #---------------------------------------------------------------------------
+    Timer = clsPhaseTimer()
+    Timer.Wrap(TacxTrainer,         'Refresh',                      'Trainer')
+    Timer.Wrap(TacxTrainer,         'SendTarget',                   'Trainer target')
+    Timer.Wrap(fe,                  'BroadcastTrainerDataMessage',  'FE broadcast')
+    Timer.Wrap(hrm,                 'BroadcastHeartrateMessage',    'HRM broadcast')
+    Timer.Wrap(pwr,                 'BroadcastMessage',             'PWR broadcast')
+    Timer.Wrap(scs,                 'BroadcastMessage',             'SCS broadcast')
+    Timer.Wrap(ctrl,                'BroadcastControlMessage',      'CTRL broadcast')
+    Timer.Wrap(AntDongle,           'Write',                        'ANT write')
+    Timer.Wrap(ant.clsAntRouter,    'Dispatch',                     'ANT dispatch')
+    if FortiusAntBody.tcx:
+        Timer.Wrap(FortiusAntBody.tcx, 'TrackpointX',               'TCX export')
+
+    #---------------------------------------------------------------------------
+    # Go!
+    #---------------------------------------------------------------------------
+    Gui.StartTime     = cycleClock.Monotonic()
+    Gui.RunningSwitch = True
+    StartTime         = time.perf_counter()
+    FortiusAntBody.Tacx2Dongle(Gui)
+    Total             = time.perf_counter() - StartTime
+    RideTime          = cycleClock.Monotonic() - Gui.StartTime
+
+    #---------------------------------------------------------------------------
+    # Report
+    #---------------------------------------------------------------------------
+    Cycles   = Timer.Phases['Trainer'][0]
+    FEpages  = Transport.Written.get((ant.msgID_BroadcastData, ant.channel_FE), 0)
+    Pages    = {p: n for (ch, p), n in Transport.Pages.items() if ch == ant.channel_FE}
+
+    logfile.Console ("-------------------------------------------------------------")
+    logfile.Console ("Harness; %4.0fs ride in %6.3fs (%4.0fx real-time), %s cycles, %4.0f cycles/s" % \
+                        (RideTime, Total, RideTime / max(Total, 1e-9), Cycles, Cycles / max(Total, 1e-9)))
+    Timer.Report(Total, Cycles)
+    logfile.Console ("-------------------------------------------------------------")
+    logfile.Console ("ANT messages sent (id, channel): count")
+    for (id, ch), n in sorted(Transport.Written.items(), key=lambda x: (x[0][0], -1 if x[0][1] is None else x[0][1])):
+        logfile.Console ("    0x%02x %-6s: %6s" % (id, '' if ch is None else 'ch=%s' % ch, n))
+    logfile.Console ("USB transfers to the dongle: %s for %s messages" % \
+                        (Transport.Transfers, sum(Transport.Written.values())))
+    logfile.Console ("FE-C pages: %s" % ' '.join('%s:%s' % (p, n) for p, n in sorted(Pages.items())))
+    logfile.Console ("FE-C broadcasts %s, expected %s (4Hz); CTP commands %s, target %s" % \
+                        (FEpages, int(RideTime * 4), CTP.Count, TacxTrainer.TargetPower))
+
+    return { 'RideTime'   : RideTime,
+             'Total'      : Total,
+             'Cycles'     : Cycles,
+             'Phases'     : Timer.Phases,
+             'Written'    : Transport.Written,
+             'FEpages'    : Pages,
+             'Commands'   : CTP.Count,
+             'Transfers'  : Transport.Transfers }
+
+# ==============================================================================
+# Main program
+# ==============================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run FortiusAnt Tacx2Dongle headless with simulated trainer and dongle')
+    parser.add_argument('-r', dest='ride',      metavar='seconds', help='Duration of the ride (default 3600)',          required=False, default=3600, type=float)
+    parser.add_argument('-c', dest='commands',  metavar='seconds', help='Interval of CTP commands, 0=none (default 5)', required=False, default=5,    type=float)
+    parser.add_argument('-R', dest='realtime',                     help='Use the real clock, do not run faster',        required=False, action='store_true')
+    parser.add_argument('-H', dest='hrm',                          help='Emulate an ANT heart rate monitor',            required=False, action='store_true')
+    parser.add_argument('-E', dest='event',                        help='Broadcast on EVENT_TX, not every 250ms',       required=False, action='store_true')
+    parser.add_argument('-S', dest='seed',      metavar='seed',    help='Seed for the simulated trainer (default 0)',  required=False, default=0,    type=int)
+    args, FortiusAntArgs = parser.parse_known_args()
+
+    #---------------------------------------------------------------------------
+    # FortiusAnt command line; the simulated trainer, no GUI
+    #---------------------------------------------------------------------------
+    if FortiusAntArgs and FortiusAntArgs[0] == '--': FortiusAntArgs = FortiusAntArgs[1:]
+    sys.argv = [sys.argv[0], '-s'] + FortiusAntArgs
+    clv = cmd.CommandLineVariables()
+    clv.gui = False
+    debug.activate(clv.debug)
+    if debug.on(debug.Any):
+        logfile.Open()
+
+    Run(args, clv)
+
+    if debug.on(debug.Any):
+        logfile.Close()
@@ -3,6 +3,7 @@
 # used with command: pyinstaller MakeFortiusANT.spec
 #
 # Version info
+# 2026-10-17    hiddenimports for the modules imported by lazyImport
 # 2021-02-04    sponsor.bmp added
 # 2021-01-07    settings.bmp added
 # 2020-03-02    Firmware.hex added
@@ -24,7 +25,7 @@ a = Analysis(['FortiusAnt.py'],
                 ( './tacxfortius_1942_firmware.hex', '.' ),
                 ( './tacximagic_1902_firmware.hex',  '.' )
              ],
-             hiddenimports=[],
+             hiddenimports=['bleBless', 'importlib.metadata', 'requests'],   # lazyImport
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
@@ -1,7 +1,12 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2021-02-21"
+__version__ = "2026-10-17"
+# 2026-10-17    PedalStrokeAnalysis() and ShowRadarGraph() with numpy, using
+#               sin/cos tables instead of math per sample; no logging per sample
+#               ModeHeatmap added: all revolutions of the session in a heatmap
+#               (clsPedalStrokeHeatmap) with the power profile and dead spots
+# 2026-10-17    Rect() added; ShowRadarGraph() refreshes the graph area only
 # 2021-02-21    .Show replaced by .ShowRadarGraph (now can be tested again)
 #               added: Angle()
 #               ToDo: show the rotating pedal.
@@ -12,11 +17,104 @@ __version__ = "2021-02-21"
 # https://github.com/wxWidgets/wxPython-Classic/blob/master/samples/wxPIA_book/Chapter-12/radargraph.py
 
 import math
+import numpy
 import random
 import time
 import wx
 import logfile
 
+# ------------------------------------------------------------------------------
+# Tables, so that angles are converted without math per sample
+# ------------------------------------------------------------------------------
+Cos = numpy.cos(numpy.radians(numpy.arange(360)))
+Sin = numpy.sin(numpy.radians(numpy.arange(360)))
+
+# ------------------------------------------------------------------------------
+# What the radar graph shows
+# ------------------------------------------------------------------------------
+ModeRevolution  = 0                         # The last pedal revolution
+ModeHeatmap     = 1                         # All revolutions of the session
+
+# ------------------------------------------------------------------------------
+# c l s P e d a l S t r o k e H e a t m a p
+# ------------------------------------------------------------------------------
+# Description:  The samples of all revolutions are counted in an
+#               angle x power histogram. Before a revolution is added, the
+#               histogram is multiplied by Decay, so that older revolutions
+#               count less (HalfLife = number of revolutions after which a
+#               revolution counts half).
+#               The work per revolution is constant, however long the ride.
+#
+#               The right pedal is at the front at 0 degrees, so
+#               the right leg drives from 270 over 0 to 90 degrees and
+#               the left leg drives from  90 over 180 to 270 degrees.
+#               The dead spot of a leg is where its (average) power is lowest.
+#
+# Input:        AngleBins   number of angle bins over 360 degrees
+#               BinWidth    Watt per power bin
+#               PowerBins   number of power bins
+#               HalfLife    revolutions
+#
+# Functions:    Add(Angles, Powers)     the samples of one revolution
+#               Density()               histogram, scaled 0...1 per angle
+#               Profile()               average power per angle bin
+#                                       (nan if no samples)
+#               MaxPower()              power below which 99% of the samples are
+#               DeadSpots()             (Left, Right), for each leg None or
+#                                       (Average, DeadSpotPower, DeadSpotAngle)
+# ------------------------------------------------------------------------------
+class clsPedalStrokeHeatmap():
+    def __init__(self, AngleBins=36, BinWidth=10, PowerBins=200, HalfLife=500):
+        self.AngleBins  = AngleBins
+        self.BinWidth   = BinWidth
+        self.PowerBins  = PowerBins
+        self.Decay      = 0.5 ** (1 / HalfLife)
+        self.Histogram  = numpy.zeros((AngleBins, PowerBins))
+        self.PowerSum   = numpy.zeros(AngleBins)   # Power per angle bin
+        self.Weight     = numpy.zeros(AngleBins)   # Samples per angle bin
+        self.Revolutions= 0
+        self.BinAngles  = (numpy.arange(AngleBins) + 0.5) * 360 / AngleBins
+        self.RightLeg   = (self.BinAngles < 90) | (self.BinAngles >= 270)
+
+    def Add(self, Angles, Powers):
+        AngleBin = (numpy.asarray(Angles, dtype=int) % 360) * self.AngleBins // 360
+        Powers   = numpy.maximum(numpy.asarray(Powers, dtype=float), 0)
+        PowerBin = numpy.minimum((Powers / self.BinWidth).astype(int), self.PowerBins - 1)
+
+        self.Histogram *= self.Decay
+        self.PowerSum  *= self.Decay
+        self.Weight    *= self.Decay
+        numpy.add.at(self.Histogram, (AngleBin, PowerBin), 1)
+        numpy.add.at(self.PowerSum,  AngleBin, Powers)
+        numpy.add.at(self.Weight,    AngleBin, 1)
+        self.Revolutions += 1
+
+    def Density(self):
+        Max = self.Histogram.max(axis=1, keepdims=True)
+        return numpy.divide(self.Histogram, Max, out=numpy.zeros_like(self.Histogram), where=Max > 0)
+
+    def Profile(self):
+        return numpy.divide(self.PowerSum, self.Weight, \
+                    out=numpy.full(self.AngleBins, numpy.nan), where=self.Weight > 0)
+
+    def MaxPower(self):
+        Cumulative = numpy.cumsum(self.Histogram.sum(axis=0))
+        if Cumulative[-1] <= 0: return 0
+        return (int(numpy.searchsorted(Cumulative, 0.99 * Cumulative[-1])) + 1) * self.BinWidth
+
+    def DeadSpots(self):
+        Profile = self.Profile()
+        rtn     = []
+        for Leg in (~self.RightLeg, self.RightLeg):
+            Power = Profile[Leg]
+            Valid = ~numpy.isnan(Power)
+            if not Valid.any():
+                rtn.append(None)
+            else:
+                i = int(numpy.nanargmin(Power))
+                rtn.append((float(numpy.nanmean(Power)), float(Power[i]), float(self.BinAngles[Leg][i])))
+        return tuple(rtn)
+
 # ------------------------------------------------------------------------------
 # Create the RadarGraph window
 # ------------------------------------------------------------------------------
@@ -49,6 +147,19 @@ class clsRadarGraph():
         self.StartTime  = 0                 # Time at PedelEcho
         self.Cadence    = 0                 # Last received Cadence
 
+        self.Mode       = ModeRevolution
+        self.Heatmap    = clsPedalStrokeHeatmap()
+        self.HeatmapBitmap = None           # Heatmap drawn on the graph area
+
+        # ----------------------------------------------------------------------
+        # Per pixel of the graph area: angle bin and distance to the center
+        # ----------------------------------------------------------------------
+        dx, dy = numpy.meshgrid(numpy.arange(int(wh)) + x - self.cx, \
+                                self.cy - y - numpy.arange(int(wh)))
+        self.PixelRadius   = numpy.hypot(dx, dy)
+        self.PixelAngleBin = (numpy.degrees(numpy.arctan2(dy, dx)) % 360 * \
+                              self.Heatmap.AngleBins / 360).astype(int) % self.Heatmap.AngleBins
+
     # --------------------------------------------------------------------------
     # P e d a l S t r o k e A n a l y s i s
     # S h o w R a d a r G r a p h
@@ -57,49 +168,107 @@ class clsRadarGraph():
     #               info = list of tuples(Time,  Power)
     #
     # Description:  Show the Pedal Stroke Analysis in the RadarGraph
+    #               The revolution is added to the heatmap, in both modes.
     #
-    # Output:       data = list of tuples(Angle, Power)
+    # Output:       data = array of (Angle, Power)
     # --------------------------------------------------------------------------
     def PedalStrokeAnalysis(self, info, Cadence):
         self.Cadence    = Cadence
         self.StartTime  = info[0][0]            # First element = at pedelecho
-        data            = []
-        logfile.Write('PedalStrokeAnalysis - Cadence=%3s info=%3s StartTime=%s' % \
-                        (self.Cadence, len(info), self.StartTime))
-        for i in info:
-            Angle = self.Angle(i[0])
-            if Angle == -1: break
+        info            = numpy.array(info, dtype=float).reshape(-1, 2)
+        Angles          = self.Angles(info[:, 0])
+        Valid           = Angles >= 0           # Until the first -1
+        Count           = len(Angles) if Valid.all() else int(numpy.argmin(Valid))
+        logfile.Write('PedalStrokeAnalysis - Cadence=%3s info=%3s StartTime=%s angles=%s' % \
+                        (self.Cadence, len(info), self.StartTime, Count))
+        data            = numpy.column_stack((Angles[:Count], info[:Count, 1]))
+        self.Heatmap.Add(data[:, 0], data[:, 1])
 
-            Power = i[1]
-
-            d = (Angle, Power)
-            logfile.Write('Angle=%3s power=%5s Time=%s' % (Angle, Power, i[0]))
-            data.append(d)
-        self.ShowRadarGraph(data)
+        if self.Mode == ModeHeatmap:
+            self.data = data
+            self.ShowHeatmap()
+        else:
+            self.ShowRadarGraph(data)
 
     def ShowRadarGraph(self, data):
         # logfile.Console('ShowRadarGraph')
+        self.data = data = numpy.array(data, dtype=float).reshape(-1, 2)
         # ----------------------------------------------------------------------
         # Calculate a scale factor to use for drawing the graph
         # The maximum power is 100% and all other powers are inside the circles
+        # at low power, outer circle = 100Watt
         # ----------------------------------------------------------------------
-        self.maxval = 100   # at low power, outer circle = 100Watt
-        for d in data:
-            self.maxval = max(d[1], self.maxval)
+        self.maxval = max(100, data[:, 1].max(initial=0))
         self.maxval /= 0.75 # If nice round move, we're at 75% border.
         self.scale = self.radius100 / self.maxval
         # ----------------------------------------------------------------------
         # Now find the coordinates for each data point
         # d[0]=Angle and d[1]=Power are calculated into a point
         # ----------------------------------------------------------------------
-        self.polypoints = []
-        for d in data:
-            point = self.PolarToCartesian(d[0], d[1] * self.scale, self.cx, self.cy)
-            self.polypoints.append(point)
+        self.polypoints = self.PolarToPoints(data[:, 0], data[:, 1] * self.scale)
+        # ----------------------------------------------------------------------
+        # Force OnPaint() of the graph area
+        # ----------------------------------------------------------------------
+        self.parent.RefreshRect(self.Rect(), eraseBackground=False)
+
+    # --------------------------------------------------------------------------
+    # S h o w H e a t m a p
+    # --------------------------------------------------------------------------
+    # Description:  Show the heatmap of the session, scaled so that 99% of the
+    #               samples are inside the 75% circle, with the average power
+    #               per angle as polygon.
+    #               The heatmap is drawn on a bitmap here (once per revolution),
+    #               so that OnPaint() only draws the bitmap.
+    # --------------------------------------------------------------------------
+    def ShowHeatmap(self):
+        self.maxval = max(100, self.Heatmap.MaxPower()) / 0.75
+        self.scale  = self.radius100 / self.maxval
+
+        Profile = self.Heatmap.Profile()
+        Valid   = ~numpy.isnan(Profile)
+        self.polypoints = self.PolarToPoints(self.Heatmap.BinAngles[Valid], Profile[Valid] * self.scale)
+
         # ----------------------------------------------------------------------
-        # Force OnPaint()
+        # Colour every pixel by the density of its (angle, power) bin
         # ----------------------------------------------------------------------
-        self.parent.Refresh()
+        PowerBin = (self.PixelRadius / self.scale / self.Heatmap.BinWidth).astype(int)
+        Inside   = (self.PixelRadius <= self.radius100) & (PowerBin < self.Heatmap.PowerBins)
+        Density  = numpy.where(Inside, \
+                        self.Heatmap.Density()[self.PixelAngleBin, numpy.minimum(PowerBin, self.Heatmap.PowerBins - 1)], 0)
+
+        wh       = self.PixelRadius.shape[0]
+        rgb      = numpy.empty((wh, wh, 3), dtype=numpy.uint8)
+        rgb[...] = (255, 64, 0)
+        alpha    = (numpy.sqrt(Density) * 255).astype(numpy.uint8)
+
+        img = wx.Image(wh, wh)
+        img.SetData(rgb.tobytes())
+        img.SetAlpha(alpha.tobytes())
+        self.HeatmapBitmap = wx.Bitmap(img)
+
+        self.parent.RefreshRect(self.Rect(), eraseBackground=False)
+
+    # --------------------------------------------------------------------------
+    # S e t M o d e
+    # --------------------------------------------------------------------------
+    # input:        Mode    ModeRevolution or ModeHeatmap
+    #
+    # Description:  Switch what is shown; the current data is shown again
+    # --------------------------------------------------------------------------
+    def SetMode(self, Mode):
+        self.Mode = Mode
+        if self.Mode == ModeHeatmap:
+            self.ShowHeatmap()
+        else:
+            self.ShowRadarGraph(self.data)
+
+    # --------------------------------------------------------------------------
+    # R e c t
+    # --------------------------------------------------------------------------
+    # Return:       The area where the graph is drawn
+    # --------------------------------------------------------------------------
+    def Rect(self):
+        return wx.Rect(int(self.x), int(self.y), int(self.wh), int(self.wh))
 
     # --------------------------------------------------------------------------
     # A n g l e
@@ -131,6 +300,27 @@ class clsRadarGraph():
 
         return rtn
 
+    def Angles(self, Timestamps):               # Angle() for an array
+        Adjust = 0
+        dps    = self.Cadence / 60 * 360
+        rtn    = ((Timestamps - self.StartTime) * dps).astype(int)
+        return numpy.where(rtn >= 360, -1, (rtn + Adjust) % 360)
+
+    # --------------------------------------------------------------------------
+    # P o l a r T o P o i n t s
+    # --------------------------------------------------------------------------
+    # input:        Angles, Radii   arrays
+    #
+    # Description:  PolarToCartesian() for arrays, using the sin/cos tables
+    #
+    # Return:       list of (x, y) around (cx, cy)
+    # --------------------------------------------------------------------------
+    def PolarToPoints(self, Angles, Radii):
+        i = numpy.asarray(Angles).astype(int) % 360
+        x = self.cx + (Radii * Cos[i]).astype(int)
+        y = self.cy - (Radii * Sin[i]).astype(int)
+        return list(zip(x.tolist(), y.tolist()))
+
     def PolarToCartesian(self, angle, radius, cx, cy):
         x = int(radius * math.cos(math.radians(angle)))
         y = int(radius * math.sin(math.radians(angle)))
@@ -147,6 +337,9 @@ class clsRadarGraph():
         dc.SetBrush(wx.Brush(wx.Colour(139,193,227)))                               # pylint: disable=maybe-no-member
         dc.DrawCircle(self.cx, self.cy, int(1.00 * self.radius100) )
 
+        if self.Mode == ModeHeatmap and self.HeatmapBitmap:
+            dc.DrawBitmap(self.HeatmapBitmap, int(self.x), int(self.y))
+
         dc.SetBrush(wx.TRANSPARENT_BRUSH)
         dc.DrawCircle(self.cx, self.cy, int(0.75 * self.radius100) )
         dc.DrawCircle(self.cx, self.cy, int(0.50 * self.radius100) )
@@ -177,7 +370,20 @@ class clsRadarGraph():
         # dc.SetBrush(wx.Brush(wx.Colour(139,193,227)))
         dc.SetBrush(wx.TRANSPARENT_BRUSH)
         dc.SetPen(wx.Pen("red", 3))            # pylint: disable=maybe-no-member
-        dc.DrawPolygon(self.polypoints)
+        if self.polypoints:
+            dc.DrawPolygon(self.polypoints)
+
+        # ----------------------------------------------------------------------
+        # Heatmap: left/right balance and dead spots (power as % of average)
+        # ----------------------------------------------------------------------
+        if self.Mode == ModeHeatmap:
+            Left, Right = self.Heatmap.DeadSpots()
+            if Left and Right and Left[0] + Right[0] > 0:
+                s = "L/R %i/%i%%  dead spot L %i%% R %i%%" % ( \
+                        round(Left[0] / (Left[0] + Right[0]) * 100), round(Right[0] / (Left[0] + Right[0]) * 100), \
+                        round(Left[1] / max(Left[0], 1) * 100), round(Right[1] / max(Right[0], 1) * 100))
+                tw, th = dc.GetTextExtent(s)
+                dc.DrawText( s, int(self.cx - tw/2), int(self.y + self.wh - th) )
 
         # ----------------------------------------------------------------------
         # Draw the location of the right pedal
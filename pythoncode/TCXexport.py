@@ -1,7 +1,9 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2023-03-17"
+__version__ = "2026-10-17"
+# 2026-10-17    cycleClock.Time() and cycleClock.UtcNow() instead of time.time()
+#               and datetime.utcnow(), so a virtual clock can be set
 # 2023-03-17    FortiusANT --> FortiusAnt
 # 2021-04-28    If paused (> 5 minutes), close and start new TCX file.
 #               Do not write is empty
@@ -9,8 +11,7 @@ __version__ = "2023-03-17"
 # 2020-11-15    Distance added to produce a valid TCX
 # 2020-11-05    First version
 #-------------------------------------------------------------------------------
-import time
-from   datetime         import datetime
+import cycleClock
 
 import logfile
 from   constants                    import mode_Power, mode_Grade
@@ -133,8 +134,8 @@ class clsTcxExport():
     #---------------------------------------------------------------------------
     def Start(self):
         self.tcx                    = ''                # Contents for TCX file
-        self.StartTime              = datetime.utcnow() # Start time of the track
-        self.StartTimeSeconds       = time.time()
+        self.StartTime              = cycleClock.UtcNow()   # Start time of the track
+        self.StartTimeSeconds       = cycleClock.Time()
         self.TotalTimeSeconds       = 0
         self.TotalDistance          = 0
         self.TotalCalories          = 0
@@ -183,7 +184,7 @@ class clsTcxExport():
     # Returns       none
     #---------------------------------------------------------------------------
     def TrackpointX(self, TacxTrainer, HeartRate):
-        TrackpointXcalled = time.time()
+        TrackpointXcalled = cycleClock.Time()
         self.ElapsedTime = TrackpointXcalled - self.TrackpointXcalled
         #-----------------------------------------------------------------------
         # Skip first call; without previous trackpoint no data
@@ -248,13 +249,13 @@ class clsTcxExport():
                                 self.TrackpointCurrentPower,    \
                                 self.TrackpointSpeedKmh)
                 self.Distance = 0
-                self.TrackpointXwritten = time.time()
+                self.TrackpointXwritten = cycleClock.Time()
             else:
                 #---------------------------------------------------------------
                 # If trackpoints are written and there is 5 minutes of 
                 # inactivity, close and start new TCX file.
                 #---------------------------------------------------------------
-                if self.TrackpointXwritten > 0 and self.TrackpointXwritten < time.time() - 300:
+                if self.TrackpointXwritten > 0 and self.TrackpointXwritten < cycleClock.Time() - 300:
                     self.Stop()     # Writes the TCX file
                                     # AND executes self.Start() to reinitialize
 
@@ -283,7 +284,7 @@ class clsTcxExport():
         # Trackpoint calculations
         #-----------------------------------------------------------------------
         self.NrTrackpoints  += 1
-        self.TrackpointTime  = self.TcxTime(datetime.utcnow())
+        self.TrackpointTime  = self.TcxTime(cycleClock.UtcNow())
         #-----------------------------------------------------------------------
         # Add trackpoint
         #-----------------------------------------------------------------------
@@ -342,7 +343,7 @@ class clsTcxExport():
         #-----------------------------------------------------------------------
         # Track calculations
         #-----------------------------------------------------------------------
-        self.TotalTimeSeconds = time.time() - self.StartTimeSeconds
+        self.TotalTimeSeconds = cycleClock.Time() - self.StartTimeSeconds
 
         #-----------------------------------------------------------------------
         # Pre-pend the Activity totals
@@ -1,7 +1,42 @@
 #---------------------------------------------------------------------------
 # Version info
 #---------------------------------------------------------------------------
-__version__ = "2024-01-22"
+__version__ = "2026-10-17"
+# 2026-10-17    clsAntTxScheduler; broadcast each master channel on EVENT_TX
+# 2026-10-17    AddShards(); channels can be spread over multiple dongles, each
+#               with its own read thread and a shared message queue.
+#               Release() releases all dongles.
+# 2026-10-17    Burst transfers; clsAntBurst reassembles received burst packets
+#               per channel, BurstTransfer() sends data as burst.
+# 2026-10-17    ReadThread() waits ReadTimeoutIdle (250ms) for data, instead of
+#               20ms, unless a response is expected after Write().
+#               clsAntReadStatistics; reads, timeouts and response latency.
+# 2026-10-17    clsAntMessageQueue; the message queue is a bounded deque,
+#               dropping the oldest broadcast on overflow.
+#               MessageQueueDrain() returns all waiting messages.
+# 2026-10-17    Write() combines the messages in bulk transfers up to the
+#               MaxPacketSize of the dongle, unless each message is flushed.
+# 2026-10-17    clsAntCapture; with debug.AntCapture (-d r) clsAntDongle records
+#               all data written to and read from the dongle in a binary file
+#               (.antcap) that can be replayed with antReplay.py
+# 2026-10-17    clsAntTransport added; clsAntDongle reads/writes the dongle
+#               through a transport: clsAntUsbTransport (pyusb) by default or
+#               e.g. antEmulator.clsAntEmulatedTransport (no hardware).
+#               pyusb is no longer required to import this module.
+# 2026-10-17    ResetDongle() waits with cycleClock.Sleep(), see clsVirtualClock
+# 2026-10-17    MessageQueuePut() sets Wakeup (if provided by the application)
+# 2026-10-17    clsAntRouter added; received messages are decomposed once
+#               (clsAntMessage) and dispatched to the handler registered for
+#               (id, channel, page).
+#               clsCommandStatus added; page 71 data per channel.
+# 2026-10-17    clsAntPage added; the msgPage/msgUnpage functions use a struct
+#               that is compiled once.
+#               ComposeMessage() packs into one buffer, without format-string.
+# 2026-10-17    clsAntFramer added; _Read() keeps partial messages across
+#               devAntDongle.read() calls instead of dropping them
+#               ("message exceeds buffer length"), searches the synch byte with
+#               bytearray.find() and checks the checksum on a memoryview.
+#               CalcChecksum() uses XorChecksum() instead of a byte-loop.
 # 2024-01-23    #381/1 Weight should be positive and <= 255
 #               #381/2 HRM is searched for infinitely
 #                       This is implemented for all slaves, for consistency.
@@ -114,6 +149,7 @@ __version__ = "2024-01-22"
 # 2019-12-30    strings[] replaced by messages[]
 #---------------------------------------------------------------------------
 import binascii
+import collections
 import glob
 import os
 import platform
@@ -121,12 +157,18 @@ from pyexpat.errors import messages
 import re
 if platform.system() == 'False':
     import serial                   # pylint: disable=import-error
-import queue
 import struct
 import threading
 import time
-import usb.core
 
+try:
+    import usb.core
+    import usb.util
+    UsePyusb        = True
+except:
+    UsePyusb        = False     # Only an emulated transport can be used
+
+import cycleClock
 import debug
 import logfile
 import structConstants      as sc
@@ -311,6 +353,10 @@ ChannelType_SharedBidirectionalReceive  = 0x20          # Slave
 ChannelType_SharedBidirectionalTransmit = 0x30          # Master
 
 msgID_RF_EVENT                          = 0x01
+EVENT_TX                                = 0x03          # Channel event (9.5.6.1)
+EVENT_TRANSFER_RX_FAILED                = 0x04
+EVENT_TRANSFER_TX_COMPLETED             = 0x05
+EVENT_TRANSFER_TX_FAILED                = 0x06
 
 msgID_ANTversion                        = 0x3e
 msgID_BroadcastData                     = 0x4e
@@ -392,6 +438,461 @@ RfFrequency_2457Mhz     =   57          # 9.5.2.6   Channel RF Frequency
 RfFrequency_2460Mhz     =   60          # used for Tacx Genius/Bushido
 RfFrequency_2466Mhz     =   66          # used for Tacx Vortex only
 RfFrequency_2478Mhz     = 0x4e          # used for Tacx Vortex Headunit
+#---------------------------------------------------------------------------
+# c l s A n t F r a m e r
+#---------------------------------------------------------------------------
+# function  Split the data returned by devAntDongle.Read() into messages
+#
+#           The dongle usually returns complete messages, but when busy
+#           (many channels open) a message can be split over two reads.
+#           The incomplete tail is kept in a bytearray and completed by the
+#           data of the next read.
+#
+#           Feed() returns the list of complete messages with correct
+#           checksum; each message is one bytes-object, copied once from
+#           the buffer. After an incorrect checksum the next synch byte is
+#           searched from the byte after the failing one, so that messages
+#           inside a garbage "message" are not lost.
+#
+# attributes
+#   MaxInfoLength   a larger length-byte means that the synch byte was not
+#                   the start of a message (garbage or a corrupted message)
+#---------------------------------------------------------------------------
+class clsAntFramer():
+    MaxInfoLength       = 0x40
+
+    def __init__(self):
+        self._Buffer    = bytearray()
+
+    def Reset(self):
+        del self._Buffer[:]
+
+    def Feed(self, data):
+        rtn    = []
+        buffer = self._Buffer
+        buffer += data
+        end    = len(buffer)
+        start  = 0
+
+        mv = memoryview(buffer)
+        try:
+            while start < end:
+                #-----------------------------------------------------------
+                # Each message starts with a4; skip characters if not
+                #-----------------------------------------------------------
+                skip = buffer.find(0xa4, start)
+                if skip == -1: skip = end
+                if skip != start:
+                    logfile.Console("Dongle.Read: %s characters skipped " % (skip - start))
+                    start = skip
+                #-----------------------------------------------------------
+                # Second character is the length of the info; add four for
+                # synch, len, id and checksum.
+                # If incomplete, keep for the next read
+                #-----------------------------------------------------------
+                if start + 1 >= end:
+                    break
+                length = buffer[start + 1]
+                if length > self.MaxInfoLength:
+                    logfile.Console("Dongle.Read: error: invalid length %s" % length)
+                    start += 1                  # Search next synch byte
+                    continue
+                length += 4
+                if start + length > end:
+                    break
+                #-----------------------------------------------------------
+                # Check checksum, return message when correct
+                #-----------------------------------------------------------
+                checksum = buffer[start + length - 1]
+                expected = XorChecksum(mv[start : start + length - 1])
+                if expected != checksum:
+                    logfile.Console("Dongle.Read: error: checksum incorrect checksum=%s expected=%s data=%s" % \
+                        ( logfile.HexSpace(checksum), logfile.HexSpace(expected), \
+                          logfile.HexSpace(bytes(mv[start : start + length])) ) )
+                    start += 1                  # Synch byte may be garbage,
+                    continue                    # search next synch byte
+                rtn.append(bytes(mv[start : start + length]))
+                #-----------------------------------------------------------
+                # Next message in buffer
+                #-----------------------------------------------------------
+                start += length
+        finally:
+            mv.release()                        # Buffer can be resized again
+
+        del buffer[:start]                      # Keep incomplete message
+        return rtn
+
+#---------------------------------------------------------------------------
+# c l s A n t M e s s a g e Q u e u e
+#---------------------------------------------------------------------------
+# function  The queue of messages received from the dongle; the read thread
+#           puts, the main loop gets.
+#
+#           A collections.deque is used, with a lock because with shards
+#           (AddShards) each read thread puts into the queue of the primary.
+#
+#           The queue is bounded: when MaxSize messages are waiting (the main
+#           loop is stalled) the oldest broadcast (or EVENT_TX) is dropped for
+#           a new message; the next broadcast supersedes it. Other messages
+#           (acknowledged data, responses) are never dropped:
+#           - when there is no broadcast in the queue, a new broadcast is
+#             dropped itself
+#           - a new other message is added, beyond MaxSize (Overflows).
+#
+#           Broadcasts and other messages are in separate deques, with a
+#           sequence number; Get() returns the oldest of both heads. So the
+#           oldest broadcast is dropped without searching the queue.
+#
+# attributes
+#   MaxSize     maximum number of messages in the queue
+#   HighWater   maximum number of messages that have been in the queue
+#   Puts, Drops number of messages put and broadcasts dropped
+#   Overflows   number of other messages queued beyond MaxSize
+#---------------------------------------------------------------------------
+class clsAntMessageQueue():
+    def __init__(self, MaxSize=1000):
+        self.MaxSize    = MaxSize
+        self.HighWater  = 0
+        self.Puts       = 0
+        self.Drops      = 0
+        self.Overflows  = 0
+        self._Sequence  = 0
+        self._Droppable = collections.deque()   # (Sequence, message) broadcasts
+        self._Other     = collections.deque()   # (Sequence, message) others
+        self._Lock      = threading.Lock()      # Multiple producers (shards)
+
+    #-----------------------------------------------------------------------
+    # D r o p p a b l e
+    #-----------------------------------------------------------------------
+    # returns   True for broadcast data and EVENT_TX; the next broadcast
+    #           supersedes it.
+    #-----------------------------------------------------------------------
+    @staticmethod
+    def Droppable(message):
+        id = message[2]
+        return id == msgID_BroadcastData or \
+              (id == msgID_ChannelResponse and message[4] == msgID_RF_EVENT and message[5] == EVENT_TX)
+
+    def Put(self, message):
+        Droppable = self.Droppable(message)
+        with self._Lock:
+            self.Puts += 1
+            if self.Size() >= self.MaxSize:
+                if self._Droppable:
+                    self._Droppable.popleft()
+                    self.Drops += 1
+                elif Droppable:
+                    self.Drops += 1
+                    return
+                else:
+                    self.Overflows += 1
+
+            self._Sequence += 1
+            if Droppable:
+                self._Droppable.append((self._Sequence, message))
+            else:
+                self._Other.append((self._Sequence, message))
+            n = self.Size()
+            if n > self.HighWater: self.HighWater = n
+
+    def _Get(self):                             # With self._Lock
+        if self._Droppable and (not self._Other or self._Droppable[0][0] < self._Other[0][0]):
+            return self._Droppable.popleft()[1]
+        if self._Other:
+            return self._Other.popleft()[1]
+        return None
+
+    def Get(self):
+        with self._Lock:
+            return self._Get()
+
+    #-----------------------------------------------------------------------
+    # D r a i n
+    #-----------------------------------------------------------------------
+    # returns   all messages in the queue (at most Max), oldest first
+    #-----------------------------------------------------------------------
+    def Drain(self, Max=None):
+        with self._Lock:
+            n   = self.Size() if Max is None else min(Max, self.Size())
+            rtn = [self._Get() for _ in range(n)]
+        return rtn
+
+    def Size(self):
+        return len(self._Droppable) + len(self._Other)
+
+    def Statistics(self):
+        return { 'Depth'     : self.Size(),
+                 'HighWater' : self.HighWater,
+                 'Puts'      : self.Puts,
+                 'Drops'     : self.Drops,
+                 'Overflows' : self.Overflows }
+
+    def Log(self):
+        s = self.Statistics()
+        logfile.Write ("AntDongle; message queue depth=%s high-water=%s/%s put=%s dropped=%s overflows=%s" % \
+            (s['Depth'], s['HighWater'], self.MaxSize, s['Puts'], s['Drops'], s['Overflows']) )
+
+#---------------------------------------------------------------------------
+# c l s A n t R e a d S t a t i s t i c s
+#---------------------------------------------------------------------------
+# function  Counters of the reads from the dongle
+#
+# attributes
+#   Reads, Empty    number of reads, and of those the reads that timed out
+#   Bytes           number of bytes read
+#   Responses       number of responses measured; the time between a Write()
+#                   that expects a response and the first data read thereafter
+#   LatencyTotal, LatencyMax    seconds
+#---------------------------------------------------------------------------
+class clsAntReadStatistics():
+    def __init__(self):
+        self.Reads          = 0
+        self.Empty          = 0
+        self.Bytes          = 0
+        self.Responses      = 0
+        self.LatencyTotal   = 0
+        self.LatencyMax     = 0
+
+    def Read(self, Length):
+        self.Reads += 1
+        self.Bytes += Length
+        if not Length: self.Empty += 1
+
+    def Response(self, Latency):
+        self.Responses    += 1
+        self.LatencyTotal += Latency
+        if Latency > self.LatencyMax: self.LatencyMax = Latency
+
+    def Statistics(self):
+        return { 'Reads'        : self.Reads,
+                 'Empty'        : self.Empty,
+                 'Bytes'        : self.Bytes,
+                 'Responses'    : self.Responses,
+                 'LatencyAvg'   : self.LatencyTotal / self.Responses * 1000 if self.Responses else 0,
+                 'LatencyMax'   : self.LatencyMax * 1000 }
+
+    def Log(self):
+        s = self.Statistics()
+        logfile.Write ("AntDongle; reads=%s empty=%s bytes=%s; responses=%s latency avg=%4.1fms max=%4.1fms" % \
+            (s['Reads'], s['Empty'], s['Bytes'], s['Responses'], s['LatencyAvg'], s['LatencyMax']) )
+
+#---------------------------------------------------------------------------
+# c l s A n t T r a n s p o r t
+#---------------------------------------------------------------------------
+# function  The interface between clsAntDongle and the (USB) device
+#
+#           Candidates(ProductID)   returns the transports (devices) that may
+#                                   be an ANT dongle with this USB ProductID
+#           Configure()             claim the device for this application
+#           Write(data)             write one ANT message
+#           Read(length, timeout)   returns the data that the dongle has sent,
+#                                   on timeout an empty buffer is returned or
+#                                   TimeoutError is raised.
+#                                   timeout in milliseconds.
+#           Release()               give the device back to the system
+#
+# attributes
+#   Manufacturer, Product, VendorID, ProductID   for messages and logging
+#   MaxPacketSize   the size of the OUT endpoint; messages are combined into
+#                   one transfer up to this size
+#
+# Id() identifies the device, so that it is not opened twice (see Shards)
+#---------------------------------------------------------------------------
+class clsAntTransport():
+    Manufacturer        = ''
+    Product             = ''
+    VendorID            = 0
+    ProductID           = 0
+    MaxPacketSize       = 64            # Bytes per bulk transfer, see Write()
+
+    def Candidates(self, _ProductID):
+        return [self]
+
+    def Id(self):
+        return id(self)
+
+    def Configure(self):
+        pass
+
+    def Write(self, data):                      # To be defined by child class
+        pass
+
+    def Read(self, length, timeout):            # To be defined by child class
+        raise TimeoutError('timeout error')     # As an idle dongle
+
+    def Release(self):
+        pass
+
+#---------------------------------------------------------------------------
+# c l s A n t U s b T r a n s p o r t
+#---------------------------------------------------------------------------
+# function  The transport to a physical ANT dongle, using pyusb
+#           endpoint 0x01 = write, 0x81 = read
+#---------------------------------------------------------------------------
+class clsAntUsbTransport(clsAntTransport):
+    def __init__(self, Device=None):
+        self.Device = Device
+
+    def __str__(self):
+        return str(self.Device)
+
+    @property
+    def Manufacturer(self):
+        return self.Device.manufacturer
+
+    @property
+    def Product(self):
+        return self.Device.product
+
+    @property
+    def VendorID(self):
+        return self.Device.idVendor
+
+    @property
+    def ProductID(self):
+        return self.Device.idProduct
+
+    def Id(self):
+        return (self.Device.bus, self.Device.address)
+
+    def Candidates(self, ProductID):
+        if not UsePyusb: raise ImportError("pyusb not installed")
+        return [clsAntUsbTransport(d) for d in usb.core.find(find_all=True, idProduct=ProductID)]
+
+    def Configure(self):
+        #-------------------------------------------------------------------
+        # As suggested by @ElDonad Elie Donadio
+        #-------------------------------------------------------------------
+        if os.name == 'posix':
+            if debug.on(debug.Function): logfile.Write("GetDongle - Detach kernel drivers")
+            for config in self.Device:
+                for i in range(config.bNumInterfaces):
+                    if self.Device.is_kernel_driver_active(i):
+                        self.Device.detach_kernel_driver(i)
+        #-------------------------------------------------------------------
+        if debug.on(debug.Function): logfile.Write ("GetDongle - Set configuration")
+        self.Device.set_configuration()
+
+        #-------------------------------------------------------------------
+        # Size of the OUT endpoint, default 64 (full-speed bulk)
+        #-------------------------------------------------------------------
+        try:
+            Endpoint = usb.util.find_descriptor(self.Device.get_active_configuration()[(0,0)], \
+                                                bEndpointAddress=0x01)
+            self.MaxPacketSize = Endpoint.wMaxPacketSize
+        except Exception as e:
+            if debug.on(debug.Function): logfile.Write ("GetDongle - MaxPacketSize not found: %s" % e)
+
+    def Write(self, data):
+        self.Device.write(0x01, data)           # input:   endpoint address, buffer, timeout
+
+    def Read(self, length, timeout):
+        return self.Device.read(0x81, length, timeout) # input:  endpoint address, length, timeout
+                                                # returns: an array of bytes
+
+    #-----------------------------------------------------------------------
+    # The opposite of Configure(), hoping that this will properly release
+    # the USB device, see #203
+    # Ref: https://github.com/pyusb/pyusb/blob/a16251f3d62de1e0b50cdfb431482d08a34355b4/docs/tutorial.rst#dont-be-selfish
+    #-----------------------------------------------------------------------
+    def Release(self):
+        f = logfile.Write
+        if debug.on(debug.Function): f ("AntDongle.reset()")
+        self.Device.reset()
+
+        for cfg in self.Device:
+            for intf in cfg:
+                if debug.on(debug.Function): f ("AntDongle.release_interface()")
+                usb.util.release_interface(self.Device, intf)
+
+        if debug.on(debug.Function): f ("AntDongle.dispose_resources()")
+        usb.util.dispose_resources(self.Device)
+
+#---------------------------------------------------------------------------
+# Capture file; binary recording of all data written to and read from the
+# dongle, see clsAntCapture and antReplay.py
+#
+#   header  CaptureMagic + start time (double, seconds since epoch)
+#   record  CaptureRecord (time, direction, length) + data
+#           time is in CaptureTimeUnit since the start of the capture
+#           direction is CaptureOut, CaptureIn or CaptureError (the text of
+#           the exception that occurred on read; e.g. a disconnect)
+#---------------------------------------------------------------------------
+CaptureMagic        = b'FANTCAP1'
+CaptureHeader       = struct.Struct('<d')
+CaptureRecord       = struct.Struct('<IBH')
+CaptureTimeUnit     = 0.0001                # 100 micro-seconds, 119 hours
+CaptureOut          = 0                     # Application --> dongle
+CaptureIn           = 1                     # Dongle --> application
+CaptureError        = 2                     # Exception during read
+
+#---------------------------------------------------------------------------
+# c l s A n t C a p t u r e
+#---------------------------------------------------------------------------
+# function  Write the data of the dongle to a capture file
+#           Much cheaper than the Data1 logging, so that it can be used
+#           during a complete ride (e.g. on a Raspberry SD card).
+#
+#           Record() is called from the main thread (write) and the read
+#           thread, the lock keeps each record complete.
+#---------------------------------------------------------------------------
+class clsAntCapture():
+    def __init__(self, FileName=None):
+        if FileName is None:
+            FileName = 'FortiusAnt.' + time.strftime('%Y-%m-%d %H-%M-%S') + '.antcap'
+            n = 0
+            while os.path.exists(FileName):     # e.g. a second dongle
+                n += 1
+                FileName = 'FortiusAnt.' + time.strftime('%Y-%m-%d %H-%M-%S') + '.%s.antcap' % n
+        self.FileName   = FileName
+        self.Records    = 0
+        self._Lock      = threading.Lock()
+        self._File      = open(FileName, 'wb')
+        self._StartTime = cycleClock.Monotonic()
+        self._File.write(CaptureMagic + CaptureHeader.pack(cycleClock.Time()))
+
+    def Record(self, Direction, data):
+        t = int((cycleClock.Monotonic() - self._StartTime) / CaptureTimeUnit)
+        with self._Lock:
+            if self._File:
+                self._File.write(CaptureRecord.pack(t & 0xffffffff, Direction, len(data)) + bytes(data))
+                self.Records += 1
+
+    def Close(self):
+        with self._Lock:
+            if self._File:
+                self._File.close()
+                self._File = None
+
+#---------------------------------------------------------------------------
+# S h a r d   p o l i c i e s
+#---------------------------------------------------------------------------
+# input     Channel, ChannelType    from the AssignChannel message
+#           Dongles                 number of dongles (primary + shards)
+#
+# function  Select the dongle for a channel, when channels are spread over
+#           multiple dongles (clsAntDongle.AddShards)
+#
+# returns   index of the dongle; 0 = primary
+#---------------------------------------------------------------------------
+def ShardMastersSlaves(Channel, ChannelType, Dongles):
+    if ChannelType & 0x10:                      # Master (transmit) channel
+        return 0
+    else:
+        return min(1, Dongles - 1)
+
+def ShardRoundRobin(Channel, ChannelType, Dongles):
+    return Channel % Dongles
+
+#---------------------------------------------------------------------------
+# Messages that are sent to the dongle of the channel (info[0])
+#---------------------------------------------------------------------------
+ChannelMessages = { msgID_UnassignChannel, msgID_AssignChannel, msgID_ChannelPeriod,
+                    msgID_ChannelSearchTimeout, msgID_ChannelRfFrequency,
+                    msgID_OpenChannel, 0x4c, msgID_BroadcastData,
+                    msgID_AcknowledgedData, msgID_BurstData, msgID_ChannelID,
+                    msgID_ChannelTransmitPower }
+
 #---------------------------------------------------------------------------
 # c l s A n t D o n g l e
 #---------------------------------------------------------------------------
@@ -404,19 +905,40 @@ RfFrequency_2478Mhz     = 0x4e          # used for Tacx Vortex Headunit
 #---------------------------------------------------------------------------
 class clsAntDongle():
     devAntDongle        = None      # There is no dongle connected yet
+                                    # the clsAntTransport that is used
+    Transport           = None      # Transport to search for a dongle
     ConfigMsg           = True
     OK                  = False
     DeviceID            = None
     Message             = ''
     Cycplus             = False
     DongleReconnected   = False     # So can be used even when OK=False
+    Capture             = None      # clsAntCapture, when recording
+
+    # Additional dongles, see AddShards()
+    Shards              = []        # clsAntDongle for each additional dongle
+    ShardPolicy         = None      # function(Channel, ChannelType, Dongles)
+    ShardMap            = None      # Channel --> clsAntDongle
+    Primary             = None      # For a shard: the dongle it belongs to
+    Exclude             = ()        # Id() of dongles that are in use
 
     # Messages are store in a queue since 22-8-2022
-    _MessageQueue       = None
-    _MessageLock        = None
+    _MessageQueue       = None      # clsAntMessageQueue
+    MessageQueueMaxSize = 1000      # Messages; 4Hz on 8 channels = 30s
+    _Framer             = None      # Splits .read() data into messages
+    Wakeup              = None      # threading.Event, set when a message is queued
 
     # Read messages in a separate thread
+    #   The thread waits ReadTimeoutIdle for data; the read returns as soon
+    #   as data arrives. Only during ResponseWindow after a Write() that
+    #   expects a response (not for broadcasts, see ExpectsResponse), the
+    #   default (short) timeout is used.
     UseThread           = True     # "Compile time" flag to use threading
+    ReadTimeoutIdle     = 250       # ms
+    ResponseWindow      = 0.100     # seconds
+    ReadStatistics      = None      # clsAntReadStatistics
+    _ResponseExpected   = None      # Time of Write() that expects a response
+    UseBatchWrite       = True     # "Compile time" flag to combine writes
     ThreadActive        = False     # "Run time" flag that threading active
     MessageThread       = None      # The thread handle
 
@@ -424,18 +946,134 @@ class clsAntDongle():
     # _ _ i n i t _ _
     #-----------------------------------------------------------------------
     # Function  Create the class and try to find a dongle
+    #
+    # Input     DeviceID    USB ProductID of the dongle, -1 = no dongle
+    #           Transport   clsAntTransport, default clsAntUsbTransport
+    #           Exclude     Id() of dongles not to be used
     #-----------------------------------------------------------------------
-    def __init__(self, DeviceID = None):
+    def __init__(self, DeviceID = None, Transport = None, Exclude = ()):
         self.DeviceID      = DeviceID
-        self._MessageQueue = queue.Queue()      # Here messages are stored
-        self._MessageLock  = threading.Lock()   # This lock protects the queue
+        self.Exclude       = Exclude
+        self.Shards        = []
+        self.ShardMap      = {}
+        self.Transport     = Transport if Transport else clsAntUsbTransport()
+        self._MessageQueue = clsAntMessageQueue(self.MessageQueueMaxSize) # Here messages are stored
+        self._Framer       = clsAntFramer()     # Partial messages between reads
+        self.ReadStatistics= clsAntReadStatistics()
         self.OK            = True               # Otherwise we're disabled!!
         if self.DeviceID == -1:
             self.OK      = False                # No ANT dongle wanted
             self.Message = "No ANT"
         else:
+            if debug.on(debug.AntCapture):
+                self.StartCapture()             # Including the reset
             self.OK      = self.__GetDongle()
 
+    #-----------------------------------------------------------------------
+    # S t a r t C a p t u r e   /   S t o p C a p t u r e
+    #-----------------------------------------------------------------------
+    # Function  Record all data written to and read from the dongle in a
+    #           binary file, that can be replayed with antReplay.py
+    #
+    # Input     FileName    default FortiusAnt.<date time>.antcap
+    #-----------------------------------------------------------------------
+    def StartCapture(self, FileName=None):
+        self.StopCapture()
+        try:
+            self.Capture = clsAntCapture(FileName)
+        except Exception as e:
+            logfile.Console("AntDongle.StartCapture exception: " + str(e))
+        else:
+            logfile.Console("ANT dongle traffic is captured in %s" % self.Capture.FileName)
+
+    def StopCapture(self):
+        for Shard in self.Shards: Shard.StopCapture()
+        if self.Capture:
+            self.Capture.Close()
+            if debug.on(debug.Function):
+                logfile.Write("AntDongle.StopCapture(): %s records" % self.Capture.Records)
+            self.Capture = None
+
+    #-----------------------------------------------------------------------
+    # R e l e a s e
+    #-----------------------------------------------------------------------
+    # Function  Give the dongle(s) back to the system, see #203
+    #-----------------------------------------------------------------------
+    def Release(self):
+        for Shard in self.Shards: Shard.Release()
+        if self.OK:
+            self.devAntDongle.Release()
+
+    #-----------------------------------------------------------------------
+    # A d d S h a r d s
+    #-----------------------------------------------------------------------
+    # Function  Use additional dongles, so that the channels are spread over
+    #           multiple dongles (radio time and channel limit per dongle).
+    #
+    #           A shard is a clsAntDongle with its own read thread, that puts
+    #           the received messages in the queue of this (primary) dongle.
+    #           The channel numbers are the same on all dongles.
+    #
+    #           Write() sends each message to the dongle of its channel, as
+    #           selected by Policy when the channel is assigned; reset and
+    #           network key go to all dongles, other messages to the primary.
+    #
+    #           To be called before the channels are configured.
+    #
+    # Input     Policy      e.g. ShardMastersSlaves, ShardRoundRobin
+    #           Count       maximum number of shards, None = all dongles found
+    #           Transports  transport per shard, default self.Transport
+    #
+    # Returns   Number of shards
+    #-----------------------------------------------------------------------
+    def AddShards(self, Policy=ShardMastersSlaves, Count=None, Transports=None):
+        if not self.OK: return 0
+        self.ShardPolicy = Policy
+        Exclude = {self.devAntDongle.Id()}
+        while Count is None or len(self.Shards) < Count:
+            if Transports is not None:
+                if len(self.Shards) >= len(Transports): break
+                Transport = Transports[len(self.Shards)]
+            else:
+                Transport = self.Transport
+            Shard = clsAntDongle(self.DeviceID, Transport, Exclude)
+            if not Shard.OK: break
+            Shard.Primary   = self
+            Shard.UseThread = self.UseThread
+            Exclude.add(Shard.devAntDongle.Id())
+            self.Shards.append(Shard)
+            logfile.Console ("ANT dongle shard %s: %s" % (len(self.Shards), Shard.Message))
+
+        if self.Shards:
+            self.Message += ' + %s' % len(self.Shards)
+        return len(self.Shards)
+
+    #-----------------------------------------------------------------------
+    # _ S h a r d O f
+    #-----------------------------------------------------------------------
+    # Returns   the dongles to which the message must be sent
+    #-----------------------------------------------------------------------
+    def _ShardOf(self, message):
+        id = message[2]
+        if id in ChannelMessages:
+            Channel = message[3] & 0b00011111
+            if id == msgID_AssignChannel:
+                Dongles = [self] + self.Shards
+                self.ShardMap[Channel] = Dongles[self.ShardPolicy(Channel, message[4], len(Dongles))]
+            return [self.ShardMap.get(Channel, self)]
+
+        elif id == msgID_RequestMessage and message[4] in (msgID_ChannelID, 0x52):
+            return [self.ShardMap.get(message[3], self)]    # ChannelID/Status
+
+        elif id == msgID_ResetSystem:
+            return [self] + [s for s in self.Shards if not s.Cycplus]
+
+        elif id == msgID_SetNetworkKey:
+            return [self] + self.Shards
+
+        else:
+            return [self]
+
     #-----------------------------------------------------------------------
     # G e t D o n g l e
     #-----------------------------------------------------------------------
@@ -454,6 +1092,7 @@ class clsAntDongle():
         self.DongleReconnected  = False
 
         self.StopReadThread()           # Stop reading in a thread
+        self._Framer.Reset()            # Partial data of previous dongle
 
         if self.DeviceID == None:
             dongles = { (4104, "Suunto"), (4105, "Garmin"), (4100, "Older") }
@@ -478,7 +1117,7 @@ class clsAntDongle():
                 # Note: filter on idVendor=0x0fcf is removed
                 #-----------------------------------------------------------
                 self.Message = "No (free) ANT-dongle found"
-                devAntDongles = usb.core.find(find_all=True, idProduct=ant_pid)
+                devAntDongles = self.Transport.Candidates(ant_pid)
             except Exception as e:
                 logfile.Console("GetDongle - Exception: %s" % e)
                 if "AttributeError" in str(e):
@@ -489,14 +1128,16 @@ class clsAntDongle():
                     self.Message = "GetDongle: " + str(e)
             else:
                 #-----------------------------------------------------------
-                # Try all dongles of this type (as returned by usb.core.find)
+                # Try all dongles of this type (as returned by Candidates)
                 #-----------------------------------------------------------
                 for self.devAntDongle in devAntDongles:
+                    if self.devAntDongle.Id() in self.Exclude:
+                        continue                    # Already used as shard
                     if debug.on(debug.Function):
                         s = "GetDongle - Try dongle: manufacturer=%7s, product=%15s, vendor=%6s, product=%6s(%s)" %\
-                            (self.devAntDongle.manufacturer, self.devAntDongle.product, \
-                            hex(self.devAntDongle.idVendor), hex(self.devAntDongle.idProduct), \
-                            self.devAntDongle.idProduct)
+                            (self.devAntDongle.Manufacturer, self.devAntDongle.Product, \
+                            hex(self.devAntDongle.VendorID), hex(self.devAntDongle.ProductID), \
+                            self.devAntDongle.ProductID)
                         logfile.Console(s.replace('\0',''))
                     if debug.on(debug.Data1 | debug.Function):
                         logfile.Print (self.devAntDongle)
@@ -506,18 +1147,7 @@ class clsAntDongle():
                     # Initialize the dongle
                     #-------------------------------------------------------
                     try:                                   # check if in use
-                        #-------------------------------------------------------
-                        # As suggested by @ElDonad Elie Donadio
-                        #-------------------------------------------------------
-                        if os.name == 'posix':
-                            if debug.on(debug.Function): logfile.Write("GetDongle - Detach kernel drivers")
-                            for config in self.devAntDongle:
-                                for i in range(config.bNumInterfaces):
-                                    if self.devAntDongle.is_kernel_driver_active(i):
-                                        self.devAntDongle.detach_kernel_driver(i)
-                        #-------------------------------------------------------
-                        if debug.on(debug.Function): logfile.Write ("GetDongle - Set configuration")
-                        self.devAntDongle.set_configuration()
+                        self.devAntDongle.Configure()
 
                         for _ in range(2):
                             #---------------------------------------------------
@@ -528,7 +1158,8 @@ class clsAntDongle():
                                                                 # same as ResetDongle()
                                                                 # done here to have explicit error-handling.
                             if debug.on(debug.Function): logfile.Write ("GetDongle - Send reset string to dongle")
-                            self.devAntDongle.write(0x01, reset_string)
+                            if self.Capture: self.Capture.Record(CaptureOut, reset_string)
+                            self.devAntDongle.Write(reset_string)
                             time.sleep(0.500)                           # after reset, 500ms before next action
 
 
@@ -543,7 +1174,7 @@ class clsAntDongle():
                                 synch, length, id, _info, _checksum, _rest, _c, _d = DecomposeMessage(s)
                                 if synch==0xa4 and length==0x01 and id==0x6f:
                                     found_available_ant_stick = True
-                                    self.Message = "Using %s dongle" %  self.devAntDongle.manufacturer # dongle[1]
+                                    self.Message = "Using %s dongle" %  self.devAntDongle.Manufacturer # dongle[1]
                                     self.Message = self.Message.replace('\0','')          # .manufacturer is NULL-terminated
                                     if 'CYCPLUS' in self.Message:
                                         self.Cycplus = True
@@ -553,14 +1184,14 @@ class clsAntDongle():
                             #---------------------------------------------------
                             if found_available_ant_stick: break
 
-                    except usb.core.USBError as e:                  # cannot write to ANT dongle
-                        if debug.on(debug.Data1 | debug.Function):
-                            logfile.Write ("GetDongle - Exception: %s" % e)
-                        self.Message = "GetDongle - ANT dongle in use"
-
                     except Exception as e:
-                        logfile.Console("GetDongle - Exception: %s" % e)
-                        self.Message = "GetDongle: " + str(e)
+                        if UsePyusb and isinstance(e, usb.core.USBError):    # cannot write to ANT dongle
+                            if debug.on(debug.Data1 | debug.Function):
+                                logfile.Write ("GetDongle - Exception: %s" % e)
+                            self.Message = "GetDongle - ANT dongle in use"
+                        else:
+                            logfile.Console("GetDongle - Exception: %s" % e)
+                            self.Message = "GetDongle: " + str(e)
 
                     #-------------------------------------------------------
                     # If found, don't try the next ANT-dongle of this type
@@ -581,41 +1212,42 @@ class clsAntDongle():
         return found_available_ant_stick
 
     #-----------------------------------------------------------------------
-    # M e s s a g e Q u e u e   P u t   /   G e t   /   S i z e
+    # M e s s a g e Q u e u e   P u t   /   G e t   /   D r a i n   /   S i z e
     #-----------------------------------------------------------------------
-    # input     self._MessageLock
-    #           self._MessageQueue
+    # input     self._MessageQueue
     #
-    # function  Put: add message to   queue, protected by lock
-    #           Get: get message from queue, protected by lock
+    # function  Put:   add message to queue (read thread)
+    #                  and set Wakeup, so that the main loop is signalled
+    #           Get:   get message from queue (main loop)
+    #           Drain: get all messages from queue (main loop)
     #
-    #           The lock is used, so that Put/Get can be called from 
-    #           different threads.
+    #           Shards put into the queue of the primary dongle;
+    #           clsAntMessageQueue is safe for multiple read threads.
     #
     # output    self._MessageQueue
     #
-    # returns   Put: None
-    #           Get: the next message from the queue (or None)
+    # returns   Put:   None
+    #           Get:   the next message from the queue (or None)
+    #           Drain: list of messages
     #-----------------------------------------------------------------------
     def MessageQueuePut(self, message):
+        if self.Primary:                # A shard uses the queue of the primary
+            self.Primary.MessageQueuePut(message)
+            return
         if debug.on(debug.Function): logfile.Write ("MessageQueuePut(%s)" % logfile.HexSpace(message))
-        self._MessageLock.acquire()
-        self._MessageQueue.put(message)
-        self._MessageLock.release()
+        self._MessageQueue.Put(message)
+        if self.Wakeup: self.Wakeup.set()
 
     def MessageQueueGet(self):
-        self._MessageLock.acquire()
-        if self.MessageQueueSize():
-            message = self._MessageQueue.get(block=False, timeout=1)	# No timeout in the lock!!
-            self._MessageQueue.task_done()
-        else:
-            message = None
-        self._MessageLock.release()
+        message = self._MessageQueue.Get()
         if debug.on(debug.Function): logfile.Write ("MessageQueueGet() returns %s" % logfile.HexSpace(message))
         return message
 
+    def MessageQueueDrain(self):
+        return self._MessageQueue.Drain()
+
     def MessageQueueSize(self):
-        return self._MessageQueue.qsize()
+        return self._MessageQueue.Size()
 
     #-----------------------------------------------------------------------
     # W r i t e
@@ -637,9 +1269,29 @@ class clsAntDongle():
     # function  write all strings to antDongle
     #           read responses from antDongle
     #
+    #           Unless each message is to be flushed (receive and flush), the
+    #           messages are combined in bulk transfers of at most
+    #           devAntDongle.MaxPacketSize bytes (UseBatchWrite). So the five
+    #           broadcasts of a cycle take two USB transfers and one read,
+    #           instead of five transfers.
+    #
     # returns   None; data is in the Queue. QueueSize() returns nr messages.
     #-----------------------------------------------------------------------
     def Write(self, messages, receive=True, drop=True, flush=True):
+        if self.Shards:
+            #---------------------------------------------------------------
+            # Each dongle gets its own messages, in the original order
+            #---------------------------------------------------------------
+            Dongles = {}
+            for message in messages:
+                for Dongle in self._ShardOf(message):
+                    Dongles.setdefault(Dongle, []).append(message)
+            for Dongle, m in Dongles.items():
+                Dongle._Write(m, receive, drop, flush)
+        else:
+            self._Write(messages, receive, drop, flush)
+
+    def _Write(self, messages, receive=True, drop=True, flush=True):
         if self.OK:                      # If no dongle ==> no action at all
             #---------------------------------------------------------------
             # Read all available messages first, it seems required to be
@@ -649,31 +1301,33 @@ class clsAntDongle():
             if receive and flush:
                 self.Read(drop)   # Flush -> default timeout = proven!
 
-            for message in messages:
-                #-----------------------------------------------------------
-                # Logging
-                #-----------------------------------------------------------
-                DongleDebugMessage("Dongle    send   :", message)
-                if debug.on(debug.Performance):
-                    logfile.Write('devAntDongle.write(0x01,%s) ...' \
-                                                    % logfile.HexSpace(message))
-                #-----------------------------------------------------------
-                # Send the message
-                # No error recovery here, will be done on the subsequent Read()
-                #       that fails, which is done either here or by application.
-                #-----------------------------------------------------------
-                try:
-                    self.devAntDongle.write(0x01,message)   # input:   endpoint address, buffer, timeout
-                                                            # returns:
-                except Exception as e:
-                    logfile.Console("AntDongle.Write exception (message lost): " + str(e))
+            if receive and self._ResponseExpected is None and self.ExpectsResponse(messages):
+                self._ResponseExpected = cycleClock.Monotonic()
 
-                if debug.on(debug.Performance): logfile.Write('... done')
-                #-----------------------------------------------------------
-                # Read all responses (after each write only when flushing!)
-                #-----------------------------------------------------------
-                if receive and flush:
-                    self.Read(drop) # Flush -> default timeout = proven!
+            #---------------------------------------------------------------
+            # When no read is required between the messages, the messages
+            # are packed in as few bulk transfers as possible
+            #---------------------------------------------------------------
+            if self.UseBatchWrite and not (receive and flush):
+                batch = bytearray()
+                for message in messages:
+                    DongleDebugMessage("Dongle    send   :", message)
+                    if batch and len(batch) + len(message) > self.devAntDongle.MaxPacketSize:
+                        self.__WriteTransfer(batch)
+                        batch = bytearray()
+                    batch += message
+                if batch:
+                    self.__WriteTransfer(batch)
+
+            else:
+                for message in messages:
+                    DongleDebugMessage("Dongle    send   :", message)
+                    self.__WriteTransfer(message)
+                    #-------------------------------------------------------
+                    # Read all responses (after each write only when flushing!)
+                    #-------------------------------------------------------
+                    if receive and flush:
+                        self.Read(drop) # Flush -> default timeout = proven!
 
             #---------------------------------------------------------------
             # Read all responses after having sent all messages.
@@ -682,6 +1336,27 @@ class clsAntDongle():
             if receive and not flush:
                 self.Read(drop, 1)       # Shortest possible timeout
 
+    #-----------------------------------------------------------------------
+    # _ _ W r i t e T r a n s f e r
+    #-----------------------------------------------------------------------
+    # input     data        one or more complete messages
+    #
+    # function  send data to antDongle in one bulk transfer
+    #           No error recovery here, will be done on the subsequent Read()
+    #           that fails, which is done either here or by application.
+    #-----------------------------------------------------------------------
+    def __WriteTransfer(self, data):
+        if debug.on(debug.Performance):
+            logfile.Write('devAntDongle.Write(%s) ...' % logfile.HexSpace(data))
+
+        if self.Capture: self.Capture.Record(CaptureOut, data)
+        try:
+            self.devAntDongle.Write(data)
+        except Exception as e:
+            logfile.Console("AntDongle.Write exception (%s bytes lost): %s" % (len(data), e))
+
+        if debug.on(debug.Performance): logfile.Write('... done')
+
     #---------------------------------------------------------------------------
     # R e a d
     #---------------------------------------------------------------------------
@@ -714,6 +1389,7 @@ class clsAntDongle():
     #---------------------------------------------------------------------------
     def ApplicationRestart(self):
         self.DongleReconnected = False
+        for Shard in self.Shards: Shard.ApplicationRestart()
 
     def __ReadAndRetry(self, timeout):
         failed  = False
@@ -728,11 +1404,15 @@ class clsAntDongle():
         # Now we have a default of 20ms, which can be overridden by the caller
         # tipically in the ANT-loop, a short timeout will be specified.
         # ----------------------------------------------------------------------
-        if debug.on(debug.Performance): logfile.Write('devAntDongle.__ReadAndRetry(0x81,1000,%s) ...' % timeout)
+        if debug.on(debug.Performance): logfile.Write('devAntDongle.__ReadAndRetry(1000,%s) ...' % timeout)
         try:
             trv = []                                        # initialize because is processed even after exception
-            trv = self.devAntDongle.read(0x81,1000,timeout) # input:  endpoint address, length, timeout
+            trv = self.devAntDongle.Read(1000,timeout)      # input:  length, timeout
                                                             # returns: an array of bytes
+            if self.Capture: self.Capture.Record(CaptureIn, trv)
+            if self._ResponseExpected is not None and len(trv):
+                self.ReadStatistics.Response(cycleClock.Monotonic() - self._ResponseExpected)
+                self._ResponseExpected = None
         # ----------------------------------------------------------------------
         # https://docs.python.org/3/library/exceptions.html
         # ----------------------------------------------------------------------
@@ -746,7 +1426,8 @@ class clsAntDongle():
                 pass
             else:
                 failed = True
-                logfile.Console("devAntDongle.read exception: " + str(e))
+                logfile.Console("devAntDongle.Read exception: " + str(e))
+                if self.Capture: self.Capture.Record(CaptureError, str(e).encode())
         # ----------------------------------------------------------------------
         # Recover from Exception
         # If the dongle does not come back, it's an infinite loop. Bad luck.
@@ -764,16 +1445,22 @@ class clsAntDongle():
             if self.__GetDongle():
                 failed = False       # Exception resolved
                 self.DongleReconnected = True
+                if self.Primary: self.Primary.DongleReconnected = True
                 logfile.Console('ANT Dongle reconnected, application restarts')
 
+        self.ReadStatistics.Read(len(trv))
         if debug.on(debug.Performance): logfile.Write('... done')
         return trv
 
-    def _Read(self, _drop, timeout = 20):
+    def _Read(self, _drop, timeout = 20, single = False):
         #-------------------------------------------------------------------
         # Read from antDongle untill no more data (timeout), or error
+        # or only one .read if single (ReadThread loops itself, so that
+        # ThreadActive and the timeout are checked on every .read)
         # Usually, dongle gives one buffer at the time, starting with 0xa4
         # Sometimes, multiple messages are received together on one .read
+        # and under load a message may be split over two .read's; the
+        # framer keeps the incomplete part untill the next .read.
         #
         # https://www.thisisant.com/forum/view/viewthread/812
         #-------------------------------------------------------------------
@@ -788,53 +1475,16 @@ class clsAntDongle():
                                                     % (logfile.HexSpaceL(trv)))
 
             if len(trv) > 900: logfile.Console("Dongle.Read() too much data from .read()" )
-            start  = 0
-            while start < len(trv):
-                error = False
-                #-------------------------------------------------------
-                # Each message starts with a4; skip characters if not
-                #-------------------------------------------------------
-                skip = start
-                while skip < len(trv) and trv[skip] != 0xa4:
-                    skip += 1
-                if skip != start:
-                    logfile.Console("Dongle.Read: %s characters skipped " % (skip - start))
-                    start = skip
-                #-------------------------------------------------------
-                # Second character in the buffer (element in trv) is length of
-                # the info; add four for synch, len, id and checksum
-                #-------------------------------------------------------
-                if start + 1 < len(trv):
-                    length = trv[start+1] + 4
-                    if start + length <= len(trv):
-                        #-------------------------------------------------------
-                        # Check length and checksum
-                        # Append to return array when correct
-                        #-------------------------------------------------------
-                        d = bytes(trv[start : start+length])
-                        checksum = d[-1:]
-                        expected = CalcChecksum(d)
-
-                        if expected != checksum:
-                            error = "error: checksum incorrect"
-                            logfile.Console("%s checksum=%s expected=%s data=%s" % \
-                                ( error, logfile.HexSpace(checksum), logfile.HexSpace(expected), logfile.HexSpace(d) ) )
-                        else:
-                            self.MessageQueuePut(d) # 2022-08-22
-                            # Messages are always stored in the queue and hence never
-                            # dropped because a caller does not handle them.
-                            DongleDebugMessage ("Dongle    receive:", d)
-                    else:
-                        error = "error: message exceeds buffer length"
-                        break
-                else:
-                    break
-                if error:
-                    logfile.Console("Dongle.Read: %s" % (error))
-                #-------------------------------------------------------
-                # Next buffer in trv
-                #-------------------------------------------------------
-                start += length
+
+            for d in self._Framer.Feed(trv):
+                self.MessageQueuePut(d) # 2022-08-22
+                # Messages are always stored in the queue and hence never
+                # dropped because a caller does not handle them.
+                DongleDebugMessage ("Dongle    receive:", d)
+
+            if single:
+                break
+
         if self.OK and debug.on(debug.Function):
             logfile.Write ("AntDongle.Read: Queue contains %s messages" % self.MessageQueueSize())
 
@@ -847,6 +1497,7 @@ class clsAntDongle():
     # ... or just using the queue as is filled in the thread
     #--------------------------------------------------------------------------
     def StartReadThread(self):
+        for Shard in self.Shards: Shard.StartReadThread()
         if self.UseThread and self.OK:
             if debug.on(debug.Function): logfile.Write ("StartReadThread(): Create thread to read messages from ANT dongle")
             self.MessageThread = threading.Thread(target=self.ReadThread, daemon=True)    # No args=(), 
@@ -860,13 +1511,52 @@ class clsAntDongle():
             pass
         else:
             self._Read(drop, timeout)
+            for Shard in self.Shards: Shard.Read(drop, timeout)
 
     def ReadThread(self):
         while self.ThreadActive:
             # print('*** Thread read message')
-            self._Read(False)
+            self._Read(False, self.ReadThreadTimeout(), True)
+
+    #--------------------------------------------------------------------------
+    # E x p e c t s R e s p o n s e
+    #--------------------------------------------------------------------------
+    # Returns   True when one of the messages is answered by the dongle;
+    #           configuration, requests, acknowledged and burst data.
+    #           Broadcasts are not; the next EVENT_TX is not a response.
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def ExpectsResponse(messages):
+        for message in messages:
+            if message[2] != msgID_BroadcastData:
+                return True
+        return False
+
+    #--------------------------------------------------------------------------
+    # R e a d T h r e a d T i m e o u t
+    #--------------------------------------------------------------------------
+    # Returns   the timeout (ms) for the next read in the thread;
+    #           short when a response is expected, so that the thread returns
+    #           to the loop quickly, otherwise long so that an idle thread
+    #           does not wake up 50 times per second.
+    #--------------------------------------------------------------------------
+    def ReadThreadTimeout(self):
+        Expected = self._ResponseExpected
+        if Expected is not None:
+            if cycleClock.Monotonic() - Expected < self.ResponseWindow:
+                return 20
+            self._ResponseExpected = None       # No response, expect no more
+        return self.ReadTimeoutIdle
+
+    #--------------------------------------------------------------------------
+    # L o g S t a t i s t i c s
+    #--------------------------------------------------------------------------
+    def LogStatistics(self):
+        self._MessageQueue.Log()
+        self.ReadStatistics.Log()
 
     def StopReadThread(self):
+        for Shard in self.Shards: Shard.StopReadThread()
         if self.MessageThread:
             if debug.on(debug.Function): logfile.Write ("StopReadThread(): Stop thread reading messages from ANT dongle")
             self.ThreadActive = False       # Signal thread to stop
@@ -875,6 +1565,24 @@ class clsAntDongle():
             if debug.on(debug.Function): logfile.Write ("StopReadThread(): Thread stopped")
 
 
+    #-----------------------------------------------------------------------
+    # B u r s t T r a n s f e r
+    #-----------------------------------------------------------------------
+    # input     Channel, data
+    #
+    # function  Send data as burst transfer; the packets are written to the
+    #           dongle without waiting in between (see Write()), the dongle
+    #           transmits them in consecutive message periods.
+    #           EVENT_TRANSFER_TX_COMPLETED or _FAILED is received on the
+    #           channel when done.
+    #
+    # returns   number of packets
+    #-----------------------------------------------------------------------
+    def BurstTransfer(self, Channel, data):
+        messages = msg50_BurstTransfer(Channel, data)
+        self.Write(messages, False)
+        return len(messages)
+
     #-----------------------------------------------------------------------
     # Standard dongle commands
     # Observation: all commands have two bytes 00 00 for which purpose is unclear
@@ -913,7 +1621,7 @@ class clsAntDongle():
                 msg4A_ResetSystem(),
             ]
             self.Write(messages, False)
-        time.sleep(0.500)                           # After Reset, 500ms before next action
+        cycleClock.Sleep(0.500)                     # After Reset, 500ms before next action
 
     def SlavePair_ChannelConfig(self, channel_pair, \
                                 DeviceNumber=0, DeviceTypeID=0, TransmissionType=0):
@@ -1213,6 +1921,9 @@ class clsAntDongle():
 #-------------------------------------------------------------------------------
 def EnumerateAll():
     logfile.Console("Dongles in the system:")
+    if not UsePyusb:
+        logfile.Console("pyusb not installed")
+        return
     devices = usb.core.find(find_all=True)
     for device in devices:
 #       print (device)
@@ -1243,34 +1954,48 @@ def calc_checksum(message):
     return CalcChecksum (message)           # alias for compatibility
 
 def CalcChecksum (message):
-    xor_value = 0
     length    = message[1]                  # byte 1; length of info
     length   += 3                           # Add synch, len, id
-    for i in range (0, length):             # Process bytes as defined in length
-        xor_value = xor_value ^ message[i]
-
-#   print('checksum', logfile.HexSpace(message), xor_value, bytes([xor_value]))
+    return bytes([XorChecksum(message[0:length])])
 
-    return bytes([xor_value])
+#-------------------------------------------------------------------------------
+# X o r C h e c k s u m
+#-------------------------------------------------------------------------------
+# input     data    bytes, bytearray or memoryview
+#
+# function  XOR of all bytes in data
+#           The bytes are taken as one integer, which is folded in halves so
+#           that a message of 13 bytes takes four steps instead of a loop
+#           over all bytes.
+#
+# returns   checksum (int)
+#-------------------------------------------------------------------------------
+def XorChecksum (data):
+    n = len(data)
+    x = int.from_bytes(data, 'little')
+    while n > 1:
+        half = n // 2                       # lower half, in bytes
+        n   -= half                         # upper half, the longest
+        x    = (x >> (half * 8)) ^ (x & ((1 << (half * 8)) - 1))
+    return x
 
 #-------------------------------------------------------------------------------
 # C o m p o s e   A N T   M e s s a g e
 #-------------------------------------------------------------------------------
-def ComposeMessage(id, info):
-    fSynch      = sc.unsigned_char
-    fLength     = sc.unsigned_char
-    fId         = sc.unsigned_char
-    fInfo       = str(len(info)) + sc.char_array  # 9 character string
+_MessageHeader = struct.Struct(sc.no_alignment + sc.unsigned_char * 3)   # synch, length, id
 
-    format  =    sc.no_alignment + fSynch + fLength + fId + fInfo
-    data    = struct.pack (format, 0xa4,    len(info), id,  info)
+def ComposeMessage(id, info):
+    length  = len(info)
+    data    = bytearray(length + 4)
+    _MessageHeader.pack_into(data, 0, 0xa4, length, id)
+    data[3:3 + length] = info
     #-----------------------------------------------------------------------
     # Add the checksum
     # (antifier added \00\00 after each message for unknown reason)
     #-----------------------------------------------------------------------
-    data += calc_checksum(data)
+    data[-1] = XorChecksum(memoryview(data)[:-1])
 
-    return data
+    return bytes(data)
 
 def DecomposeMessage(d):
     synch       = 0
@@ -1295,55 +2020,311 @@ def DecomposeMessage(d):
 
     #---------------------------------------------------------------------------
     # Special treatment for Burst data
-    # Note that SequenceNumber is not returned and therefore lost, which is to
-    #      be implemented as soon as we will use msgID_BurstData
+    # Note that SequenceNumber is not returned, use unmsg50_BurstData(info)
     #---------------------------------------------------------------------------
     if id == msgID_BurstData:
-        _SequenceNumber = (Channel & 0b11100000) >> 5 # Upper 3 bits
         Channel         =  Channel & 0b00011111       # Lower 5 bits
 
     return synch, length, id, info, checksum, rest, Channel, DataPageNumber
 
 #-------------------------------------------------------------------------------
-# D e b u g M e s s a g e
+# c l s A n t P a g e
 #-------------------------------------------------------------------------------
-# input     msg, d
+# function  Precompiled layout of an ANT message content (info), so that the
+#           struct-format is built once (at import) instead of on every
+#           msgPage/msgUnpage call.
 #
-# function  Write structured dongle message to logfile if so requested
-#           Message ID is translated to text
-#           Also, channel and page are logged
-#           - the first byte of info is not always channel, if not ignore!
-#           - only some messages have a datapage, then page is printed
-#           - and some messages, payload is not printed but specific data
-#               e.g. ANTversion
+# input     Name            name of the page, used for View()
+#           Endian          sc.no_alignment or sc.big_endian
+#           Fields          tuple of (name, format); name=None for padding
 #
-# returns   none
+# functions Pack(*values)               returns info
+#           Unpack(info)                returns tuple of values
+#           View(info)                  returns namedtuple of values
 #-------------------------------------------------------------------------------
-def DongleDebugMessage(text, d):
-    if debug.on(debug.Data1):
-        synch, length, id, info, checksum, _rest, Channel, p = DecomposeMessage(d)
+class clsAntPage():
+    def __init__(self, Name, Endian, Fields):
+        self.Name           = Name
 
-        #-----------------------------------------------------------------------
-        # info_ is the payload of the message
-        # Channel and p are filled, but only valid for some messages
-        #-----------------------------------------------------------------------
-        info_ = logfile.HexSpace(info)
+        format              = ''.join([f for _n, f in Fields])
+        self.Fields         = tuple([n for n, _f in Fields if n != None])
+        self.Struct         = struct.Struct(Endian + format)
+        self.Size           = self.Struct.size
+        self.Tuple          = collections.namedtuple(Name, self.Fields)
 
-        #-----------------------------------------------------------------------
-        # First add readable name (id_) to id
-        #-----------------------------------------------------------------------
-        if   id == msgID_ANTversion             : id_ = 'ANT version'
+    def Pack(self, *values):
+        return self.Struct.pack(*values)
 
-        elif id == msgID_BroadcastData          : id_ = 'Broadcast Data'
-        elif id == msgID_AcknowledgedData       : id_ = 'Acknowledged Data'
+    def Unpack(self, info):
+        return self.Struct.unpack_from(info)
 
-        elif id == msgID_ChannelResponse        : id_ = 'Channel Response'
-        elif id == msgID_Capabilities           : id_ = 'Capabilities'
-        elif id == msgID_UnassignChannel        : id_ = 'Unassign Channel'
-        elif id == msgID_AssignChannel          : id_ = 'Assign Channel'
-        elif id == msgID_ChannelPeriod          : id_ = 'Channel Period'
-        elif id == msgID_ChannelSearchTimeout   : id_ = 'Channel Search Timeout'
-        elif id == msgID_ChannelRfFrequency     : id_ = 'Channel RfFrequency'
+    def View(self, info):
+        return self.Tuple._make(self.Struct.unpack_from(info))
+
+#-------------------------------------------------------------------------------
+# c l s A n t M e s s a g e
+#-------------------------------------------------------------------------------
+# input     d               received ANT message
+#
+# function  The ANT message, decomposed once; all handlers use these fields
+#           instead of calling DecomposeMessage() again.
+#           SubPageNumber is the third byte of info (Tacx pages), if present.
+#-------------------------------------------------------------------------------
+class clsAntMessage():
+    def __init__(self, d):
+        self.Message        = d
+        self.synch, self.length, self.id, self.info, self.checksum, self.rest, \
+            self.Channel, self.DataPageNumber = DecomposeMessage(d)
+        self.SubPageNumber  = self.info[2] if len(self.info) > 2 else None
+
+#-------------------------------------------------------------------------------
+# c l s A n t R o u t e r
+#-------------------------------------------------------------------------------
+# function  Dispatch received ANT messages to the handler that is registered
+#           for (id, Channel, DataPageNumber).
+#           None in the key is a wildcard; the most specific handler is tried
+#           first:
+#               (id,   Channel, DataPageNumber)     e.g. FE-C page 49
+#               (id,   Channel, None)               all pages of a channel
+#               (None, Channel, None)               all messages of a channel
+#               (id,   None,    None)               message for any channel
+#
+#           A handler is called with a clsAntMessage and returns True when the
+#           message is handled; otherwise the next handler is tried.
+#           So the work per message does not grow with the number of channels.
+#
+# functions Register(Handler, id, Channel, DataPageNumber)
+#           Dispatch(d)     returns True if the message is handled
+#           Log(m, error)   show what we ignore, not to be blind for surprises
+#-------------------------------------------------------------------------------
+class clsAntRouter():
+    def __init__(self, PrintWarnings=False):
+        self.Handlers       = {}
+        self.PrintWarnings  = PrintWarnings
+
+    def Register(self, Handler, id=None, Channel=None, DataPageNumber=None):
+        self.Handlers[(id, Channel, DataPageNumber)] = Handler
+
+    def Dispatch(self, d):
+        m = clsAntMessage(d)
+        h = self.Handlers
+        for key in ((m.id,  m.Channel, m.DataPageNumber), \
+                    (m.id,  m.Channel, None), \
+                    (None,  m.Channel, None), \
+                    (m.id,  None,      None)):
+            Handler = h.get(key)
+            if Handler != None and Handler(m):
+                return True
+
+        self.Log(m, "Not handled")
+        return False
+
+    def Log(self, m, error):
+        if self.PrintWarnings or debug.on(debug.Data1): logfile.Write(\
+            "ANT Dongle:%s: synch=%s, len=%2s, id=%s, check=%s, channel=%s, page=%s(%s) info=%s" % \
+            (error, m.synch, m.length, hex(m.id), m.checksum, m.Channel, m.DataPageNumber, \
+             hex(m.DataPageNumber), logfile.HexSpace(m.info)))
+
+#-------------------------------------------------------------------------------
+# c l s A n t B u r s t
+#-------------------------------------------------------------------------------
+# function  Reassemble the burst packets (msgID_BurstData) of each channel
+#           into the complete data.
+#
+#           The sequence number of each packet is checked; when a packet is
+#           missing, the transfer is discarded (Lost). A first packet while
+#           a transfer is in progress discards the incomplete transfer too.
+#
+# functions Register(Handler, Channel)  Handler(Channel, data) is called
+#                                       with the data of a complete transfer
+#           Dispatch(m)                 the handler for clsAntRouter
+#           Feed(m)                     returns (Channel, data) when complete,
+#                                       otherwise None
+#           ChannelResponse(m)          calls Failed() for a channel response
+#                                       EVENT_TRANSFER_RX_FAILED
+#           Failed(Channel)             discard the incomplete transfer
+#
+# attributes
+#   Completed, Lost     number of transfers
+#-------------------------------------------------------------------------------
+class clsAntBurst():
+    MaxLength           = 0x10000       # Bytes, longer transfers are discarded
+
+    def __init__(self):
+        self.Handlers   = {}            # Channel --> Handler
+        self.Transfers  = {}            # Channel --> [Sequence, bytearray]
+        self.Completed  = 0
+        self.Lost       = 0
+
+    def Register(self, Handler, Channel):
+        self.Handlers[Channel] = Handler
+
+    def Dispatch(self, m):
+        rtn = self.Feed(m)
+        if rtn:
+            Channel, data = rtn
+            Handler = self.Handlers.get(Channel)
+            if Handler:
+                Handler(Channel, data)
+            elif debug.on(debug.Data1):
+                logfile.Write("Burst data on channel %s not handled: %s" % (Channel, logfile.HexSpace(data)))
+        return True
+
+    def Feed(self, m):
+        Channel, Sequence, data = unmsg50_BurstData(m.info)
+        Transfer = self.Transfers.get(Channel)
+
+        if Sequence & 0b011 == 0:                               # First packet
+            if Transfer:
+                self._Lost(Channel, 'incomplete')
+            Transfer = self.Transfers[Channel] = [0, bytearray()]
+
+        elif Transfer is None:
+            return None                                         # No transfer in
+                                                                # progress; first
+                                                                # packet missed or
+                                                                # already discarded
+        elif Sequence & 0b011 != BurstSequenceNext(Transfer[0]):
+            self._Lost(Channel, 'sequence %s after %s' % (Sequence & 0b011, Transfer[0]))
+            return None
+
+        Transfer[0]  = Sequence & 0b011
+        Transfer[1] += data
+
+        if Sequence & BurstLastPacket:
+            del self.Transfers[Channel]
+            self.Completed += 1
+            return Channel, bytes(Transfer[1])
+
+        if len(Transfer[1]) > self.MaxLength:
+            self._Lost(Channel, 'too long')
+        return None
+
+    def ChannelResponse(self, m):
+        _Channel, InitiatingMessageID, ResponseCode = unmsg64_ChannelResponse(m.info)
+        if InitiatingMessageID == msgID_RF_EVENT and ResponseCode == EVENT_TRANSFER_RX_FAILED:
+            self.Failed(m.Channel)
+            return True
+        return False
+
+    def Failed(self, Channel):
+        if Channel in self.Transfers:
+            self._Lost(Channel, 'failed')
+
+    def _Lost(self, Channel, reason):
+        self.Transfers.pop(Channel, None)
+        self.Lost += 1
+        if debug.on(debug.Data1):
+            logfile.Write("Burst transfer on channel %s lost; %s" % (Channel, reason))
+
+#-------------------------------------------------------------------------------
+# c l s A n t T x S c h e d u l e r
+#-------------------------------------------------------------------------------
+# function  Broadcast the data of each master channel on its own channel period.
+#
+#           After a broadcast, the dongle reports EVENT_TX for the channel; the
+#           data for the next broadcast must be sent to the dongle before the
+#           next channel period, otherwise the previous data is sent again.
+#           So, when EVENT_TX is received, the channel is due and Messages()
+#           returns the next payload, created by the Provider of the channel.
+#
+#           This way each channel is served at its own period (e.g. 8182/32768
+#           for PWR, 8086/32768 for SCS) and a slow loop delays one channel,
+#           not all channels at once.
+#
+#           When no EVENT_TX is received for Timeout seconds (e.g. after the
+#           channel is opened or when the event is dropped from the queue),
+#           the payload is sent anyway.
+#
+# functions Register(Provider, Channel) Provider() returns the broadcast
+#                                       message, or None if nothing to send
+#           Dispatch(m)                 the handler for clsAntRouter; returns
+#                                       True for EVENT_TX on a registered
+#                                       channel
+#           Messages()                  the messages for the due channels
+#
+# attributes
+#   Events, Timeouts    number of payloads sent on EVENT_TX and on timeout
+#-------------------------------------------------------------------------------
+class clsAntTxScheduler():
+    Timeout             = 1.0           # Seconds
+
+    def __init__(self):
+        self.Providers  = {}            # Channel --> Provider
+        self.Due        = {}            # Channels with EVENT_TX, in order
+        self.LastSent   = {}            # Channel --> time
+        self.Events     = 0
+        self.Timeouts   = 0
+
+    def Register(self, Provider, Channel):
+        self.Providers[Channel] = Provider
+
+    def Dispatch(self, m):
+        Channel, InitiatingMessageID, ResponseCode = unmsg64_ChannelResponse(m.info)
+        if InitiatingMessageID == msgID_RF_EVENT and ResponseCode == EVENT_TX \
+                and Channel in self.Providers:
+            self.Due[Channel] = True
+            return True
+        return False
+
+    def Messages(self):
+        now = cycleClock.Monotonic()
+        messages = []
+        for Channel, Provider in self.Providers.items():
+            if Channel in self.Due:
+                self.Events += 1
+            elif now - self.LastSent.get(Channel, 0) >= self.Timeout:
+                self.Timeouts += 1
+            else:
+                continue
+            self.LastSent[Channel] = now
+            message = Provider()
+            if message:
+                messages.append(message)
+        self.Due.clear()
+        return messages
+
+#-------------------------------------------------------------------------------
+# D e b u g M e s s a g e
+#-------------------------------------------------------------------------------
+# input     msg, d
+#
+# function  Write structured dongle message to logfile if so requested
+#           Message ID is translated to text
+#           Also, channel and page are logged
+#           - the first byte of info is not always channel, if not ignore!
+#           - only some messages have a datapage, then page is printed
+#           - and some messages, payload is not printed but specific data
+#               e.g. ANTversion
+#
+# returns   none
+#-------------------------------------------------------------------------------
+def DongleDebugMessage(text, d):
+    if debug.on(debug.Data1):
+        synch, length, id, info, checksum, _rest, Channel, p = DecomposeMessage(d)
+
+        #-----------------------------------------------------------------------
+        # info_ is the payload of the message
+        # Channel and p are filled, but only valid for some messages
+        #-----------------------------------------------------------------------
+        info_ = logfile.HexSpace(info)
+
+        #-----------------------------------------------------------------------
+        # First add readable name (id_) to id
+        #-----------------------------------------------------------------------
+        if   id == msgID_ANTversion             : id_ = 'ANT version'
+
+        elif id == msgID_BroadcastData          : id_ = 'Broadcast Data'
+        elif id == msgID_AcknowledgedData       : id_ = 'Acknowledged Data'
+        elif id == msgID_BurstData              : id_ = 'Burst Data'
+
+        elif id == msgID_ChannelResponse        : id_ = 'Channel Response'
+        elif id == msgID_Capabilities           : id_ = 'Capabilities'
+        elif id == msgID_UnassignChannel        : id_ = 'Unassign Channel'
+        elif id == msgID_AssignChannel          : id_ = 'Assign Channel'
+        elif id == msgID_ChannelPeriod          : id_ = 'Channel Period'
+        elif id == msgID_ChannelSearchTimeout   : id_ = 'Channel Search Timeout'
+        elif id == msgID_ChannelRfFrequency     : id_ = 'Channel RfFrequency'
         elif id == msgID_SetNetworkKey          : id_ = 'Set NetworkKey'
         elif id == msgID_ResetSystem            : id_ = 'Reset System'
         elif id == msgID_OpenChannel            : id_ = 'Open Channel'
@@ -1519,6 +2500,48 @@ def msg4D_RequestMessage(ChannelNumber, RequestedMessageID):
     msg     = ComposeMessage (0x4d, info)
     return msg
 
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   50   B u r s t   D a t a
+# ------------------------------------------------------------------------------
+# D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
+# Page  40.   5.5.4 Burst transfers
+# Page  64. 9.5.5.3 Burst Transfer Data (0x50)
+#
+# The first byte of info contains the channel (lower 5 bits) and the sequence
+# number (upper 3 bits): 0 for the first packet, then 1, 2, 3, 1, 2, 3...
+# and BurstLastPacket is added to the last packet.
+# ------------------------------------------------------------------------------
+BurstLastPacket     = 0b100
+
+def BurstSequenceNext(Sequence):
+    return Sequence % 3 + 1                 # 0 -> 1 -> 2 -> 3 -> 1
+
+def msg50_BurstData(ChannelNumber, SequenceNumber, Data):
+    info    = bytes(((SequenceNumber << 5) | (ChannelNumber & 0b00011111),)) + Data
+    msg     = ComposeMessage (msgID_BurstData, info)
+    return msg
+
+def unmsg50_BurstData(info):
+    ChannelNumber   = info[0] & 0b00011111
+    SequenceNumber  = info[0] >> 5
+    return ChannelNumber, SequenceNumber, info[1:]
+
+#-------------------------------------------------------------------------------
+# msg50_BurstTransfer returns the list of burst packets for data; the data is
+# padded with zeroes to a multiple of 8 bytes.
+#-------------------------------------------------------------------------------
+def msg50_BurstTransfer(ChannelNumber, data):
+    data     = bytes(data) + bytes(-len(data) % 8)
+    packets  = max(1, len(data) // 8)
+    messages = []
+    Sequence = 0
+    for i in range(packets):
+        if i == packets - 1:
+            Sequence |= BurstLastPacket
+        messages.append(msg50_BurstData(ChannelNumber, Sequence, data[i * 8 : i * 8 + 8].ljust(8, b'\x00')))
+        Sequence = BurstSequenceNext(Sequence)
+    return messages
+
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   51   C h a n n e l I D
 # ------------------------------------------------------------------------------
@@ -1533,12 +2556,14 @@ def msg51_ChannelID(ChannelNumber, DeviceNumber, DeviceTypeID, TransmissionType)
     msg     = ComposeMessage (0x51, info)
     return msg
 
-def unmsg51_ChannelID(info):
-    #                              0                  1                   2                  3
-    format  =    sc.no_alignment + sc.unsigned_char + sc.unsigned_short + sc.unsigned_char + sc.unsigned_char
-    tuple  = struct.unpack (format, info)
+codecMsg51_ChannelID = clsAntPage('ChannelID', sc.no_alignment, (
+    ('ChannelNumber',       sc.unsigned_char    ),
+    ('DeviceNumber',        sc.unsigned_short   ),
+    ('DeviceTypeID',        sc.unsigned_char    ),
+    ('TransmissionType',    sc.unsigned_char    )))
 
-    return                         tuple[0],          tuple[1],           tuple[2],          tuple[3]
+def unmsg51_ChannelID(info):
+    return codecMsg51_ChannelID.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   60   C h a n n e l T r a n s m i t P o w e r
@@ -1555,20 +2580,13 @@ def msg60_ChannelTransmitPower(ChannelNumber, TransmitPower):
 # D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
 # 9.5.6 Channel response / event messages
 # ------------------------------------------------------------------------------
-def unmsg64_ChannelResponse(info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char
-
-    nInitiatingMessageID= 1
-    fInitiatingMessageID= sc.unsigned_char
+codecMsg64_ChannelResponse = clsAntPage('ChannelResponse', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),
+    ('InitiatingMessageID', sc.unsigned_char    ),
+    ('ResponseCode',        sc.unsigned_char    )))
 
-    nResponseCode       = 2
-    fResponseCode       = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fInitiatingMessageID + fResponseCode
-    tuple  = struct.unpack (format, info)
-
-    return tuple[nChannel], tuple[nInitiatingMessageID], tuple[nResponseCode]
+def unmsg64_ChannelResponse(info):
+    return codecMsg64_ChannelResponse.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   P o w e r   p r o f i l e
@@ -1577,6 +2595,15 @@ def unmsg64_ChannelResponse(info):
 #  trainer: D00001086_ANT+_Device_Profile_-_Bicycle_Power_Rev_5.1.pdf
 #           Data page 16 (0x10) Power-only Main Data Page
 # ------------------------------------------------------------------------------
+codecPage16_PowerOnly = clsAntPage('PowerOnly', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('EventCount',          sc.unsigned_char    ),
+    ('PedalPower',          sc.unsigned_char    ),
+    ('InstantaneousCadence',sc.unsigned_char    ),
+    ('AccumulatedPower',    sc.unsigned_short   ),
+    ('InstantaneousPower',  sc.unsigned_short   )))
+
 def msgPage16_PowerOnly (Channel, EventCount, Cadence, AccumulatedPower, CurrentPower):
     DataPageNumber      = 16
 
@@ -1585,18 +2612,7 @@ def msgPage16_PowerOnly (Channel, EventCount, Cadence, AccumulatedPower, Current
     AccumulatedPower      = int(       min(0xffff, AccumulatedPower))
     CurrentPower          = int(max(0, min(0x0fff, CurrentPower    )))  # 2021-02-19
 
-    fChannel              = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber       = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEventCount           = sc.unsigned_char
-    fPedalPower           = sc.unsigned_char
-    fInstantaneousCadence = sc.unsigned_char
-    fAccumulatedPower     = sc.unsigned_short
-    fInstantaneousPower   = sc.unsigned_short
-
-    format = sc.no_alignment +  fChannel + fDataPageNumber + fEventCount + fPedalPower + fInstantaneousCadence + fAccumulatedPower + fInstantaneousPower
-    info   = struct.pack(format, Channel,   DataPageNumber,   EventCount,   0xff,         Cadence,                AccumulatedPower,   CurrentPower)
-
-    return info
+    return codecPage16_PowerOnly.Pack(Channel, DataPageNumber, EventCount, 0xff, Cadence, AccumulatedPower, CurrentPower)
 
 # ------------------------------------------------------------------------------
 # P a g e 0 0   T a c x V o r t e x D a t a S p e e d
@@ -1619,51 +2635,31 @@ def msgPage16_PowerOnly (Channel, EventCount, Cadence, AccumulatedPower, Current
 #06:15:48,254: IGNORED!! msg=0x4e ch=7 p=0 info="07 00 80 17 00 4a 00 05 1d" TACX_VORTEX_DATA_SPEED
 #                                                ch p  power speed rrrrr cd
 # ------------------------------------------------------------------------------
+codecPage00_TacxVortexDataSpeed = clsAntPage('TacxVortexDataSpeed', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # 0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # payload[0]        First byte of the ANT+ datapage
+    ('Power',               sc.unsigned_short   ),  # payload[1 and 2]  Watts, big-endian
+    ('Speed',               sc.unsigned_short   ),  # payload[3 and 4]  cm/s, big-endian
+    (None,                  sc.pad * 2          ),  # payload[5 and 6]
+    ('Cadence',             sc.unsigned_char    )))  # payload[7]
+
 def msgPage00_TacxVortexDataSpeed (Channel, Power, Speed, Cadence):
     DataPageNumber      = 0
 
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # payload[0]        First byte of the ANT+ datapage
-    fPower              = sc.unsigned_short # payload[1 and 2]  Watts, big-endian
-    fSpeed              = sc.unsigned_short # payload[3 and 4]  cm/s, big-endian
-    fReserved           = sc.pad * 2        # payload[5 and 6]
-    fCadence            = sc.unsigned_char  # payload[7]
-
-    format = sc.big_endian +    fChannel + fDataPageNumber +    fPower +    fSpeed + fReserved + fCadence
-    info   = struct.pack(format, Channel ,  DataPageNumber , int(Power), int(Speed),          int(Cadence))
+    info = codecPage00_TacxVortexDataSpeed.Pack(Channel, DataPageNumber, int(Power), int(Speed), int(Cadence))
 
     # print('msgPage00_TacxVortexDataSpeed', info, Channel, Power, Speed, Cadence)
 
     return info
 
 def msgUnpage00_TacxVortexDataSpeed (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0]        First byte of the ANT+ datapage
-
-    nPower              = 2
-    fPower              = sc.unsigned_short # payload[1 and 2]  Watts, big-endian
-
-    nSpeed              = 3
-    fSpeed              = sc.unsigned_short # payload[3 and 4]  cm/s, big-endian
-
-    fReserved           = sc.pad * 2        # payload[5 and 6]
-
-    nCadence            = 4
-    fCadence            = sc.unsigned_char  # payload[7]
+    _Channel, _DataPageNumber, P, S, C = codecPage00_TacxVortexDataSpeed.Unpack(info)
 
-    format= sc.big_endian + fChannel + fDataPageNumber + fPower + fSpeed + fReserved + fCadence
-    tuple = struct.unpack (format, info)
-
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    UsingVirtualSpeed   = (tuple[nPower] & 0x8000) >> 15 # B 1000 0000 0000 0000
-    CalibrationState    = (tuple[nPower] & 0x6000) >> 13 # B 0110 0000 0000 0000
-    Power               =  tuple[nPower] & 0x07ff        # B 0000 0111 1111 1111
-    Speed               =  tuple[nSpeed] & 0x03ff        # B 0000 0011 1111 1111
-    Cadence             =  tuple[nCadence]
+    UsingVirtualSpeed   = (P & 0x8000) >> 15            # B 1000 0000 0000 0000
+    CalibrationState    = (P & 0x6000) >> 13            # B 0110 0000 0000 0000
+    Power               =  P & 0x07ff                   # B 0000 0111 1111 1111
+    Speed               =  S & 0x03ff                   # B 0000 0011 1111 1111
+    Cadence             =  C
 
     return UsingVirtualSpeed, Power, Speed, CalibrationState, Cadence
 
@@ -1687,37 +2683,19 @@ def msgUnpage00_TacxVortexDataSpeed (info):
 #06:15:35,603: IGNORED!! msg=0x4e ch=7 p=1 info="07 01 3d 0d 00 29 42 00 00" TACX_VORTEX_DATA_SERIAL
 #                                                ch p  s1 s2 serial-- alarm
 # ------------------------------------------------------------------------------
-def msgUnpage01_TacxVortexDataSerial (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    nS1                 = 2
-    fS1                 = sc.unsigned_char  # payload[1]
-
-    nS2                 = 3
-    fS2                 = sc.unsigned_char  # payload[2]
+codecPage01_TacxVortexDataSerial = clsAntPage('TacxVortexDataSerial', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # payload[0] First byte of the ANT+ datapage
+    ('S1',                  sc.unsigned_char    ),  # payload[1]
+    ('S2',                  sc.unsigned_char    ),  # payload[2]
+    ('S3',                  sc.unsigned_char    ),  # payload[3]
+    ('Serial',              sc.unsigned_short   ),  # payload[4, 5]
+    ('Alarm',               sc.unsigned_short   )))  # payload[6, 7]
 
-    nS3                 = 4
-    fS3                 = sc.unsigned_char  # payload[3]
-
-    nSerial             = 5
-    fSerial             = sc.unsigned_short # payload[4, 5]
-
-    nAlarm              = 6
-    fAlarm              = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fS1 + fS2 + fS3 + fSerial + fAlarm
-    tuple = struct.unpack (format, info)
+def msgUnpage01_TacxVortexDataSerial (info):
+    _Channel, _DataPageNumber, S1, S2, S3, Serial, Alarm = codecPage01_TacxVortexDataSerial.Unpack(info)
 
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    S1                  =  tuple[nS1]
-    S2                  =  tuple[nS2]
-    Serial              =  tuple[nS3] * 256 * 256 + tuple[nSerial]
-    Alarm               =  tuple[nAlarm]
+    Serial              =  S3 * 256 * 256 + Serial
 
     return S1, S2, Serial, Alarm
 
@@ -1738,32 +2716,16 @@ def msgUnpage01_TacxVortexDataSerial (info):
 #06:15:35,850: IGNORED!! msg=0x4e ch=7 p=2 info="07 02 00 61 83 00 02 00 07" TACX_VORTEX_DATA_VERSION
 #                                                ch p  rrrrrrrr ma mi build
 # ------------------------------------------------------------------------------
-def msgUnpage02_TacxVortexDataVersion (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    fReserved           = sc.pad * 3        # payload[1, 2, 3]
-
-    nMajor              = 2
-    fMajor              = sc.unsigned_char  # payload[4]
-
-    nMinor              = 3
-    fMinor              = sc.unsigned_char  # payload[5]
-
-    nBuild              = 4
-    fBuild              = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fReserved + fMajor + fMinor + fBuild
-    tuple = struct.unpack (format, info)
+codecPage02_TacxVortexDataVersion = clsAntPage('TacxVortexDataVersion', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # payload[0] First byte of the ANT+ datapage
+    (None,                  sc.pad * 3          ),  # payload[1, 2, 3]
+    ('Major',               sc.unsigned_char    ),  # payload[4]
+    ('Minor',               sc.unsigned_char    ),  # payload[5]
+    ('Build',               sc.unsigned_short   )))  # payload[6, 7]
 
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    Major               =  tuple[nMajor]
-    Minor               =  tuple[nMinor]
-    Build               =  tuple[nBuild]
+def msgUnpage02_TacxVortexDataVersion (info):
+    _Channel, _DataPageNumber, Major, Minor, Build = codecPage02_TacxVortexDataVersion.Unpack(info)
 
     return Major, Minor, Build
 
@@ -1786,44 +2748,24 @@ def msgUnpage02_TacxVortexDataVersion (info):
 #                                                      rrrrrrrrrrr cal
 #                                                                     vtxid
 # ------------------------------------------------------------------------------
+codecPage03_TacxVortexDataCalibration = clsAntPage('TacxVortexDataCalibration', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # payload[0] First byte of the ANT+ datapage
+    (None,                  sc.pad * 4          ),  # payload[1, 2, 3, 4]
+    ('Calibration',         sc.unsigned_char    ),  # payload[5]
+    ('VortexID',            sc.unsigned_short   )))  # payload[6, 7]
+
 def msgPage03_TacxVortexDataCalibration (Channel, Calibration, VortexID):
     DataPageNumber      = 3
 
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-    fReserved           = sc.pad * 4        # payload[1, 2, 3, 4]
-    fCalibration        = sc.unsigned_char  # payload[5]
-    fVortexID           = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian +     fChannel + fDataPageNumber + fReserved + fCalibration + fVortexID
-    info   = struct.pack(format, Channel,   DataPageNumber,               Calibration,   VortexID)
+    info = codecPage03_TacxVortexDataCalibration.Pack(Channel, DataPageNumber, Calibration, VortexID)
 
     # print('msgPage03_TacxVortexDataCalibration', info, Channel, Calibration, VortexID)
 
     return info
 
 def msgUnpage03_TacxVortexDataCalibration (info):
-    nChannel            = 0
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-
-    nDataPageNumber     = 1
-    fDataPageNumber     = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    fReserved           = sc.pad * 4        # payload[1, 2, 3, 4]
-
-    nCalibration        = 2
-    fCalibration        = sc.unsigned_char  # payload[5]
-
-    nVortexID           = 3
-    fVortexID           = sc.unsigned_short # payload[6, 7]
-
-    format= sc.big_endian + fChannel + fDataPageNumber + fReserved + fCalibration + fVortexID
-    tuple = struct.unpack (format, info)
-
-    _Channel            =  tuple[nChannel]
-    _DataPageNumber     =  tuple[nDataPageNumber]
-    Calibration         =  tuple[nCalibration]
-    VortexID            =  tuple[nVortexID]
+    _Channel, _DataPageNumber, Calibration, VortexID = codecPage03_TacxVortexDataCalibration.Unpack(info)
 
     return Calibration, VortexID
 
@@ -1929,37 +2871,24 @@ def msgPage16_TacxVortexSetCalibrationValue (Channel, VortexID, CalibrationValue
 #                      power >> 8, power & 0xFF);
 #   }
 # ------------------------------------------------------------------------------
+codecPage16_TacxVortexSetPower = clsAntPage('TacxVortexSetPower', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('VortexID',            sc.unsigned_short   ),
+    ('Command',             sc.unsigned_char    ),  # 0xAA power request
+    ('Subcommand',          sc.unsigned_char    ),
+    ('NoCalibrationData',   sc.unsigned_char    ),
+    ('Power',               sc.unsigned_short   )))  # https://tacx.com/nl/product/i-vortex/
+
 def msgPage16_TacxVortexSetPower (Channel, VortexID, Power):
     DataPageNumber      = 16
-
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0xAA power request
-    fSubcommand         = sc.unsigned_char
-    fNoCalibrationData  = sc.unsigned_char
-    fPower              = sc.unsigned_short # https://tacx.com/nl/product/i-vortex/
     Power = max(0, Power)                   # --> No simulation descent ==> power > 0
 
-    format = sc.big_endian +    fChannel + fDataPageNumber +   fVortexID + fCommand + fSubcommand + fNoCalibrationData + fPower
-    info   = struct.pack(format, Channel,   DataPageNumber, int(VortexID),  0xAA,      0,            0,               int(Power))
-
-    return info
+    return codecPage16_TacxVortexSetPower.Pack(Channel, DataPageNumber, int(VortexID), 0xAA, 0, 0, int(Power))
 
 def msgUnpage16_TacxVortexSetPower (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID           = sc.unsigned_short
-    fCommand            = sc.unsigned_char  # 0xAA power request
-    fSubcommand         = sc.unsigned_char
-    fNoCalibrationData  = sc.unsigned_char
-    fPower              = sc.unsigned_short
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fVortexID + fCommand + fSubcommand + fNoCalibrationData + fPower
-    tuple = struct.unpack (format, info)
-
-          #Channel,  DataPageNumber, VortexID, Command,  Subcommand, NoCalibrationData, Power
-    return tuple[0], tuple[1],       tuple[2], tuple[3], tuple[4],   tuple[5],          tuple[6]
+    #      Channel, DataPageNumber, VortexID, Command, Subcommand, NoCalibrationData, Power
+    return codecPage16_TacxVortexSetPower.Unpack(info)
 
 # ------------------------------------------------------------------------------
 #     P a g e 1 7 2   T a c x V o r t e x H U _ C h a n g e H e a d u n i t M o d e
@@ -1994,69 +2923,55 @@ def msgUnpage16_TacxVortexSetPower (info):
 # to trigger the serial-number (the default frame), the version-number and the
 # battery status.
 # ------------------------------------------------------------------------------
+codecPage000_TacxVortexHU_StayAlive = clsAntPage('TacxVortexHU_StayAlive', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    (None,                  sc.pad * 8          )))
+
 def msgPage000_TacxVortexHU_StayAlive (Channel):        # No Power Off
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fReserved           = sc.pad * 8
+    return codecPage000_TacxVortexHU_StayAlive.Pack(Channel)
 
-    format = sc.big_endian +    fChannel + fReserved
-    info   = struct.pack(format, Channel)
-
-    return info
+codecPage172_TacxVortexHU_ChangeHeadunitMode = clsAntPage('TacxVortexHU_ChangeHeadunitMode', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('Command',             sc.unsigned_char    ),  # 0x03 Change headunit Mode
+    ('Mode',                sc.unsigned_char    ),  # 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
+    (None,                  sc.pad * 5          )))
 
 def msgPage172_TacxVortexHU_ChangeHeadunitMode (Channel, Mode):
     DataPageNumber      = 172
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCommand            = sc.unsigned_char  # 0x03 Change headunit Mode
-    fMode               = sc.unsigned_char  # 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
-    fReserved           = sc.pad * 5
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fCommand + fMode + fReserved
-    info   = struct.pack(format, Channel,   DataPageNumber,   0x03,      Mode)
+    return codecPage172_TacxVortexHU_ChangeHeadunitMode.Pack(Channel, DataPageNumber, 0x03, Mode)
 
-    return info
+codecPage221_TacxVortexHU_ButtonPressed = clsAntPage('TacxVortexHU_ButtonPressed', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # 0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # 1 First byte of the ANT+ datapage (payload)
+    ('Command',             sc.unsigned_char    ),  # 2 0x10 Button press
+    ('Button',              sc.unsigned_char    ),  # 3 Button 1...5
+    (None,                  sc.pad * 4          ),  # -
+    ('Count',               sc.unsigned_char    )))  # 4
 
 def msgUnpage221_TacxVortexHU_ButtonPressed (info):
-    fChannel            = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fCommand            = sc.unsigned_char  # 2 0x10 Button press
-
-    nButton             = 3
-    fButton             = sc.unsigned_char  # 3 Button 1...5
-
-    fReserved           = sc.pad * 4        # -
-    fCount              = sc.unsigned_char  # 4
-
-    format = sc.big_endian +    fChannel + fDataPageNumber + fCommand + fButton + fReserved + fCount
-    tuple = struct.unpack (format, info)
-
-    return tuple[nButton]
+    return codecPage221_TacxVortexHU_ButtonPressed.Unpack(info)[3]
 
 # -------------------------------------------------------------------------------------
 # P a g e 1 7 3  ( 0 x 0 1 )  T a c x V o r t e x S e r i a l M o d e
 # -------------------------------------------------------------------------------------
-def msgUnpage173_01_TacxVortexHU_SerialMode (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x01
-
-    fMode               = sc.unsigned_char  # head-unit mode
-    nMode               = 3
-    fYear               = sc.unsigned_char  # production year
-    nYear               = 4
-    fDeviceType         = sc.unsigned_char  # device type id
-    nDeviceType         = 5
-    fDeviceNumber       = '3' + sc.char_array  # device number
-    nDeviceNumber       = 6
+codecPage173_01_TacxVortexHU_SerialMode = clsAntPage('TacxVortexHU_SerialMode', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x01
+    ('Mode',                sc.unsigned_char    ),  # head-unit mode
+    ('Year',                sc.unsigned_char    ),  # production year
+    ('DeviceType',          sc.unsigned_char    ),  # device type id
+    ('DeviceNumber',        '3' + sc.char_array )))  # device number
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fMode + fYear + fDeviceType + fDeviceNumber
-    tuple = struct.unpack(format, info)
+def msgUnpage173_01_TacxVortexHU_SerialMode (info):
+    _Channel, _DataPageNumber, _SubPageNumber, Mode, Year, DeviceType, DeviceNumber = \
+        codecPage173_01_TacxVortexHU_SerialMode.Unpack(info)
 
-    deviceNumber = int.from_bytes(tuple[nDeviceNumber], byteorder='big')
+    deviceNumber = int.from_bytes(DeviceNumber, byteorder='big')
 
-    return tuple[nMode], tuple[nYear], tuple[nDeviceType], deviceNumber
+    return Mode, Year, DeviceType, deviceNumber
 
 # ------------------------------------------------------------------------------
 # T a c x  G e n i u s  p a g e s
@@ -2067,6 +2982,15 @@ def msgUnpage173_01_TacxVortexHU_SerialMode (info):
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 1 )  T a c x G e n i u s S e t T a r g e t
 # ------------------------------------------------------------------------------
+codecPage220_01_TacxGeniusSetTarget = clsAntPage('TacxGeniusSetTarget', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),
+    ('Mode',                sc.unsigned_char    ),  # brake mode (slope/power/heart rate)
+    ('Target',              sc.short            ),  # target slope (%) * 10/power (W)/HR (bpm)
+    ('Weight',              sc.unsigned_char    ),  # user + bike weight (kg)
+    (None,                  sc.pad * 2          )))
+
 def msgPage220_01_TacxGeniusSetTarget (Channel, Mode, Target, Weight):
     DataPageNumber      = 220
     SubPageNumber       = 0x01
@@ -2076,163 +3000,129 @@ def msgPage220_01_TacxGeniusSetTarget (Channel, Mode, Target, Weight):
     else:
         Target = int(Target)
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char
-    fMode               = sc.unsigned_char  # brake mode (slope/power/heart rate)
-    fTarget             = sc.short          # target slope (%) * 10/power (W)/HR (bpm)
-    fWeight             = sc.unsigned_char  # user + bike weight (kg)
-    fPadding            = sc.pad * 2
-
-    format = sc.big_endian +     fChannel + fDataPageNumber + fSubPageNumber + fMode + fTarget + fWeight + fPadding
-    info   = struct.pack (format, Channel,   DataPageNumber,   SubPageNumber,   Mode,   Target,   Weight)
-
-    return info
+    return codecPage220_01_TacxGeniusSetTarget.Pack(Channel, DataPageNumber, SubPageNumber, Mode, Target, Weight)
 
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 2 )  T a c x G e n i u s W i n d R e s i s t a n c e
 # ------------------------------------------------------------------------------
+codecPage220_02_TacxGeniusWindResistance = clsAntPage('TacxGeniusWindResistance', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),
+    ('WindResistance',      sc.unsigned_short   ),  # 0.5 * wind resistance cofficient (kg/m) * 1000
+    ('WindSpeed',           sc.short            ),  # wind speed (m/s) * 250 (head wind = negative)
+    (None,                  sc.pad * 2          )))
+
 def msgPage220_02_TacxGeniusWindResistance (Channel, WindResistance, WindSpeed):
     DataPageNumber      = 220
     SubPageNumber       = 0x02
     WindResistance      = int(WindResistance)
     WindSpeed           = int(WindSpeed)
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char
-    fWindResistance     = sc.unsigned_short # 0.5 * wind resistance cofficient (kg/m) * 1000
-    fWindSpeed          = sc.short          # wind speed (m/s) * 250 (head wind = negative)
-    fPadding            = sc.pad * 2
-
-    format = sc.big_endian +     fChannel + fDataPageNumber + fSubPageNumber + fWindResistance + fWindSpeed + fPadding
-    info   = struct.pack (format, Channel,   DataPageNumber,   SubPageNumber,   WindResistance,   WindSpeed)
-
-    return info
+    return codecPage220_02_TacxGeniusWindResistance.Pack(Channel, DataPageNumber, SubPageNumber, WindResistance, WindSpeed)
 
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 4 )  T a c x G e n i u s C a l i b r a t i o n
 # ------------------------------------------------------------------------------
+codecPage220_04_TacxGeniusCalibration = clsAntPage('TacxGeniusCalibration', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),
+    ('Action',              sc.unsigned_char    ),  # Calibration action
+    (None,                  sc.pad * 5          )))
+
 def msgPage220_04_TacxGeniusCalibration (Channel, Action):
     DataPageNumber      = 220
     SubPageNumber       = 0x04
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char
-    fAction             = sc.unsigned_char  # Calibration action
-    fPadding            = sc.pad * 5
-
-    format = sc.big_endian +     fChannel + fDataPageNumber + fSubPageNumber + fAction + fPadding
-    info   = struct.pack (format, Channel,   DataPageNumber,   SubPageNumber,   Action)
-
-    return info
+    return codecPage220_04_TacxGeniusCalibration.Pack(Channel, DataPageNumber, SubPageNumber, Action)
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 1 )  T a c x G e n i u s S p e e d / P o w e r / C a d e n c e
 # -------------------------------------------------------------------------------------
-def msgUnpage221_01_TacxGeniusSpeedPowerCadence (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x01
-
-    fSpeed              = sc.unsigned_short # speed (km/h) * 10
-    nSpeed              = 3
-    fPower              = sc.unsigned_short # power (W)
-    nPower              = 4
-    fCadence            = sc.unsigned_char  # cadence (rpm)
-    nCadence            = 5
-    fBalance            = sc.unsigned_char  # L/R power balance (%)
-    nBalance            = 6
+codecPage221_01_TacxGeniusSpeedPowerCadence = clsAntPage('TacxGeniusSpeedPowerCadence', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x01
+    ('Speed',               sc.unsigned_short   ),  # speed (km/h) * 10
+    ('Power',               sc.unsigned_short   ),  # power (W)
+    ('Cadence',             sc.unsigned_char    ),  # cadence (rpm)
+    ('Balance',             sc.unsigned_char    )))  # L/R power balance (%)
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fSpeed + fPower + fCadence + fBalance
-    tuple = struct.unpack(format, info)
+def msgUnpage221_01_TacxGeniusSpeedPowerCadence (info):
+    _Channel, _DataPageNumber, _SubPageNumber, Speed, Power, Cadence, Balance = \
+        codecPage221_01_TacxGeniusSpeedPowerCadence.Unpack(info)
 
-    return tuple[nPower], tuple[nSpeed], tuple[nCadence], tuple[nBalance]
+    return Power, Speed, Cadence, Balance
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 2 )  T a c x G e n i u s D i s t a n c e H R
 # -------------------------------------------------------------------------------------
-def msgUnpage221_02_TacxGeniusDistanceHR (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x02
-
-    fDistance           = sc.unsigned_int   # distance (m)
-    nDistance           = 3
-    fHeartrate          = sc.unsigned_char  # heartrate (bpm) (Vortex/Bushido only?)
-    nHeartrate          = 4
-    fPadding            = sc.pad
+codecPage221_02_TacxGeniusDistanceHR = clsAntPage('TacxGeniusDistanceHR', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x02
+    ('Distance',            sc.unsigned_int     ),  # distance (m)
+    ('Heartrate',           sc.unsigned_char    ),  # heartrate (bpm) (Vortex/Bushido only?)
+    (None,                  sc.pad              )))
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fDistance + fHeartrate + fPadding
-    tuple = struct.unpack(format, info)
+def msgUnpage221_02_TacxGeniusDistanceHR (info):
+    _Channel, _DataPageNumber, _SubPageNumber, Distance, Heartrate = \
+        codecPage221_02_TacxGeniusDistanceHR.Unpack(info)
 
-    return tuple[nDistance], tuple[nHeartrate]
+    return Distance, Heartrate
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 3 )  T a c x G e n i u s A l a r m T e m p e r a t u r e
 # -------------------------------------------------------------------------------------
-def msgUnpage221_03_TacxGeniusAlarmTemperature (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x03
+codecPage221_03_TacxGeniusAlarmTemperature = clsAntPage('TacxGeniusAlarmTemperature', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x03
+    ('Alarm',               sc.unsigned_short   ),  # alarm bitmask
+    ('Temperature',         sc.unsigned_char    ),  # brake temperature (°C ?)
+    ('Powerback',           sc.unsigned_short   ),  # Powerback (W)
+    (None,                  sc.pad              )))
 
-    fAlarm              = sc.unsigned_short # alarm bitmask
-    nAlarm              = 3
-    fTemperature        = sc.unsigned_char  # brake temperature (°C ?)
-    nTemperature        = 4
-    fPowerback          = sc.unsigned_short # Powerback (W)
-    nPowerback          = 5
-    fPadding            = sc.pad
-
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fAlarm + fTemperature + fPowerback + fPadding
-    tuple = struct.unpack(format, info)
+def msgUnpage221_03_TacxGeniusAlarmTemperature (info):
+    _Channel, _DataPageNumber, _SubPageNumber, Alarm, Temperature, Powerback = \
+        codecPage221_03_TacxGeniusAlarmTemperature.Unpack(info)
 
-    return tuple[nAlarm], tuple[nTemperature], tuple[nPowerback]
+    return Alarm, Temperature, Powerback
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 4 )  T a c x G e n i u s C a l i b r a t i o n I n f o
 # -------------------------------------------------------------------------------------
-def msgUnpage221_04_TacxGeniusCalibrationInfo (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x04
+codecPage221_04_TacxGeniusCalibrationInfo = clsAntPage('TacxGeniusCalibrationInfo', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x04
+    ('CalibrationState',    sc.unsigned_char    ),  # calibration status
+    ('CalibrationValue',    sc.unsigned_short   ),  # brake temperature (°C ?)
+    (None,                  3 * sc.pad          )))
 
-    fCalibrationState   = sc.unsigned_char  # calibration status
-    nCalibrationState   = 3
-    fCalibrationValue   = sc.unsigned_short  # brake temperature (°C ?)
-    nCalibrationValue   = 4
-    fPadding            = 3 * sc.pad
-
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fCalibrationState + fCalibrationValue + fPadding
-    tuple = struct.unpack(format, info)
+def msgUnpage221_04_TacxGeniusCalibrationInfo (info):
+    _Channel, _DataPageNumber, _SubPageNumber, CalibrationState, CalibrationValue = \
+        codecPage221_04_TacxGeniusCalibrationInfo.Unpack(info)
 
-    return tuple[nCalibrationState], tuple[nCalibrationValue]
+    return CalibrationState, CalibrationValue
 
 # -------------------------------------------------------------------------------------
 # P a g e 1 7 3  ( 0 x 0 1 )  T a c x B u s h i d o S e r i a l M o d e
 # -------------------------------------------------------------------------------------
-def msgUnpage173_01_TacxBushidoSerialMode (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber      = sc.unsigned_char  # == 0x01
-
-    fMode               = sc.unsigned_char  # head unit mode
-    nMode               = 3
-    fYear               = sc.unsigned_char  # production year
-    nYear               = 4
-    fDeviceNumber       = sc.int            # device number
-    nDeviceNumber       = 5
+codecPage173_01_TacxBushidoSerialMode = clsAntPage('TacxBushidoSerialMode', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SubPageNumber',       sc.unsigned_char    ),  # == 0x01
+    ('Mode',                sc.unsigned_char    ),  # head unit mode
+    ('Year',                sc.unsigned_char    ),  # production year
+    ('DeviceNumber',        sc.int              )))  # device number
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + \
-             fMode + fYear + fDeviceNumber
-    tuple = struct.unpack(format, info)
+def msgUnpage173_01_TacxBushidoSerialMode (info):
+    _Channel, _DataPageNumber, _SubPageNumber, Mode, Year, DeviceNumber = \
+        codecPage173_01_TacxBushidoSerialMode.Unpack(info)
 
-    return tuple[nMode], tuple[nYear], tuple[nDeviceNumber]
+    return Mode, Year, DeviceNumber
 
 # ------------------------------------------------------------------------------
 # P a g e 1 6   G e n e r a l   F E   i n f o
@@ -2243,6 +3133,16 @@ def msgUnpage173_01_TacxBushidoSerialMode (info):
 # Notes:    Even though HRM is defined, it appears not being picked up by
 #           Trainer Road.
 # ------------------------------------------------------------------------------
+codecPage16_GeneralFEdata = clsAntPage('GeneralFEdata', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  #1 First byte of the ANT+ datapage (payload)
+    ('EquipmentType',       sc.unsigned_char    ),  #2
+    ('ElapsedTime',         sc.unsigned_char    ),  #3
+    ('DistanceTravelled',   sc.unsigned_char    ),  #4
+    ('Speed',               sc.unsigned_short   ),  #5
+    ('HeartRate',           sc.unsigned_char    ),  #6
+    ('Capabilities',        sc.unsigned_char    )))  #7
+
 def msgPage16_GeneralFEdata (Channel, ElapsedTime, DistanceTravelled, Speed, HeartRate):
     DataPageNumber      = 16
     EquipmentType       = 0x19      # Trainer
@@ -2262,34 +3162,12 @@ def msgPage16_GeneralFEdata (Channel, ElapsedTime, DistanceTravelled, Speed, Hea
 
     Capabilities = HRM | Distance | VirtualSpeedFlag | FEstate | LapToggleBit
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEquipmentType      = sc.unsigned_char
-    fElapsedTime        = sc.unsigned_char
-    fDistanceTravelled  = sc.unsigned_char
-    fSpeed              = sc.unsigned_short
-    fHeartRate          = sc.unsigned_char
-    fCapabilities       = sc.unsigned_char
-
-    format=   sc.no_alignment+fChannel+fDataPageNumber+fEquipmentType+fElapsedTime+fDistanceTravelled+fSpeed+fHeartRate+fCapabilities
-    info  =struct.pack(format, Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled, Speed, HeartRate, Capabilities)
-
-    return info
+    return codecPage16_GeneralFEdata.Pack(Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled, \
+                                          Speed, HeartRate, Capabilities)
 
 def msgUnpage16_GeneralFEdata (info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fEquipmentType      = sc.unsigned_char  #2
-    fElapsedTime        = sc.unsigned_char  #3
-    fDistanceTravelled  = sc.unsigned_char  #4
-    fSpeed              = sc.unsigned_short #5
-    fHeartRate          = sc.unsigned_char  #6
-    fCapabilities       = sc.unsigned_char  #7
-
-    format=   sc.no_alignment+fChannel+fDataPageNumber+fEquipmentType+fElapsedTime+fDistanceTravelled+fSpeed+fHeartRate+fCapabilities
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6], tuple[7]
+    #      Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled, Speed, HeartRate, Capabilities
+    return codecPage16_GeneralFEdata.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 2 5   T r a i n e r   i n f o
@@ -2298,6 +3176,15 @@ def msgUnpage16_GeneralFEdata (info):
 #  trainer: D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 #           Data page 25 (0x19) Specific Trainer/Stationary Bike Data
 # ------------------------------------------------------------------------------
+codecPage25_TrainerData = clsAntPage('TrainerData', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  #1 First byte of the ANT+ datapage (payload)
+    ('Event',               sc.unsigned_char    ),  #2
+    ('Cadence',             sc.unsigned_char    ),  #3
+    ('AccPower',            sc.unsigned_short   ),  #4
+    ('InstPower',           sc.unsigned_short   ),  #5 The first four bits have another meaning!!
+    ('Flags',               sc.unsigned_char    )))  #6
+
 def msgPage25_TrainerData(Channel, EventCounter, Cadence, AccumulatedPower, CurrentPower):
     DataPageNumber      = 25
     EventCounter        = int(       min(  0xff, EventCounter      ))
@@ -2306,32 +3193,10 @@ def msgPage25_TrainerData(Channel, EventCounter, Cadence, AccumulatedPower, Curr
     CurrentPower        = int(max(0, min(0x0fff, CurrentPower      )))  # 2021-02-19
     Flags               = 0x30          # Hmmm.... leave as is but do not understand the value
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEvent              = sc.unsigned_char
-    fCadence            = sc.unsigned_char
-    fAccPower           = sc.unsigned_short
-    fInstPower          = sc.unsigned_short # The first four bits have another meaning!!
-    fFlags              = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fEvent +      fCadence + fAccPower +       fInstPower +  fFlags
-    info  = struct.pack (format,  Channel,   DataPageNumber,   EventCounter, Cadence,   AccumulatedPower, CurrentPower, Flags)
-
-    return info
+    return codecPage25_TrainerData.Pack(Channel, DataPageNumber, EventCounter, Cadence, AccumulatedPower, CurrentPower, Flags)
 
 def msgUnpage25_TrainerData(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fEvent              = sc.unsigned_char  #2
-    fCadence            = sc.unsigned_char  #3
-    fAccPower           = sc.unsigned_short #4
-    fInstPower          = sc.unsigned_short #5 The first four bits have another meaning!!
-    fFlags              = sc.unsigned_char  #6
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fEvent + fCadence + fAccPower + fInstPower + fFlags
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    return codecPage25_TrainerData.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 4 8   B a s i c R e s i s t a n c e
@@ -2339,22 +3204,14 @@ def msgUnpage25_TrainerData(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 48 (0x30) Basic Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage48_BasicResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+codecPage48_BasicResistance = clsAntPage('BasicResistance', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    (None,                  sc.pad * 6          ),
+    ('TotalResistance',     sc.unsigned_char    )))
 
-    fReserved           = sc.pad * 6
-
-    nTotalResistance    = 2
-    fTotalResistance    = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTotalResistance
-    tuple  = struct.unpack (format, info)
-
-    rtn = tuple[nTotalResistance] * 0.005    # 0 ... 100%
+def msgUnpage48_BasicResistance(info):
+    rtn = codecPage48_BasicResistance.Unpack(info)[2] * 0.005    # 0 ... 100%
 
     return rtn
 
@@ -2364,22 +3221,14 @@ def msgUnpage48_BasicResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 49 (0x31) Target Power
 # ------------------------------------------------------------------------------
-def msgUnpage49_TargetPower(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 5
-
-    nTargetPower        = 2
-    fTargetPower        = sc.unsigned_short # units of 0.25Watt
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTargetPower
-    tuple  = struct.unpack (format, info)
+codecPage49_TargetPower = clsAntPage('TargetPower', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    (None,                  sc.pad * 5          ),
+    ('TargetPower',         sc.unsigned_short   )))  # units of 0.25Watt
 
-    TargetPower = tuple[nTargetPower] / 4   # returns units of 1Watt
+def msgUnpage49_TargetPower(info):
+    TargetPower = codecPage49_TargetPower.Unpack(info)[2] / 4   # returns units of 1Watt
 
     return TargetPower
 
@@ -2389,40 +3238,28 @@ def msgUnpage49_TargetPower(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 50 (0x32) Wind Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage50_WindResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+codecPage50_WindResistance = clsAntPage('WindResistance', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    (None,                  sc.pad * 4          ),
+    ('WindResistanceCoefficient', sc.unsigned_char),
+    ('WindSpeed',           sc.unsigned_char    ),
+    ('DraftingFactor',      sc.unsigned_char    )))
 
-    fReserved           = sc.pad * 4
-
-    nWindResistanceCoefficient = 2
-    fWindResistanceCoefficient = sc.unsigned_char
-
-    nWindSpeed          = 3
-    fWindSpeed          = sc.unsigned_char
-
-    nDraftingFactor     = 4
-    fDraftingFactor     = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fWindResistanceCoefficient + fWindSpeed + fDraftingFactor
-    tuple  = struct.unpack (format, info)
+def msgUnpage50_WindResistance(info):
+    _Channel, _DataPageNumber, WindResistance, WindSpeed, DraftingFactor = \
+        codecPage50_WindResistance.Unpack(info)
 
-    WindResistance = tuple[nWindResistanceCoefficient]
     if WindResistance == 0xff:
         WindResistance = 0.51
     else:
         WindResistance = WindResistance * 0.01 # kg/m
 
-    WindSpeed = tuple[nWindSpeed]
     if WindSpeed == 0xff:
         WindSpeed = 0.0
     else:
         WindSpeed = WindSpeed - 127 # km/h
 
-    DraftingFactor = tuple[nDraftingFactor]
     if DraftingFactor == 0xff:
         DraftingFactor = 1.0
     else:
@@ -2436,30 +3273,21 @@ def msgUnpage50_WindResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 51 (0x33) Target Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage51_TrackResistance(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved           = sc.pad * 4
-
-    nGrade              = 2
-    fGrade              = sc.unsigned_short
+codecPage51_TrackResistance = clsAntPage('TrackResistance', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    (None,                  sc.pad * 4          ),
+    ('Grade',               sc.unsigned_short   ),
+    ('RollingResistance',   sc.unsigned_char    )))
 
-    nRollingResistance  = 3
-    fRollingResistance  = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fGrade + fRollingResistance
-    tuple  = struct.unpack (format, info)
+def msgUnpage51_TrackResistance(info):
+    _Channel, _DataPageNumber, Grade, RollingResistance = \
+        codecPage51_TrackResistance.Unpack(info)
 
-    Grade = tuple[nGrade]
     if Grade == 0xffff: Grade = 0
     Grade = Grade * 0.01 - 200          # -200% - 200%, units 0.01%
     Grade = round(Grade,2)
 
-    RollingResistance = tuple[nRollingResistance]
     if RollingResistance == 0xff:
         RollingResistance = 0.004
     else:
@@ -2473,39 +3301,27 @@ def msgUnpage51_TrackResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 55 (0x37) User Configuration
 # ------------------------------------------------------------------------------
-def msgUnpage55_UserConfiguration(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nUserWeight         = 2
-    fUserWeight         = sc.unsigned_short
-
-    fReserved           = sc.pad
-
-    nBicycleInfo        = 3
-    fBicycleInfo        = sc.unsigned_short
-
-    nBicycleWheelDiameter= 4
-    fBicycleWheelDiameter= sc.unsigned_char
+codecPage55_UserConfiguration = clsAntPage('UserConfiguration', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('UserWeight',          sc.unsigned_short   ),
+    (None,                  sc.pad              ),
+    ('BicycleInfo',         sc.unsigned_short   ),
+    ('BicycleWheelDiameter',sc.unsigned_char    ),
+    ('GearRatio',           sc.unsigned_char    )))
 
-    nGearRatio          = 5
-    fGearRatio          = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fUserWeight + fReserved + fBicycleInfo + fBicycleWheelDiameter + fGearRatio
-    tuple  = struct.unpack (format, info)
+def msgUnpage55_UserConfiguration(info):
+    _Channel, _DataPageNumber, UserWeight, BicycleInfo, BicycleWheelDiameter, GearRatio = \
+        codecPage55_UserConfiguration.Unpack(info)
 
-    UserWeigth                = tuple[nUserWeight] * 0.01                # 0 ... 655.34 kg
+    UserWeigth                = UserWeight * 0.01                       # 0 ... 655.34 kg
 
-    BicycleInfo               = tuple[nBicycleInfo]
     _BicyleWheelDiameterOffset= (BicycleInfo & 0x000f)                   # 0 - 10 mm
     BicycleWeigth             = (BicycleInfo & 0xfff0) / 16 * 0.05       # 0 - 50 kg
 
-    BicyleWheelDiameter       = tuple[nBicycleWheelDiameter] * 0.01      # 0 - 2.54m
+    BicyleWheelDiameter       = BicycleWheelDiameter * 0.01             # 0 - 2.54m
 
-    GearRatio                 = tuple[nGearRatio] * 0.03                 # 0.03 - 7.65
+    GearRatio                 = GearRatio * 0.03                        # 0.03 - 7.65
 
     return UserWeigth, BicycleWeigth, BicyleWheelDiameter, GearRatio
 
@@ -2516,63 +3332,32 @@ def msgUnpage55_UserConfiguration(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 70: (0x46) RequestDataPage
 # ------------------------------------------------------------------------------
+codecPage70_RequestDataPage = clsAntPage('RequestDataPage', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SlaveSerialNumber',   sc.unsigned_short   ),
+    ('DescriptorByte1',     sc.unsigned_char    ),
+    ('DescriptorByte2',     sc.unsigned_char    ),
+    ('ReqTransmissionResp', sc.unsigned_char    ),
+    ('RequestedPageNumber', sc.unsigned_char    ),
+    ('CommandType',         sc.unsigned_char    )))
+
 def msgPage70_RequestDataPage(Channel, SlaveSerialNumber, DescriptorByte1, \
                 DescriptorByte2, NrTimes, RequestedPageNumber, CommandType):
     DataPageNumber      = 70
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber  = sc.unsigned_short
-    fDescriptorByte1    = sc.unsigned_char
-    fDescriptorByte2    = sc.unsigned_char
-    fReqTransmissionResp= sc.unsigned_char
-    fRequestedPageNumber= sc.unsigned_char
-    fCommandType        = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + fDescriptorByte1 + \
-               fDescriptorByte2 + fReqTransmissionResp + fRequestedPageNumber + fCommandType
-
-    info  = struct.pack (format,  Channel,   DataPageNumber,   SlaveSerialNumber,   DescriptorByte1,  \
-                DescriptorByte2,   NrTimes,               RequestedPageNumber,   CommandType)
-
-    return info
+    return codecPage70_RequestDataPage.Pack(Channel, DataPageNumber, SlaveSerialNumber, DescriptorByte1, \
+                DescriptorByte2, NrTimes, RequestedPageNumber, CommandType)
 
 def msgUnpage70_RequestDataPage(info):
-    _nChannel           = 0
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber    = 1
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nSlaveSerialNumber  = 2
-    fSlaveSerialNumber  = sc.unsigned_short
-
-    nDescriptorByte1    = 3
-    fDescriptorByte1    = sc.unsigned_char
-
-    nDescriptorByte2    = 4
-    fDescriptorByte2    = sc.unsigned_char
-
-    nReqTransmissionResp= 5
-    fReqTransmissionResp= sc.unsigned_char
-
-    nRequestedPageNumber= 6
-    fRequestedPageNumber= sc.unsigned_char
+    _Channel, _DataPageNumber, SlaveSerialNumber, DescriptorByte1, DescriptorByte2, \
+        ReqTranmissionResponse, RequestedPageNumber, CommandType = codecPage70_RequestDataPage.Unpack(info)
 
-    nCommandType        = 7
-    fCommandType        = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + \
-             fDescriptorByte1 + fDescriptorByte2 + fReqTransmissionResp + \
-             fRequestedPageNumber + fCommandType
-    tuple  = struct.unpack (format, info)
-
-    ReqTranmissionResponse = tuple[nReqTransmissionResp]
     AckRequired         = ReqTranmissionResponse & 0x80
     NrTimes             = ReqTranmissionResponse & 0x7f
 
-    return tuple[nSlaveSerialNumber], tuple[nDescriptorByte1], tuple[nDescriptorByte2], \
-           AckRequired, NrTimes, tuple[nRequestedPageNumber], tuple[nCommandType]
+    return SlaveSerialNumber, DescriptorByte1, DescriptorByte2, \
+           AckRequired, NrTimes, RequestedPageNumber, CommandType
 
 # ------------------------------------------------------------------------------
 # P a g e 5 4 _ F E   C a p a b i l i t i e s
@@ -2580,22 +3365,21 @@ def msgUnpage70_RequestDataPage(info):
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # ------------------------------------------------------------------------------
+codecPage54_FE_Capabilities = clsAntPage('FE_Capabilities', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('Reserved1',           sc.unsigned_char    ),
+    ('Reserved2',           sc.unsigned_char    ),
+    ('Reserved3',           sc.unsigned_char    ),
+    ('Reserved4',           sc.unsigned_char    ),
+    ('MaximumResistance',   sc.unsigned_short   ),
+    ('CapabilitiesBits',    sc.unsigned_char    )))
+
 def msgPage54_FE_Capabilities(Channel, Reserved1, Reserved2, Reserved3, Reserved4, MaximumResistance, CapabilitiesBits):
     DataPageNumber      = 54
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fReserved2          = sc.unsigned_char
-    fReserved3          = sc.unsigned_char
-    fReserved4          = sc.unsigned_char
-    fMaximumResistance  = sc.unsigned_short
-    fCapabilitiesBits   = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fReserved3 + fReserved4 + fMaximumResistance + fCapabilitiesBits
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1 ,  Reserved2 ,  Reserved3 ,  Reserved4 ,  MaximumResistance,   CapabilitiesBits)
-
-    return info
+    return codecPage54_FE_Capabilities.Pack(Channel, DataPageNumber, Reserved1, Reserved2, Reserved3, Reserved4, \
+                                            MaximumResistance, CapabilitiesBits)
 
 # ------------------------------------------------------------------------------
 # P a g e 7 1 _ C o m m a n d S t a t u s
@@ -2603,23 +3387,62 @@ def msgPage54_FE_Capabilities(Channel, Reserved1, Reserved2, Reserved3, Reserved
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # ------------------------------------------------------------------------------
+codecPage71_CommandStatus = clsAntPage('CommandStatus', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('LastReceivedCommandID',sc.unsigned_char   ),
+    ('SequenceNr',          sc.unsigned_char    ),
+    ('CommandStatus',       sc.unsigned_char    ),
+    ('Data1',               sc.unsigned_char    ),
+    ('Data2',               sc.unsigned_char    ),
+    ('Data3',               sc.unsigned_char    ),
+    ('Data4',               sc.unsigned_char    )))
+
 def msgPage71_CommandStatus(Channel, LastReceivedCommandID, SequenceNr, CommandStatus, Data1, Data2, Data3, Data4):
     DataPageNumber          = 71
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber         = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fLastReceivedCommandID  = sc.unsigned_char
-    fSequenceNr             = sc.unsigned_char
-    fCommandStatus          = sc.unsigned_char
-    fData1                  = sc.unsigned_char
-    fData2                  = sc.unsigned_char
-    fData3                  = sc.unsigned_char
-    fData4                  = sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fLastReceivedCommandID + fSequenceNr + fCommandStatus + fData1 + fData2 + fData3 + fData4
-    info  = struct.pack (format,  Channel,   DataPageNumber,   LastReceivedCommandID,   SequenceNr,   CommandStatus,   Data1,   Data2,   Data3,   Data4)
+    return codecPage71_CommandStatus.Pack(Channel, DataPageNumber, LastReceivedCommandID, SequenceNr, CommandStatus, \
+                                          Data1, Data2, Data3, Data4)
 
-    return info
+# ------------------------------------------------------------------------------
+# c l s C o m m a n d S t a t u s
+# ------------------------------------------------------------------------------
+# function  The "last command" data of a channel, returned in page 71 when the
+#           slave requests it (page 70) after sending a command.
+#           255 = no command received yet.
+#
+# functions Update(CommandID, Data1..4, SequenceNr, CommandStatus)
+#               SequenceNr=None: our own sequence, wraps around after 254
+#               Data: echo of the raw command data (cannot use unpage, unpage
+#                     does unit conversion etc)
+#           Page()  returns msgPage71_CommandStatus for the channel
+# ------------------------------------------------------------------------------
+class clsCommandStatus():
+    def __init__(self, Channel):
+        self.Channel                = Channel
+        self.LastReceivedCommandID  = 255
+        self.SequenceNr             = 255
+        self.CommandStatus          = 255
+        self.Data1                  = 0xff
+        self.Data2                  = 0xff
+        self.Data3                  = 0xff
+        self.Data4                  = 0xff
+
+    def Update(self, CommandID, Data1, Data2, Data3, Data4, SequenceNr=None, CommandStatus=0):
+        if SequenceNr == None:
+            SequenceNr = (self.SequenceNr + 1) % 255
+        self.LastReceivedCommandID  = CommandID
+        self.SequenceNr             = SequenceNr
+        self.CommandStatus          = CommandStatus     # 0 = successfully processed
+        self.Data1                  = Data1
+        self.Data2                  = Data2
+        self.Data3                  = Data3
+        self.Data4                  = Data4
+
+    def Page(self):
+        return msgPage71_CommandStatus(self.Channel, self.LastReceivedCommandID, \
+                    self.SequenceNr, self.CommandStatus, \
+                    self.Data1, self.Data2, self.Data3, self.Data4)
 
 # ------------------------------------------------------------------------------
 # P a g e 7 3 _ G e n e r i c C o m m a n d
@@ -2627,36 +3450,22 @@ def msgPage71_CommandStatus(Channel, LastReceivedCommandID, SequenceNr, CommandS
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # ------------------------------------------------------------------------------
+codecPage73_GenericCommand = clsAntPage('GenericCommand', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('SlaveSerialNumber',   sc.unsigned_short   ),
+    ('SlaveManufacturerID', sc.unsigned_short   ),
+    ('SequenceNr',          sc.unsigned_char    ),
+    ('CommandNr',           sc.unsigned_short   )))
+
 def msgPage73_GenericCommand(Channel, SlaveSerialNumber, SlaveManufacturerID, SequencNr, CommandNr):
     DataPageNumber          = 73
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber         = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber      = sc.unsigned_short
-    fSlaveManufacturerID    = sc.unsigned_short
-    fSequenceNr             = sc.unsigned_char
-    fCommandNr              = sc.unsigned_short
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + fSlaveManufacturerID + fSequenceNr +\
-               fCommandNr
-    info  = struct.pack (format,  Channel,   DataPageNumber,   SlaveSerialNumber,   SlaveManufacturerID,   SequencNr,
-                         CommandNr)
-
-    return info
+    return codecPage73_GenericCommand.Pack(Channel, DataPageNumber, SlaveSerialNumber, SlaveManufacturerID, \
+                                           SequencNr, CommandNr)
 
 def msgUnpage73_GenericCommand (info):
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber         = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber      = sc.unsigned_short
-    fSlaveManufacturerID    = sc.unsigned_short
-    fSequenceNr             = sc.unsigned_char
-    fCommandNr              = sc.unsigned_short
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fSlaveSerialNumber + fSlaveManufacturerID + fSequenceNr + \
-               fCommandNr
-    tuple = struct.unpack (format, info)
-
-    return tuple[2], tuple[3], tuple[4], tuple[5]
+    return codecPage73_GenericCommand.Unpack(info)[2:]
 
 # ------------------------------------------------------------------------------
 # P a g e 8 0 _ M a n u f a c t u r e r I n f o
@@ -2665,17 +3474,18 @@ def msgUnpage73_GenericCommand (info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 80: (0x50) Manufacturers Information
 # ------------------------------------------------------------------------------
+codecPage80_ManufacturerInfo = clsAntPage('ManufacturerInfo', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  #1 First byte of the ANT+ datapage (payload)
+    ('Reserved1',           sc.unsigned_char    ),  #2
+    ('Reserved2',           sc.unsigned_char    ),  #3
+    ('HWrevision',          sc.unsigned_char    ),  #4
+    ('ManufacturerID',      sc.unsigned_short   ),  #5
+    ('ModelNumber',         sc.unsigned_short   )))  #6
+
 def msgPage80_ManufacturerInfo(Channel, Reserved1, Reserved2, HWrevision, ManufacturerID, ModelNumber):
     DataPageNumber      = 80
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fReserved2          = sc.unsigned_char
-    fHWrevision         = sc.unsigned_char
-    fManufacturerID     = sc.unsigned_short
-    fModelNumber        = sc.unsigned_short
-
     # page 28 byte 4,5,6,7- 15=dynastream, 89=tacx
     # antifier used 15 : "a4 09 4e 00 50 ff ff 01 0f 00 85 83 bb"
     # we use 89 (tacx) with the same ModelNumber
@@ -2683,24 +3493,10 @@ def msgPage80_ManufacturerInfo(Channel, Reserved1, Reserved2, HWrevision, Manufa
     # Should be variable and caller-supplied; perhaps it influences pairing
     # when trainer-software wants a specific device?
     #
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fHWrevision + fManufacturerID + fModelNumber
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1,   Reserved2,   HWrevision,   ManufacturerID,   ModelNumber)
-
-    return info
+    return codecPage80_ManufacturerInfo.Pack(Channel, DataPageNumber, Reserved1, Reserved2, HWrevision, ManufacturerID, ModelNumber)
 
 def msgUnpage80_ManufacturerInfo(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char  #2
-    fReserved2          = sc.unsigned_char  #3
-    fHWrevision         = sc.unsigned_char  #4
-    fManufacturerID     = sc.unsigned_short #5
-    fModelNumber        = sc.unsigned_short #6
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fReserved2 + fHWrevision + fManufacturerID + fModelNumber
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    return codecPage80_ManufacturerInfo.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 8 1   P r o d u c t I n f o r m a t i o n
@@ -2709,33 +3505,21 @@ def msgUnpage80_ManufacturerInfo(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 81: (0x51) Product Information
 # ------------------------------------------------------------------------------
+codecPage81_ProductInformation = clsAntPage('ProductInformation', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  #1 First byte of the ANT+ datapage (payload)
+    ('Reserved1',           sc.unsigned_char    ),  #2
+    ('SWrevisionSupp',      sc.unsigned_char    ),  #3
+    ('SWrevisionMain',      sc.unsigned_char    ),  #4
+    ('SerialNumber',        sc.unsigned_int     )))  #5
+
 def msgPage81_ProductInformation(Channel, Reserved1, SWrevisionSupp, SWrevisionMain, SerialNumber):
     DataPageNumber      = 81
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fSWrevisionSupp     = sc.unsigned_char
-    fSWrevisionMain     = sc.unsigned_char
-    fSerialNumber       = sc.unsigned_int
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fSWrevisionSupp + fSWrevisionMain + fSerialNumber
-    info  = struct.pack (format,  Channel,   DataPageNumber,   Reserved1,   SWrevisionSupp,   SWrevisionMain,   SerialNumber)
-
-    return info
+    return codecPage81_ProductInformation.Pack(Channel, DataPageNumber, Reserved1, SWrevisionSupp, SWrevisionMain, SerialNumber)
 
 def msgUnpage81_ProductInformation(info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char  #2
-    fSWrevisionSupp     = sc.unsigned_char  #3
-    fSWrevisionMain     = sc.unsigned_char  #4
-    fSerialNumber       = sc.unsigned_int   #5
-
-    format= sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fSWrevisionSupp + fSWrevisionMain + fSerialNumber
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5]
+    return codecPage81_ProductInformation.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 8 2   B a t t e r y S t a t u s
@@ -2744,25 +3528,21 @@ def msgUnpage81_ProductInformation(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 82: (0x52) Battery Status
 # ------------------------------------------------------------------------------
+codecPage82_BatteryStatus = clsAntPage('BatteryStatus', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('Reserved1',           sc.unsigned_char    ),
+    ('BatteryIdentifier',   sc.unsigned_char    ),
+    ('CumulativeTime1',     sc.unsigned_char    ),
+    ('CumulativeTime2',     sc.unsigned_char    ),
+    ('CumulativeTime3',     sc.unsigned_char    ),
+    ('BatteryVoltage',      sc.unsigned_char    ),
+    ('DescriptiveBitField', sc.unsigned_char    )))
+
 def msgPage82_BatteryStatus(Channel):
     DataPageNumber      = 82
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1          = sc.unsigned_char
-    fBatteryIdentifier  = sc.unsigned_char
-    fCumulativeTime1    = sc.unsigned_char
-    fCumulativeTime2    = sc.unsigned_char
-    fCumulativeTime3    = sc.unsigned_char
-    fBatteryVoltage     = sc.unsigned_char
-    fDescriptiveBitField= sc.unsigned_char
-
-    format=    sc.no_alignment + fChannel + fDataPageNumber + fReserved1 + fBatteryIdentifier + \
-                fCumulativeTime1 + fCumulativeTime2 + fCumulativeTime3 + \
-                fBatteryVoltage + fDescriptiveBitField
-    info  = struct.pack (format, Channel, DataPageNumber, 0xff, 0x00, 0,0,0, 0, 0x0f | 0x10 | 0x00)
-
-    return info
+    return codecPage82_BatteryStatus.Pack(Channel, DataPageNumber, 0xff, 0x00, 0,0,0, 0, 0x0f | 0x10 | 0x00)
 
 # ------------------------------------------------------------------------------
 # P a g e 0, 1, 2   H e a r t R a t e I n f o
@@ -2770,6 +3550,16 @@ def msgPage82_BatteryStatus(Channel):
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00000693_-_ANT+_Device_Profile_-_Heart_Rate_Rev_2.1.pdf
 # ------------------------------------------------------------------------------
+codecPage_Hrm = clsAntPage('Hrm', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  #0 First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  #1 First byte of the ANT+ datapage (payload)
+    ('Spec1',               sc.unsigned_char    ),  #2
+    ('Spec2',               sc.unsigned_char    ),  #3
+    ('Spec3',               sc.unsigned_char    ),  #4
+    ('HeartBeatEventTime',  sc.unsigned_short   ),  #5
+    ('HeartBeatCount',      sc.unsigned_char    ),  #6
+    ('HeartRate',           sc.unsigned_char    )))  #7
+
 def msgPage_Hrm (Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTime, HeartBeatCount, HeartRate):
     DataPageNumber      = int(min(  0xff, DataPageNumber     ))
     Spec1               = int(min(  0xff, Spec1              ))
@@ -2779,34 +3569,10 @@ def msgPage_Hrm (Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTim
     HeartBeatCount      = int(min(  0xff, HeartBeatCount     ))
     HeartRate           = int(min(  0xff, HeartRate          ))
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSpec1              = sc.unsigned_char
-    fSpec2              = sc.unsigned_char
-    fSpec3              = sc.unsigned_char
-    fHeartBeatEventTime = sc.unsigned_short
-    fHeartBeatCount     = sc.unsigned_char
-    fHeartRate          = sc.unsigned_char
-
-    format      = sc.no_alignment + fChannel + fDataPageNumber + fSpec1 + fSpec2 + fSpec3 + fHeartBeatEventTime +  fHeartBeatCount + fHeartRate
-    info        = struct.pack (format, Channel, DataPageNumber,   Spec1,   Spec2,   Spec3,   HeartBeatEventTime,    HeartBeatCount,   HeartRate)
-
-    return info
+    return codecPage_Hrm.Pack(Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTime, HeartBeatCount, HeartRate)
 
 def msgUnpage_Hrm (info):
-    fChannel            = sc.unsigned_char  #0 First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  #1 First byte of the ANT+ datapage (payload)
-    fSpec1              = sc.unsigned_char  #2
-    fSpec2              = sc.unsigned_char  #3
-    fSpec3              = sc.unsigned_char  #4
-    fHeartBeatEventTime = sc.unsigned_short #5
-    fHeartBeatCount     = sc.unsigned_char  #6
-    fHeartRate          = sc.unsigned_char  #7
-
-    format      = sc.no_alignment + fChannel + fDataPageNumber + fSpec1 + fSpec2 + fSpec3 + fHeartBeatEventTime +  fHeartBeatCount + fHeartRate
-    tuple = struct.unpack (format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6], tuple[7]
+    return codecPage_Hrm.Unpack(info)
 
 # ------------------------------------------------------------------------------
 # P a g e 0   S p e e d C a d e n c e S e n s o r
@@ -2814,41 +3580,25 @@ def msgUnpage_Hrm (info):
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001163_-_ANT+_Device_Profile_-_Bicycle_Speed_and_Cadence_2.1.pdf
 # ------------------------------------------------------------------------------
+codecPage_SCS = clsAntPage('SCS', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+                                                    # There is no DataPageNumber
+    ('CadenceEventTime',    sc.unsigned_short   ),
+    ('CadenceRevolutionCount', sc.unsigned_short),
+    ('SpeedEventTime',      sc.unsigned_short   ),
+    ('SpeedRevolutionCount',sc.unsigned_short   )))
+
 def msgPage_SCS (Channel, CadenceEventTime, CadenceRevolutionCount, SpeedEventTime, SpeedRevolutionCount):
-    _DataPageNumber         = 0
     CadenceEventTime        = int(min(0xffff, CadenceEventTime      ))
     CadenceRevolutionCount  = int(min(0xffff, CadenceRevolutionCount))
     SpeedEventTime          = int(min(0xffff, SpeedEventTime        ))
     SpeedRevolutionCount    = int(min(0xffff, SpeedRevolutionCount  ))
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber        = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime       = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime         = sc.unsigned_short
-    fSpeedRevolutionCount   = sc.unsigned_short
-
-    format      = sc.no_alignment + fChannel + fCadenceEventTime + \
-                        fCadenceRevolutionCount + fSpeedEventTime + fSpeedRevolutionCount
-    info        = struct.pack (format, Channel, CadenceEventTime,   \
-                        CadenceRevolutionCount,    SpeedEventTime,   SpeedRevolutionCount)
-
-    return info
+    return codecPage_SCS.Pack(Channel, CadenceEventTime, CadenceRevolutionCount, SpeedEventTime, SpeedRevolutionCount)
 
 def msgUnpage_SCS (info):
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber        = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime       = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime         = sc.unsigned_short
-    fSpeedRevolutionCount   = sc.unsigned_short
-
-    format      = sc.no_alignment + fChannel + fCadenceEventTime + \
-                        fCadenceRevolutionCount + fSpeedEventTime + fSpeedRevolutionCount
-    tuple = struct.unpack (format, info)
-
     #      EventTime, CadenceRevolutionCount, EventTime, SpeedRevolutionCount
-    return tuple[1],  tuple[2],               tuple[3],  tuple[4]
+    return codecPage_SCS.Unpack(info)[1:]
 
 # ------------------------------------------------------------------------------
 # P a g e 2   C o n t r o l
@@ -2856,26 +3606,23 @@ def msgUnpage_SCS (info):
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001307_-_ANT+_Device_Profile_-_Controls_-_2.0.pdf
 # ------------------------------------------------------------------------------
+codecPage2_CTRL = clsAntPage('CTRL', sc.no_alignment, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('CurrentNotifications',sc.unsigned_char    ),
+    ('Reserved1',           sc.unsigned_char    ),
+    ('Reserved2',           sc.unsigned_char    ),
+    ('Reserved3',           sc.unsigned_char    ),
+    ('Reserved4',           sc.unsigned_char    ),
+    ('Reserved5',           sc.unsigned_char    ),
+    ('DeviceCapabilities',  sc.unsigned_char    )))
+
 def msgPage2_CTRL (Channel, CurrentNotifcations, Reserved1, Reserved2, Reserved3, Reserved4, Reserved5,
                    DeviceCapabilities):
     DataPageNumber         = 2
 
-    fChannel                = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber         = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCurrentNotifications   = sc.unsigned_char
-    fReserved1              = sc.unsigned_char
-    fReserved2              = sc.unsigned_char
-    fReserved3              = sc.unsigned_char
-    fReserved4              = sc.unsigned_char
-    fReserved5              = sc.unsigned_char
-    fDeviceCapabilities     = sc.unsigned_char
-
-    format      = sc.no_alignment + fChannel + fDataPageNumber + fCurrentNotifications + fReserved1 + fReserved2 + \
-                  fReserved3 + fReserved4 + fReserved5 + fDeviceCapabilities
-    info        = struct.pack (format, Channel, DataPageNumber, CurrentNotifcations, Reserved1, Reserved2, Reserved3,
-                               Reserved4, Reserved5, DeviceCapabilities)
-
-    return info
+    return codecPage2_CTRL.Pack(Channel, DataPageNumber, CurrentNotifcations, Reserved1, Reserved2, Reserved3,
+                                Reserved4, Reserved5, DeviceCapabilities)
 
 # ------------------------------------------------------------------------------
 # T a c x  B l a c k T r a c k  p a g e s
@@ -2886,32 +3633,28 @@ def msgPage2_CTRL (Channel, CurrentNotifcations, Reserved1, Reserved2, Reserved3
 # -------------------------------------------------------------------------------------
 # P a g e 0 0  T a c x B l a c k T r a c k A n g l e
 # -------------------------------------------------------------------------------------
-def msgUnpage00_TacxBlackTrackAngle (info):
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+codecPage00_TacxBlackTrackAngle = clsAntPage('TacxBlackTrackAngle', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    ('Angle',               sc.short            ),  # raw angle
+    ('Reserved',            sc.unsigned_char    ),  # always 0xff (?)
+    (None,                  4 * sc.pad          )))
 
-    fAngle              = sc.short # raw angle
-    nAngle              = 2
-    fReserved           = sc.unsigned_char # always 0xff (?)
-    nReserved           = 3
-    fPadding            = 4 * sc.pad
-
-    format = sc.big_endian + fChannel + fDataPageNumber + fAngle + fReserved + fPadding
-    tuple = struct.unpack(format, info)
+def msgUnpage00_TacxBlackTrackAngle (info):
+    _Channel, _DataPageNumber, Angle, Reserved = codecPage00_TacxBlackTrackAngle.Unpack(info)
 
-    return tuple[nAngle], tuple[nReserved]
+    return Angle, Reserved
 
 # ------------------------------------------------------------------------------
 # P a g e 0 1  T a c x B l a c k T r a c k K e e p A l i v e
 # ------------------------------------------------------------------------------
+codecPage01_TacxBlackTrackKeepAlive = clsAntPage('TacxBlackTrackKeepAlive', sc.big_endian, (
+    ('Channel',             sc.unsigned_char    ),  # First byte of the ANT+ message content
+    ('DataPageNumber',      sc.unsigned_char    ),  # First byte of the ANT+ datapage (payload)
+    (None,                  sc.pad * 7          )))
+
 def msgPage01_TacxBlackTrackKeepAlive (Channel):
     DataPageNumber      = 0x01
 
-    fChannel            = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber     = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fPadding            = sc.pad * 7
+    return codecPage01_TacxBlackTrackKeepAlive.Pack(Channel, DataPageNumber)
 
-    format = sc.big_endian +     fChannel + fDataPageNumber + fPadding
-    info   = struct.pack (format, Channel,   DataPageNumber)
-
-    return info
@@ -0,0 +1,491 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    The last packet of a burst is answered with TRANSFER_TX_COMPLETED
+# 2026-10-17    Write() accepts multiple messages in one transfer
+# 2026-10-17    First version; an emulated ANT dongle, so that antDongle,
+#               FortiusAntBody and ExplorAnt can run without hardware.
+#-------------------------------------------------------------------------------
+# Description:  clsAntEmulatedTransport is a clsAntTransport that behaves as an
+#               ANT dongle with the ANT devices around it:
+#
+#               - Reset (0x4a) is answered with StartUp (0x6f)
+#               - Channel configuration messages are answered with a
+#                 ChannelResponse (RESPONSE_NO_ERROR); assignment, channel id
+#                 and channel period are stored per channel.
+#               - Requests (0x4d) for Capabilities, ANTversion, ChannelID and
+#                 ChannelStatus are answered.
+#               - An open master channel sends EVENT_TX once per channel period
+#                 (or EVENT_TRANSFER_TX_COMPLETED after acknowledged data).
+#               - An open slave channel pairs with an emulated device of the
+#                 same DeviceTypeID (and DeviceNumber, unless wildcard) and
+#                 receives its pages once per channel period.
+#               - An emulated slave device (e.g. a CTP) on an open master
+#                 channel sends acknowledged data to that channel.
+#
+#               Emulated devices:
+#               - clsEmulatedHRM        Heart Rate Monitor
+#               - clsEmulatedVortex     Tacx i-Vortex (page 0 and 3)
+#               - clsEmulatedCTP        Cycle Training Program; FE-C page 49
+#                                       and 51 commands from Profile
+#
+#               Load multiplies the messages a device sends per channel
+#               period, to test the read thread, framer and router at stress
+#               message rates.
+#
+#               The time is taken from cycleClock, so that the emulated dongle
+#               runs on a virtual clock as well.
+#
+# Usage:        AntDongle = ant.clsAntDongle(None, antEmulator.clsAntEmulatedTransport(
+#                               [antEmulator.clsEmulatedHRM(), antEmulator.clsEmulatedCTP()]))
+#
+#               python antEmulator.py -t 10 -l 100      benchmark, see __main__
+#-------------------------------------------------------------------------------
+import argparse
+import array
+import threading
+import time
+
+import antDongle         as ant
+import cycleClock
+import debug
+import logfile
+
+#-------------------------------------------------------------------------------
+# ANT protocol, D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf 9.5.6.1
+#-------------------------------------------------------------------------------
+msgID_CloseChannel                  = 0x4c
+msgID_ChannelStatus                 = 0x52
+
+RESPONSE_NO_ERROR                   = 0x00
+EVENT_TX                            = 0x03
+EVENT_TRANSFER_TX_COMPLETED         = 0x05
+EVENT_CHANNEL_CLOSED                = 0x07
+INVALID_MESSAGE                     = 0x28
+
+ChannelStatus_Unassigned            = 0
+ChannelStatus_Assigned              = 1
+ChannelStatus_Searching             = 2
+ChannelStatus_Tracking              = 3
+
+ChannelPeriodUnit                   = 32768     # Period in 1/32768 seconds
+ChannelPeriodDefault                = 8192      # 4Hz
+
+# ------------------------------------------------------------------------------
+# c l s E m u l a t e d C h a n n e l
+# ------------------------------------------------------------------------------
+# Description:  The state of one channel of the emulated dongle
+# ------------------------------------------------------------------------------
+class clsEmulatedChannel:
+    def __init__(self, Number, ChannelType, NetworkNumber):
+        self.Number             = Number
+        self.ChannelType        = ChannelType
+        self.NetworkNumber      = NetworkNumber
+        self.Master             = ChannelType in (ant.ChannelType_BidirectionalTransmit,
+                                                  ant.ChannelType_UnidirectionalTransmitOnly,
+                                                  ant.ChannelType_SharedBidirectionalTransmit)
+        self.DeviceNumber       = 0
+        self.DeviceTypeID       = 0
+        self.TransmissionType   = 0
+        self.Period             = ChannelPeriodDefault
+        self.Open               = False
+        self.NextEvent          = None
+        self.Acknowledged       = False     # Acknowledged data to be sent
+        self.Device             = None      # The paired clsEmulatedDevice
+
+# ------------------------------------------------------------------------------
+# c l s E m u l a t e d D e v i c e
+# ------------------------------------------------------------------------------
+# Description:  An ANT device around the dongle
+#               Master = True   the device transmits broadcast data, received
+#                               on a slave channel of the dongle (e.g. HRM)
+#               Master = False  the device is a slave of a master channel of
+#                               the dongle and may send acknowledged data
+#                               (e.g. a CTP on the FE-C channel)
+#
+#               Page(now) returns (msgID, info) or None; the first byte of
+#               info (the channel) is replaced by the channel number.
+# ------------------------------------------------------------------------------
+class clsEmulatedDevice:
+    Master              = True
+
+    def __init__(self, DeviceTypeID, DeviceNumber, TransmissionType=ant.TransmissionType_IC):
+        self.DeviceTypeID       = DeviceTypeID
+        self.DeviceNumber       = DeviceNumber
+        self.TransmissionType   = TransmissionType
+        self.Count              = 0         # Pages sent
+
+    def Page(self, _now):
+        return None
+
+# ------------------------------------------------------------------------------
+# c l s E m u l a t e d H R M
+# ------------------------------------------------------------------------------
+class clsEmulatedHRM(clsEmulatedDevice):
+    def __init__(self, DeviceNumber=57591, HeartRate=123):
+        super().__init__(ant.DeviceTypeID_HRM, DeviceNumber)
+        self.HeartRate          = HeartRate
+        self.HeartBeatCount     = 0
+        self.HeartBeatTime      = None
+
+    def Page(self, now):
+        if self.HeartBeatTime is None:
+            self.HeartBeatTime = now
+        while now - self.HeartBeatTime >= 60 / self.HeartRate:
+            self.HeartBeatTime  += 60 / self.HeartRate
+            self.HeartBeatCount += 1
+        self.Count += 1
+        Toggle = 0x80 if (self.Count // 4) % 2 else 0           # Page change toggle
+        return ant.msgID_BroadcastData, ant.msgPage_Hrm(0, Toggle, 0xff, 0xff, 0xff, \
+                    self.HeartBeatTime % 64, self.HeartBeatCount & 0xff, self.HeartRate)
+
+# ------------------------------------------------------------------------------
+# c l s E m u l a t e d V o r t e x
+# ------------------------------------------------------------------------------
+# Description:  Tacx i-Vortex; page 3 (calibration, VortexID) every 4th page,
+#               otherwise page 0 (power, wheelspeed, cadence)
+# ------------------------------------------------------------------------------
+class clsEmulatedVortex(clsEmulatedDevice):
+    def __init__(self, DeviceNumber=4711, Power=150, WheelSpeed=800, Cadence=85):
+        super().__init__(ant.DeviceTypeID_VTX, DeviceNumber)
+        self.Power              = Power
+        self.WheelSpeed         = WheelSpeed
+        self.Cadence            = Cadence
+
+    def Page(self, _now):
+        self.Count += 1
+        if self.Count % 4 == 0:
+            info = ant.msgPage03_TacxVortexDataCalibration(0, 0, self.DeviceNumber)
+        else:
+            info = ant.msgPage00_TacxVortexDataSpeed(0, self.Power, self.WheelSpeed, self.Cadence)
+        return ant.msgID_BroadcastData, info
+
+# ------------------------------------------------------------------------------
+# c l s E m u l a t e d C T P
+# ------------------------------------------------------------------------------
+# Description:  Cycle Training Program, slave on the FE-C master channel.
+#               Once every Interval seconds the next command from Profile is
+#               sent; (49, Watt) = Target Power, (51, %) = Grade.
+#               Interval = 0: no commands at all
+# ------------------------------------------------------------------------------
+class clsEmulatedCTP(clsEmulatedDevice):
+    Master              = False
+
+    Profile = ( (49, 100), (49, 150), (49, 200), (49, 250), (49, 300), (49, 150),
+                (51,   0), (51,   2), (51,   5), (51,  -3), (51,   8), (51,   1) )
+
+    def __init__(self, Interval=5, Profile=None):
+        super().__init__(ant.DeviceTypeID_FE, 0)
+        self.Interval           = Interval
+        self.CommandTime        = None
+        if Profile: self.Profile = Profile
+
+    def Page(self, now):
+        if not self.Interval: return None
+        if self.CommandTime is None:
+            self.CommandTime = now
+        if now < self.CommandTime: return None
+
+        Page, Value = self.Profile[self.Count % len(self.Profile)]
+        if Page == 49:
+            info = ant.codecPage49_TargetPower.Pack(0, Page, int(Value * 4))    # 0.25 Watt
+        else:
+            info = ant.codecPage51_TrackResistance.Pack(0, Page, int((Value + 200) * 100), 0xff)
+        self.Count       += 1
+        self.CommandTime += self.Interval
+        return ant.msgID_AcknowledgedData, info
+
+# ------------------------------------------------------------------------------
+# c l s A n t E m u l a t e d T r a n s p o r t
+# ------------------------------------------------------------------------------
+# Description:  The emulated dongle, see module header
+#
+# Input:        Devices     list of clsEmulatedDevice
+#               Load        messages per channel period per device (stress)
+#
+# Statistics:   Written     (msgID, Channel) --> count, messages to the dongle
+#               Transfers   number of Write() calls (USB transfers)
+#               Pages       (Channel, DataPageNumber) --> count, data written
+#               Received    messages from the dongle (to the application)
+# ------------------------------------------------------------------------------
+class clsAntEmulatedTransport(ant.clsAntTransport):
+    Manufacturer        = 'Emulated'
+    Product             = 'ANT emulator'
+    VendorID            = 0x0fcf
+    ProductID           = 0x1008
+
+    MaxChannels         = 8
+    MaxNetworks         = 3
+    Version             = b'AP2EMU1.00\x00'
+
+    def __init__(self, Devices=(), Load=1):
+        self.Devices    = list(Devices)
+        self.Load       = Load
+        self.Channels   = {}                    # Number --> clsEmulatedChannel
+        self._Output    = bytearray()           # Messages not yet read
+        self._Lock      = threading.Lock()      # Write() and Read() in different threads
+        self._Data      = threading.Event()     # Set when there is output
+
+        self._Framer    = ant.clsAntFramer()    # Messages in a transfer
+
+        self.Written    = {}
+        self.Pages      = {}
+        self.Transfers  = 0
+        self.Received   = 0
+
+    def Candidates(self, _ProductID):
+        return [self]
+
+    # --------------------------------------------------------------------------
+    # W r i t e
+    # --------------------------------------------------------------------------
+    # Description:  Process the ANT messages sent to the dongle; one transfer
+    #               may contain multiple messages.
+    # --------------------------------------------------------------------------
+    def Write(self, data):
+        self.Transfers += 1
+        for message in self._Framer.Feed(data):
+            self._Message(message)
+
+    def _Message(self, data):
+        _synch, _length, id, info, _checksum, _rest, Channel, DataPageNumber = \
+            ant.DecomposeMessage(data)
+
+        with self._Lock:
+            key = (id, Channel)
+            self.Written[key] = self.Written.get(key, 0) + 1
+            c = self.Channels.get(Channel)
+
+            if   id == ant.msgID_ResetSystem:
+                self.Channels = {}
+                self._Respond(ant.msgID_StartUp, b'\x20')       # 0x20 = command reset
+
+            elif id == ant.msgID_AssignChannel:
+                self.Channels[Channel] = clsEmulatedChannel(Channel, info[1], info[2])
+                self._ChannelResponse(Channel, id)
+
+            elif id == ant.msgID_UnassignChannel:
+                self.Channels.pop(Channel, None)
+                self._ChannelResponse(Channel, id)
+
+            elif id == ant.msgID_SetNetworkKey:
+                self._ChannelResponse(info[0], id)              # Network number
+
+            elif id == ant.msgID_ChannelID and c:
+                _Channel, c.DeviceNumber, c.DeviceTypeID, c.TransmissionType = \
+                    ant.unmsg51_ChannelID(info)
+                self._ChannelResponse(Channel, id)
+
+            elif id == ant.msgID_ChannelPeriod and c:
+                c.Period = info[1] + (info[2] << 8)
+                self._ChannelResponse(Channel, id)
+
+            elif id == ant.msgID_OpenChannel and c:
+                c.Open      = True
+                c.NextEvent = cycleClock.Monotonic() + c.Period / ChannelPeriodUnit
+                self._ChannelResponse(Channel, id)
+
+            elif id == msgID_CloseChannel and c:
+                c.Open      = False
+                c.Device    = None
+                self._ChannelResponse(Channel, id)
+                self._ChannelResponse(Channel, ant.msgID_RF_EVENT, EVENT_CHANNEL_CLOSED)
+
+            elif id == ant.msgID_RequestMessage:
+                self._Request(info[0], info[1])
+
+            elif id in (ant.msgID_BroadcastData, ant.msgID_AcknowledgedData, ant.msgID_BurstData):
+                key = (Channel, DataPageNumber)
+                self.Pages[key] = self.Pages.get(key, 0) + 1
+                if id == ant.msgID_AcknowledgedData and c: c.Acknowledged = True
+                if id == ant.msgID_BurstData and data[3] >> 5 & ant.BurstLastPacket:
+                    self._ChannelResponse(Channel, ant.msgID_RF_EVENT, EVENT_TRANSFER_TX_COMPLETED)
+
+            elif id in (ant.msgID_ChannelSearchTimeout, ant.msgID_ChannelRfFrequency,
+                        ant.msgID_ChannelTransmitPower) and c:
+                self._ChannelResponse(Channel, id)
+
+            else:
+                self._ChannelResponse(Channel, id, INVALID_MESSAGE)
+
+    # --------------------------------------------------------------------------
+    # R e a d
+    # --------------------------------------------------------------------------
+    # Description:  Return the output of the dongle; if there is none, wait for
+    #               the next channel event, at most timeout milli-seconds.
+    # --------------------------------------------------------------------------
+    def Read(self, length, timeout):
+        now = cycleClock.Monotonic()
+        with self._Lock:
+            self._Events(now)
+            if not self._Output:
+                self._Data.clear()
+                Wait = timeout / 1000
+                for c in self.Channels.values():
+                    if c.Open: Wait = min(Wait, c.NextEvent - now)
+
+        if not self._Output and Wait > 0:
+            cycleClock.Wait(self._Data, Wait)
+
+        with self._Lock:
+            self._Events(cycleClock.Monotonic())
+            if not self._Output:
+                raise TimeoutError('timeout error')
+            rtn = array.array('B', self._Output[:length])
+            del self._Output[:length]
+        return rtn
+
+    # --------------------------------------------------------------------------
+    # _ E v e n t s
+    # --------------------------------------------------------------------------
+    # Description:  Generate the messages of all channel periods until now.
+    #               When far behind (more than one second), the missed periods
+    #               are skipped.
+    # --------------------------------------------------------------------------
+    def _Events(self, now):
+        for c in self.Channels.values():
+            if not c.Open: continue
+            Period = c.Period / ChannelPeriodUnit
+            if now - c.NextEvent > 1: c.NextEvent = now
+            while c.NextEvent <= now:
+                c.NextEvent += Period
+                self._ChannelEvent(c, now)
+
+    def _ChannelEvent(self, c, now):
+        #-----------------------------------------------------------------------
+        # Pair with a device; on a master channel, DeviceNumber is our own
+        #-----------------------------------------------------------------------
+        if c.Device is None:
+            for d in self.Devices:
+                if d.Master != c.Master and d.DeviceTypeID == c.DeviceTypeID and \
+                        (c.Master or c.DeviceNumber in (0, d.DeviceNumber)):
+                    c.Device = d
+                    break
+        #-----------------------------------------------------------------------
+        # Master: the data is transmitted
+        #-----------------------------------------------------------------------
+        if c.Master:
+            if c.Acknowledged:
+                c.Acknowledged = False
+                self._ChannelResponse(c.Number, ant.msgID_RF_EVENT, EVENT_TRANSFER_TX_COMPLETED)
+            else:
+                self._ChannelResponse(c.Number, ant.msgID_RF_EVENT, EVENT_TX)
+        #-----------------------------------------------------------------------
+        # The paired device sends data
+        #-----------------------------------------------------------------------
+        if c.Device:
+            for _ in range(self.Load):
+                rtn = c.Device.Page(now)
+                if rtn is None: break
+                id, info = rtn
+                info = bytearray(info)
+                info[0] = c.Number
+                self._Respond(id, info)
+
+    # --------------------------------------------------------------------------
+    # _ R e q u e s t
+    # --------------------------------------------------------------------------
+    def _Request(self, Channel, RequestedID):
+        c = self.Channels.get(Channel)
+        if   RequestedID == ant.msgID_Capabilities:
+            self._Respond(RequestedID, bytes((self.MaxChannels, self.MaxNetworks, 0, 0, 0, 0)))
+        elif RequestedID == ant.msgID_ANTversion:
+            self._Respond(RequestedID, self.Version)
+        elif RequestedID == ant.msgID_ChannelID and c:
+            d = c.Device if c.Device else c
+            self._Respond(RequestedID, ant.codecMsg51_ChannelID.Pack(Channel, \
+                    d.DeviceNumber, d.DeviceTypeID, d.TransmissionType))
+        elif RequestedID == msgID_ChannelStatus:
+            if   c is None:  Status = ChannelStatus_Unassigned
+            elif not c.Open: Status = ChannelStatus_Assigned
+            elif c.Device:   Status = ChannelStatus_Tracking
+            else:            Status = ChannelStatus_Searching
+            self._Respond(RequestedID, bytes((Channel, Status)))
+        else:
+            self._ChannelResponse(Channel, ant.msgID_RequestMessage, INVALID_MESSAGE)
+
+    def _ChannelResponse(self, Channel, id, Code=RESPONSE_NO_ERROR):
+        self._Respond(ant.msgID_ChannelResponse, bytes((Channel, id, Code)))
+
+    def _Respond(self, id, info):
+        self._Output += ant.ComposeMessage(id, info)
+        self.Received += 1
+        self._Data.set()
+
+# ==============================================================================
+# Main program; benchmark of clsAntDongle (read thread, framer) and
+#               clsAntRouter with the emulated dongle
+# ==============================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark antDongle with an emulated ANT dongle')
+    parser.add_argument('-t', dest='seconds',   metavar='seconds', help='Duration (default 10)',                  required=False, default=10, type=float)
+    parser.add_argument('-l', dest='load',      metavar='n',       help='Messages per channel period (default 1)', required=False, default=1,  type=int)
+    parser.add_argument('-n', dest='nothread',                     help='Do not use the read thread',              required=False, action='store_true')
+    parser.add_argument('-d', dest='debug',     metavar='flags',   help='Debug flags',                             required=False, default=0,  type=int)
+    args = parser.parse_args()
+
+    debug.activate(args.debug)
+    if debug.on(debug.Any): logfile.Open()
+
+    Transport = clsAntEmulatedTransport([clsEmulatedHRM(), clsEmulatedVortex(), clsEmulatedCTP(0.25)], args.load)
+    AntDongle = ant.clsAntDongle(None, Transport)
+    AntDongle.UseThread = not args.nothread
+    Wakeup    = threading.Event()
+    AntDongle.Wakeup    = Wakeup
+    logfile.Console (AntDongle.Message)
+
+    AntDongle.Calibrate()
+    AntDongle.Trainer_ChannelConfig()
+    AntDongle.SlaveHRM_ChannelConfig(0)
+    AntDongle.SlaveVTX_ChannelConfig(0)
+
+    #---------------------------------------------------------------------------
+    # Count the dispatched messages per id
+    #---------------------------------------------------------------------------
+    Counts = {}
+    def Count(m):
+        Counts[m.id] = Counts.get(m.id, 0) + 1
+        return True
+
+    Router = ant.clsAntRouter()
+    for id in (ant.msgID_BroadcastData, ant.msgID_AcknowledgedData, ant.msgID_ChannelResponse, ant.msgID_ChannelID):
+        Router.Register(Count, id)
+
+    #---------------------------------------------------------------------------
+    # FE-C broadcast at 4Hz, dispatch all that is received
+    #---------------------------------------------------------------------------
+    AntClock       = cycleClock.clsCycleClock(0.25, 'Benchmark')
+    Dispatched     = 0
+    DispatchTime   = 0
+    StartTime      = time.perf_counter()
+    StartCPU       = time.process_time()
+    while time.perf_counter() - StartTime < args.seconds:
+        if AntClock.Due():
+            info = ant.msgPage16_GeneralFEdata(ant.channel_FE, 0, 0, 0, 0)
+            AntDongle.Write([ant.ComposeMessage(ant.msgID_BroadcastData, info)], True, False)
+
+        t = time.perf_counter()
+        while AntDongle.MessageQueueSize() > 0:
+            Router.Dispatch(AntDongle.MessageQueueGet())
+            Dispatched += 1
+        DispatchTime += time.perf_counter() - t
+
+        if not AntDongle.ThreadActive: AntDongle.Read(False, 1)
+        Wakeup.wait(max(0, min(0.25, AntClock.Deadline - cycleClock.Monotonic())))
+        Wakeup.clear()
+
+    Elapsed = time.perf_counter() - StartTime
+    CPU     = time.process_time() - StartCPU
+    AntDongle.StopReadThread()
+
+    logfile.Console ("Load=%s thread=%s: %s messages from dongle, %s dispatched in %4.1fs; %6.0f msg/s" % \
+        (args.load, AntDongle.UseThread, Transport.Received, Dispatched, Elapsed, Dispatched / Elapsed))
+    logfile.Console ("CPU %4.2fs (%3.0f%%), dispatch %4.3fs = %4.1f us/message" % \
+        (CPU, CPU / Elapsed * 100, DispatchTime, DispatchTime / max(1, Dispatched) * 1e6))
+    logfile.Console ("Dispatched per id: %s" % ' '.join('0x%02x:%s' % (k, v) for k, v in sorted(Counts.items())))
+    s = AntDongle.ReadStatistics.Statistics()
+    logfile.Console ("Reads %s (empty %s), %s responses, latency avg %4.1fms max %4.1fms" % \
+        (s['Reads'], s['Empty'], s['Responses'], s['LatencyAvg'], s['LatencyMax']))
+
+    if debug.on(debug.Any): logfile.Close()
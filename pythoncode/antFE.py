@@ -1,7 +1,10 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-12-28"
+__version__ = "2026-10-17"
+# 2026-10-17    cycleClock.Monotonic() used, so a virtual clock can be set
+# 2026-10-17    AccumulatedTime from time.monotonic(), wall-clock changes
+#               (NTP) no longer disturb AccumulatedTime and DistanceTravelled
 # 2020-12-28    AccumulatedPower not negative
 # 2020-12-27    Interleave and EventCount more according specification
 #               see comment in antPWR.py for more info.
@@ -9,7 +12,7 @@ __version__ = "2020-12-28"
 # 2020-05-07    pylint error free
 # 2020-02-18    First version, split-off from FortiusAnt.py
 #-------------------------------------------------------------------------------
-import time
+import cycleClock
 import antDongle         as ant
 
 def Initialize():
@@ -19,7 +22,7 @@ def Initialize():
     AccumulatedPower        = 0
     AccumulatedTime         = 0
     DistanceTravelled       = 0
-    AccumulatedLastTime     = time.time()
+    AccumulatedLastTime     = cycleClock.Monotonic()
 
 # ------------------------------------------------------------------------------
 # B r o a d c a s t T r a i n e r D a t a M e s s a g e
@@ -68,7 +71,7 @@ def BroadcastTrainerDataMessage (Cadence, CurrentPower, SpeedKmh, HeartRate):
         #-----------------------------------------------------------------------
         # Send general fe data every 3 packets
         #-----------------------------------------------------------------------
-        t                       = time.time()
+        t                       = cycleClock.Monotonic()
         ElapsedTime             = t - AccumulatedLastTime # time since previous event
         AccumulatedLastTime     = t
         AccumulatedTime        += ElapsedTime * 4         # in 0.25s
@@ -1,13 +1,15 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2020-12-27"
+__version__ = "2026-10-17"
+# 2026-10-17    cycleClock.Monotonic() used, so a virtual clock can be set
+# 2026-10-17    HeartBeatTime from time.monotonic(), not the wall-clock
 # 2020-12-27    Interleave like antPWR.py
 # 2020-05-07    devAntDongle not needed, not used
 # 2020-05-07    pylint error free
 # 2020-02-18    First version, split-off from FortiusAnt.py
 #-------------------------------------------------------------------------------
-import time
+import cycleClock
 import antDongle         as ant
 
 def Initialize():
@@ -38,10 +40,10 @@ def BroadcastHeartrateMessage (HeartRate):
     # To make this fit in the Interleave cycle (0...255) I have 
     # chosen blocks of 64 messages as below:
     #-------------------------------------------------------------------------
-    if (time.time() - HeartBeatTime) >= (60 / float(HeartRate)):
+    if (cycleClock.Monotonic() - HeartBeatTime) >= (60 / float(HeartRate)):
         HeartBeatCounter   += 1                                     # Increment heart beat count                     
         HeartBeatEventTime += (60 / float(HeartRate))               # Reset last time of heart beat
-        HeartBeatTime       = time.time()                           # Current time for next processing
+        HeartBeatTime       = cycleClock.Monotonic()                     # Current time for next processing
         
         if HeartBeatEventTime >= 64 or HeartBeatCounter >= 256:     # Rollover at 64seconds
             HeartBeatCounter   = 0
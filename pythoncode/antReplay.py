@@ -0,0 +1,212 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    First version; replay a capture of the ANT dongle traffic
+#-------------------------------------------------------------------------------
+# Description:  A capture file (.antcap) is created by clsAntDongle when
+#               debug.AntCapture is active (FortiusAnt -d r), see
+#               antDongle.clsAntCapture for the format.
+#
+#               clsAntCaptureReader     returns the records of a capture
+#               clsAntReplayTransport   a clsAntTransport that returns the data
+#                                       that was read from the dongle, at the
+#                                       recorded time (1x), N times faster or
+#                                       as fast as possible (Speed=0).
+#                                       Data written is not sent anywhere.
+#                                       A recorded read-exception is raised
+#                                       again, so that the dongle recovery
+#                                       (e.g. CYCPLUS disconnect) is replayed.
+#
+#               Since clsAntDongle processes the replayed data as if read from
+#               a dongle, framing errors ("characters skipped", "checksum
+#               incorrect") occur again and can be investigated with the
+#               normal debug-logging.
+#
+# Usage:        python antReplay.py -l capture.antcap       list the records
+#               python antReplay.py capture.antcap          replay max speed
+#               python antReplay.py -s 1 -d 4 capture.antcap
+#                                                           replay real-time,
+#                                                           logging messages
+#-------------------------------------------------------------------------------
+import argparse
+import array
+import time
+
+import antDongle         as ant
+import cycleClock
+import debug
+import logfile
+
+# ------------------------------------------------------------------------------
+# c l s A n t C a p t u r e R e a d e r
+# ------------------------------------------------------------------------------
+# Description:  Read a capture file
+#
+# Input:        FileName
+#
+# Output:       StartTime   time.time() when the capture was started
+#               Records     list of (Time, Direction, data)
+#                           Time in seconds since the start of the capture
+#
+# Exceptions:   ValueError when not a capture file
+# ------------------------------------------------------------------------------
+class clsAntCaptureReader:
+    def __init__(self, FileName):
+        self.FileName  = FileName
+        self.Records   = []
+
+        with open(FileName, 'rb') as f:
+            Capture = f.read()
+
+        if not Capture.startswith(ant.CaptureMagic):
+            raise ValueError("%s is not an ANT capture file" % FileName)
+        Offset = len(ant.CaptureMagic)
+        self.StartTime, = ant.CaptureHeader.unpack_from(Capture, Offset)
+        Offset += ant.CaptureHeader.size
+
+        while Offset + ant.CaptureRecord.size <= len(Capture):
+            Time, Direction, Length = ant.CaptureRecord.unpack_from(Capture, Offset)
+            Offset += ant.CaptureRecord.size
+            self.Records.append((Time * ant.CaptureTimeUnit, Direction, Capture[Offset : Offset + Length]))
+            Offset += Length
+
+    def Duration(self):
+        return self.Records[-1][0] if self.Records else 0
+
+# ------------------------------------------------------------------------------
+# c l s A n t R e p l a y T r a n s p o r t
+# ------------------------------------------------------------------------------
+# Description:  Replay the data read from the dongle; see module header
+#
+# Input:        FileName    capture file
+#               Speed       1 = as recorded, 2 = twice as fast, ...
+#                           0 = as fast as possible
+#
+# Output:       Finished    all records are replayed
+#               Written     number of messages written by the application
+# ------------------------------------------------------------------------------
+class clsAntReplayTransport(ant.clsAntTransport):
+    Manufacturer        = 'Replay'
+    VendorID            = 0x0fcf
+    ProductID           = 0x1008
+
+    def __init__(self, FileName, Speed=0):
+        self.Capture    = clsAntCaptureReader(FileName)
+        self.Product    = FileName
+        self.Speed      = Speed
+        self.Finished   = False
+        self.Written    = 0
+        self._StartTime = None
+        self._Records   = iter([r for r in self.Capture.Records if r[1] != ant.CaptureOut])
+        self._Next      = None
+        self._Pending   = b''                   # Not returned by previous Read()
+        self._Timeout   = True                  # Speed=0: previous Read() timed out
+        self._Advance()
+
+    def Configure(self):
+        if self._StartTime is None:             # Not again on a reconnect
+            self._StartTime = cycleClock.Monotonic()
+
+    def Write(self, _data):
+        self.Written += 1
+
+    # --------------------------------------------------------------------------
+    # R e a d
+    # --------------------------------------------------------------------------
+    # Description:  Return the next recorded data, when its time has come.
+    #               If not within timeout, raise TimeoutError as the dongle does.
+    # --------------------------------------------------------------------------
+    def Read(self, length, timeout):
+        if not self._Pending:
+            if self._Next is None:
+                if self.Speed: cycleClock.Sleep(timeout / 1000)
+                raise TimeoutError('timeout error')
+
+            Time, Direction, data = self._Next
+            if not self.Speed:
+                #---------------------------------------------------------------
+                # One buffer per read-loop, as the dongle usually does
+                #---------------------------------------------------------------
+                self._Timeout = not self._Timeout
+                if self._Timeout: raise TimeoutError('timeout error')
+            else:
+                Wait = self._StartTime + Time / self.Speed - cycleClock.Monotonic()
+                if Wait > timeout / 1000:
+                    cycleClock.Sleep(timeout / 1000)
+                    raise TimeoutError('timeout error')
+                if Wait > 0:
+                    cycleClock.Sleep(Wait)
+            self._Advance()
+
+            if Direction == ant.CaptureError:
+                raise Exception(data.decode(errors='replace'))
+            self._Pending = data
+
+        rtn = array.array('B', self._Pending[:length])
+        self._Pending = self._Pending[length:]
+        return rtn
+
+    def _Advance(self):
+        self._Next = next(self._Records, None)
+        if self._Next is None:
+            self.Finished = True
+
+# ==============================================================================
+# Main program; list or replay a capture file
+# ==============================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='List or replay a capture of ANT dongle traffic (FortiusAnt -d r)')
+    parser.add_argument('file',                                    help='Capture file (.antcap)')
+    parser.add_argument('-l', dest='list',                         help='List the records, do not replay',      required=False, action='store_true')
+    parser.add_argument('-s', dest='speed',     metavar='speed',   help='1=real-time, 0=max speed (default 0)', required=False, default=0, type=float)
+    parser.add_argument('-d', dest='debug',     metavar='flags',   help='Debug flags, 4 = log all messages',    required=False, default=0, type=int)
+    args = parser.parse_args()
+
+    debug.activate(args.debug & ~debug.AntCapture)  # Do not capture the replay
+    if debug.on(debug.Any): logfile.Open('antReplay')
+
+    if args.list:
+        #-----------------------------------------------------------------------
+        # List all records
+        #-----------------------------------------------------------------------
+        Capture = clsAntCaptureReader(args.file)
+        logfile.Console ("%s: started %s, %s records, %4.1f seconds" % (args.file, \
+            time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(Capture.StartTime)), \
+            len(Capture.Records), Capture.Duration()))
+        Arrows = {ant.CaptureOut: '-->', ant.CaptureIn: '<--', ant.CaptureError: '!!!'}
+        for Time, Direction, data in Capture.Records:
+            if Direction == ant.CaptureError:
+                Text = data.decode(errors='replace')
+            else:
+                Text = logfile.HexSpace(data)
+            print ("%10.4f %s %s" % (Time, Arrows.get(Direction, '???'), Text))
+
+    else:
+        #-----------------------------------------------------------------------
+        # Replay through clsAntDongle, so that framing and recovery are
+        # executed as when the capture was made.
+        #-----------------------------------------------------------------------
+        Transport = clsAntReplayTransport(args.file, args.speed)
+        AntDongle = ant.clsAntDongle(None, Transport)
+        AntDongle.UseThread = False
+        logfile.Console (AntDongle.Message)
+
+        Counts    = {}
+        Reconnect = 0
+        StartTime = time.perf_counter()
+        while AntDongle.OK and not Transport.Finished:
+            AntDongle.Read(False, 20)
+            if AntDongle.DongleReconnected:
+                Reconnect += 1
+                AntDongle.ApplicationRestart()
+            while AntDongle.MessageQueueSize() > 0:
+                id = AntDongle.MessageQueueGet()[2]
+                Counts[id] = Counts.get(id, 0) + 1
+        Elapsed = time.perf_counter() - StartTime
+
+        logfile.Console ("Replayed %4.1f seconds in %4.1f seconds, %s reconnects" % \
+            (Transport.Capture.Duration(), Elapsed, Reconnect))
+        logfile.Console ("Messages per id: %s" % ' '.join('0x%02x:%s' % (k, v) for k, v in sorted(Counts.items())))
+
+    if debug.on(debug.Any): logfile.Close()
@@ -14,7 +14,8 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2022-08-10"
+__version__ = "2026-10-17"
+# 2026-10-17    WriteRequest() sets CommandReceived and Wakeup
 # 2022-08-10    Steering implemented according marcoveeneman and switchable's code
 # 2022-04-12    TargetMode is initially None, so that FortiusAnt knowns that no
 #               command is yet received.
@@ -312,6 +313,12 @@ class clsFTMS_bless(clsBleServer):
     HasControl          = False         # CTP is controlling the FTMS
     Started             = False         # A CTP training is started
 
+    #---------------------------------------------------------------------------
+    # Signal to the application that a command is received
+    #---------------------------------------------------------------------------
+    CommandReceived     = False         # Set by WriteRequest(), reset by caller
+    Wakeup              = None          # threading.Event, provided by caller
+
     # --------------------------------------------------------------------------
     # _ _ i n i t _ _
     # --------------------------------------------------------------------------
@@ -636,6 +643,12 @@ class clsFTMS_bless(clsBleServer):
             characteristic.value = info
             self.BlessServer.update_value(bc.sFitnessMachineUUID, bc.cFitnessMachineControlPointUUID)
 
+            #-----------------------------------------------------------------------
+            # Inform the application, so that it does not wait for the next cycle
+            #-----------------------------------------------------------------------
+            self.CommandReceived = True
+            if self.Wakeup: self.Wakeup.set()
+
             if False:
                 self.logfileWrite("bleBless: New value for characteristic %s = %s" % (char, HexSpace(info)))
 
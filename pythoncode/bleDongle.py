@@ -1,7 +1,9 @@
 #---------------------------------------------------------------------------
 # Version info
 #---------------------------------------------------------------------------
-__version__ = "2022-12-28"
+__version__ = "2026-10-17"
+# 2026-10-17    requests imported on first use (lazyImport)
+# 2026-10-17    CommandReceived/Wakeup defined, same as bleBless
 # 2022-12-28    Issue#404, incorrect usages of() corrected. See 2022-03-24.
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
 # 2022-03-24    logfile.fLogfile must be checked before usage
@@ -17,6 +19,7 @@ __version__ = "2022-12-28"
 from   constants import mode_Power, mode_Grade, UseBluetooth
 
 import debug
+import lazyImport
 import lib_programname
 import logfile
 import os
@@ -25,7 +28,7 @@ import time
 
 if UseBluetooth:
     import json
-    import requests
+    requests = lazyImport.clsLazyModule('requests')
     import subprocess
 import atexit
 
@@ -47,6 +50,9 @@ import FortiusAntCommand    as cmd
 #
 #---------------------------------------------------------------------------
 class clsBleInterface():
+    CommandReceived = False     # Not signalled; data is read by Refresh()
+    Wakeup          = None
+
     def __init__(self, clv, host = 'localhost', port = 9999):
         self.OK        = False
         self.host      = host
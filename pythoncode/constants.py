@@ -1,7 +1,12 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2022-08-10"
+__version__ = "2026-10-17"
+# 2026-10-17    presence of wx checked without importing it
+#               added: help_profile
+# 2026-10-17    added: UseAntTxScheduler
+# 2026-10-17    added: UseAntShards
+# 2026-10-17    added: UseTrainerThread
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
 # 2022-03-03    added: UsePythonLogging
 #               added: help_bb, modified help_b
@@ -29,10 +34,17 @@ UseGui              = True	    # Can be modified to force no-GUI
 UseMultiProcessing  = True      # Production version can be either False or True
 OnRaspberry         = True      # We're running on Raspberry Pi
 UsePythonLogging    = True
+UseTrainerThread    = False     # USB-trainer read/written in a separate thread
+UseAntShards        = False     # Channels spread over all ANT dongles found
+UseAntTxScheduler   = False     # ANT broadcasts on EVENT_TX, not every 250ms
 
-try:
-    from wx import EVT_CLOSE    # Just checking presence
-except:
+#-------------------------------------------------------------------------------
+# wx: just checking presence, it is imported when used; if the import fails
+#     FortiusAnt.GuiAvailable() clears UseGui.
+#-------------------------------------------------------------------------------
+import importlib.util
+
+if importlib.util.find_spec('wx') is None:
     UseGui          = False  	# no wx, no GUI
 
 try:
@@ -96,6 +108,7 @@ help_r = "Target Resistance = Target Power (to create power curve)."
 help_s = "Simulate trainer to test ANT+ connectivity."
 help_t = "Specify Tacx Type; if not specified, USB-trainers will be detected automatically."
 help_T = "Transmission, default value = " + Transmission
+help_profile = "Report the import time per module at startup."
 help_x = "Export TCX file to upload into Strava, Sporttracks, Training peaks."
 
 #-------------------------------------------------------------------------------
@@ -0,0 +1,355 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    clsClock and clsVirtualClock added; all timing of the
+#               Tacx2Dongle pipeline via Time(), Monotonic(), Sleep(), Wait()
+#               so that a simulated ride can run faster than real-time.
+# 2026-10-17    First version; cycle timing for Tacx2Dongle, Runoff and
+#               calibration on time.monotonic() with absolute deadlines.
+#-------------------------------------------------------------------------------
+import collections
+from   datetime         import datetime
+import time
+
+import debug
+import logfile
+
+# ------------------------------------------------------------------------------
+# c l s C l o c k
+# ------------------------------------------------------------------------------
+# Description:  The clock as used by FortiusAnt; real time.
+#
+#               Time()          seconds since epoch (wall-clock, time.time)
+#               Monotonic()     seconds, for intervals (time.monotonic)
+#               UtcNow()        datetime, for timestamps in exported files
+#               Sleep(s)        wait s seconds
+#               Wait(Event, s)  wait s seconds or until Event is set
+#                               returns True when the Event is set
+# ------------------------------------------------------------------------------
+class clsClock:
+    def Time(self):
+        return time.time()
+
+    def Monotonic(self):
+        return time.monotonic()
+
+    def UtcNow(self):
+        return datetime.utcnow()
+
+    def Sleep(self, Seconds):
+        if Seconds > 0: time.sleep(Seconds)
+
+    def Wait(self, Event, Seconds):
+        return Event.wait(Seconds)
+
+# ------------------------------------------------------------------------------
+# c l s V i r t u a l C l o c k
+# ------------------------------------------------------------------------------
+# Description:  A clock that does not wait, but moves forward.
+#               Sleep() and Wait() advance the time immediatly, so a loop runs
+#               as fast as the CPU allows, while all time-based logic
+#               (4Hz ANT, HeartRate timeouts, TCX trackpoints) sees the
+#               time as if it were real.
+#
+#               Wait() returns True without advancing if the Event is set; the
+#               Event is cleared by the caller, as with threading.Event.
+#
+# Input:        Start       seconds since epoch, default now
+# ------------------------------------------------------------------------------
+class clsVirtualClock(clsClock):
+    def __init__(self, Start=None):
+        if Start is None: Start = time.time()
+        self.Start      = Start
+        self.Now        = Start
+        self.Slept      = 0             # Total time advanced by Sleep/Wait
+
+    def Time(self):
+        return self.Now
+
+    def Monotonic(self):
+        return self.Now
+
+    def UtcNow(self):
+        return datetime.utcfromtimestamp(self.Now)
+
+    def Sleep(self, Seconds):
+        if Seconds > 0:
+            self.Now   += Seconds
+            self.Slept += Seconds
+
+    def Wait(self, Event, Seconds):
+        if Event.is_set():
+            return True
+        self.Sleep(Seconds)
+        return False
+
+    def Elapsed(self):
+        return self.Now - self.Start
+
+#-------------------------------------------------------------------------------
+# The clock used by all modules; SetClock() to replace (e.g. clsVirtualClock)
+#-------------------------------------------------------------------------------
+Clock = clsClock()
+
+def SetClock(NewClock):
+    global Clock
+    Clock = NewClock
+    return Clock
+
+def Time():
+    return Clock.Time()
+
+def Monotonic():
+    return Clock.Monotonic()
+
+def UtcNow():
+    return Clock.UtcNow()
+
+def Sleep(Seconds):
+    Clock.Sleep(Seconds)
+
+def Wait(Event, Seconds):
+    return Clock.Wait(Event, Seconds)
+
+#-------------------------------------------------------------------------------
+# Catch-up policies; what to do when one or more deadlines are missed
+#-------------------------------------------------------------------------------
+# catchupSkip       Missed cycles are skipped; the next deadline is the next
+#                   one on the original grid, so the phase is not changed.
+# catchupBurst      Missed cycles are executed without waiting (at most
+#                   MaxBurst cycles), then continue as catchupSkip.
+# catchupRestart    The next deadline is calculated from now, the grid moves.
+#-------------------------------------------------------------------------------
+catchupSkip    = 0
+catchupBurst   = 1
+catchupRestart = 2
+
+#-------------------------------------------------------------------------------
+# Histogram of the jitter; the upper limit (ms) of each bucket, last = rest
+#-------------------------------------------------------------------------------
+JitterBuckets  = (1, 2, 5, 10, 20, 50, 100, 250)
+
+# ------------------------------------------------------------------------------
+# c l s C y c l e C l o c k
+# ------------------------------------------------------------------------------
+# Description:  Provide a steady cycle of CycleTime seconds.
+#
+#               Wall-clock time is not used, because the wall-clock can be changed
+#               (NTP on Raspberry Pi) and sleeping "CycleTime - ElapsedTime"
+#               accumulates the processing- and wakeup-delays of every cycle.
+#               Deadlines are absolute: Deadline(n) = Origin + n * CycleTime.
+#
+#               Usage:
+#                   Clock = clsCycleClock(0.25, 'Loop')
+#                   while Running:
+#                       StartTime = Clock.Begin()
+#                       ... do the work ...
+#                       Clock.Wait()            or Clock.End() and wait for
+#                                                  Clock.Remaining() seconds
+#
+#               Statistics over the last Window cycles:
+#               - Jitter    = the time the cycle started too late
+#               - Overrun   = the cycle's work took more than CycleTime
+#
+# Input:        CycleTime, Name, Catchup, MaxBurst, Window
+#               Clock       function returning seconds, default Monotonic()
+#                           of the clock that is set using SetClock()
+# ------------------------------------------------------------------------------
+class clsCycleClock:
+    def __init__(self, CycleTime, Name='', Catchup=catchupSkip, MaxBurst=4, \
+                       Window=240, Clock=None):
+        self.CycleTime      = CycleTime
+        self.Name           = Name
+        self.Catchup        = Catchup
+        self.MaxBurst       = MaxBurst
+        self.Clock          = Clock if Clock else Monotonic
+
+        self.Deadline       = None      # Start of the next cycle
+        self.StartTime      = None      # Start of the current cycle
+        self.ElapsedTime    = 0         # Processing time of last cycle
+        self.Burst          = 0         # Consecutive cycles without waiting
+
+        self.Cycles         = 0         # Total number of cycles
+        self.Overruns       = 0         # Total number of overruns
+        self.Skipped        = 0         # Total number of skipped deadlines
+
+        self.Samples        = collections.deque(maxlen=Window) # (bucket, overrun)
+        self.Histogram      = [0] * (len(JitterBuckets) + 1)
+        self.WindowOverruns = 0
+        self.JitterMax      = 0         # ms, since last Log()
+
+    # --------------------------------------------------------------------------
+    # R e s e t
+    # --------------------------------------------------------------------------
+    # Description:  The first cycle starts now; statistics are kept
+    # --------------------------------------------------------------------------
+    def Reset(self):
+        self.Deadline       = None
+        self.Burst          = 0
+
+    # --------------------------------------------------------------------------
+    # B e g i n
+    # --------------------------------------------------------------------------
+    # Description:  Start a cycle; register the jitter (delay against deadline)
+    #
+    # Returns:      StartTime (Clock-seconds)
+    # --------------------------------------------------------------------------
+    def Begin(self):
+        now = self.Clock()
+        if self.Deadline is None:
+            self.Deadline = now
+        self.StartTime = now
+        self._Sample((now - self.Deadline) * 1000, self.ElapsedTime > self.CycleTime)
+        return now
+
+    # --------------------------------------------------------------------------
+    # E n d
+    # --------------------------------------------------------------------------
+    # Description:  End a cycle; the next deadline is set according the
+    #               catch-up policy.
+    #
+    # Returns:      ElapsedTime of this cycle
+    # --------------------------------------------------------------------------
+    def End(self):
+        now = self.Clock()
+        self.ElapsedTime = now - self.StartTime
+        self.Deadline   += self.CycleTime
+
+        if self.ElapsedTime > self.CycleTime:
+            self.Overruns += 1
+
+        if now >= self.Deadline:
+            if self.Catchup == catchupBurst and self.Burst < self.MaxBurst:
+                self.Burst += 1                 # Start next cycle immediatly
+            elif self.Catchup == catchupRestart:
+                self.Skipped  += 1
+                self.Deadline  = now + self.CycleTime
+                self.Burst     = 0
+            else:
+                Missed         = int((now - self.Deadline) / self.CycleTime) + 1
+                self.Skipped  += Missed
+                self.Deadline += Missed * self.CycleTime
+                self.Burst     = 0
+        else:
+            self.Burst = 0
+        return self.ElapsedTime
+
+    # --------------------------------------------------------------------------
+    # R e m a i n i n g
+    # --------------------------------------------------------------------------
+    # Returns:      Seconds until the next deadline (negative when late)
+    # --------------------------------------------------------------------------
+    def Remaining(self):
+        if self.Deadline is None: return 0
+        return self.Deadline - self.Clock()
+
+    # --------------------------------------------------------------------------
+    # W a i t
+    # --------------------------------------------------------------------------
+    # Description:  End the cycle and sleep until the next deadline
+    #
+    # Returns:      SleepTime
+    # --------------------------------------------------------------------------
+    def Wait(self):
+        self.End()
+        SleepTime = self.Remaining()
+        if SleepTime > 0:
+            Sleep(SleepTime)
+            if debug.on(debug.Data2):
+                logfile.Write ("%s; Sleep(%4.2f) to fill %s seconds done." % \
+                                        (self.Name, SleepTime, self.CycleTime) )
+        else:
+            if self.ElapsedTime > self.CycleTime * 2 and debug.on(debug.Any):
+                logfile.Write ("%s; Processing time %5.3f is %5.3f longer than planned %5.3f (seconds)" % \
+                    (self.Name, self.ElapsedTime, self.ElapsedTime - self.CycleTime, self.CycleTime) )
+        return SleepTime
+
+    # --------------------------------------------------------------------------
+    # D u e
+    # --------------------------------------------------------------------------
+    # Description:  For a clock that is not used to wait but to check whether
+    #               something must be done (e.g. 4Hz ANT in a faster loop).
+    #               No statistics are collected.
+    #
+    # Input:        now; Clock-seconds, default Clock()
+    #
+    # Returns:      True when the deadline has passed; next deadline is set
+    # --------------------------------------------------------------------------
+    def Due(self, now=None):
+        if now is None: now = self.Clock()
+        if self.Deadline is None:
+            self.Deadline = now
+        if now < self.Deadline:
+            return False
+
+        self.Cycles   += 1
+        self.Deadline += self.CycleTime
+        if now >= self.Deadline:
+            if self.Catchup == catchupRestart:
+                self.Deadline  = now + self.CycleTime
+            else:
+                Missed         = int((now - self.Deadline) / self.CycleTime) + 1
+                self.Deadline += Missed * self.CycleTime
+            self.Skipped += 1
+        return True
+
+    # --------------------------------------------------------------------------
+    # _ S a m p l e
+    # --------------------------------------------------------------------------
+    # Description:  Add jitter (ms) to the rolling histogram; when the window
+    #               is full, the oldest sample is removed from the histogram.
+    # --------------------------------------------------------------------------
+    def _Sample(self, Jitter, Overrun):
+        self.Cycles += 1
+        if Jitter < 0: Jitter = 0
+        self.JitterMax = max(self.JitterMax, Jitter)
+
+        Bucket = len(JitterBuckets)
+        for i, Limit in enumerate(JitterBuckets):
+            if Jitter < Limit:
+                Bucket = i
+                break
+
+        if len(self.Samples) == self.Samples.maxlen:
+            OldBucket, OldOverrun = self.Samples[0]
+            self.Histogram[OldBucket] -= 1
+            self.WindowOverruns       -= OldOverrun
+
+        self.Samples.append((Bucket, Overrun))
+        self.Histogram[Bucket] += 1
+        self.WindowOverruns    += Overrun
+
+    # --------------------------------------------------------------------------
+    # S t a t i s t i c s
+    # --------------------------------------------------------------------------
+    # Returns:      dictionary with counters and the rolling jitter histogram
+    #               {'<1ms': n, '<2ms': n, ... '>=250ms': n}
+    # --------------------------------------------------------------------------
+    def Statistics(self):
+        Histogram = {}
+        for i, Limit in enumerate(JitterBuckets):
+            Histogram['<%sms' % Limit] = self.Histogram[i]
+        Histogram['>=%sms' % JitterBuckets[-1]] = self.Histogram[-1]
+
+        return { 'Cycles'         : self.Cycles,
+                 'Overruns'       : self.Overruns,
+                 'Skipped'        : self.Skipped,
+                 'Window'         : len(self.Samples),
+                 'WindowOverruns' : self.WindowOverruns,
+                 'JitterMax'      : self.JitterMax,
+                 'Jitter'         : Histogram }
+
+    # --------------------------------------------------------------------------
+    # L o g
+    # --------------------------------------------------------------------------
+    # Description:  Write the statistics to the logfile; JitterMax is reset
+    # --------------------------------------------------------------------------
+    def Log(self):
+        s = self.Statistics()
+        logfile.Write ("%s; cycles=%s overruns=%s skipped=%s; last %s cycles: overruns=%s jitter=%s max=%4.1fms" % \
+            (self.Name, s['Cycles'], s['Overruns'], s['Skipped'], s['Window'], \
+             s['WindowOverruns'], \
+             ' '.join('%s:%s' % (k, v) for k, v in s['Jitter'].items() if v), \
+             s['JitterMax']) )
+        self.JitterMax = 0
@@ -4,7 +4,8 @@ assert sys.version_info >= (3,5), "Python version >= 3.5 required"
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2021-02-22"
+__version__ = "2026-10-17"
+# 2026-10-17    AntCapture added, outside All/Any
 # 2020-02-22    Performance added
 # 2020-12-18    Ble added
 # 2020-11-13    LogfileJson added
@@ -18,8 +19,8 @@ __version__ = "2021-02-22"
 # Define global constants
 # Modules that include these variables have to prefix: if debug.On(debug.No) ...
 #-------------------------------------------------------------------------------
-# 8421 8421 8421 8421 
-# ---C EWID bpjm uafA   Characters that can be used in -d flag
+#    8421 8421 8421 8421 
+# r  ---C EWID bpjm uafA    Characters that can be used in -d flag
 #-------------------------------------------------------------------------------
 No				= 0x0000    #    0
 Application    	= 0x0001    #    1
@@ -40,6 +41,12 @@ logging_CRITICAL= 0x1000    # 4096      Critical only
 All	        	= 0xffff    # 65535		When setting, it's All
 Any				= All		#			When checing, it's Any
 
+#-------------------------------------------------------------------------------
+# Not part of All/Any; -d 65535 must not start a capture file and a capture
+# alone does not open the logfile.
+#-------------------------------------------------------------------------------
+AntCapture      = 0x10000   # 65536     antDongle, binary capture file
+
 #-------------------------------------------------------------------------------
 # debug.on / off
 #-------------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    First version; lazy imports and startup profiling
+#-------------------------------------------------------------------------------
+# Description:  Some subsystems are only used when enabled on the command line;
+#               bluetooth (bless, asyncio, requests), the GUI (wx, numpy) and
+#               the Raspberry Pi display. Importing them all at startup costs
+#               seconds on a Raspberry Pi Zero.
+#
+#               clsLazyModule imports a module when an attribute is first used:
+#                   bleBless = lazyImport.clsLazyModule('bleBless')
+#               is equivalent to
+#                   import bleBless
+#               but the import is done by bleBless.clsFTMS_bless(...).
+#               For "import a.b as x", use clsLazyModule('a.b').
+#
+#               ProfileStartup() measures the time of all following imports
+#               (as python -X importtime does) and Report() shows the modules
+#               that took the longest since the previous Report().
+#               It must be called as early as possible; see FortiusAnt.py
+#               --profile-startup.
+#-------------------------------------------------------------------------------
+import importlib
+import sys
+import threading
+import time
+
+StartTime   = time.perf_counter()           # As close to program start as we can
+
+# ------------------------------------------------------------------------------
+# c l s L a z y M o d u l e
+# ------------------------------------------------------------------------------
+# Input:        Name        the module to be imported on first use
+#
+# Description:  Attributes are taken from (and set on) the imported module.
+#               Use Version(Name) to show the version of a module without
+#               importing it.
+# ------------------------------------------------------------------------------
+class clsLazyModule:
+    def __init__(self, Name):
+        self.__dict__['_Name']   = Name
+        self.__dict__['_Module'] = None
+
+    def _Load(self):
+        if self._Module is None:
+            self.__dict__['_Module'] = importlib.import_module(self._Name)
+        return self._Module
+
+    def __getattr__(self, Name):
+        return getattr(self._Load(), Name)
+
+    def __setattr__(self, Name, Value):
+        setattr(self._Load(), Name, Value)
+
+    def __repr__(self):
+        return "<lazy module '%s'%s>" % (self._Name, '' if self._Module else ' (not loaded)')
+
+# ------------------------------------------------------------------------------
+# V e r s i o n
+# ------------------------------------------------------------------------------
+# Input:        Name        module name
+#
+# Returns:      the __version__ of the module, if it is imported
+# ------------------------------------------------------------------------------
+def Version(Name):
+    if Name in sys.modules:
+        return getattr(sys.modules[Name], '__version__', '?')
+    return 'not loaded'
+
+# ==============================================================================
+# Startup profiling
+# ==============================================================================
+# Times         Name --> [Self, Cumulative] in seconds
+#                       Self        executing the module itself
+#                       Cumulative  including the modules it imports
+# ------------------------------------------------------------------------------
+Times           = {}
+TopLevel        = 0                         # Cumulative of the outer imports
+_Reported       = set()
+_Local          = threading.local()         # Per thread: stack of child time
+
+def _Timed(Name, Function, *args):
+    Stack = getattr(_Local, 'Stack', None)
+    if Stack is None: Stack = _Local.Stack = []
+    Stack.append(0)                         # Time spent in imports of Name
+    t = time.perf_counter()
+    try:
+        return Function(*args)
+    finally:
+        Cumulative = time.perf_counter() - t
+        Children   = Stack.pop()
+        Counters   = Times.setdefault(Name, [0, 0])
+        Counters[0] += Cumulative - Children
+        Counters[1] += Cumulative
+        if Stack:
+            Stack[-1] += Cumulative
+        else:
+            global TopLevel
+            TopLevel += Cumulative
+
+# ------------------------------------------------------------------------------
+# The loader as found by the other finders, with the time measured
+# Other functions (get_data, is_package, ...) are passed to the loader.
+# ------------------------------------------------------------------------------
+class _clsTimedLoader:
+    def __init__(self, Loader, Name):
+        self.Loader = Loader
+        self.Name   = Name
+
+    def create_module(self, Spec):
+        if not hasattr(self.Loader, 'create_module'): return None
+        return _Timed(self.Name, self.Loader.create_module, Spec)
+
+    def exec_module(self, Module):
+        _Timed(self.Name, self.Loader.exec_module, Module)
+
+    def __getattr__(self, Name):
+        return getattr(self.Loader, Name)
+
+# ------------------------------------------------------------------------------
+# First on sys.meta_path; asks the other finders and wraps the loader
+# ------------------------------------------------------------------------------
+class _clsImportProfiler:
+    def find_spec(self, Name, Path, Target=None):
+        for Finder in sys.meta_path:
+            if Finder is self or not hasattr(Finder, 'find_spec'):
+                continue
+            Spec = Finder.find_spec(Name, Path, Target)
+            if Spec is not None:
+                if Spec.loader is not None and hasattr(Spec.loader, 'exec_module'):
+                    Spec.loader = _clsTimedLoader(Spec.loader, Name)
+                return Spec
+        return None
+
+def Profiling():
+    return any(isinstance(Finder, _clsImportProfiler) for Finder in sys.meta_path)
+
+def ProfileStartup():
+    if not Profiling():
+        sys.meta_path.insert(0, _clsImportProfiler())
+
+# ------------------------------------------------------------------------------
+# R e p o r t
+# ------------------------------------------------------------------------------
+# Input:        Title       where we are, e.g. 'devices are activated'
+#               Count       number of modules to show
+#
+# Description:  Show the time since start, the total import time and the
+#               modules imported since the previous Report(), slowest first
+# ------------------------------------------------------------------------------
+def Report(Title, Count=25):
+    import logfile
+    Modules = sorted((n for n in Times if n not in _Reported), key=lambda n: -Times[n][1])
+    _Reported.update(Modules)
+
+    logfile.Console ("Startup profile; %s after %5.3fs, imports %5.3fs, %s new modules" % \
+                        (Title, time.perf_counter() - StartTime, TopLevel, len(Modules)))
+    logfile.Console ("%10s %10s  %s" % ('self [ms]', 'cumul [ms]', 'module'))
+    for Name in Modules[:Count]:
+        logfile.Console ("%10.1f %10.1f  %s" % (Times[Name][0] * 1000, Times[Name][1] * 1000, Name))
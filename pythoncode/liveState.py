@@ -0,0 +1,217 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    First version; live values between main and GUI process
+#-------------------------------------------------------------------------------
+# Description:  With multiprocessing, the GUI runs in a child process.
+#               The values to be displayed (SetValues, SetLeds, SetMessages) are
+#               written by the main process in a shared memory block and the
+#               GUI reads the block on its own timer; no pickling, no pipe that
+#               can fill up and no need to throttle SetValues().
+#
+#               Layout of the block (little endian):
+#                   Header      Sequence, ValuesCount, Leds, MessageCount
+#                   Values      the 11 parameters of SetValues()
+#                   Messages    a ring of MessageSlots (Tacx, Dongle, HRM)
+#
+#               The block is protected by a seqlock: the writer increments
+#               Sequence before and after writing (odd = write in progress);
+#               the reader copies the block and retries when Sequence was odd
+#               or changed during the copy. So the writer is never blocked by
+#               the reader. Writers in the main process (multiple threads) are
+#               serialized with a lock.
+#               The message ring is only copied when there are new messages.
+#               If no consistent copy is made in MaxRetries, Poll() returns
+#               nothing and the GUI tries again on the next timer tick.
+#
+#               Leds are written as state (as the GUI would show them) so that
+#               the reader does not need to see every SetLeds() call.
+#               Messages that are overwritten before being read are lost; the
+#               reader continues with the oldest message in the ring.
+#
+# Usage:        Main:   LiveState = liveState.clsLiveState()
+#                       pass LiveState.Name to the child process
+#                       LiveState.SetValues(...) etc.
+#                       LiveState.Close(); LiveState.Unlink()
+#               Child:  LiveState = liveState.clsLiveState(Name)
+#                       Values, Leds, Messages = LiveState.Poll()
+#                       LiveState.Close()
+#-------------------------------------------------------------------------------
+import struct
+import threading
+
+try:
+    from multiprocessing import shared_memory
+    UseSharedMemory = True
+except ImportError:                             # Python < 3.8
+    UseSharedMemory = False
+
+import debug
+import logfile
+
+#-------------------------------------------------------------------------------
+# Layout of the shared memory block
+#-------------------------------------------------------------------------------
+Header          = struct.Struct('<QIII')        # Sequence, ValuesCount, Leds, MessageCount
+Values          = struct.Struct('<dddiddddiid') # fSpeed, iRevs, iPower, iTargetMode,
+                                                # iTargetPower, fTargetGrade, iTacx,
+                                                # iHeartRate, iCrancksetIndex,
+                                                # iCassetteIndex, fReduction
+MessageSize     = 256                           # Bytes per message (utf-8)
+MessageSlots    = 16
+Message         = struct.Struct('<hhh%ds%ds%ds' % (MessageSize, MessageSize, MessageSize))
+                                                # Lengths (-1 = None), Tacx, Dongle, HRM
+ValuesOffset    = Header.size
+MessagesOffset  = ValuesOffset + Values.size
+BlockSize       = MessagesOffset + Message.size * MessageSlots
+
+Leds            = 5                             # Tacx, Shutdown, Cadence, BLE, ANT
+                                                # as FortiusAntGui.StatusLeds
+MaxRetries      = 100
+
+# ------------------------------------------------------------------------------
+# c l s L i v e S t a t e
+# ------------------------------------------------------------------------------
+# Input:        Name    None = create the block (main process)
+#                       else attach to the block with that name (GUI process)
+#
+# Functions:    writer  SetValues(), SetLeds(), SetMessages()
+#                       parameters as FortiusAntGui
+#               reader  Poll() returns (Values, Leds, Messages)
+#                           Values      tuple, None if not changed
+#                                       (or no consistent copy made)
+#                           Leds        list of 5 bool, None if not changed
+#                           Messages    list of (Tacx, Dongle, HRM), written
+#                                       since the previous Poll()
+#               Close()     the block is no longer used by this process
+#               Unlink()    remove the block (by the creator, after Close)
+# ------------------------------------------------------------------------------
+class clsLiveState:
+    def __init__(self, Name=None):
+        self.Creator = Name is None
+        if self.Creator:
+            self.Memory = shared_memory.SharedMemory(create=True, size=BlockSize)
+            self.Memory.buf[:BlockSize] = bytes(BlockSize)
+        else:
+            self.Memory = shared_memory.SharedMemory(name=Name)
+        self.Name = self.Memory.name
+
+        # Writer
+        self._Lock          = threading.Lock()
+        self._Sequence      = 0
+        self._ValuesCount   = 0
+        self._Leds          = [False] * Leds
+        self._MessageCount  = 0
+
+        # Reader
+        self._ReadValues    = 0
+        self._ReadLeds      = None
+        self._ReadMessages  = 0
+        self.Retries        = 0
+
+        if debug.on(debug.MultiProcessing):
+            logfile.Write ("mp-clsLiveState(%s) %s, %s bytes" % (Name, self.Name, BlockSize))
+
+    # --------------------------------------------------------------------------
+    # Writer; the header is written last, within the Sequence increments
+    # --------------------------------------------------------------------------
+    def _Begin(self):
+        self._Sequence += 1                     # Odd; write in progress
+        struct.pack_into('<Q', self.Memory.buf, 0, self._Sequence)
+
+    def _End(self):
+        self._Sequence += 1                     # Even; consistent
+        Header.pack_into(self.Memory.buf, 0, self._Sequence, self._ValuesCount, \
+            sum(1 << i for i, Led in enumerate(self._Leds) if Led), self._MessageCount)
+
+    def SetValues(self, fSpeed, iRevs, iPower, iTargetMode, iTargetPower, fTargetGrade, \
+                    iTacx, iHeartRate, iCrancksetIndex, iCassetteIndex, fReduction):
+        v = [0 if x is None else x for x in (fSpeed, iRevs, iPower, iTargetMode, \
+                iTargetPower, fTargetGrade, iTacx, iHeartRate, iCrancksetIndex, \
+                iCassetteIndex, fReduction)]    # A value may not be known yet
+        with self._Lock:
+            self._Begin()
+            Values.pack_into(self.Memory.buf, ValuesOffset, *v)
+            self._ValuesCount += 1
+            self._End()
+
+    def SetLeds(self, ANT=None, BLE=None, Cadence=None, Shutdown=None, Tacx=None):
+        with self._Lock:
+            self._Begin()
+            for i, Led in enumerate((Tacx, Shutdown, Cadence, BLE, ANT)):
+                if Led != None: self._Leds[i] = not self._Leds[i] if Led else False
+            self._End()
+
+    def SetMessages(self, Tacx=None, Dongle=None, HRM=None):
+        Lengths = []
+        Texts   = []
+        for Text in (Tacx, Dongle, HRM):
+            if Text is None:
+                Lengths.append(-1)
+                Texts.append(b'')
+            else:
+                b = Text.encode('utf-8')[:MessageSize]
+                Lengths.append(len(b))
+                Texts.append(b)
+
+        with self._Lock:
+            self._Begin()
+            Message.pack_into(self.Memory.buf, \
+                MessagesOffset + (self._MessageCount % MessageSlots) * Message.size, \
+                *Lengths, *Texts)
+            self._MessageCount += 1
+            self._End()
+
+    # --------------------------------------------------------------------------
+    # Reader
+    # --------------------------------------------------------------------------
+    def _Snapshot(self):
+        buf = self.Memory.buf
+        for _ in range(MaxRetries):
+            Sequence, = struct.unpack_from('<Q', buf, 0)
+            if Sequence % 2 == 0:
+                Block = bytes(buf[:MessagesOffset])
+                if Header.unpack_from(Block, 0)[3] != self._ReadMessages:
+                    Block += bytes(buf[MessagesOffset:BlockSize])
+                if Header.unpack_from(Block, 0)[0] == Sequence and \
+                   struct.unpack_from('<Q', buf, 0)[0] == Sequence:
+                    return Block
+            self.Retries += 1
+        return None
+
+    def Poll(self):
+        Block = self._Snapshot()
+        if Block is None:
+            return None, None, []
+        _Sequence, ValuesCount, LedBits, MessageCount = Header.unpack_from(Block, 0)
+
+        rtnValues = None
+        if ValuesCount != self._ReadValues:
+            self._ReadValues = ValuesCount
+            rtnValues = Values.unpack_from(Block, ValuesOffset)
+
+        rtnLeds = None
+        if LedBits != self._ReadLeds:
+            self._ReadLeds = LedBits
+            rtnLeds = [bool(LedBits & (1 << i)) for i in range(Leds)]
+
+        rtnMessages = []
+        First = max(self._ReadMessages, MessageCount - MessageSlots)
+        for n in range(First, MessageCount):
+            m = Message.unpack_from(Block, MessagesOffset + (n % MessageSlots) * Message.size)
+            rtnMessages.append(tuple(None if Length < 0 else Text[:Length].decode('utf-8', errors='ignore') \
+                                     for Length, Text in zip(m[:3], m[3:])))
+        self._ReadMessages = MessageCount
+
+        return rtnValues, rtnLeds, rtnMessages
+
+    # --------------------------------------------------------------------------
+    # Clean-up
+    # --------------------------------------------------------------------------
+    def Close(self):
+        self.Memory.close()
+
+    def Unlink(self):
+        if self.Creator:
+            self.Memory.unlink()
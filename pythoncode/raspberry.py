@@ -1,7 +1,9 @@
 #---------------------------------------------------------------------------
 # Version info
 #---------------------------------------------------------------------------
-__version__ = "2023-03-22"
+__version__ = "2026-10-17"
+# 2026-10-17  the display modules are imported on first use (lazyImport),
+#             so only with -O
 # 2023-03-22  When the trainer is idle (60 seconds no cadence) the display
 #             is dimmed, just displaying "Idle"
 # 2022-01-14  #363 st7789b added; Waveshare 1.3 LCD with different pin layout
@@ -42,20 +44,20 @@ MySelf = None
 from   constants            import mode_Power, mode_Grade, OnRaspberry, mile
 import constants
 import FortiusAntCommand    as cmd
+import lazyImport
 import logfile
 
 UseOutputDisplay = False
 if OnRaspberry:
     import gpiozero                                     # pylint: disable=import-error
 
-    try:
-        from adafruit_rgb_display.rgb import color565   # pylint: disable=import-error
-        import adafruit_rgb_display.st7789 as st7789    # pylint: disable=import-error
-        import board                                    # pylint: disable=import-error
-        import digitalio                                # pylint: disable=import-error
-        from PIL import Image, ImageDraw, ImageFont     # pylint: disable=import-error
-    except:
-        pass
+    rgb       = lazyImport.clsLazyModule('adafruit_rgb_display.rgb')        # rgb.color565()
+    st7789    = lazyImport.clsLazyModule('adafruit_rgb_display.st7789')
+    board     = lazyImport.clsLazyModule('board')
+    digitalio = lazyImport.clsLazyModule('digitalio')
+    Image     = lazyImport.clsLazyModule('PIL.Image')
+    ImageDraw = lazyImport.clsLazyModule('PIL.ImageDraw')
+    ImageFont = lazyImport.clsLazyModule('PIL.ImageFont')
     UseOutputDisplay = True
 
 # ------------------------------------------------------------------------------
@@ -932,13 +934,13 @@ if __name__ == "__main__":
                 rpi.backlight.value = True                      # turn on backlight
 
             if rpi.buttonB.value and not rpi.buttonA.value:     # just button A pressed
-                rpi.st7789.fill(color565(255, 0, 0))            # red
+                rpi.st7789.fill(rgb.color565(255, 0, 0))        # red
 
             if rpi.buttonA.value and not rpi.buttonB.value:     # just button B pressed
-                rpi.st7789.fill(color565(0, 0, 255))            # blue
+                rpi.st7789.fill(rgb.color565(0, 0, 255))        # blue
 
             if not rpi.buttonA.value and not rpi.buttonB.value: # none pressed
-                rpi.st7789.fill(color565(0, 255, 0))            # green
+                rpi.st7789.fill(rgb.color565(0, 255, 0))        # green
 
         # ----------------------------------------------------------------------
         # Stop for next button press
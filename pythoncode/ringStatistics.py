@@ -0,0 +1,145 @@
+#-------------------------------------------------------------------------------
+# Version info
+#-------------------------------------------------------------------------------
+__version__ = "2026-10-17"
+# 2026-10-17    Oldest() added; recalculate every Size values
+# 2026-10-17    First version; running statistics over the last N values
+#-------------------------------------------------------------------------------
+import collections
+import math
+
+# ------------------------------------------------------------------------------
+# c l s R i n g S t a t i s t i c s
+# ------------------------------------------------------------------------------
+# Description:  Statistics over the last Size values (a moving window), without
+#               recalculating over the whole window for each new value:
+#
+#               - The values are kept in a ring buffer; the oldest is replaced.
+#               - Mean and variance are updated with Welford's algorithm, for a
+#                 sliding window: add the new value and remove the oldest.
+#               - Min and Max are the first of a monotonic deque; a value that
+#                 can never become the minimum (maximum) is removed as soon as
+#                 a smaller (larger) value is added.
+#
+#               So Add() and all statistics are O(1), whatever the Size;
+#               a longer window costs memory, not time.
+#
+#               Since rounding errors of the running sums accumulate, mean and
+#               variance are recalculated from the buffer once every Size values
+#               (which is O(1) per value as well).
+#
+# Input:        Size        number of values in the window
+#               Fill        if specified, the window starts full of this value
+#                           (as numpy.array([0] * Size) would do)
+#
+# Functions:    Add(Value)
+#               Full()      the window contains Size values
+#               Count()     number of values in the window
+#               Mean(), Variance(), Stdev()     population variance/stdev
+#               Min(), Max(), Range()           Range = Max - Min
+#               Stable(Tolerance)               Full() and Range() < Tolerance
+#               Values()    the values, oldest first
+#               Oldest()    the value that is replaced by the next Add()
+#                           when Full(), e.g. to maintain a sorted copy
+# ------------------------------------------------------------------------------
+class clsRingStatistics:
+    def __init__(self, Size, Fill=None):
+        self.Size       = Size
+        self._Buffer    = [0] * Size
+        self._Index     = 0             # Position of the next value
+        self._Count     = 0             # Number of values in the window
+        self._Added     = 0             # Sequence number of the next value
+        self._Mean      = 0
+        self._M2        = 0             # Sum of squared differences from mean
+        self._MinDeque  = collections.deque()    # (Sequence, Value), ascending
+        self._MaxDeque  = collections.deque()    # (Sequence, Value), descending
+
+        if Fill is not None:
+            for _ in range(Size): self.Add(Fill)
+
+    # --------------------------------------------------------------------------
+    # A d d
+    # --------------------------------------------------------------------------
+    def Add(self, Value):
+        if self._Count < self.Size:
+            #-------------------------------------------------------------------
+            # Window not full yet; Welford's algorithm
+            #-------------------------------------------------------------------
+            self._Count += 1
+            Delta        = Value - self._Mean
+            self._Mean  += Delta / self._Count
+            self._M2    += Delta * (Value - self._Mean)
+        else:
+            #-------------------------------------------------------------------
+            # Replace the oldest value
+            #-------------------------------------------------------------------
+            Oldest       = self._Buffer[self._Index]
+            Mean         = self._Mean
+            self._Mean  += (Value - Oldest) / self.Size
+            self._M2    += (Value - Oldest) * (Value - self._Mean + Oldest - Mean)
+            if self._M2 < 0: self._M2 = 0
+
+        self._Buffer[self._Index] = Value
+        self._Index = (self._Index + 1) % self.Size
+
+        #-----------------------------------------------------------------------
+        # Monotonic deques; remove the values that left the window
+        #-----------------------------------------------------------------------
+        Sequence = self._Added
+        self._Added += 1
+
+        while self._MinDeque and self._MinDeque[-1][1] >= Value: self._MinDeque.pop()
+        self._MinDeque.append((Sequence, Value))
+        while self._MinDeque[0][0] <= Sequence - self.Size: self._MinDeque.popleft()
+
+        while self._MaxDeque and self._MaxDeque[-1][1] <= Value: self._MaxDeque.pop()
+        self._MaxDeque.append((Sequence, Value))
+        while self._MaxDeque[0][0] <= Sequence - self.Size: self._MaxDeque.popleft()
+
+        if self._Added % self.Size == 0:
+            self._Recalculate()
+
+    def _Recalculate(self):
+        Values      = self.Values()
+        self._Mean  = sum(Values) / len(Values)
+        self._M2    = sum((v - self._Mean) ** 2 for v in Values)
+
+    # --------------------------------------------------------------------------
+    # S t a t i s t i c s
+    # --------------------------------------------------------------------------
+    def Full(self):
+        return self._Count == self.Size
+
+    def Count(self):
+        return self._Count
+
+    def Mean(self):
+        return self._Mean
+
+    def Variance(self):
+        return self._M2 / self._Count if self._Count else 0
+
+    def Stdev(self):
+        return math.sqrt(self.Variance())
+
+    def Min(self):
+        return self._MinDeque[0][1] if self._MinDeque else None
+
+    def Max(self):
+        return self._MaxDeque[0][1] if self._MaxDeque else None
+
+    def Range(self):
+        return self.Max() - self.Min() if self._Count else 0
+
+    def Stable(self, Tolerance):
+        return self.Full() and self.Range() < Tolerance
+
+    def Oldest(self):
+        if self._Count < self.Size:
+            return self._Buffer[0] if self._Count else None
+        return self._Buffer[self._Index]
+
+    def Values(self):
+        if self._Count < self.Size:
+            return self._Buffer[:self._Count]
+        return self._Buffer[self._Index:] + self._Buffer[:self._Index]
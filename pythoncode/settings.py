@@ -1,7 +1,9 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2023-12-13"
+__version__ = "2026-10-17"
+# 2026-10-17    The dialog is defined on first use (settings.OpenDialog), so
+#               that wx is not imported by FortiusAntCommand in console mode
 # 2023-12-13    Issue #445: Specifying Vortex interactively has no effect
 #               Incorrect values typed in combobxo, replaced with '' without
 #               further notice.
@@ -37,10 +39,6 @@ import constants
 import debug
 import logfile
 
-if constants.UseGui:
-    import webbrowser
-    import wx
-
 #-------------------------------------------------------------------------------
 # constants
 #-------------------------------------------------------------------------------
@@ -309,7 +307,27 @@ def ReadJsonFile (args):
 
     return jsonLoaded
 
-if constants.UseGui:
+# ------------------------------------------------------------------------------
+# The dialog is defined on first use of one of these names, e.g.
+# settings.OpenDialog(), so that wx is only imported when the GUI is used
+# (Python 3.7+ module __getattr__)
+# ------------------------------------------------------------------------------
+DialogNames = ('OpenDialog', 'WriteJsonFile', 'dlgFortiusAntSettings')
+
+def __getattr__(Name):
+    if constants.UseGui and Name in DialogNames:
+        DefineDialog()
+        return globals()[Name]
+    raise AttributeError("module %s has no attribute %s" % (__name__, Name))
+
+def DefineDialog():
+    global webbrowser, wx
+    global OpenDialog, WriteJsonFile, Under, RightOf, EVT_CHAR_uint, \
+           EVT_KILL_FOCUS_int_range, EVT_KILL_FOCUS_combobox, EVT_CHAR_ufloat, \
+           EVT_KILL_FOCUS_float_range, dlgFortiusAntSettings
+    import webbrowser
+    import wx
+
     # ------------------------------------------------------------------------------
     #  O p e n D i a l o g
     # ------------------------------------------------------------------------------
@@ -1,7 +1,11 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2022-08-22"
+__version__ = "2026-10-17"
+# 2026-10-17    FilterWindow.median maintained incrementally; CalLength parameter
+# 2026-10-17    FilterWindow on ringStatistics.clsRingStatistics
+# 2026-10-17    Keep-alive timing uses cycleClock.Time()
+# 2026-10-17    HandleAntMessage() registered at ant.clsAntRouter
 # 2022-08-22    Small debugging line added
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
 # 2021-11-14    Initial version, switchable
@@ -9,10 +13,12 @@ __version__ = "2022-08-22"
 
 from abc import ABC
 import antDongle as ant
+import bisect
+import cycleClock
 import debug
 import logfile
+import ringStatistics
 import statistics
-import time
 
 
 #-------------------------------------------------------------------------------
@@ -28,14 +34,17 @@ class clsSteering:
     _MinAngle = -45.0
     _MaxAngle = 45.0
 
-    def __init__(self, InitialCalLeft, InitialCalRight, CalStabilityLimit=15, DeadZone=0.0):
+    def __init__(self, InitialCalLeft, InitialCalRight, CalStabilityLimit=15, DeadZone=0.0, CalLength=None):
+        if CalLength is None:
+            CalLength = self._CalLength         # Longer is more robust, slower
+
         self._InitialCalLeft    = InitialCalLeft
         self._InitialCalRight   = InitialCalRight
         self._CalStabilityLimit = CalStabilityLimit
         self._DeadZone          = DeadZone
 
         self._RawAngle          = None      # The value as provided by the device
-        self._CalWindow         = FilterWindow(self._CalLength)
+        self._CalWindow         = FilterWindow(CalLength)
 
         self.CalMid             = None      # The filtered value for the   mid-position
         self.CalLeft            = None      # The filtered value for the  left-position = 45 degrees
@@ -139,27 +148,39 @@ class clsSteering:
 # FilterWindow
 #-------------------------------------------------------------------------------
 # Moving median filter
+#
+# The values of the window are also kept sorted, so that the median is looked
+# up instead of sorting the window on every access: on update, the oldest value
+# is removed from and the new value inserted into the sorted list (bisect).
+# The standard deviation is maintained by clsRingStatistics.
 #-------------------------------------------------------------------------------
 class FilterWindow:
     def __init__(self, length):
-        self._window_len = length
-        self._data = []
+        self._window = ringStatistics.clsRingStatistics(length)
+        self._sorted = []
 
     def update(self, value):
-        self._data.append(value)
-        self._data = self._data[-self._window_len:]
+        if self._window.Full():
+            del self._sorted[bisect.bisect_left(self._sorted, self._window.Oldest())]
+        bisect.insort(self._sorted, value)
+        self._window.Add(value)
 
     @property
     def ready(self):
-        return len(self._data) == self._window_len
+        return self._window.Full()
 
     @property
     def median(self):
-        return statistics.median(self._data)
+        n = len(self._sorted)
+        if n == 0:
+            raise statistics.StatisticsError("no median for empty data")
+        if n % 2:
+            return self._sorted[n // 2]
+        return (self._sorted[n // 2 - 1] + self._sorted[n // 2]) / 2
 
     @property
     def stdev(self):
-        return statistics.pstdev(self._data)
+        return self._window.Stdev()
 
 
 #-------------------------------------------------------------------------------
@@ -178,21 +199,31 @@ class clsBlackTrack:
         self._DeviceNumber = None
 
         # time of last keep-alive message
-        self._KeepAliveTime = time.time()
+        self._KeepAliveTime = cycleClock.Time()
+
+    #---------------------------------------------------------------------------
+    # RegisterAntHandlers
+    #---------------------------------------------------------------------------
+    # function  Register HandleAntMessage for all messages on our channel
+    #
+    # inputs    ant.clsAntRouter
+    #---------------------------------------------------------------------------
+    def RegisterAntHandlers(self, Router):
+        Router.Register(self.HandleAntMessage, Channel=self._Channel)
 
     #---------------------------------------------------------------------------
     # HandleAntMessage
     #---------------------------------------------------------------------------
     # function  Process an ANT message (if related to the BlackTrack)
     #
-    # inputs    ANT message bytes
+    # inputs    ant.clsAntMessage (decomposed ANT message)
     #
     # returns   True if message was handled
     #           False if it should still be handled elsewhere
     #---------------------------------------------------------------------------
-    def HandleAntMessage(self, Message):
-        _sync, _length, msgId, info, _checksum, _rest, \
-            channel, dataPageNumber = ant.DecomposeMessage(Message)
+    def HandleAntMessage(self, m):
+        msgId, info, channel, dataPageNumber = \
+            m.id, m.info, m.Channel, m.DataPageNumber
         dataHandled = False
         messages = []
 
@@ -214,7 +245,7 @@ class clsBlackTrack:
                 # Keep BlackTrack from turning off (send page 0x01)
                 #---------------------------------------------------------------
                 keepAliveInterval = 10  # in s
-                timeElapsed = time.time() - self._KeepAliveTime
+                timeElapsed = cycleClock.Time() - self._KeepAliveTime
 
                 if timeElapsed > keepAliveInterval:
                     keep_alive = ant.msgPage01_TacxBlackTrackKeepAlive (self._Channel)
@@ -225,7 +256,7 @@ class clsBlackTrack:
                         logfile.Write("Tacx BlackTrack Page=1 (OUT)  Keep-alive")
 
                     # reset keep-alive timer
-                    self._KeepAliveTime = time.time()
+                    self._KeepAliveTime = cycleClock.Time()
 
                 # -------------------------------------------------------------------
                 # Data page 0x00 BlackTrack Angle
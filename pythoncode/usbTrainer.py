@@ -1,7 +1,27 @@
 #-------------------------------------------------------------------------------
 # Version info
 #-------------------------------------------------------------------------------
-__version__ = "2023-01-19"
+__version__ = "2026-10-17"
+# 2026-10-17    cycleClock.Time() instead of time.time() for PedalEcho, keep-alive
+#               and watchdog timing; clsSimulatedTrainer can run on a virtual
+#               clock (FortiusAntHarness.py). The trainer I/O thread remains on
+#               time.monotonic(), since it serves real USB hardware.
+# 2026-10-17    MagneticBrake TargetPower2Resistance() uses clsResistanceIndex
+#               (precalculated power per speed and step) instead of calculating
+#               Resistance2PowerMB() for each step on every refresh.
+# 2026-10-17    Power2Speed() solves the Gribble formula (Power2Speed_Gribble)
+#               instead of a bisection over _Grade2Power(); trainer-fields are
+#               no longer modified temporarily.
+# 2026-10-17    clsUsbFrame; received buffers are parsed with a precompiled
+#               struct and a named view instead of composing the format and
+#               padding the buffer on every receive.
+# 2026-10-17    clsTacxUsbTrainer.StartIOthread(); optionally the head unit is
+#               written/read in a separate thread (constants.UseTrainerThread)
+#               and Refresh() takes the last received frame without waiting.
+# 2026-10-17    SendTarget() added, to send a new target without waiting for
+#               the next Refresh(). Calculation in _Target2Resistance().
+# 2026-10-17    RegisterANThandlers() added; HandleANTmessage() is called by
+#               ant.clsAntRouter with the decomposed message.
 # 2024-01-19    In GradeMode virtual gearbox does not work (#381) for antTrainers,
 #               like Genius and Vortex.
 #               Reason is that, for the other trainers, always a target-resistance
@@ -161,7 +181,11 @@ __version__ = "2023-01-19"
 # 2019-12-25    Target grade implemented; modes defined
 #-------------------------------------------------------------------------------
 import array
+import bisect
+import collections
 import lib_programname
+import math
+import threading
 from enum import Enum
 import usb.core
 import os
@@ -173,6 +197,7 @@ import time
 import antDongle         as ant
 from   constants                    import mode_Power, mode_Grade
 import constants
+import cycleClock
 import debug
 import logfile
 import steering
@@ -251,11 +276,15 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def SetUserConfiguration(UserWeight, ...)               # Store User
 #
 #     def Refresh(QuarterSecond, TacxMode)                    # Receive, Calculate, Send
+#     def SendTarget(TacxMode)                                # Calculate, Send (new target)
 #     def SendToTrainer(QuarterSecond, TacxMode)              # To be defined by child class
 #     def _ReceiveFromTrainer()                               # To be defined by child class
 #     def TargetPower2Resistance()                            # To be defined by child class
 #
 #     def CalibrateSupported()                                # Return whether calibration supported
+#     def RegisterANThandlers(Router)                         # ANT-trainers register their channels
+#     def StartIOthread()                                     # USB-trainers only
+#     def StopIOthread()
 #
 #     def _Grade2Power()                                      # Calculate required Power from Grade
 #                                                             # This is where the magic is done!
@@ -264,6 +293,7 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #
 # class clsSimulatedTrainer(clsTacxTrainer)
 #     def Refresh(QuarterSecond, Tacxmode)                    # Randomize data (does not receive/send!)
+#     def SendTarget(TacxMode)                                # Nothing to send
 #                                                             # Completely replaces parent.Refresh()
 #
 # class clsTacxAntVortexTrainer(clsTacxTrainer)
@@ -271,7 +301,8 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def SendToTrainer(QuarterSecond, TacxMode)
 #     def _ReceiveFromTrainer()
 #     def TargetPower2Resistance()                            # Conversion TargetPower -> TargetResistance
-#     def HandleANTmessage(message)
+#     def RegisterANThandlers(Router)                         # VTX and VHU channel --> HandleANTmessage
+#     def HandleANTmessage(m)                                 # m = ant.clsAntMessage
 #
 # class clsTacxUsbTrainer(clsTacxTrainer)
 #     def Wheel2Speed()                                       # Convert Wheelspeed -> Kmh
@@ -279,6 +310,11 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def Refresh(QuarterSecond, TacxMode)                    # Add USB-special(s) to parent.Refresh()
 #     def USB_Read()                                          # Read buffer from USB connected Tacx
 #     def SendToTrainer(tacxMode)                             # Send buffer to   USB connected Tacx
+#     def StartIOthread()                                     # Read/write head unit in a thread
+#     def StopIOthread()
+#     def _IOthread()                                         # The thread, publishes frames
+#     def _IOpublish(data)                                    # Store frame in double buffer
+#     def _IOsnapshot()                                       # Get last frame from double buffer
 #
 # class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer)
 #     def TargetPower2Resistance()                            # Legacy conversion TargetPower -> TargetResistance
@@ -292,6 +328,105 @@ fortius_fw = os.path.join(dirname, 'tacxfortius_1942_firmware.hex')
 #     def SendToTrainerUSBData(TacxMode, ...)                 # Compose new buffer to be sent
 #     def _ReceiveFromTrainer ()                              # Read and parse new data from trainer
 #
+#-------------------------------------------------------------------------------
+# G r i b b l e   physics, see www.gribble.org
+#-------------------------------------------------------------------------------
+# Required power = roll + air + slope
+#
+#   P(v) = (c + i/100) * m * g * v  +  0.5 * p_cdA * d * (v+w) * |v+w| * v
+#
+# Grade2Power_Gribble()     returns P for a given speed
+# Power2Speed_Gribble()     returns v for a given power; P(v) is a cubic in v
+#                           (for v+w >= 0 and for v+w < 0) which is solved
+#                           with CubicRoots(), without iterations.
+#-------------------------------------------------------------------------------
+def Grade2Power_Gribble(SpeedKmh, Grade, Weight, RollingResistance, \
+                        WindResistance, WindSpeed, DraftingFactor):
+    c     = RollingResistance               # default=0.004
+    m     = Weight                          # default=75+10 kg
+    g     = 9.81                            # m/s2
+    v     = SpeedKmh / 3.6                  # m/s   km/hr * 1000 / 3600
+    Proll = c * m * g * v                   # Watt
+
+    p_cdA = WindResistance                  # default=0.51
+    w     = WindSpeed / 3.6                 # default=0
+    d     = DraftingFactor                  # default=1
+    # without abs a strong tailwind would result in a higher power
+    Pair  = 0.5 * p_cdA * (v+w) * abs(v+w) * d * v # Watt
+
+    i     = Grade                           # Percentage 0...100
+    Pslope= i/100 * m * g * v               # Watt
+
+    return Proll + Pair + Pslope
+
+#-------------------------------------------------------------------------------
+# input     Power, Grade, Weight, RollingResistance, WindResistance, WindSpeed
+#           DraftingFactor
+#
+# function  Solve Grade2Power_Gribble(v) = Power
+#           A big negative grade has two solutions for a (negative) power;
+#           the highest speed of the two is chosen.
+#           If the power is below the minimum of the curve, the speed at the
+#           minimum is returned.
+#
+# returns   SpeedKmh
+#-------------------------------------------------------------------------------
+def Power2Speed_Gribble(Power, Grade, Weight, RollingResistance, \
+                        WindResistance, WindSpeed, DraftingFactor):
+    if Power == 0: return 0                 # No power, no speed
+
+    a     = (RollingResistance + Grade/100) * Weight * 9.81
+    k     = 0.5 * WindResistance * DraftingFactor
+    w     = WindSpeed / 3.6
+
+    # v+w >= 0:  k*v^3 + 2kw*v^2 + (kw^2 + a)*v - P = 0
+    Speeds = [v for v in CubicRoots(k, 2*k*w, k*w*w + a, -Power) if v >= max(0, -w)]
+
+    # v+w <  0: -k*v^3 - 2kw*v^2 + (a - kw^2)*v - P = 0    (tailwind)
+    if not Speeds and w < 0:
+        Speeds = [v for v in CubicRoots(-k, -2*k*w, a - k*w*w, -Power) if 0 <= v < -w]
+
+    # Not reachable: take the minimum of the curve, where dP/dv = 0
+    if not Speeds:
+        Speeds = [v for v in CubicRoots(0, 3*k, 4*k*w, k*w*w + a) if v >= 0] or [0]
+
+    return max(Speeds) * 3.6
+
+#-------------------------------------------------------------------------------
+# input     a, b, c, d
+#
+# function  Solve a*x^3 + b*x^2 + c*x + d = 0 (Cardano, trigonometric if
+#           three real roots); a and b may be zero.
+#
+# returns   list of real roots
+#-------------------------------------------------------------------------------
+def CubicRoots(a, b, c, d):
+    if a == 0:
+        if b == 0:
+            return [-d / c] if c else []
+        D = c*c - 4*b*d
+        if D < 0: return []
+        r = math.sqrt(D)
+        return [(-c + r) / (2*b), (-c - r) / (2*b)]
+
+    b, c, d = b/a, c/a, d/a                 # x^3 + b*x^2 + c*x + d = 0
+    p       = c - b*b/3                     # t^3 + p*t + q = 0, x = t - b/3
+    q       = 2*b*b*b/27 - b*c/3 + d
+    shift   = -b/3
+    D       = (q/2)**2 + (p/3)**3
+
+    if D > 0:                               # One real root
+        r = math.sqrt(D)
+        u = math.copysign(abs(-q/2 + r) ** (1/3), -q/2 + r)
+        v = math.copysign(abs(-q/2 - r) ** (1/3), -q/2 - r)
+        return [u + v + shift]
+    elif p == 0:                            # Triple root
+        return [shift]
+    else:                                   # Three real roots
+        m     = 2 * math.sqrt(-p/3)
+        theta = math.acos(max(-1, min(1, 3*q / (p*m)))) / 3
+        return [m * math.cos(theta - 2*math.pi*k/3) + shift for k in range(3)]
+
 #-------------------------------------------------------------------------------
 # c l s T a c x T r a i n e r           The parent for all trainers
 #-------------------------------------------------------------------------------
@@ -333,7 +468,7 @@ class clsTacxTrainer():
     PedalEcho               = 0
     PreviousPedalEcho       = 0             # detection for PedalEcho=1
     PedalEchoCount          = 0             # count of PedalEcho=1 events
-    PedalEchoTime           = time.time()   # the time of the last PedalEcho event
+    PedalEchoTime           = cycleClock.Time()   # the time of the last PedalEcho event
     SpeedKmh                = 0             # round(,1)
     VirtualSpeedKmh         = 0             #           see Grade_mode
     CalculatedSpeedKmh      = 0             # see #Power2Speed#
@@ -670,7 +805,7 @@ class clsTacxTrainer():
         #-----------------------------------------------------------------------
         if self.PedalEcho == 1 and self.PreviousPedalEcho == 0:
             self.PedalEchoCount += 1
-            self.PedalEchoTime   = time.time()
+            self.PedalEchoTime   = cycleClock.Time()
         self.PreviousPedalEcho = self.PedalEcho
 
         #-----------------------------------------------------------------------
@@ -684,6 +819,64 @@ class clsTacxTrainer():
 
         # No negative value defined for ANT message Page25 (#)
         # if self.CurrentPower < 0: self.CurrentPower = 0     # --> msgPage25_TrainerData
+        self._Target2Resistance()
+
+        #-----------------------------------------------------------------------
+        # Antifier's calibration; see _Target2Resistance()
+        #-----------------------------------------------------------------------
+        if self.clv.PowerFactor:
+            self.CurrentResistance /= self.clv.PowerFactor  # Was just received
+            self.CurrentPower      /= self.clv.PowerFactor  # Was just received
+
+        # ----------------------------------------------------------------------
+        # Round after all these calculations (and correct data type!) #361 
+        # ----------------------------------------------------------------------
+        self.Cadence             = int(self.Cadence)
+        self.TargetPower         = int(self.TargetPower)
+        self.TargetResistance    = int(self.TargetResistance)
+        self.CurrentResistance   = int(self.CurrentResistance)
+        self.CurrentPower        = int(self.CurrentPower)
+        self.SpeedKmh            = round(self.SpeedKmh,1)
+        self.VirtualSpeedKmh     = round(self.VirtualSpeedKmh,1)
+
+        #-----------------------------------------------------------------------
+        # Then send the results to the trainer again
+        #-----------------------------------------------------------------------
+        self.SendToTrainer(QuarterSecond, TacxMode)
+
+    #---------------------------------------------------------------------------
+    # S e n d T a r g e t
+    #---------------------------------------------------------------------------
+    # Input         Class variables Target***, as just modified by the caller
+    #               TacxMode, to pass to SendToTrainer()
+    #
+    # Function      Between two Refresh()-es a new target is received (ANT/BLE)
+    #               Calculate the resistance with the last received wheelspeed
+    #               and send it to the trainer, so that the command does not
+    #               wait for the next cycle.
+    #               The trainer is not read; buttons etc. are for Refresh().
+    #
+    # Output        TargetPower, TargetResistance
+    #---------------------------------------------------------------------------
+    def SendTarget(self, TacxMode):
+        if debug.on(debug.Function):logfile.Write ( \
+                    'clsTacxTrainer.SendTarget(%s)' % TacxMode)
+        self._Target2Resistance()
+        self.TargetPower         = int(self.TargetPower)
+        self.TargetResistance    = int(self.TargetResistance)
+        self.VirtualSpeedKmh     = round(self.VirtualSpeedKmh,1)
+        self.SendToTrainer(False, TacxMode)
+
+    #---------------------------------------------------------------------------
+    # _ T a r g e t 2 R e s i s t a n c e
+    #---------------------------------------------------------------------------
+    # Input         TargetMode, TargetGrade, TargetPowerProvided, SpeedKmh
+    #
+    # Function      Calculate TargetPower and TargetResistance
+    #
+    # Output        VirtualSpeedKmh, TargetPower, TargetResistance
+    #---------------------------------------------------------------------------
+    def _Target2Resistance(self):
         assert (self.TargetMode in (mode_Power, mode_Grade))
 
         if  self.TargetMode == mode_Grade:
@@ -714,31 +907,39 @@ class clsTacxTrainer():
         # and that the formula can be corrected with the PowerFactor.
         # Therefore before Send:
         #       the TargetResistance is multiplied by factor
-        # and after Receive:
+        # and after Receive (in Refresh):
         #       the CurrentResistance and CurrentPower are divided by factor
         # Just for antifier upwards compatibility; usage unknown.
         #-----------------------------------------------------------------------
         if self.clv.PowerFactor:
             self.TargetResistance  *= self.clv.PowerFactor  # Will be sent
 
-            self.CurrentResistance /= self.clv.PowerFactor  # Was just received
-            self.CurrentPower      /= self.clv.PowerFactor  # Was just received
+    #---------------------------------------------------------------------------
+    # R e g i s t e r A N T h a n d l e r s
+    #---------------------------------------------------------------------------
+    # input     Router      ant.clsAntRouter
+    #
+    # function  Register the handler(s) for the ANT channel(s) of the trainer
+    #           Only for ANT-trainers, USB-trainers have no ANT channel.
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def RegisterANThandlers(self, Router):
+        pass
 
-        # ----------------------------------------------------------------------
-        # Round after all these calculations (and correct data type!) #361 
-        # ----------------------------------------------------------------------
-        self.Cadence             = int(self.Cadence)
-        self.TargetPower         = int(self.TargetPower)
-        self.TargetResistance    = int(self.TargetResistance)
-        self.CurrentResistance   = int(self.CurrentResistance)
-        self.CurrentPower        = int(self.CurrentPower)
-        self.SpeedKmh            = round(self.SpeedKmh,1)
-        self.VirtualSpeedKmh     = round(self.VirtualSpeedKmh,1)
+    #---------------------------------------------------------------------------
+    # S t a r t I O t h r e a d   /   S t o p I O t h r e a d
+    #---------------------------------------------------------------------------
+    # function  Start/stop reading and writing the trainer in a separate thread
+    #           Only for USB-trainers, see clsTacxUsbTrainer.
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def StartIOthread(self):
+        pass
 
-        #-----------------------------------------------------------------------
-        # Then send the results to the trainer again
-        #-----------------------------------------------------------------------
-        self.SendToTrainer(QuarterSecond, TacxMode)
+    def StopIOthread(self):
+        pass
 
     #---------------------------------------------------------------------------
     # C a l i b r a t e S u p p o r t e d
@@ -811,22 +1012,9 @@ class clsTacxTrainer():
         # Matthew updates according www.gribble.org
         # See: https://www.gribble.org/cycling/power_v_speed.html
         #-----------------------------------------------------------------------
-        c     = self.RollingResistance              # default=0.004
-        m     = self.UserAndBikeWeight              # default=75+10 kg
-        g     = 9.81                                # m/s2
-        v     = self.VirtualSpeedKmh / 3.6          # m/s   km/hr * 1000 / 3600
-        Proll = c * m * g * v                       # Watt
-
-        p_cdA = self.WindResistance                 # default=0.51
-        w     = self.WindSpeed / 3.6                # default=0
-        d     = self.DraftingFactor                 # default=1
-        # without abs a strong tailwind would result in a higher power
-        Pair  = 0.5 * p_cdA * (v+w) * abs(v+w) * d * v # Watt
-
-        i     = self.TargetGrade                    # Percentage 0...100
-        Pslope= i/100 * m * g * v                   # Watt
-
-        self.TargetPower = int(Proll + Pair + Pslope)
+        self.TargetPower = int(Grade2Power_Gribble(self.VirtualSpeedKmh, \
+                    self.TargetGrade, self.UserAndBikeWeight, self.RollingResistance, \
+                    self.WindResistance, self.WindSpeed, self.DraftingFactor))
 
     #---------------------------------------------------------------------------
     # www.fiets.nl
@@ -865,101 +1053,41 @@ class clsTacxTrainer():
     #
     # description   Based upon inputs, estimate Speed
     #
-    #               Note: the Grade2Power() functions operate on self, and 
-    #                     therefore do not require input/return variables.
-    #
     #               The reason we do NOT modify self.VirtualSpeedKmh here is
     #               that that speed is directly related to the physical wheel-
     #               speed. So CalculatedSpeed is added and the consumer of the
     #               data can choose which of the two to use. 
     #
-    #               _Grade2Power() uses self.VirtualSpeedKmh as input to
-    #               calculate power. Therefore the value is saved and restored.
-    #               The field is used here to find the correct speed resulting
-    #               in the searched power.
-    #               *** appologies for this construction ***
+    #               The speed is solved from the Gribble formula, see
+    #               Power2Speed_Gribble(); no trainer-fields are modified.
     #
     # output:       self.CalculatedSpeed
     #
     # returns:      None
     #---------------------------------------------------------------------------
     def Power2Speed(self, Grade=0):                             #Power2Speed#
-        SpeedLo     = 1         # The low  speed in the range where we estimate
-        SpeedHi     = 100       # The high ...
-        Speed       = 0         # The estimated speed
-        PrevPower   = 0         # The previous power
-
-        # ----------------------------------------------------------------------
-        # We are going to SEARCH a VirtualSpeedKmh, resulting in TargetPower
-        # that equals CurrentPower. Save these two fields and restore afterwards
-        # ----------------------------------------------------------------------
-        SaveVirtualSpeedKmh = self.VirtualSpeedKmh
-        SaveTargetPower     = self.TargetPower
-        SaveTargetGrade     = self.TargetGrade
-
         # ----------------------------------------------------------------------
         # In powermode, by default we use TargetGrade=0 to calculate the speed
         # if we ride a virtual route, the TargetGrade is taken from the GPX and
         # provided as a parameter.
-        # We COULD leave TargetGrade modified, but restore it just to be neat.
         #
         # In GradeMode, the TargetGrade is already set.
         # ----------------------------------------------------------------------
         if self.TargetMode == mode_Power:
-            self.TargetGrade = Grade
-
-        if self.CurrentPower == 0:
-            Speed = 0           # No power, no speed
+            TargetGrade = Grade
         else:
-            SpeedLo = 1         # We do not cycle backwards
-            SpeedHi = 100       # Smart guy going faster :-)
-            
-            # ------------------------------------------------------------------
-            # If power is negative, find point where curve goes up
-            # The powercurve with a big negative slope has two solutions for the
-            # speed when the (negative) power is given; herewith we chose to get
-            # the highest speed of the two.
-            # ------------------------------------------------------------------
-            if self.CurrentPower < 0:
-                self.VirtualSpeedKmh = SpeedLo
-                self._Grade2Power()
-                PrevPower = 10000
-                while self.TargetPower < PrevPower:
-                    SpeedLo = SpeedLo + 5
-                    PrevPower = self.TargetPower
-                    self.VirtualSpeedKmh = SpeedLo
-                    self._Grade2Power()
-            
-            # ------------------------------------------------------------------
-            # Find the power that matches the searched speed
-            #
-            #    +----------+----------+
-            # SpeedLo ... Speed ... SpeedHi
-            #          TargetPower
-            # Move SpeedLo/SpeedHi based upon power, untill close enough.
-            # ------------------------------------------------------------------
-            while (SpeedHi / SpeedLo) > 1.05:
-            
-                Speed = (SpeedLo + SpeedHi) / 2         # The estimated speed
-                self.VirtualSpeedKmh = Speed            # results in
-                self._Grade2Power()                     # TargetPower
-                
-                if self.TargetPower < self.CurrentPower:
-                    SpeedLo = Speed                     # New boundary
-                else:
-                    SpeedHi = Speed                     # New boundary
+            TargetGrade = self.TargetGrade
 
-        # ----------------------------------------------------------------------
-        # Restore fields
-        # ----------------------------------------------------------------------
-        self.VirtualSpeedKmh = SaveVirtualSpeedKmh
-        self.TargetPower     = SaveTargetPower
-        self.TargetGrade     = SaveTargetGrade
+        UserAndBikeWeight = self.UserAndBikeWeight
+        if UserAndBikeWeight < 70:                  # As _Grade2Power()
+            UserAndBikeWeight = 75 + 10
 
         # ----------------------------------------------------------------------
         # Our output
         # ----------------------------------------------------------------------
-        self.CalculatedSpeedKmh = Speed
+        self.CalculatedSpeedKmh = Power2Speed_Gribble(self.CurrentPower, \
+                    TargetGrade, UserAndBikeWeight, self.RollingResistance, \
+                    self.WindResistance, self.WindSpeed, self.DraftingFactor)
 
     # --------------------------------------------------------------------------
     # D i s p l a y S t a t e T a b l e
@@ -1040,6 +1168,15 @@ class clsSimulatedTrainer(clsTacxTrainer):
                                                         InitialCalRight=100,
                                                         DeadZone=7.0)
 
+    # --------------------------------------------------------------------------
+    # S e n d T a r g e t
+    # --------------------------------------------------------------------------
+    # Description:  There is no trainer to send to; the new target is used by
+    #               the next Refresh().
+    # --------------------------------------------------------------------------
+    def SendTarget(self, _TacxMode=None):
+        pass
+
     # --------------------------------------------------------------------------
     # R e f r e s h
     # --------------------------------------------------------------------------
@@ -1065,8 +1202,8 @@ class clsSimulatedTrainer(clsTacxTrainer):
         # Trigger for pedalstroke analysis (PedalEcho)
         # Data for Speed and Cadence Sensor (-Time and -Count)
         # ----------------------------------------------------------------------
-        if self.Cadence and (time.time() - self.PedalEchoTime) > 60 / self.Cadence:
-            self.PedalEchoTime   = time.time()
+        if self.Cadence and (cycleClock.Time() - self.PedalEchoTime) > 60 / self.Cadence:
+            self.PedalEchoTime   = cycleClock.Time()
             self.PedalEcho       = 1
             self.PedalEchoCount += 1
         else:
@@ -1178,7 +1315,7 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
         self.__VTX_AlarmStatus = 0              # brake errors/warnings (page 1)
 
         # time of last keep-alive message
-        self.__KeepAliveTime   = time.time()
+        self.__KeepAliveTime   = cycleClock.Time()
 
         self.Message = 'Pair with Tacx Vortex and Headunit'
 
@@ -1267,7 +1404,7 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
                 if self.__AntVHUpaired:
                     # Head-unit powers off after 3 minutes
                     KeepAliveInterval = 10  # in s
-                    TimeElapsed = time.time() - self.__KeepAliveTime
+                    TimeElapsed = cycleClock.Time() - self.__KeepAliveTime
 
                     if TimeElapsed > KeepAliveInterval:
                         info = ant.msgPage000_TacxVortexHU_StayAlive (ant.channel_VHU_s)
@@ -1278,7 +1415,7 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
                             logfile.Write("Vortex HU page 0 (OUT) Keep-alive")
 
                         # reset keep-alive timer
-                        self.__KeepAliveTime = time.time()
+                        self.__KeepAliveTime = cycleClock.Time()
 
                     # ---------------------------------------------------------------
                     #  Request PC-mode (repeat until confirmation)
@@ -1335,13 +1472,23 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
     #     if debug.on(debug.Function):logfile.Write ("clsTacxAntVortexTrainer.Refresh()")
     #     pass
 
+    #---------------------------------------------------------------------------
+    # RegisterANThandlers()
+    #---------------------------------------------------------------------------
+    # All messages on the VTX and VHU channel are handled here
+    #---------------------------------------------------------------------------
+    def RegisterANThandlers(self, Router):
+        Router.Register(self.HandleANTmessage, Channel=ant.channel_VTX_s)
+        Router.Register(self.HandleANTmessage, Channel=ant.channel_VHU_s)
+
     #---------------------------------------------------------------------------
     # HandleANTmessage()
     #---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        _synch, _length, id, info, _checksum, _rest, Channel, DataPageNumber = \
-                                                       ant.DecomposeMessage(msg)
-        SubPageNumber = info[2] if len(info) > 2 else None
+    # input     m       ant.clsAntMessage, as dispatched by ant.clsAntRouter
+    #---------------------------------------------------------------------------
+    def HandleANTmessage(self, m):
+        id, info, Channel, DataPageNumber, SubPageNumber = \
+            m.id, m.info, m.Channel, m.DataPageNumber, m.SubPageNumber
         dataHandled = False
         messages    = []
 
@@ -1699,13 +1846,22 @@ class clsTacxAntTrainer(clsTacxTrainer):
         deltaRR = self.RollingResistance - defaultRR
         return deltaRR * 100
 
+    #---------------------------------------------------------------------------
+    # RegisterANThandlers()
+    #---------------------------------------------------------------------------
+    # All messages on the trainer channel are handled here
+    #---------------------------------------------------------------------------
+    def RegisterANThandlers(self, Router):
+        Router.Register(self.HandleANTmessage, Channel=self.Channel)
+
     #---------------------------------------------------------------------------
     # HandleANTmessage()
     #---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        _synch, _length, id, info, _checksum, _rest, \
-        Channel, DataPageNumber = ant.DecomposeMessage(msg)
-        SubPageNumber = info[2] if len(info) > 2 else None
+    # input     m       ant.clsAntMessage, as dispatched by ant.clsAntRouter
+    #---------------------------------------------------------------------------
+    def HandleANTmessage(self, m):
+        id, info, Channel, DataPageNumber, SubPageNumber = \
+            m.id, m.info, m.Channel, m.DataPageNumber, m.SubPageNumber
         dataHandled = False
         messages = []
 
@@ -1788,7 +1944,7 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
     def _ResetTrainer(self):
         super()._ResetTrainer()
         self.__Calibrated       = False
-        self.__WatchdogTime     = time.time()
+        self.__WatchdogTime     = cycleClock.Time()
         self.__CalibrationValue = 0
         self.__State            = GeniusState.Pairing
 
@@ -1802,12 +1958,12 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
             self.Operational = True       # FortiusAnt can send/receive to brake
 
     def __ResetTimeout(self):
-        self.__WatchdogTime = time.time()
+        self.__WatchdogTime = cycleClock.Time()
 
     def __CheckCalibrationTimeout(self):
         # cancel calibration if no progress in last 60s
         timeout = 60
-        if time.time() > self.__WatchdogTime + timeout:
+        if cycleClock.Time() > self.__WatchdogTime + timeout:
             self.__SetState(GeniusState.CalibrationFailed)
             self.__Calibrated = False
 
@@ -1952,10 +2108,9 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
     #---------------------------------------------------------------------------
     # HandleANTmessage()
     #---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        _synch, _length, id, info, _checksum, _rest,\
-                Channel, DataPageNumber = ant.DecomposeMessage(msg)
-        SubPageNumber = info[2] if len(info) > 2 else None
+    def HandleANTmessage(self, m):
+        id, info, Channel, DataPageNumber, SubPageNumber = \
+            m.id, m.info, m.Channel, m.DataPageNumber, m.SubPageNumber
         dataHandled = False
         messages = []
 
@@ -2042,7 +2197,7 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
         # Messages that are not Genius specific are handled by the base class
         #-----------------------------------------------------------------------
         if not dataHandled:
-            dataHandled = super().HandleANTmessage(msg)
+            dataHandled = super().HandleANTmessage(m)
 
         #-----------------------------------------------------------------------
         # Send messages, leave receiving to the outer loop
@@ -2134,7 +2289,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
         super()._ResetTrainer()
         self.__State            = BushidoState.Pairing
         self.__ModeRequested    = ant.VHU_PCmode
-        self.__KeepAliveTime    = time.time()
+        self.__KeepAliveTime    = cycleClock.Time()
         self.__Buttons          = ant.VHU_Button_None
 
     def __SetState(self, state):
@@ -2216,7 +2371,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
         # Send keep-alive pages at regular interval to keep HU awake
         # -------------------------------------------------------------------
         KeepAliveInterval = 10  # in s
-        TimeElapsed = time.time() - self.__KeepAliveTime
+        TimeElapsed = cycleClock.Time() - self.__KeepAliveTime
         if TimeElapsed > KeepAliveInterval and QuarterSecond:
             info = ant.msgPage000_TacxVortexHU_StayAlive(self.Channel)
             msg = ant.ComposeMessage(ant.msgID_BroadcastData, info)
@@ -2226,7 +2381,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
                 logfile.Write("Bushido page 0 (OUT) Keep-alive")
 
             # reset keep-alive timer
-            self.__KeepAliveTime = time.time()
+            self.__KeepAliveTime = cycleClock.Time()
 
         # ---------------------------------------------------------------
         # Request mode switch (repeat until response received)
@@ -2256,10 +2411,9 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
     # ---------------------------------------------------------------------------
     # HandleANTmessage()
     # ---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        _synch, _length, id, info, _checksum, _rest, \
-        Channel, DataPageNumber = ant.DecomposeMessage(msg)
-        SubPageNumber = info[2] if len(info) > 2 else None
+    def HandleANTmessage(self, m):
+        id, info, Channel, DataPageNumber, SubPageNumber = \
+            m.id, m.info, m.Channel, m.DataPageNumber, m.SubPageNumber
         dataHandled = False
         messages = []
 
@@ -2352,7 +2506,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
         # Messages that are not Bushido specific are handled by the base class
         # -----------------------------------------------------------------------
         if not dataHandled:
-            dataHandled = super().HandleANTmessage(msg)
+            dataHandled = super().HandleANTmessage(m)
 
         # -----------------------------------------------------------------------
         # Send messages, leave receiving to the outer loop
@@ -2414,11 +2568,99 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
 
         return rtn
 
+#-------------------------------------------------------------------------------
+# c l s U s b F r a m e
+#-------------------------------------------------------------------------------
+# input     Name, Fields = [(FieldName, structConstant), ...]
+#           FieldName = None for filler (sc.pad)
+#
+# function  The layout of a buffer received from a USB head unit, compiled
+#           once (per class) instead of composing the format on every receive.
+#
+#           View(data)  copies data into a 64-byte scratch buffer (the rest is
+#                       zero; some trainers return 48 bytes only) and returns
+#                       a namedtuple with the fields
+#-------------------------------------------------------------------------------
+class clsUsbFrame():
+    def __init__(self, Name, Fields):
+        self.Name           = Name
+        format              = ''.join([f for _n, f in Fields])
+        self.Struct         = struct.Struct(sc.no_alignment + format)
+        self.Size           = self.Struct.size
+        self.Tuple          = collections.namedtuple(Name, [n for n, _f in Fields if n != None])
+
+        self._Buffer        = bytearray(max(64, self.Size))
+        self._Zeros         = bytes(len(self._Buffer))
+        self._View          = memoryview(self._Buffer)
+
+    def View(self, data):
+        n = min(len(data), len(self._Buffer))
+        self._View[:n] = data[:n]
+        self._View[n:] = self._Zeros[n:]
+        return self.Tuple._make(self.Struct.unpack_from(self._Buffer))
+
+#-------------------------------------------------------------------------------
+# c l s R e s i s t a n c e I n d e x
+#-------------------------------------------------------------------------------
+# input     Resistances     the resistance steps, power increasing with step
+#           Targets         the value to return for each step
+#           Power           function(Resistance, SpeedKmh) returning Watt
+#           Key             what Power() depends on, e.g. clv.CalibrateRR, so
+#                           that the caller knows when to rebuild the index
+#
+# function  Table[speed bucket][step] = Power, calculated once, so that the
+#           step for a TargetPower is found with bisect instead of calculating
+#           the power for every step on every refresh.
+#           SpeedKmh has one decimal (see Wheel2Speed), so buckets of 0.1 km/h
+#           give the same result as calculating.
+#
+#           Lookup(TargetPower, SpeedKmh, Interpolate)
+#               returns Targets[i] of the first step with Power >= TargetPower
+#               (the last step if none).
+#               With Interpolate, the value between Targets[i-1] and Targets[i]
+#               in proportion to the power is returned.
+#-------------------------------------------------------------------------------
+class clsResistanceIndex():
+    SpeedStep = 0.1                             # km/h per bucket
+    SpeedMax  = 100                             # km/h; above, Power() is used
+
+    def __init__(self, Resistances, Targets, Power, Key=None):
+        self.Resistances = Resistances
+        self.Targets     = Targets
+        self.Power       = Power
+        self.Key         = Key
+        self.Table       = [ [Power(r, b * self.SpeedStep) for r in Resistances] \
+                             for b in range(int(self.SpeedMax / self.SpeedStep) + 1) ]
+
+    def Lookup(self, TargetPower, SpeedKmh, Interpolate=False):
+        b = int(round(SpeedKmh / self.SpeedStep))
+        if 0 <= b < len(self.Table):
+            Row = self.Table[b]
+        else:
+            Row = [self.Power(r, SpeedKmh) for r in self.Resistances]
+
+        i = bisect.bisect_left(Row, TargetPower)
+        if i == len(Row):
+            return self.Targets[-1]
+
+        if Interpolate and i > 0 and Row[i] > Row[i-1]:
+            f = (TargetPower - Row[i-1]) / (Row[i] - Row[i-1])
+            return self.Targets[i-1] + f * (self.Targets[i] - self.Targets[i-1])
+
+        return self.Targets[i]
+
 #-------------------------------------------------------------------------------
 # c l s T a c x U s b T r a i n e r
 #-------------------------------------------------------------------------------
 class clsTacxUsbTrainer(clsTacxTrainer):
     USB_ReadErrorCount = 0
+
+    # Trainer I/O thread, see StartIOthread()
+    IOthread           = None                   # Active thread
+    IOcycleTime        = 0.02                   # Write/read cycle of the thread
+    IOreconnectTime    = 2                      # Reconnect when no frame for 2s
+    IOexpectedHeader   = USB_ControlResponse    # Frames with other headers are
+                                                # not published (None: all)
     #---------------------------------------------------------------------------
     # Convert WheelSpeed --> Speed in km/hr
     # SpeedScale must be defined in sub-class
@@ -2486,6 +2728,8 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     # returns   data
     #---------------------------------------------------------------------------
     def USB_Read(self):
+        if self.IOthread: return self._IOsnapshot()
+
         self.tacxEvent = True                   # Assume we receive correct buffer
         data = array.array('B', [])             # Empty array of bytes
         try:
@@ -2535,6 +2779,12 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     #           reconnecting here works fine.
     #---------------------------------------------------------------------------
     def USB_Read_retry4x40(self, expectedHeader = USB_ControlResponse):
+        #-----------------------------------------------------------------------
+        # When the trainer is read by _IOthread(), retry and reconnect are
+        # done there; here the last received frame is returned.
+        #-----------------------------------------------------------------------
+        if self.IOthread: return self._IOsnapshot()
+
         #-----------------------------------------------------------------------
         # If multiple reads fail, we try to reconnect.
         # This is not necessary when succesfull reads occur in the meantime.
@@ -2700,11 +2950,181 @@ class clsTacxUsbTrainer(clsTacxTrainer):
                     logfile.Write ("                  tacx mode=%s target=%s pe=%s weight=%s cal=%s" % \
                                                 (TacxMode, Target, PedalEcho, Weight, Calibrate))
 
+                if self.IOthread:
+                    self.IOcommand = data                   # Sent by _IOthread()
+                    self.IOcommandEvent.set()               # immediatly
+                else:
+                    try:
+                        self.UsbDevice.write(0x02, data, 30)                         # send data to device
+                    except Exception as e:
+                        logfile.Console("Write to USB trainer error: " + str(e))
+
+    #---------------------------------------------------------------------------
+    # S t a r t I O t h r e a d
+    #---------------------------------------------------------------------------
+    # function  Start _IOthread() that owns the head unit:
+    #           - the last command from SendToTrainer() is written every
+    #             IOcycleTime (and immediatly when a new command is provided)
+    #           - the response is read and, when correct, stored in a double
+    #             buffer; the last frame is returned by USB_Read[_retry4x40]()
+    #             so that Refresh() does not wait for the head unit.
+    #
+    #           A slow or misbehaving head unit does not delay the main loop
+    #           (ANT broadcasts, BLE) anymore.
+    #
+    #           Runoff and calibration read the trainer inline (no thread).
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def StartIOthread(self):
+        if self.IOthread: return
+        if debug.on(debug.Function): logfile.Write ("clsTacxUsbTrainer.StartIOthread()")
+
+        self.IOcommand      = None                      # Last command to send
+        self.IOcommandEvent = threading.Event()         # New command available
+        self.IObuffer       = [bytearray(64), bytearray(64)]
+        self.IOlength       = [0, 0]                    # Length of the frames
+        self.IOindex        = 0                         # Buffer with last frame
+        self.IOsequence     = 0                         # Published frames
+        self.IOfirstFrame   = threading.Event()         # First frame published
+        self.IOconsumed     = 0                         # Frame taken by _IOsnapshot()
+        self.IOactive       = True
+
+        self.IOthread = threading.Thread(target=self._IOthread, name='Trainer I/O', daemon=True)
+        self.IOthread.start()
+
+        #-----------------------------------------------------------------------
+        # Give the head unit the opportunity to provide the first frame
+        #-----------------------------------------------------------------------
+        self.IOfirstFrame.wait(self.IOreconnectTime)
+
+    #---------------------------------------------------------------------------
+    # S t o p I O t h r e a d
+    #---------------------------------------------------------------------------
+    # function  Stop _IOthread(); trainer is read/written inline again
+    #
+    # returns   None
+    #---------------------------------------------------------------------------
+    def StopIOthread(self):
+        if not self.IOthread: return
+        if debug.on(debug.Function): logfile.Write ("clsTacxUsbTrainer.StopIOthread()")
+
+        self.IOactive = False
+        self.IOcommandEvent.set()
+        self.IOthread.join(1)
+        self.IOthread = None
+
+    #---------------------------------------------------------------------------
+    # _ I O t h r e a d
+    #---------------------------------------------------------------------------
+    # function  Write last command, read response and publish the frame.
+    #           If no correct frame is received for IOreconnectTime seconds,
+    #           the USB device is reconnected (see USB_Read_retry4x40).
+    #---------------------------------------------------------------------------
+    def _IOthread(self):
+        Clock     = cycleClock.clsCycleClock(self.IOcycleTime, 'Trainer I/O', \
+                                                  Clock=time.monotonic) # USB is real-time
+        LastFrame = time.monotonic()
+        while self.IOactive:
+            Clock.Begin()
+            #-------------------------------------------------------------------
+            # Write the last command (repeated, the brake only answers commands)
+            #-------------------------------------------------------------------
+            data = self.IOcommand
+            if data:
                 try:
-                    self.UsbDevice.write(0x02, data, 30)                             # send data to device
+                    self.UsbDevice.write(0x02, data, 30)
                 except Exception as e:
                     logfile.Console("Write to USB trainer error: " + str(e))
 
+            #-------------------------------------------------------------------
+            # Read the response
+            #-------------------------------------------------------------------
+            data = array.array('B', [])
+            try:
+                data = self.UsbDevice.read(0x82, 64, 30)
+            except Exception as e:
+                if "timeout error" in str(e) or "timed out" in str(e) or isinstance(e, TimeoutError):
+                    pass
+                else:
+                    logfile.Console("Read from USB trainer error: " + str(e))
+
+            if len(data) > 27:
+                Header = int(data[27]<<24 | data[26]<<16 | data[25]<<8 | data[24] )
+            else:
+                Header = -1
+
+            if debug.on(debug.Data2):
+                logfile.Write ("Trainer recv hdr=%s data=%s (len=%s)" % \
+                                    (hex(Header), logfile.HexSpace(data), len(data)))
+
+            #-------------------------------------------------------------------
+            # Publish correct frames; reconnect if nothing correct for too long
+            #-------------------------------------------------------------------
+            if (self.IOexpectedHeader is None and len(data) > 0) or \
+               (len(data) >= 40 and Header == self.IOexpectedHeader):
+                self._IOpublish(data)
+                LastFrame = time.monotonic()
+
+            elif time.monotonic() - LastFrame > self.IOreconnectTime:
+                logfile.Console('Tacx head unit returns no correct data (len=%s hdr=%s)' % \
+                                                (len(data), hex(Header)))
+                logfile.Console('Try to reconnect to Tacx head unit')
+                msg, _hu, UsbDevice, _LegacyProtocol = clsTacxTrainer.InitializeUSB(self.Headunit)
+                logfile.Console (msg)
+                if UsbDevice: self.UsbDevice = UsbDevice
+                LastFrame = time.monotonic()
+
+            #-------------------------------------------------------------------
+            # Wait for the next cycle or a new command
+            #-------------------------------------------------------------------
+            Clock.End()
+            SleepTime = Clock.Remaining()
+            if SleepTime > 0 and self.IOcommandEvent.wait(SleepTime):
+                Clock.Reset()                   # New command; restart cycle
+            self.IOcommandEvent.clear()
+
+    #---------------------------------------------------------------------------
+    # _ I O p u b l i s h
+    #---------------------------------------------------------------------------
+    # function  Store the frame in the buffer that is NOT being read, then
+    #           make it the current one. _IOsnapshot() reads the current one.
+    #---------------------------------------------------------------------------
+    def _IOpublish(self, data):
+        i                   = 1 - self.IOindex
+        self.IObuffer[i][:len(data)] = data
+        self.IOlength[i]    = len(data)
+        self.IOindex        = i
+        self.IOsequence    += 1
+        if self.IOsequence == 1: self.IOfirstFrame.set()
+
+    #---------------------------------------------------------------------------
+    # _ I O s n a p s h o t
+    #---------------------------------------------------------------------------
+    # function  Return the last frame published by _IOthread()
+    #           The buffer is only valid if the thread did not start writing
+    #           it while being copied (IOindex changed); then try again.
+    #
+    # output    Header, tacxEvent (True if new frame since previous call)
+    #
+    # returns   data
+    #---------------------------------------------------------------------------
+    def _IOsnapshot(self):
+        while True:
+            Sequence = self.IOsequence
+            i        = self.IOindex
+            data     = array.array('B', self.IObuffer[i][:self.IOlength[i]])
+            if self.IOindex == i and self.IOsequence - Sequence < 2: break
+
+        self.tacxEvent  = Sequence != self.IOconsumed
+        self.IOconsumed = Sequence
+
+        if len(data) > 27:
+            self.Header = int(data[27]<<24 | data[26]<<16 | data[25]<<8 | data[24] )
+        else:
+            self.Header = -1
+        return data
+
 #-------------------------------------------------------------------------------
 # c l s T a c x L e g a c y U s b T r a i n e r
 #-------------------------------------------------------------------------------
@@ -2713,6 +3133,30 @@ class clsTacxUsbTrainer(clsTacxTrainer):
 # ==> iMagic
 #-------------------------------------------------------------------------------
 class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
+    IOexpectedHeader = None                     # Legacy frames have no header
+
+    #---------------------------------------------------------------------------
+    # Buffer format, see _ReceiveFromTrainer()
+    #---------------------------------------------------------------------------
+    ControlFrame = clsUsbFrame('LegacyControlFrame', [
+        ('StatusAndCursors',  sc.unsigned_char),    # 0
+        ('Speed',             sc.unsigned_short),   # 1, 2      Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
+        ('Cadence',           sc.unsigned_char),    # 3
+        ('HeartRate',         sc.unsigned_char),    # 4
+        ('StopWatch',         sc.unsigned_int),     # 5,6,7,8
+        ('CurrentResistance', sc.unsigned_char),    # 9
+        ('PedalSensor',       sc.unsigned_char),    # 10
+        ('Axis0',             sc.unsigned_char),    # 11
+        ('Axis1',             sc.unsigned_char),    # 12
+        ('Axis2',             sc.unsigned_char),    # 13
+        ('Axis3',             sc.unsigned_char),    # 14
+        ('Counter',           sc.unsigned_char),    # 15
+        ('WheelCount',        sc.unsigned_char),    # 16
+        ('YearProduction',    sc.unsigned_char),    # 17
+        ('DeviceSerial',      sc.unsigned_short),   # 18, 19
+        ('FirmwareVersion',   sc.unsigned_char),    # 20
+        ])
+
     def __init__(self, clv, Message, Headunit, UsbDevice):
         super().__init__(clv, Message)
         if debug.on(debug.Function):logfile.Write ("clsTacxLegacyUsbTrainer.__init__()")
@@ -2831,73 +3275,24 @@ class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
         data = self.USB_Read()
 
         #-----------------------------------------------------------------------
-        # Define buffer format
+        # A short buffer (e.g. timeout) cannot be parsed
         #-----------------------------------------------------------------------
-        nStatusAndCursors   = 0                 # 0
-        fStatusAndCursors   = sc.unsigned_char
-
-        nSpeed              = 1                 # 1, 2      Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-        fSpeed              = sc.unsigned_short
-
-        nCadence            = 2                 # 3
-        fCadence            = sc.unsigned_char
-
-        nHeartRate          = 3                 # 4
-        fHeartRate          = sc.unsigned_char
-
-        #nStopWatch         = 4
-        fStopWatch          = sc.unsigned_int   # 5,6,7,8
-
-        nCurrentResistance  = 5                 # 9
-        fCurrentResistance  = sc.unsigned_char
-
-        nPedalSensor        = 6                 # 10
-        fPedalSensor        = sc.unsigned_char
-
-        #nAxis0             = 7                 # 11
-        fAxis0              = sc.unsigned_char
-
-        nAxis1              = 8                 # 12
-        fAxis1              = sc.unsigned_char
-
-        #nAxis2             = 9                 # 13
-        fAxis2              = sc.unsigned_char
-
-        #nAxis3             = 10                # 14
-        fAxis3              = sc.unsigned_char
-
-        #nCounter           = 11                # 15
-        fCounter            = sc.unsigned_char
-
-        #nWheelCount        = 12                # 16
-        fWheelCount         = sc.unsigned_char
-
-        #nYearProduction    = 13                # 17
-        fYearProduction     = sc.unsigned_char
-
-        #nDeviceSerial      = 14                # 18, 19
-        fDeviceSerial       = sc.unsigned_short
-
-        #nFirmwareVersion   = 15                # 20
-        fFirmwareVersion    = sc.unsigned_char
+        if len(data) < self.ControlFrame.Size:
+            return
 
         #-----------------------------------------------------------------------
-        # Parse buffer
+        # Parse buffer, see ControlFrame
         # Note that the button-bits have an inversed logic:
         #   1=not pushed, 0=pushed. Hence the xor.
         #-----------------------------------------------------------------------
-        format = sc.no_alignment + fStatusAndCursors + fSpeed + fCadence + fHeartRate + fStopWatch + fCurrentResistance + \
-                fPedalSensor + fAxis0 + fAxis1 + fAxis2 + fAxis3 + fCounter + fWheelCount + \
-                fYearProduction + fDeviceSerial + fFirmwareVersion
-        tuple = struct.unpack (format, data)
-
-        self.Axis                = tuple[nAxis1]
-        self.Buttons             = ((tuple[nStatusAndCursors] & 0xf0) >> 4) ^ 0x0f
-        self.Cadence             = tuple[nCadence]
-        self.CurrentResistance   = tuple[nCurrentResistance]
-        self.HeartRate           = tuple[nHeartRate]
-        self.PedalEcho           = tuple[nPedalSensor]
-        self.WheelSpeed          = tuple[nSpeed]
+        f = self.ControlFrame.View(data)
+        self.Axis                = f.Axis1
+        self.Buttons             = ((f.StatusAndCursors & 0xf0) >> 4) ^ 0x0f
+        self.Cadence             = f.Cadence
+        self.CurrentResistance   = f.CurrentResistance
+        self.HeartRate           = f.HeartRate
+        self.PedalEcho           = f.PedalSensor
+        self.WheelSpeed          = f.Speed
 
         self.Wheel2Speed()
         self.CurrentResistance2Power()
@@ -2927,6 +3322,57 @@ class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
 # simplifying it.
 #-------------------------------------------------------------------------------
 class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
+    #---------------------------------------------------------------------------
+    # MagneticBrake: power of currentR[] steps, see TargetPower2Resistance()
+    # Interpolation between the targetR[] steps is possible, but note that the
+    # head unit rounds other values down to the nearest step.
+    #---------------------------------------------------------------------------
+    ResistanceIndex          = None
+    MagneticBrakeInterpolate = False
+
+    #---------------------------------------------------------------------------
+    # Buffer formats, see _ReceiveFromTrainer() and _ReceiveFromTrainer_MotorBrake()
+    #---------------------------------------------------------------------------
+    ControlFrame = clsUsbFrame('NewControlFrame', [
+        ('DeviceSerial',      sc.unsigned_short),   # 0...1
+        (None,                sc.pad * ( 7 - 1)),   # 2...7
+        ('YearProduction',    sc.unsigned_char),    # 8
+        (None,                sc.pad * (11 - 8)),   # 9...11
+        ('HeartRate',         sc.unsigned_char),    # 12
+        ('Buttons',           sc.unsigned_char),    # 13
+        ('HeartDetect',       sc.unsigned_char),    # 14
+        ('ErrorCount',        sc.unsigned_char),    # 15
+        ('Axis0',             sc.unsigned_short),   # 16-17
+        ('Axis1',             sc.unsigned_short),   # 18-19
+        ('Axis2',             sc.unsigned_short),   # 20-21
+        ('Axis3',             sc.unsigned_short),   # 22-23
+        ('Header',            sc.unsigned_int),     # 24-27
+        ('Distance',          sc.unsigned_int),     # 28-31
+        ('Speed',             sc.unsigned_short),   # 32, 33    Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
+        (None,                sc.pad * 2),          # 34...35   Increases if you accellerate?
+        (None,                sc.pad * 2),          # 36...37   Average power?
+        ('CurrentResistance', sc.short),            # 38, 39
+        ('TargetResistance',  sc.short),            # 40, 41
+        ('Events',            sc.unsigned_char),    # 42
+        (None,                sc.pad),              # 43
+        ('Cadence',           sc.unsigned_char),    # 44
+        (None,                sc.pad),              # 45
+        ('ModeEcho',          sc.unsigned_char),    # 46
+        ('ChecksumLSB',       sc.unsigned_char),    # 47
+        ('ChecksumMSB',       sc.unsigned_char),    # 48
+        (None,                sc.pad * (63 - 48)),  # 49...63
+        ])
+
+    VersionFrame = clsUsbFrame('NewVersionFrame', [
+        (None,                     sc.pad * 24),    #  0...23
+        ('Header',                 sc.unsigned_int),# 24...27
+        ('MotorBrakeUnitFirmware', sc.unsigned_int),# 28...31   0.x.y.z
+        ('MotorBrakeUnitSerial',   sc.unsigned_int),# 32...35   tt-YY-##### (tt=41 (T1941), YY=year,
+                                                    #                 ##### brake individual serial)
+        ('Version2',               sc.unsigned_short), # 36, 37
+        (None,                     sc.pad * (63-37)),  # 38...63
+        ])
+
     def __init__(self, clv, Message, Headunit, UsbDevice):
         super().__init__(clv, Message)
         if debug.on(debug.Function):logfile.Write ("clsTacxNewUsbTrainer.__init__()")
@@ -3101,10 +3547,11 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             # e.g. Tacx Flow: Magnetic Brake T1901 connected to head unit T1932
             #-------------------------------------------------------------------
             if self.WheelSpeed > 0:
-                for i in range(0, len(self.currentR)):
-                    if self.Resistance2PowerMB(self.currentR[i], self.SpeedKmh) >= self.TargetPower:
-                        break
-                rtn = self.targetR[i]
+                if self.ResistanceIndex is None or self.ResistanceIndex.Key != self.clv.CalibrateRR:
+                    self.ResistanceIndex = clsResistanceIndex(self.currentR, self.targetR, \
+                                                self.Resistance2PowerMB, self.clv.CalibrateRR)
+                rtn = self.ResistanceIndex.Lookup(self.TargetPower, self.SpeedKmh, \
+                                                self.MagneticBrakeInterpolate)
 
         rtn = int(rtn)
 
@@ -3303,108 +3750,19 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             pass
         else:
             #-----------------------------------------------------------------------
-            # Define buffer format
+            # Parse buffer, see ControlFrame
+            # Note that tt_FortiusSB returns 48 bytes only; View() pads to 64
             #-----------------------------------------------------------------------
-            #nDeviceSerial      =  0                # 0...1
-            fDeviceSerial       = sc.unsigned_short
-
-            fFiller2_7          = sc.pad * ( 7 - 1) # 2...7
-
-            #nYearProduction    =  1                # 8
-            fYearProduction     = sc.unsigned_char
-
-            fFiller9_11         = sc.pad * (11 - 8) # 9...11
-
-            nHeartRate          =  2                # 12
-            fHeartRate          = sc.unsigned_char
-
-            nButtons            =  3                # 13
-            fButtons            = sc.unsigned_char
-
-            #nHeartDetect       =  4                # 14
-            fHeartDetect        = sc.unsigned_char
-
-            #nErrorCount        =  5                # 15
-            fErrorCount         = sc.unsigned_char
-
-            #nAxis0             =  6                # 16-17
-            fAxis0              = sc.unsigned_short
-
-            nAxis1              =  7                # 18-19
-            fAxis1              = sc.unsigned_short
-
-            #nAxis2             =  8                # 20-21
-            fAxis2              = sc.unsigned_short
-
-            #nAxis3             =  9                # 22-23
-            fAxis3              = sc.unsigned_short
-
-            _nHeader            = 10                # 24-27
-            fHeader             = sc.unsigned_int
-
-            #nDistance          = 11                # 28-31
-            fDistance           = sc.unsigned_int
-
-            nSpeed              = 12                # 32, 33            Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-            fSpeed              = sc.unsigned_short
-
-            fFiller34_35        = sc.pad * 2        # 34...35           Increases if you accellerate?
-            fFiller36_37        = sc.pad * 2        # 36...37           Average power?
-
-            nCurrentResistance  = 13                # 38, 39
-            fCurrentResistance  = sc.short
-
-            nTargetResistance   = 14                # 40, 41
-            fTargetResistance   = sc.short
-
-            nEvents             = 15                # 42
-            fEvents             = sc.unsigned_char
-
-            fFiller43           = sc.pad            # 43
-
-            nCadence            = 16                # 44
-            fCadence            = sc.unsigned_char
-
-            fFiller45           = sc.pad            # 45
-
-            #nModeEcho          = 17                # 46
-            fModeEcho           = sc.unsigned_char
-
-            #nChecksumLSB       = 18                # 47
-            fChecksumLSB        = sc.unsigned_char
-
-            #nChecksumMSB       = 19                # 48
-            fChecksumMSB        = sc.unsigned_char
-
-            fFiller49_63        = sc.pad * (63 - 48)# 49...63
-
-            format = sc.no_alignment + fDeviceSerial + fFiller2_7 + fYearProduction + \
-                    fFiller9_11 + fHeartRate + fButtons + fHeartDetect + fErrorCount + \
-                    fAxis0 + fAxis1 + fAxis2 + fAxis3 + fHeader + fDistance + fSpeed + \
-                    fFiller34_35 + fFiller36_37 + fCurrentResistance + fTargetResistance + \
-                    fEvents + fFiller43 + fCadence + fFiller45 + fModeEcho + \
-                    fChecksumLSB + fChecksumMSB + fFiller49_63
-
-            #-----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
-            #-----------------------------------------------------------------------
-            for _v in range( 64 - len(data) ):
-                data.append(0)
-
-            #-----------------------------------------------------------------------
-            # Parse buffer
-            #-----------------------------------------------------------------------
-            tuple = struct.unpack (format, data)
-            self.Axis               = tuple[nAxis1]
-            self.Buttons            = tuple[nButtons]
-            self.Cadence            = tuple[nCadence]
-            self.CurrentResistance  = tuple[nCurrentResistance]
-            #self.Header            = tuple[nHeader]   filled in USB_Read already
-            self.HeartRate          = tuple[nHeartRate]
-            self.PedalEcho          = tuple[nEvents]
-            self.TargetResistanceFT = tuple[nTargetResistance]
-            self.WheelSpeed         = tuple[nSpeed]
+            f = self.ControlFrame.View(data)
+            self.Axis               = f.Axis1
+            self.Buttons            = f.Buttons
+            self.Cadence            = f.Cadence
+            self.CurrentResistance  = f.CurrentResistance
+            #self.Header            = f.Header      filled in USB_Read already
+            self.HeartRate          = f.HeartRate
+            self.PedalEcho          = f.Events
+            self.TargetResistanceFT = f.TargetResistance
+            self.WheelSpeed         = f.Speed
 
             self.Wheel2Speed()
             self.CurrentResistance2Power()
@@ -3455,44 +3813,14 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         if len(data) < 40:
             pass
         else:
-            #-------------------------------------------------------------------
-            # Define buffer format
-            #-------------------------------------------------------------------
-            fFiller0_23             = sc.pad * 24       #  0...23
-
-            _nHeader                = 0
-            fHeader                 = sc.unsigned_int   # 24...27
-
-            nMotorBrakeUnitFirmware = 1
-            fMotorBrakeUnitFirmware = sc.unsigned_int   # 28...31   0.x.y.z
-
-            nMotorBrakeUnitSerial   = 2                 # 32...35   tt-YY-##### (tt=41 (T1941), YY=year,
-            fMotorBrakeUnitSerial   = sc.unsigned_int   #                 ##### brake individual serial)
-
-            nVersion2               = 3                 # 36, 37
-            fVersion2               = sc.unsigned_short
-
-            fFiller38_63            = sc.pad * (63-37)  # 38...63
-
-            format = sc.no_alignment + fFiller0_23 + fHeader + fMotorBrakeUnitFirmware + \
-                        fMotorBrakeUnitSerial + \
-                        fVersion2 + fFiller38_63
-
-            #-----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
-            #-----------------------------------------------------------------------
-            for _v in range( 64 - len(data) ):
-                data.append(0)
-
             #-----------------------------------------------------------------------
-            # Parse buffer
+            # Parse buffer, see VersionFrame
             #-----------------------------------------------------------------------
-            tuple = struct.unpack (format, data)
-            #self.Header                = tuple[nHeader]   filled in USB_Read already
-            self.MotorBrakeUnitFirmware = tuple[nMotorBrakeUnitFirmware]
-            self.MotorBrakeUnitSerial   = tuple[nMotorBrakeUnitSerial]
-            self.Version2               = tuple[nVersion2]
+            f = self.VersionFrame.View(data)
+            #self.Header                = f.Header      filled in USB_Read already
+            self.MotorBrakeUnitFirmware = f.MotorBrakeUnitFirmware
+            self.MotorBrakeUnitSerial   = f.MotorBrakeUnitSerial
+            self.Version2               = f.Version2
 
             #-----------------------------------------------------------------------
             # Split serial; all decimal digits = tt-yy-#####